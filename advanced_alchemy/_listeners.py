@@ -699,6 +699,46 @@ def setup_cache_listeners() -> None:
     logger.debug("Cache invalidation listeners registered")
 
 
+def prehash_passwords(session: "Session", *_: Any) -> None:
+    """Hash plain text passwords in worker threads before an async session flushes.
+
+    Called from SQLAlchemy's
+    :meth:`before_flush <sqlalchemy.orm.SessionEvents.before_flush>` event.  Async sessions
+    flush inside a greenlet, so the hashes are awaited with
+    :func:`~sqlalchemy.util.concurrency.await_only` rather than computed on the event loop by
+    :meth:`PasswordHash.process_bind_param <advanced_alchemy.types.PasswordHash.process_bind_param>`.
+    Synchronous flushes are left to hash inline.
+
+    Args:
+        session: The sync :class:`Session <sqlalchemy.orm.Session>` instance that underlies the async
+            session.
+    """
+    from sqlalchemy.util.concurrency import await_only, in_greenlet
+
+    if not in_greenlet():
+        return
+
+    from advanced_alchemy.types.password_hash.base import _pending_password_instances, prehash_passwords_async
+
+    instances = _pending_password_instances(session)
+    if instances:
+        await_only(prehash_passwords_async(instances))
+
+
+def setup_password_hash_listeners() -> None:
+    """Register the password prehashing listener globally.
+
+    Use this for async sessions that are not created by
+    :class:`SQLAlchemyAsyncConfig <advanced_alchemy.config.SQLAlchemyAsyncConfig>`, which
+    registers the listener on its own session maker.
+    """
+    from sqlalchemy.event import contains
+    from sqlalchemy.orm import Session
+
+    if not contains(Session, "before_flush", prehash_passwords):
+        event.listen(Session, "before_flush", prehash_passwords)
+
+
 # Existing listener (keep it)
 def touch_updated_timestamp(session: "Session", *_: Any) -> None:
     """Set timestamp on update.
@@ -92,6 +92,13 @@ class SQLAlchemyAsyncConfig(GenericSQLAlchemyConfig[AsyncEngine, AsyncSession, a
 
     The configuration options are documented in the Alembic documentation.
     """
+    enable_password_hash_listener: bool = False
+    """Enable the password prehashing listener.
+
+    Hashes plain text :class:`PasswordHash <advanced_alchemy.types.PasswordHash>` values in worker
+    threads before each flush instead of on the event loop. Enable if your models have password
+    columns that are assigned plain text passwords.
+    """
     routing_config: "Optional[RoutingConfig]" = None
     """Optional read/write routing configuration.
 
@@ -142,6 +149,7 @@ class SQLAlchemyAsyncConfig(GenericSQLAlchemyConfig[AsyncEngine, AsyncSession, a
         from advanced_alchemy._listeners import (
             AsyncCacheListener,
             AsyncFileObjectListener,
+            prehash_passwords,
             touch_updated_timestamp,
         )
 
@@ -153,6 +161,9 @@ class SQLAlchemyAsyncConfig(GenericSQLAlchemyConfig[AsyncEngine, AsyncSession, a
                 routing_config=self.routing_config,
                 engine_config=self.engine_config_dict,
                 session_config=self.session_config_dict,
+                instrument_pool=self.instrument_pool,
+                enable_vector_search=self.enable_vector_search,
+                pool_event_hooks=self.pool_event_hooks,
             )
             self.session_maker = routing_maker
         else:
@@ -174,6 +185,8 @@ class SQLAlchemyAsyncConfig(GenericSQLAlchemyConfig[AsyncEngine, AsyncSession, a
                 event.listen(sync_maker, "after_rollback", AsyncFileObjectListener.after_rollback)
             if self.enable_touch_updated_timestamp_listener:
                 event.listen(sync_maker, "before_flush", touch_updated_timestamp)
+            if self.enable_password_hash_listener:
+                event.listen(sync_maker, "before_flush", prehash_passwords)
             event.listen(sync_maker, "after_commit", AsyncCacheListener.after_commit)
             event.listen(sync_maker, "after_rollback", AsyncCacheListener.after_rollback)
             session_maker.configure(sync_session_class=sync_maker)
@@ -183,6 +196,26 @@ class SQLAlchemyAsyncConfig(GenericSQLAlchemyConfig[AsyncEngine, AsyncSession, a
             raise ImproperConfigurationError(msg)
         return cast("async_sessionmaker[AsyncSession]", self.session_maker)  # pyright: ignore[reportUnknownMemberType]
 
+    async def prewarm_engines(self) -> int:
+        """Open and validate :attr:`prewarm_pool` connections on every engine.
+
+        With routing configured, every engine of the routing session maker is
+        warmed concurrently, read replicas included.
+
+        Returns:
+            The total number of connections opened and validated.
+        """
+        if self.prewarm_pool < 1:
+            return 0
+
+        from advanced_alchemy.routing import RoutingAsyncSessionMaker
+        from advanced_alchemy.utils.pool import prewarm_engine_async
+
+        session_maker = self.create_session_maker()
+        if isinstance(session_maker, RoutingAsyncSessionMaker):
+            return await session_maker.prewarm(self.prewarm_pool)
+        return await prewarm_engine_async(self.get_engine(), self.prewarm_pool)
+
     @asynccontextmanager
     async def get_session(
         self,
@@ -11,6 +11,8 @@ from advanced_alchemy.exceptions import ImproperConfigurationError
 from advanced_alchemy.utils.dataclass import Empty, simple_asdict
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from sqlalchemy import Connection, Engine, MetaData
     from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession, async_sessionmaker
     from sqlalchemy.orm import Mapper, Query, Session, sessionmaker
@@ -19,6 +21,7 @@ if TYPE_CHECKING:
 
     from advanced_alchemy.cache import CacheConfig, CacheManager
     from advanced_alchemy.utils.dataclass import EmptyType
+    from advanced_alchemy.utils.pool import PoolEventHook, PoolMonitor, PoolStats
 
 __all__ = (
     "ALEMBIC_TEMPLATE_PATH",
@@ -189,6 +192,29 @@ class GenericSQLAlchemyConfig(Generic[EngineT, SessionT, SessionMakerT]):
     - ``False``: Log warnings on file operation failures, don't raise exceptions
     - ``True`` (default): Raise exceptions on file operation failures
     """
+    prewarm_pool: int = 0
+    """Number of pooled connections to open and validate per engine at application startup.
+
+    Read replicas and other routing engines are warmed as well. Capped at each pool's size;
+    ``0`` disables pre-warming. The framework integrations run it from their startup hooks.
+    """
+    instrument_pool: bool = False
+    """Collect per-engine connection pool statistics from pool events.
+
+    Read them with :meth:`pool_stats`. With routing configured, every engine is instrumented.
+    """
+    pool_event_hooks: "Sequence[PoolEventHook]" = field(default_factory=tuple)
+    """Hooks notified of every pool checkout, connect and invalidation.
+
+    Setting any hook implies :attr:`instrument_pool`.
+    """
+    enable_vector_search: bool = False
+    """Instrument the engines for :class:`VectorSimilarityFilter <advanced_alchemy.filters.VectorSimilarityFilter>`.
+
+    On PostgreSQL, applies the ``hnsw_ef_search`` and ``ivfflat_probes`` execution options with
+    ``SET LOCAL`` before each statement that sets them. On SQLite, creates the ``aa_vector_distance``
+    function on each new connection. With routing configured, every engine is instrumented.
+    """
     cache_config: "Optional[CacheConfig]" = None
     """Optional :class:`CacheConfig <advanced_alchemy.cache.CacheConfig>` for dogpile.cache integration.
 
@@ -208,6 +234,7 @@ class GenericSQLAlchemyConfig(Generic[EngineT, SessionT, SessionMakerT]):
     Takes precedence over :attr:`cache_config`. Useful when sharing a single cache manager across
     multiple configs.
     """
+    _pool_monitor: "Optional[PoolMonitor]" = field(init=False, default=None, repr=False, compare=False)
     _SESSION_SCOPE_KEY_REGISTRY: "ClassVar[set[str]]" = field(init=False, default=cast("set[str]", set()))
     """Internal counter for ensuring unique identification of session scope keys in the class."""
     _ENGINE_APP_STATE_KEY_REGISTRY: "ClassVar[set[str]]" = field(init=False, default=cast("set[str]", set()))
@@ -219,6 +246,9 @@ class GenericSQLAlchemyConfig(Generic[EngineT, SessionT, SessionMakerT]):
         if self.connection_string is not None and self.engine_instance is not None:
             msg = "Only one of 'connection_string' or 'engine_instance' can be provided."
             raise ImproperConfigurationError(msg)
+        if self.prewarm_pool < 0:
+            msg = "'prewarm_pool' must not be negative."
+            raise ImproperConfigurationError(msg)
         if self.metadata is None:
             self.metadata = metadata_registry.get(self.bind_key)
         else:
@@ -287,7 +317,7 @@ class GenericSQLAlchemyConfig(Generic[EngineT, SessionT, SessionMakerT]):
             :class:`sqlalchemy.Engine` or :class:`sqlalchemy.ext.asyncio.AsyncEngine` instance used by the plugin.
         """
         if self.engine_instance:
-            return self.engine_instance
+            return self._instrument_engine(self.engine_instance)
 
         if self.connection_string is None:
             msg = "One of 'connection_string' or 'engine_instance' must be provided."
@@ -301,7 +331,49 @@ class GenericSQLAlchemyConfig(Generic[EngineT, SessionT, SessionMakerT]):
             del engine_config["json_deserializer"]
             del engine_config["json_serializer"]
             self.engine_instance = self.create_engine_callable(self.connection_string, **engine_config)
-        return self.engine_instance
+        return self._instrument_engine(self.engine_instance)
+
+    def _instrument_engine(self, engine: EngineT) -> EngineT:
+        """Register the engine-level listeners used by the library.
+
+        Applies the vector search execution options on PostgreSQL and creates the
+        vector distance function on SQLite if vector search is enabled, and attaches a
+        pool monitor once if pool instrumentation is enabled.
+
+        Args:
+            engine: The engine used by the plugin.
+
+        Returns:
+            The same engine.
+        """
+        if self.enable_vector_search:
+            from advanced_alchemy.types.vector import register_sqlite_vector_functions, register_vector_search_options
+
+            register_vector_search_options(engine)
+            register_sqlite_vector_functions(engine)
+        if self._pool_monitor is None and (self.instrument_pool or self.pool_event_hooks):
+            from advanced_alchemy.utils.pool import PoolMonitor
+
+            self._pool_monitor = PoolMonitor(engine, label=self.bind_key or "default", hooks=self.pool_event_hooks)
+        return engine
+
+    def pool_stats(self) -> "dict[str, PoolStats]":
+        """Get connection pool statistics for the engines of this config.
+
+        With routing configured, every engine of the routing session maker is
+        reported under its ``"<group>[<index>]"`` label. Otherwise the engine is
+        reported under :attr:`bind_key`, or ``"default"``.
+
+        Returns:
+            Statistics by engine label, empty unless pool instrumentation is enabled.
+        """
+        from advanced_alchemy.routing import RoutingAsyncSessionMaker, RoutingSyncSessionMaker
+
+        if isinstance(self.session_maker, (RoutingAsyncSessionMaker, RoutingSyncSessionMaker)):
+            return self.session_maker.pool_stats()
+        if self._pool_monitor is None:
+            return {}
+        return {self._pool_monitor.label: self._pool_monitor.stats()}
 
     def create_session_maker(self) -> "Callable[[], SessionT]":  # pragma: no cover
         """Get a session maker. If none exists yet, create one.
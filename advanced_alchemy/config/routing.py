@@ -7,12 +7,20 @@ write operations to the primary database.
 
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Optional, Union
+from typing import TYPE_CHECKING, Optional, Union
+
+from advanced_alchemy.exceptions import ImproperConfigurationError
+
+if TYPE_CHECKING:
+    from advanced_alchemy.routing.replication import ReplicationPositionProbe
 
 __all__ = (
+    "HealthCheckConfig",
     "ReplicaConfig",
     "RoutingConfig",
     "RoutingStrategy",
+    "ShardingConfig",
+    "StickyWindow",
 )
 
 
@@ -29,6 +37,12 @@ class RoutingStrategy(Enum):
     RANDOM = auto()
     """Select engines randomly."""
 
+    LEAST_CONNECTIONS = auto()
+    """Select the engine with the fewest checked-out pool connections."""
+
+    LATENCY_EWMA = auto()
+    """Select the engine with the lowest exponentially weighted query latency."""
+
 
 def _default_read_replicas() -> list[Union[str, "EngineConfig"]]:
     """Return an empty list for read replica configuration."""
@@ -58,6 +72,105 @@ class EngineConfig:
 ReplicaConfig = EngineConfig
 
 
+@dataclass
+class StickyWindow:
+    """Limits for sticky-to-primary routing after a write.
+
+    Stickiness ends as soon as either limit is reached. Every new write restarts
+    the window.
+    """
+
+    seconds: Optional[float] = None
+    """Seconds after the last write during which reads stick to the primary."""
+
+    statements: Optional[int] = None
+    """Number of statements after the last write that stick to the primary."""
+
+    def __post_init__(self) -> None:
+        """Validate configuration.
+
+        Raises:
+            ImproperConfigurationError: If no limit is set or a limit is not positive.
+        """
+        if self.seconds is None and self.statements is None:
+            msg = "StickyWindow requires 'seconds' and/or 'statements'"
+            raise ImproperConfigurationError(msg)
+        if (self.seconds is not None and self.seconds <= 0) or (self.statements is not None and self.statements < 1):
+            msg = "StickyWindow limits must be positive"
+            raise ImproperConfigurationError(msg)
+
+
+@dataclass
+class ShardingConfig:
+    """Hash-based horizontal sharding configuration.
+
+    Rows are assigned to shards by consistent hashing of the ``shard_key``
+    attribute. Each shard is a bind group in :attr:`RoutingConfig.engines`.
+    """
+
+    shard_key: str
+    """Name of the model attribute holding the shard key (e.g. ``tenant_id``)."""
+
+    shards: list[str]
+    """Bind group names of the shards."""
+
+    virtual_nodes: int = 100
+    """Number of positions per shard on the hash ring."""
+
+    def __post_init__(self) -> None:
+        """Validate configuration.
+
+        Raises:
+            ImproperConfigurationError: If no shards are configured, shards repeat, or ``virtual_nodes`` is not positive.
+        """
+        if not self.shards or len(set(self.shards)) != len(self.shards):
+            msg = "ShardingConfig requires at least one shard and shard names must be unique"
+            raise ImproperConfigurationError(msg)
+        if self.virtual_nodes < 1:
+            msg = "virtual_nodes must be at least 1"
+            raise ImproperConfigurationError(msg)
+
+
+@dataclass
+class HealthCheckConfig:
+    """Configuration for background replica health checks.
+
+    Each non-default engine is probed periodically with a lightweight
+    ``SELECT 1``. A circuit breaker per engine ejects it from selection after
+    ``failure_threshold`` consecutive failed probes, waits ``recovery_timeout``
+    seconds, then probes it in a half-open state and re-admits it after
+    ``success_threshold`` consecutive successful probes.
+    """
+
+    interval: float = 5.0
+    """Seconds between probe rounds."""
+
+    timeout: float = 2.0
+    """Seconds to wait for a single probe before counting it as a failure."""
+
+    failure_threshold: int = 3
+    """Consecutive probe failures before an engine is ejected."""
+
+    recovery_timeout: float = 30.0
+    """Seconds an ejected engine stays open before it is probed again."""
+
+    success_threshold: int = 1
+    """Consecutive successful half-open probes required to re-admit an engine."""
+
+    def __post_init__(self) -> None:
+        """Validate configuration.
+
+        Raises:
+            ImproperConfigurationError: If any threshold or duration is out of range.
+        """
+        if self.interval <= 0 or self.timeout <= 0 or self.recovery_timeout < 0:
+            msg = "interval and timeout must be positive and recovery_timeout must not be negative"
+            raise ImproperConfigurationError(msg)
+        if self.failure_threshold < 1 or self.success_threshold < 1:
+            msg = "failure_threshold and success_threshold must be at least 1"
+            raise ImproperConfigurationError(msg)
+
+
 @dataclass
 class RoutingConfig:
     """Read/Write routing configuration.
@@ -107,8 +220,46 @@ class RoutingConfig:
     reset_stickiness_on_commit: bool = True
     """Reset stickiness after commit."""
 
+    sticky_window: Optional[StickyWindow] = None
+    """Optional time or statement limit for sticky-after-write.
+
+    By default stickiness lasts until commit or the end of the context. Long-lived
+    contexts such as websocket handlers and background workers can set a window so
+    that reads return to replicas once it expires.
+    """
+
+    replication_probe: "Optional[ReplicationPositionProbe]" = None
+    """Optional replication-position probe for lag-aware read-your-writes.
+
+    When set, the primary's replication position is recorded after each committed
+    write and later reads are routed only to replicas that have replayed it, instead
+    of pinning them to the primary. Stickiness after commit still follows
+    ``reset_stickiness_on_commit``.
+
+    See :class:`~advanced_alchemy.routing.replication.PostgresLSNProbe` and
+    :class:`~advanced_alchemy.routing.replication.MySQLGTIDProbe`.
+    """
+
+    health_check: Optional[HealthCheckConfig] = None
+    """Optional background health checking for non-default, non-shard engine groups.
+
+    When set, unhealthy replicas are ejected from selection and reads fall back
+    to the default group until the replica recovers.
+    """
+
+    sharding: Optional[ShardingConfig] = None
+    """Optional hash-based sharding across bind groups.
+
+    When set, repositories route operations carrying the shard key to the owning
+    shard and scatter queries without it to every shard.
+    """
+
     def __post_init__(self) -> None:
-        """Normalize configuration."""
+        """Normalize configuration.
+
+        Raises:
+            ImproperConfigurationError: If a shard has no engines configured.
+        """
         # Migrate legacy config to engines map
         if self.primary_connection_string:
             if self.default_group not in self.engines:
@@ -122,6 +273,12 @@ class RoutingConfig:
                 self.engines[self.read_group] = []
             self.engines[self.read_group].extend(self.read_replicas)
 
+        if self.sharding is not None:
+            missing = [shard for shard in self.sharding.shards if not self.engines.get(shard)]
+            if missing:
+                msg = f"Shards {missing} have no engines configured in 'engines'"
+                raise ImproperConfigurationError(msg)
+
     def get_engine_configs(self, group: str) -> list[EngineConfig]:
         """Get engine configs for a specific group.
 
@@ -136,6 +136,9 @@ class SQLAlchemySyncConfig(GenericSQLAlchemyConfig[Engine, Session, sessionmaker
                 routing_config=self.routing_config,
                 engine_config=self.engine_config_dict,
                 session_config=self.session_config_dict,
+                instrument_pool=self.instrument_pool,
+                enable_vector_search=self.enable_vector_search,
+                pool_event_hooks=self.pool_event_hooks,
             )
             self.session_maker = routing_maker
         else:
@@ -160,6 +163,26 @@ class SQLAlchemySyncConfig(GenericSQLAlchemyConfig[Engine, Session, sessionmaker
             raise ImproperConfigurationError(msg)
         return cast("sessionmaker[Session]", self.session_maker)  # pyright: ignore[reportUnknownMemberType]
 
+    def prewarm_engines(self) -> int:
+        """Open and validate :attr:`prewarm_pool` connections on every engine.
+
+        With routing configured, every engine of the routing session maker is
+        warmed, read replicas included.
+
+        Returns:
+            The total number of connections opened and validated.
+        """
+        if self.prewarm_pool < 1:
+            return 0
+
+        from advanced_alchemy.routing import RoutingSyncSessionMaker
+        from advanced_alchemy.utils.pool import prewarm_engine_sync
+
+        session_maker = self.create_session_maker()
+        if isinstance(session_maker, RoutingSyncSessionMaker):
+            return session_maker.prewarm(self.prewarm_pool)
+        return prewarm_engine_sync(self.get_engine(), self.prewarm_pool)
+
     @contextmanager
     def get_session(self) -> "Generator[Session, None, None]":
         """Get a session context manager.
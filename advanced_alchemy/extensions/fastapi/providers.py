@@ -36,6 +36,7 @@ from advanced_alchemy.filters import (
     ChoicesFilter,
     CollectionFilter,
     FilterTypes,
+    FullTextSearchFilter,
     LimitOffset,
     NotInCollectionFilter,
     OrderBy,
@@ -108,6 +109,8 @@ class DependencyDefaults:
     """Key for the order by dependency."""
     SEARCH_FILTER_DEPENDENCY_KEY: str = "search_filter"
     """Key for the search filter dependency."""
+    FULL_TEXT_SEARCH_FILTER_DEPENDENCY_KEY: str = "full_text_search_filter"
+    """Key for the full-text search filter dependency."""
     DEFAULT_PAGINATION_SIZE: int = 20
     """Default pagination size."""
 
@@ -347,6 +350,7 @@ def provide_filters(
         "updated_at",
         "pagination_type",
         "search",
+        "full_text_search",
         "sort_field",
         "not_in_fields",
         "in_fields",
@@ -589,6 +593,7 @@ def _create_filter_aggregate_function_fastapi(  # noqa: C901, PLR0915
                 field_name=field_names,
                 value=search_string,  # type: ignore[arg-type]
                 ignore_case=ignore_case or False,
+                mode=config.get("search_mode", "contains"),
             )
 
         param_name = dep_defaults.SEARCH_FILTER_DEPENDENCY_KEY
@@ -601,6 +606,40 @@ def _create_filter_aggregate_function_fastapi(  # noqa: C901, PLR0915
         )
         annotations[param_name] = Annotated[Optional[SearchFilter], Depends(provide_search_filter)]
 
+    # Add full-text search filter providers
+    if full_text_fields := config.get("full_text_search"):
+
+        def provide_full_text_search_filter(
+            search_query: Annotated[
+                Optional[str],
+                Query(
+                    required=False,
+                    alias="searchQuery",
+                    description="Full-text search query.",
+                ),
+            ] = None,
+        ) -> FullTextSearchFilter:
+            field_names = (
+                set(full_text_fields.split(",")) if isinstance(full_text_fields, str) else set(full_text_fields)
+            )
+
+            return FullTextSearchFilter(
+                field_name=field_names,
+                value=search_query,  # type: ignore[arg-type]
+                language=config.get("full_text_search_language", "english"),
+                order_by_rank=config.get("full_text_search_order_by_rank", True),
+            )
+
+        param_name = dep_defaults.FULL_TEXT_SEARCH_FILTER_DEPENDENCY_KEY
+        params.append(
+            inspect.Parameter(
+                name=param_name,
+                kind=inspect.Parameter.KEYWORD_ONLY,
+                annotation=Annotated[Optional[FullTextSearchFilter], Depends(provide_full_text_search_filter)],
+            )
+        )
+        annotations[param_name] = Annotated[Optional[FullTextSearchFilter], Depends(provide_full_text_search_filter)]
+
     # Add sort filter providers
     if sort_field := config.get("sort_field"):
         sort_field_default = normalize_sort_field(sort_field)
@@ -775,7 +814,7 @@ def _aggregate_filter_function(**kwargs: Any) -> list[FilterTypes]:
             continue
         if isinstance(filter_value, list):
             filters.extend(cast("list[FilterTypes]", filter_value))
-        elif isinstance(filter_value, SearchFilter) and filter_value.value is None:  # pyright: ignore # noqa: SIM114
+        elif isinstance(filter_value, (SearchFilter, FullTextSearchFilter)) and filter_value.value is None:  # pyright: ignore # noqa: SIM114
             continue  # type: ignore
         elif isinstance(filter_value, OrderBy) and filter_value.field_name is None:  # pyright: ignore
             continue  # type: ignore
@@ -108,6 +108,7 @@ class SQLAlchemySyncConfig(_SQLAlchemySyncConfig):
         self.bind_key = self.bind_key or "default"
         if self.create_all:
             self.create_all_metadata()
+        self.prewarm_engines()
         if self.commit_mode != "manual":
             self._setup_session_handling(app)
 
@@ -202,6 +203,7 @@ class SQLAlchemyAsyncConfig(_SQLAlchemyAsyncConfig):
             raise ImproperConfigurationError(msg)
         if self.create_all:
             _ = portal.call(self.create_all_metadata)
+        _ = portal.call(self.prewarm_engines)
         self._setup_session_handling(app, portal)
 
     def _setup_session_handling(self, app: "Flask", portal: "Portal") -> None:
@@ -1,7 +1,7 @@
 from advanced_alchemy import base, exceptions, filters, mixins, operations, repository, service, types, utils
 from advanced_alchemy.alembic.commands import AlembicCommands
 from advanced_alchemy.config import AlembicAsyncConfig, AlembicSyncConfig, AsyncSessionConfig, SyncSessionConfig
-from advanced_alchemy.extensions.litestar import providers, session, store
+from advanced_alchemy.extensions.litestar import providers, reaper, session, store
 from advanced_alchemy.extensions.litestar.cli import get_database_migration_plugin
 from advanced_alchemy.extensions.litestar.dto import SQLAlchemyDTO, SQLAlchemyDTOConfig
 from advanced_alchemy.extensions.litestar.plugins import (
@@ -62,6 +62,7 @@ __all__ = (
     "mixins",
     "operations",
     "providers",
+    "reaper",
     "repository",
     "service",
     "session",
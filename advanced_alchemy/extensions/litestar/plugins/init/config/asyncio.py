@@ -27,12 +27,14 @@ from advanced_alchemy.routing.maker import dispose_session_maker_async
 logger = logging.getLogger("advanced_alchemy.extensions.litestar")
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncGenerator, Coroutine
+    from collections.abc import AsyncGenerator, Coroutine, Sequence
 
     from litestar import Litestar
     from litestar.datastructures.state import State
     from litestar.types import BeforeMessageSendHookHandler, Message, Scope
 
+    from advanced_alchemy.extensions.litestar.reaper import ExpiredRowReaper
+
     # noinspection PyUnresolvedReferences
 
 
@@ -170,6 +172,11 @@ class SQLAlchemyAsyncConfig(_SQLAlchemyAsyncConfig):
     """
     set_default_exception_handler: bool = True
     """Sets the default exception handler on application start."""
+    reapers: "Sequence[ExpiredRowReaper[Any]]" = field(default_factory=list)
+    """Expired-row reapers run in the background for the lifetime of the application.
+
+    Reapers without a config of their own use this config.
+    """
 
     def _ensure_unique(self, registry_name: str, key: str, new_key: Optional[str] = None, _iter: int = 0) -> str:
         new_key = new_key if new_key is not None else key
@@ -222,8 +229,15 @@ class SQLAlchemyAsyncConfig(_SQLAlchemyAsyncConfig):
         try:
             if self.create_all:
                 await self.create_all_metadata(app)
+            await self.prewarm_engines()
+            for reaper in self.reapers:
+                if reaper.config is None:
+                    reaper.config = self
+                reaper.start()
             yield
         finally:
+            for reaper in self.reapers:
+                await reaper.stop()
             if self.engine_dependency_key in deps:
                 engine = deps[self.engine_dependency_key]
                 if hasattr(engine, "dispose"):
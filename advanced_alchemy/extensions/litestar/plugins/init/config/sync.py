@@ -23,16 +23,19 @@ from advanced_alchemy.extensions.litestar.plugins.init.config.common import (
 from advanced_alchemy.extensions.litestar.plugins.init.config.engine import EngineConfig
 from advanced_alchemy.routing.context import reset_routing_context
 from advanced_alchemy.routing.maker import dispose_session_maker_sync
+from advanced_alchemy.utils.sync_tools import async_
 
 logger = logging.getLogger("advanced_alchemy.extensions.litestar")
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncGenerator
+    from collections.abc import AsyncGenerator, Sequence
 
     from litestar import Litestar
     from litestar.datastructures.state import State
     from litestar.types import BeforeMessageSendHookHandler, Message, Scope
 
+    from advanced_alchemy.extensions.litestar.reaper import ExpiredRowReaper
+
 __all__ = (
     "SQLAlchemySyncConfig",
     "autocommit_before_send_handler",
@@ -171,6 +174,11 @@ class SQLAlchemySyncConfig(_SQLAlchemySyncConfig):
     """
     set_default_exception_handler: bool = True
     """Sets the default exception handler on application start."""
+    reapers: "Sequence[ExpiredRowReaper[Any]]" = field(default_factory=list)
+    """Expired-row reapers run in the background for the lifetime of the application.
+
+    Reapers without a config of their own use this config.
+    """
 
     def _ensure_unique(self, registry_name: str, key: str, new_key: Optional[str] = None, _iter: int = 0) -> str:
         new_key = new_key if new_key is not None else key
@@ -224,8 +232,15 @@ class SQLAlchemySyncConfig(_SQLAlchemySyncConfig):
         try:
             if self.create_all:
                 self.create_all_metadata(app)
+            await async_(self.prewarm_engines)()
+            for reaper in self.reapers:
+                if reaper.config is None:
+                    reaper.config = self
+                reaper.start()
             yield
         finally:
+            for reaper in self.reapers:
+                await reaper.stop()
             if self.engine_dependency_key in deps:
                 engine = deps[self.engine_dependency_key]
                 if hasattr(engine, "dispose"):
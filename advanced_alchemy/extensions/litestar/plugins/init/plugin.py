@@ -19,6 +19,7 @@ from advanced_alchemy.filters import (
     FilterGroup,
     FilterMap,
     FilterTypes,
+    FullTextSearchFilter,
     InAnyFilter,
     LimitOffset,
     LogicalOperatorMap,
@@ -31,6 +32,7 @@ from advanced_alchemy.filters import (
     SearchFilter,
     StatementFilter,
     StatementTypeT,
+    VectorSimilarityFilter,
 )
 from advanced_alchemy.service import ModelDictListT, ModelDictT, ModelDTOT, ModelOrRowMappingT, ModelT, OffsetPagination
 
@@ -53,6 +55,8 @@ signature_namespace_values: dict[str, Any] = {
     "SearchFilter": SearchFilter,
     "NotInCollectionFilter": NotInCollectionFilter,
     "NotInSearchFilter": NotInSearchFilter,
+    "FullTextSearchFilter": FullTextSearchFilter,
+    "VectorSimilarityFilter": VectorSimilarityFilter,
     "FilterTypes": FilterTypes,
     "OffsetPagination": OffsetPagination,
     "ExistsFilter": ExistsFilter,
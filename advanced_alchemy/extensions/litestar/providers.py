@@ -31,6 +31,7 @@ from advanced_alchemy.filters import (
     ChoicesFilter,
     CollectionFilter,
     FilterTypes,
+    FullTextSearchFilter,
     LimitOffset,
     NotInCollectionFilter,
     OrderBy,
@@ -108,6 +109,8 @@ class DependencyDefaults:
     """Key for the order by dependency."""
     SEARCH_FILTER_DEPENDENCY_KEY: str = "search_filter"
     """Key for the search filter dependency."""
+    FULL_TEXT_SEARCH_FILTER_DEPENDENCY_KEY: str = "full_text_search_filter"
+    """Key for the full-text search filter dependency."""
     DEFAULT_PAGINATION_SIZE: int = 20
     """Default pagination size."""
 
@@ -441,10 +444,37 @@ def _create_statement_filters(  # noqa: C901, PLR0915
                 field_name=field_names,
                 value=search_string,  # type: ignore[arg-type]
                 ignore_case=ignore_case or False,
+                mode=config.get("search_mode", "contains"),
             )
 
         filters[dep_defaults.SEARCH_FILTER_DEPENDENCY_KEY] = Provide(provide_search_filter, sync_to_thread=False)
 
+    if full_text_fields := config.get("full_text_search"):
+
+        def provide_full_text_search_filter(
+            search_query: Annotated[
+                StringOrNone,
+                QueryParameter(
+                    name="searchQuery",
+                    title="Full-text search query",
+                ),
+            ] = None,
+        ) -> FullTextSearchFilter:
+            field_names = (
+                set(full_text_fields.split(",")) if isinstance(full_text_fields, str) else set(full_text_fields)
+            )
+
+            return FullTextSearchFilter(
+                field_name=field_names,
+                value=search_query,  # type: ignore[arg-type]
+                language=config.get("full_text_search_language", "english"),
+                order_by_rank=config.get("full_text_search_order_by_rank", True),
+            )
+
+        filters[dep_defaults.FULL_TEXT_SEARCH_FILTER_DEPENDENCY_KEY] = Provide(
+            provide_full_text_search_filter, sync_to_thread=False
+        )
+
     if sort_field := config.get("sort_field"):
         filters[dep_defaults.ORDER_BY_FILTER_DEPENDENCY_KEY] = Provide(
             _create_order_by_filter_provider(sort_field, config.get("sort_order", "desc")),
@@ -685,6 +715,14 @@ def _create_filter_aggregate_function(config: FilterConfig) -> Callable[..., lis
         )
         annotations["search_filter"] = SearchFilter
 
+    if config.get("full_text_search"):
+        parameters["full_text_search_filter"] = inspect.Parameter(
+            name="full_text_search_filter",
+            kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+            annotation=NamedDependency[SkipValidation[FullTextSearchFilter]],
+        )
+        annotations["full_text_search_filter"] = FullTextSearchFilter
+
     if config.get("pagination_type") == "limit_offset":
         parameters["limit_offset_filter"] = inspect.Parameter(
             name="limit_offset_filter",
@@ -767,6 +805,10 @@ def _create_filter_aggregate_function(config: FilterConfig) -> Callable[..., lis
             and search_filter.value is not None  # pyright: ignore[reportUnnecessaryComparison]
         ):
             filters.append(search_filter)
+        if (
+            full_text_search_filter := cast("Optional[FullTextSearchFilter]", kwargs.get("full_text_search_filter"))
+        ) and full_text_search_filter.value is not None:  # pyright: ignore[reportUnnecessaryComparison]
+            filters.append(full_text_search_filter)
         if (
             (order_by := cast("Optional[OrderBy]", kwargs.get("order_by_filter")))
             and order_by is not None  # pyright: ignore[reportUnnecessaryComparison]
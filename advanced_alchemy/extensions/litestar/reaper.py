@@ -0,0 +1,284 @@
+"""Background removal of expired store and session rows.
+
+A single ``DELETE ... WHERE expires_at < now`` over a large session table holds
+long locks and produces one huge transaction. :class:`ExpiredRowReaper` deletes
+expired rows in bounded, primary-key ordered batches instead, each in its own
+short transaction, optionally pausing between batches and stopping after a
+maximum runtime. It can run on a schedule from the SQLAlchemy plugin lifespan
+by adding it to the ``reapers`` of a Litestar SQLAlchemy config.
+"""
+
+import asyncio
+import contextlib
+import datetime
+import logging
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Generic, Optional, TypeVar, Union, cast
+
+from litestar.exceptions import ImproperlyConfiguredException
+from sqlalchemy import delete, inspect, select
+
+from advanced_alchemy.extensions.litestar.plugins.init import SQLAlchemyAsyncConfig, SQLAlchemySyncConfig
+from advanced_alchemy.utils.sync_tools import async_
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from sqlalchemy import ColumnElement, CursorResult
+    from sqlalchemy.ext.asyncio import AsyncSession
+    from sqlalchemy.orm import Session
+
+__all__ = ("ExpiredRowReaper", "ReaperStats")
+
+logger = logging.getLogger("advanced_alchemy")
+
+SQLAlchemyConfigT = TypeVar("SQLAlchemyConfigT", bound=Union[SQLAlchemyAsyncConfig, SQLAlchemySyncConfig])
+
+
+@dataclass(frozen=True)
+class ReaperStats:
+    """Snapshot of the work done by an :class:`ExpiredRowReaper`."""
+
+    table: str
+    """Name of the reaped table."""
+    runs: int
+    """Number of completed runs."""
+    batches: int
+    """Number of batches that deleted at least one row."""
+    deleted: int
+    """Total number of deleted rows."""
+    errors: int
+    """Number of runs that failed."""
+    last_run_deleted: int
+    """Rows deleted by the last completed run."""
+    last_run_duration: float
+    """Duration of the last completed run, in seconds."""
+    last_run_at: Optional[datetime.datetime]
+    """When the last completed run finished, or ``None`` if none has."""
+
+
+class ExpiredRowReaper(Generic[SQLAlchemyConfigT]):
+    """Delete expired rows in bounded, primary-key ordered batches.
+
+    Works with any mapped model that has a single-column primary key and an
+    ``expires_at`` column, such as :class:`~advanced_alchemy.extensions.litestar.store.StoreModelMixin`
+    and :class:`~advanced_alchemy.extensions.litestar.session.SessionModelMixin` subclasses.
+
+    Example:
+        Reaping sessions every five minutes from the plugin lifespan::
+
+            reaper = ExpiredRowReaper(
+                SessionModel, batch_size=1000, max_runtime=30
+            )
+            config = SQLAlchemyAsyncConfig(
+                connection_string=..., reapers=[reaper]
+            )
+    """
+
+    __slots__ = (
+        "_batches",
+        "_config",
+        "_criteria",
+        "_deleted",
+        "_errors",
+        "_last_run_at",
+        "_last_run_deleted",
+        "_last_run_duration",
+        "_model",
+        "_runs",
+        "_task",
+        "batch_size",
+        "batch_sleep",
+        "interval",
+        "max_runtime",
+    )
+
+    def __init__(
+        self,
+        model: "type[Any]",
+        config: "Optional[SQLAlchemyConfigT]" = None,
+        *,
+        batch_size: int = 1000,
+        batch_sleep: float = 0.0,
+        max_runtime: Optional[float] = 60.0,
+        interval: float = 300.0,
+        criteria: "Sequence[ColumnElement[bool]]" = (),
+    ) -> None:
+        """Initialize the reaper.
+
+        Args:
+            model: The mapped model whose expired rows are deleted.
+            config: The SQLAlchemy config used to open sessions. When the reaper is
+                registered on a config's ``reapers``, it defaults to that config.
+            batch_size: Maximum number of rows deleted per statement and transaction.
+            batch_sleep: Seconds to pause between batches.
+            max_runtime: Seconds after which a run stops starting new batches, or ``None``
+                to run until no expired rows are left.
+            interval: Seconds between runs when running in the background.
+            criteria: Additional criteria restricting which expired rows are deleted.
+
+        Raises:
+            ValueError: If ``batch_size`` or ``interval`` is not positive.
+        """
+        if batch_size < 1:
+            msg = "batch_size must be at least 1"
+            raise ValueError(msg)
+        if interval <= 0:
+            msg = "interval must be positive"
+            raise ValueError(msg)
+        self._model = model
+        self._config = config
+        self._criteria = tuple(criteria)
+        self.batch_size = batch_size
+        self.batch_sleep = batch_sleep
+        self.max_runtime = max_runtime
+        self.interval = interval
+        self._task: Optional[asyncio.Task[None]] = None
+        self._runs = 0
+        self._batches = 0
+        self._deleted = 0
+        self._errors = 0
+        self._last_run_deleted = 0
+        self._last_run_duration = 0.0
+        self._last_run_at: Optional[datetime.datetime] = None
+
+    @property
+    def config(self) -> "Optional[SQLAlchemyConfigT]":
+        """The SQLAlchemy config used to open sessions."""
+        return self._config
+
+    @config.setter
+    def config(self, value: "SQLAlchemyConfigT") -> None:
+        self._config = value
+
+    @property
+    def stats(self) -> ReaperStats:
+        """A snapshot of the reaper's counters."""
+        return ReaperStats(
+            table=cast("str", self._model.__table__.name),
+            runs=self._runs,
+            batches=self._batches,
+            deleted=self._deleted,
+            errors=self._errors,
+            last_run_deleted=self._last_run_deleted,
+            last_run_duration=self._last_run_duration,
+            last_run_at=self._last_run_at,
+        )
+
+    @property
+    def is_running(self) -> bool:
+        """Check whether the background task is running.
+
+        Returns:
+            ``True`` if the reaper has been started and not stopped.
+        """
+        return self._task is not None and not self._task.done()
+
+    def _batch_ids(self, now: datetime.datetime) -> "Any":
+        primary_key = inspect(self._model).primary_key[0]
+        return (
+            select(primary_key)
+            .where(self._model.expires_at < now, *self._criteria)
+            .order_by(primary_key)
+            .limit(self.batch_size)
+        )
+
+    def _delete_batch(self, ids: "Sequence[Any]", now: datetime.datetime) -> "Any":
+        primary_key = inspect(self._model).primary_key[0]
+        return (
+            delete(self._model)
+            .where(primary_key.in_(ids), self._model.expires_at < now)
+            .execution_options(synchronize_session=False)
+        )
+
+    def _reap_batch_sync(self, now: datetime.datetime) -> "tuple[int, int]":
+        with cast("Session", cast("SQLAlchemySyncConfig", self._config).get_session()) as session:
+            ids = session.execute(self._batch_ids(now)).scalars().all()
+            if not ids:
+                return 0, 0
+            result = cast("CursorResult[Any]", session.execute(self._delete_batch(ids, now)))
+            session.commit()
+            return len(ids), result.rowcount
+
+    async def _reap_batch_async(self, now: datetime.datetime) -> "tuple[int, int]":
+        async with cast("AsyncSession", cast("SQLAlchemyAsyncConfig", self._config).get_session()) as session:
+            ids = (await session.execute(self._batch_ids(now))).scalars().all()
+            if not ids:
+                return 0, 0
+            result = cast("CursorResult[Any]", await session.execute(self._delete_batch(ids, now)))
+            await session.commit()
+            return len(ids), result.rowcount
+
+    async def reap(self) -> int:
+        """Delete expired rows batch by batch until none are left or ``max_runtime`` is exceeded.
+
+        Raises:
+            ImproperlyConfiguredException: If the reaper has no config.
+
+        Returns:
+            The number of deleted rows.
+        """
+        if self._config is None:
+            msg = "ExpiredRowReaper has no SQLAlchemy config"
+            raise ImproperlyConfiguredException(msg)
+        reap_batch = (
+            self._reap_batch_async if isinstance(self._config, SQLAlchemyAsyncConfig) else async_(self._reap_batch_sync)
+        )
+        started = time.monotonic()
+        now = datetime.datetime.now(datetime.timezone.utc)
+        deleted = batches = 0
+        while True:
+            selected, removed = await reap_batch(now)
+            if removed:
+                deleted += removed
+                batches += 1
+            if selected < self.batch_size:
+                break
+            if self.max_runtime is not None and time.monotonic() - started >= self.max_runtime:
+                break
+            if self.batch_sleep > 0:
+                await asyncio.sleep(self.batch_sleep)
+        duration = time.monotonic() - started
+        self._runs += 1
+        self._batches += batches
+        self._deleted += deleted
+        self._last_run_deleted = deleted
+        self._last_run_duration = duration
+        self._last_run_at = datetime.datetime.now(datetime.timezone.utc)
+        logger.debug(
+            "Reaped %d expired rows from %s in %d batches (%.3fs)",
+            deleted,
+            self._model.__table__.name,
+            batches,
+            duration,
+        )
+        return deleted
+
+    def start(self) -> None:
+        """Start reaping every ``interval`` seconds in a task on the running event loop.
+
+        Does nothing if the reaper is already running. Must be called from within a running event loop.
+        """
+        if self.is_running:
+            return
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Cancel the background task and wait for it to exit."""
+        task, self._task = self._task, None
+        if task is None or task.done():
+            return
+        task.cancel()
+        if task.get_loop() is asyncio.get_running_loop():
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.reap()
+            except Exception:
+                self._errors += 1
+                logger.exception("Failed to reap expired rows from %s", self._model.__table__.name)
+            await asyncio.sleep(self.interval)
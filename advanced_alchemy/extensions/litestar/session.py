@@ -1,5 +1,8 @@
 import datetime
-from abc import ABC, abstractmethod
+import hashlib
+import threading
+from abc import ABC
+from collections import OrderedDict
 from copy import deepcopy
 from typing import TYPE_CHECKING, Any, Final, Generic, Optional, TypeVar, Union, cast
 
@@ -16,6 +19,7 @@ from sqlalchemy import (
     delete,
     func,
     select,
+    update,
 )
 from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import Mapped, Session, declarative_mixin, declared_attr, mapped_column
@@ -25,11 +29,13 @@ from advanced_alchemy.extensions.litestar.plugins.init import (
     SQLAlchemyAsyncConfig,
     SQLAlchemySyncConfig,
 )
+from advanced_alchemy.extensions.litestar.reaper import ExpiredRowReaper
 from advanced_alchemy.operations import OnConflictUpsert
 from advanced_alchemy.utils.sync_tools import async_
 
 if TYPE_CHECKING:
     from litestar.stores.base import Store
+    from sqlalchemy import CursorResult, Update
     from sqlalchemy.ext.asyncio import AsyncSession
     from sqlalchemy.orm.decl_base import _TableArgsType as TableArgsType  # pyright: ignore[reportPrivateUsage]
     from sqlalchemy.sql import Select
@@ -48,6 +54,9 @@ _POSTGRES_VERSION_SUPPORTING_MERGE: Final = 15
 # Temporary toggle to disable PostgreSQL MERGE due to locking concerns
 _DISABLE_POSTGRES_MERGE: Final = True
 
+# Maximum number of sessions whose content hash is remembered for write elision
+_MAX_TRACKED_SESSIONS: Final = 10_000
+
 
 @declarative_mixin
 class SessionModelMixin(UUIDv7Base):
@@ -119,13 +128,22 @@ class SQLAlchemySessionBackendBase(ServerSideSessionBackend, ABC, Generic[SQLAlc
           SQLAlchemyPlugin.
     """
 
-    __slots__ = ("_model", "_session_maker")
+    __slots__ = (
+        "_model",
+        "_renewal_threshold",
+        "_session_maker",
+        "_skip_unchanged_writes",
+        "_tracked",
+        "_tracked_lock",
+    )
 
     def __init__(
         self,
         config: "ServerSideSessionConfig",
         alchemy_config: "SQLAlchemyConfigT",
         model: "type[SessionModelMixin]",
+        skip_unchanged_writes: bool = True,
+        renewal_threshold: Optional[float] = None,
     ) -> None:
         """Initialize `BaseSQLAlchemyBackend`.
 
@@ -133,10 +151,24 @@ class SQLAlchemySessionBackendBase(ServerSideSessionBackend, ABC, Generic[SQLAlc
             config: An instance of `SQLAlchemyBackendConfig`
             alchemy_config: An instance of `SQLAlchemyConfig`
             model: A mapped model subclassing `SessionModelMixin`
+            skip_unchanged_writes: Skip writing the session data when it is unchanged since
+                it was last loaded or stored by this backend.
+            renewal_threshold: Only renew a session's expiry when its remaining lifetime has
+                dropped below this fraction of ``max_age``. ``None`` renews on every access.
+
+        Raises:
+            ImproperlyConfiguredException: If ``renewal_threshold`` is not in ``(0, 1]``.
         """
+        if renewal_threshold is not None and not 0 < renewal_threshold <= 1:
+            msg = "renewal_threshold must be greater than 0 and at most 1"
+            raise ImproperlyConfiguredException(msg)
         self._model = model
         self._config = config
         self._alchemy = alchemy_config
+        self._skip_unchanged_writes = skip_unchanged_writes
+        self._renewal_threshold = renewal_threshold
+        self._tracked: OrderedDict[str, tuple[bytes, datetime.datetime]] = OrderedDict()
+        self._tracked_lock = threading.Lock()
 
     def __deepcopy__(self, memo: dict[int, Any]) -> "SQLAlchemySessionBackendBase[SQLAlchemyConfigT]":
         """Custom deepcopy implementation to handle unpicklable SQLAlchemy objects."""
@@ -160,6 +192,11 @@ class SQLAlchemySessionBackendBase(ServerSideSessionBackend, ABC, Generic[SQLAlc
         # This is safe because configs are typically shared and immutable
         new_obj._alchemy = self.alchemy  # noqa: SLF001
 
+        new_obj._skip_unchanged_writes = self._skip_unchanged_writes  # noqa: SLF001
+        new_obj._renewal_threshold = self._renewal_threshold  # noqa: SLF001
+        new_obj._tracked = OrderedDict()  # noqa: SLF001
+        new_obj._tracked_lock = threading.Lock()  # noqa: SLF001
+
         return new_obj
 
     def _select_session_obj(self, session_id: str) -> "Select[tuple[SessionModelMixin]]":
@@ -170,6 +207,51 @@ class SQLAlchemySessionBackendBase(ServerSideSessionBackend, ABC, Generic[SQLAlc
             seconds=self.config.max_age
         )
 
+    def _needs_renewal(self, expires_at: datetime.datetime, now: datetime.datetime) -> bool:
+        """Check whether a session's expiry should be pushed back to ``now + max_age``."""
+        if self._renewal_threshold is None:
+            return True
+        if expires_at.tzinfo is None:
+            expires_at = expires_at.replace(tzinfo=datetime.timezone.utc)
+        return (expires_at - now).total_seconds() < self.config.max_age * self._renewal_threshold
+
+    def _track(self, session_id: str, data: bytes, expires_at: datetime.datetime) -> None:
+        """Remember the content hash and expiry of the stored session data."""
+        if not self._skip_unchanged_writes:
+            return
+        digest = hashlib.blake2b(data, digest_size=16).digest()
+        with self._tracked_lock:
+            self._tracked[session_id] = (digest, expires_at)
+            self._tracked.move_to_end(session_id)
+            if len(self._tracked) > _MAX_TRACKED_SESSIONS:
+                self._tracked.popitem(last=False)
+
+    def _forget(self, session_id: Optional[str] = None) -> None:
+        """Drop the tracked state of one session, or of all sessions."""
+        with self._tracked_lock:
+            if session_id is None:
+                self._tracked.clear()
+            else:
+                self._tracked.pop(session_id, None)
+
+    def _tracked_expiry(self, session_id: str, data: bytes) -> Optional[datetime.datetime]:
+        """Return the known expiry of ``session_id`` if its stored data equals ``data``."""
+        if not self._skip_unchanged_writes:
+            return None
+        with self._tracked_lock:
+            tracked = self._tracked.get(session_id)
+        if tracked is None or tracked[0] != hashlib.blake2b(data, digest_size=16).digest():
+            return None
+        return tracked[1]
+
+    def _renew_statement(self, session_id: str, expires_at: datetime.datetime) -> "Update":
+        return (
+            update(self._model)
+            .where(self._model.session_id == session_id)
+            .values(expires_at=expires_at)
+            .execution_options(synchronize_session=False)
+        )
+
     @staticmethod
     def supports_merge(dialect: "Optional[Dialect]" = None, force_disable_merge: bool = False) -> bool:
         """Check if the dialect supports MERGE statements for upserts."""
@@ -196,9 +278,18 @@ class SQLAlchemySessionBackendBase(ServerSideSessionBackend, ABC, Generic[SQLAlc
             and not force_disable_upsert
         )
 
-    @abstractmethod
-    async def delete_expired(self) -> None:
-        """Delete all expired sessions from the database."""
+    async def delete_expired(self, batch_size: int = 1000) -> None:
+        """Delete all expired sessions from the database.
+
+        Rows are deleted in primary-key ordered batches, each in its own transaction,
+        so that large session tables are not locked for the whole cleanup. Use an
+        :class:`~advanced_alchemy.extensions.litestar.reaper.ExpiredRowReaper` to run
+        the cleanup on a schedule.
+
+        Args:
+            batch_size: Maximum number of sessions deleted per transaction.
+        """
+        await ExpiredRowReaper(self._model, self.alchemy, batch_size=batch_size, max_runtime=None).reap()
 
     @property
     def model(self) -> "type[SessionModelMixin]":
@@ -254,18 +345,25 @@ class SQLAlchemyAsyncSessionBackend(SQLAlchemySessionBackendBase[SQLAlchemyAsync
             if session_obj:
                 if not session_obj.is_expired:
                     data = session_obj.data
-                    self._update_session_expiry(session_obj)
-                    await db_session.commit()
+                    if self._needs_renewal(session_obj.expires_at, datetime.datetime.now(datetime.timezone.utc)):
+                        self._update_session_expiry(session_obj)
+                        expires_at = session_obj.expires_at
+                        await db_session.commit()
+                    else:
+                        expires_at = session_obj.expires_at
+                    self._track(session_id, data, expires_at)
                     return data
                 await db_session.delete(session_obj)
                 await db_session.commit()
+        self._forget(session_id)
         return None
 
     async def set(self, /, session_id: str, data: bytes, store: "Store") -> None:
         """Store `data` under the `session_id` for later retrieval.
 
         If there is already data associated with `session_id`, replace
-        it with `data` and reset its expiry time
+        it with `data` and reset its expiry time. Unchanged data is not written again;
+        only the expiry is renewed, subject to the renewal threshold.
 
         Args:
             session_id: The session-ID.
@@ -273,7 +371,19 @@ class SQLAlchemyAsyncSessionBackend(SQLAlchemySessionBackendBase[SQLAlchemyAsync
             store: The store to store the session in (not used in this backend)
         """
         session_id = session_id[:SESSION_ID_MAX_LENGTH] if len(session_id) > SESSION_ID_MAX_LENGTH else session_id
-        expires_at = datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(seconds=self.config.max_age)
+        now = datetime.datetime.now(datetime.timezone.utc)
+        expires_at = now + datetime.timedelta(seconds=self.config.max_age)
+
+        tracked_expiry = self._tracked_expiry(session_id, data)
+        if tracked_expiry is not None:
+            if not self._needs_renewal(tracked_expiry, now):
+                return
+            async with self.alchemy.get_session() as db_session:
+                result = await db_session.execute(self._renew_statement(session_id, expires_at))
+                await db_session.commit()
+            if cast("CursorResult[Any]", result).rowcount:
+                self._track(session_id, data, expires_at)
+                return
 
         async with self.alchemy.get_session() as db_session:
             if db_session.bind is None:  # pyright: ignore[reportUnnecessaryComparison]
@@ -324,6 +434,7 @@ class SQLAlchemyAsyncSessionBackend(SQLAlchemySessionBackendBase[SQLAlchemyAsync
                 session_obj.expires_at = expires_at
 
             await db_session.commit()
+        self._track(session_id, data, expires_at)
 
     async def delete(self, /, session_id: str, store: "Store") -> None:
         """Delete the data associated with `session_id`. Fails silently if no such session-ID exists.
@@ -337,18 +448,14 @@ class SQLAlchemyAsyncSessionBackend(SQLAlchemySessionBackendBase[SQLAlchemyAsync
         async with self.alchemy.get_session() as db_session:
             await db_session.execute(delete(self._model).where(self._model.session_id == session_id))
             await db_session.commit()
+        self._forget(session_id)
 
     async def delete_all(self, /, store: "Store") -> None:
         """Delete all session data."""
         async with self.alchemy.get_session() as db_session:
             await db_session.execute(delete(self._model))
             await db_session.commit()
-
-    async def delete_expired(self) -> None:
-        """Delete all expired session from the database."""
-        async with self.alchemy.get_session() as db_session:
-            await db_session.execute(delete(self._model).where(self._model.is_expired))
-            await db_session.commit()
+        self._forget()
 
 
 class SQLAlchemySyncSessionBackend(SQLAlchemySessionBackendBase[SQLAlchemySyncConfig]):
@@ -366,12 +473,18 @@ class SQLAlchemySyncSessionBackend(SQLAlchemySessionBackendBase[SQLAlchemySyncCo
             if session_obj:
                 if not session_obj.is_expired:
                     data = session_obj.data
-                    self._update_session_expiry(session_obj)
-                    db_session.commit()
+                    if self._needs_renewal(session_obj.expires_at, datetime.datetime.now(datetime.timezone.utc)):
+                        self._update_session_expiry(session_obj)
+                        expires_at = session_obj.expires_at
+                        db_session.commit()
+                    else:
+                        expires_at = session_obj.expires_at
+                    self._track(session_id, data, expires_at)
                     return data
                 db_session.delete(session_obj)
                 db_session.commit()
-            return None
+        self._forget(session_id)
+        return None
 
     async def get(self, /, session_id: str, store: "Store") -> Optional[bytes]:
         """Retrieve data associated with `session_id`.
@@ -387,7 +500,19 @@ class SQLAlchemySyncSessionBackend(SQLAlchemySessionBackendBase[SQLAlchemySyncCo
 
     def _set_sync(self, session_id: str, data: bytes) -> None:
         session_id = session_id[:SESSION_ID_MAX_LENGTH] if len(session_id) > SESSION_ID_MAX_LENGTH else session_id
-        expires_at = datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(seconds=self.config.max_age)
+        now = datetime.datetime.now(datetime.timezone.utc)
+        expires_at = now + datetime.timedelta(seconds=self.config.max_age)
+
+        tracked_expiry = self._tracked_expiry(session_id, data)
+        if tracked_expiry is not None:
+            if not self._needs_renewal(tracked_expiry, now):
+                return
+            with self.alchemy.get_session() as db_session:
+                result = db_session.execute(self._renew_statement(session_id, expires_at))
+                db_session.commit()
+            if cast("CursorResult[Any]", result).rowcount:
+                self._track(session_id, data, expires_at)
+                return
 
         with self.alchemy.get_session() as db_session:
             if db_session.bind is None:
@@ -438,12 +563,14 @@ class SQLAlchemySyncSessionBackend(SQLAlchemySessionBackendBase[SQLAlchemySyncCo
                 session_obj.expires_at = expires_at
 
             db_session.commit()
+        self._track(session_id, data, expires_at)
 
     async def set(self, /, session_id: str, data: bytes, store: "Store") -> None:
         """Store `data` under the `session_id` for later retrieval.
 
         If there is already data associated with `session_id`, replace
-        it with `data` and reset its expiry time
+        it with `data` and reset its expiry time. Unchanged data is not written again;
+        only the expiry is renewed, subject to the renewal threshold.
 
         Args:
             session_id: The session-ID
@@ -458,6 +585,7 @@ class SQLAlchemySyncSessionBackend(SQLAlchemySessionBackendBase[SQLAlchemySyncCo
         with self.alchemy.get_session() as db_session:
             db_session.execute(delete(self._model).where(self._model.session_id == session_id))
             db_session.commit()
+        self._forget(session_id)
 
     async def delete(self, /, session_id: str, store: "Store") -> None:
         """Delete the data associated with `session_id`. Fails silently if no such session-ID exists.
@@ -472,16 +600,8 @@ class SQLAlchemySyncSessionBackend(SQLAlchemySessionBackendBase[SQLAlchemySyncCo
         with self.alchemy.get_session() as db_session:
             db_session.execute(delete(self._model))
             db_session.commit()
+        self._forget()
 
     async def delete_all(self) -> None:
         """Delete all session data."""
         return await async_(self._delete_all_sync)()
-
-    def _delete_expired_sync(self) -> None:
-        with self.alchemy.get_session() as db_session:
-            db_session.execute(delete(self._model).where(self._model.is_expired))
-            db_session.commit()
-
-    async def delete_expired(self) -> None:
-        """Delete all expired session from the database."""
-        return await async_(self._delete_expired_sync)()
@@ -14,6 +14,7 @@ from sqlalchemy import (
     LargeBinary,
     String,
     UniqueConstraint,
+    bindparam,
     delete,
     func,
     insert,
@@ -31,12 +32,14 @@ from advanced_alchemy.extensions.litestar.plugins.init import (
     SQLAlchemyAsyncConfig,
     SQLAlchemySyncConfig,
 )
+from advanced_alchemy.extensions.litestar.reaper import ExpiredRowReaper
 from advanced_alchemy.operations import OnConflictUpsert
 from advanced_alchemy.utils.sync_tools import async_
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncGenerator, Generator
+    from collections.abc import AsyncGenerator, Generator, Iterable, Mapping, Sequence
 
+    from sqlalchemy import Table, Update
     from sqlalchemy.ext.asyncio import AsyncSession
     from sqlalchemy.orm.decl_base import _TableArgsType as TableArgsType  # pyright: ignore[reportPrivateUsage]
     from sqlalchemy.sql.elements import BooleanClauseList
@@ -50,6 +53,16 @@ _POSTGRES_VERSION_SUPPORTING_MERGE: Final = 15
 # Temporary toggle to disable PostgreSQL MERGE due to locking concerns
 _DISABLE_POSTGRES_MERGE: Final = True
 
+# Maximum number of keys sent in one statement by the batch operations
+_BATCH_SIZE: Final = 500
+
+_T = TypeVar("_T")
+
+
+def _chunked(items: "Sequence[_T]") -> "Generator[Sequence[_T], None, None]":
+    for start in range(0, len(items), _BATCH_SIZE):
+        yield items[start : start + _BATCH_SIZE]
+
 
 @declarative_mixin
 class StoreModelMixin(UUIDv7Base):
@@ -361,79 +374,108 @@ class SQLAlchemyStore(NamespacedStore, Generic[SQLAlchemyConfigT]):
         else:
             await async_(self._set_sync)(key, value, expires_in)
 
+    @staticmethod
+    def supports_update_returning(dialect: Optional[Dialect] = None) -> bool:
+        """Check whether the dialect can return columns from an ``UPDATE`` statement.
+
+        Args:
+            dialect: The dialect to check.
+
+        Returns:
+            ``True`` if ``UPDATE ... RETURNING`` (or ``OUTPUT``) is supported.
+        """
+        return bool(dialect and dialect.update_returning)
+
+    @staticmethod
+    def _renew_delta(renew_for: Optional[Union[int, datetime.timedelta]]) -> Optional[datetime.timedelta]:
+        """Normalize ``renew_for`` to a timedelta, or ``None`` when no renewal is requested."""
+        if not renew_for:
+            return None
+        return renew_for if isinstance(renew_for, datetime.timedelta) else datetime.timedelta(seconds=renew_for)
+
+    def _live_criteria(self, db_key: str, db_namespace: Optional[str], now: datetime.datetime) -> tuple[Any, ...]:
+        """Return the criteria matching a key that has not expired."""
+        return (
+            self._model.key == db_key,
+            self._model.namespace == db_namespace,
+            (self._model.expires_at.is_(None)) | (self._model.expires_at > now),
+        )
+
     def _get_sync(self, key: str, renew_for: Optional[Union[int, datetime.timedelta]] = None) -> Optional[bytes]:
         db_key, db_namespace = self._make_key(key)
         now = datetime.datetime.now(datetime.timezone.utc)
+        delta = self._renew_delta(renew_for)
+        criteria = self._live_criteria(db_key, db_namespace, now)
 
-        with self._get_sync_session() as session, session.begin():
+        with self._get_sync_session() as session:
             if session.bind is None:
                 msg = "Database connection is not available"
                 raise ImproperlyConfiguredException(msg)
-            dialect_name = session.bind.dialect.name
+            dialect = session.bind.dialect
 
-            value = session.execute(
-                select(self._model.value).where(
-                    self._model.key == db_key,
-                    self._model.namespace == db_namespace,
-                    (self._model.expires_at.is_(None)) | (self._model.expires_at > now),
-                )
-            ).scalar_one_or_none()
-
-            if value:
-                if renew_for:
-                    delta = (
-                        renew_for
-                        if isinstance(renew_for, datetime.timedelta)
-                        else datetime.timedelta(seconds=renew_for)
-                    )
-                    session.execute(
+            if delta is not None and self.supports_update_returning(dialect):
+                # Renew and read in a single round trip
+                with session.begin():
+                    value = session.execute(
                         update(self._model)
-                        .where(self._model.key == db_key, self._model.namespace == db_namespace)
+                        .where(*criteria)
                         .values(expires_at=now + delta)
-                    )
+                        .returning(self._model.value)
+                        .execution_options(synchronize_session=False)
+                    ).scalar_one_or_none()
+                return self._decode_base64_value(value, dialect.name) if value else None
+
+            # Plain reads and misses need no explicit transaction or commit
+            value = session.execute(select(self._model.value).where(*criteria)).scalar_one_or_none()
+            if not value:
+                return None
+            if delta is not None:
+                session.execute(
+                    update(self._model)
+                    .where(self._model.key == db_key, self._model.namespace == db_namespace)
+                    .values(expires_at=now + delta)
+                )
                 session.commit()
-                return self._decode_base64_value(value, dialect_name)
-
-            session.commit()  # Commit even if not found
-            return None
+            return self._decode_base64_value(value, dialect.name)
 
     async def _get_async(self, key: str, renew_for: Optional[Union[int, datetime.timedelta]] = None) -> Optional[bytes]:
         db_key, db_namespace = self._make_key(key)
         now = datetime.datetime.now(datetime.timezone.utc)
+        delta = self._renew_delta(renew_for)
+        criteria = self._live_criteria(db_key, db_namespace, now)
 
-        async with self._get_async_session() as session, session.begin():
+        async with self._get_async_session() as session:
             if session.bind is None:  # pyright: ignore[reportUnnecessaryComparison]
                 msg = "Database connection is not available"  # type: ignore[unreachable]
                 raise ImproperlyConfiguredException(msg)
-            dialect_name = session.bind.dialect.name
+            dialect = session.bind.dialect
 
-            value = (
+            if delta is not None and self.supports_update_returning(dialect):
+                # Renew and read in a single round trip
+                async with session.begin():
+                    value = (
+                        await session.execute(
+                            update(self._model)
+                            .where(*criteria)
+                            .values(expires_at=now + delta)
+                            .returning(self._model.value)
+                            .execution_options(synchronize_session=False)
+                        )
+                    ).scalar_one_or_none()
+                return self._decode_base64_value(value, dialect.name) if value else None
+
+            # Plain reads and misses need no explicit transaction or commit
+            value = (await session.execute(select(self._model.value).where(*criteria))).scalar_one_or_none()
+            if not value:
+                return None
+            if delta is not None:
                 await session.execute(
-                    select(self._model.value).where(
-                        self._model.key == db_key,
-                        self._model.namespace == db_namespace,
-                        (self._model.expires_at.is_(None)) | (self._model.expires_at > now),
-                    )
+                    update(self._model)
+                    .where(self._model.key == db_key, self._model.namespace == db_namespace)
+                    .values(expires_at=now + delta)
                 )
-            ).scalar_one_or_none()
-
-            if value:
-                if renew_for:
-                    delta = (
-                        renew_for
-                        if isinstance(renew_for, datetime.timedelta)
-                        else datetime.timedelta(seconds=renew_for)
-                    )
-                    await session.execute(
-                        update(self._model)
-                        .where(self._model.key == db_key, self._model.namespace == db_namespace)
-                        .values(expires_at=now + delta)
-                    )
                 await session.commit()
-                return self._decode_base64_value(value, dialect_name)
-
-            await session.commit()  # Commit even if not found
-            return None
+            return self._decode_base64_value(value, dialect.name)
 
     async def get(self, key: str, renew_for: Optional[Union[int, datetime.timedelta]] = None) -> Optional[bytes]:
         """Get a value. Handles both sync and async backends.
@@ -474,6 +516,220 @@ class SQLAlchemyStore(NamespacedStore, Generic[SQLAlchemyConfigT]):
         else:
             await async_(self._delete_sync)(key)
 
+    def _batch_rows(
+        self,
+        values: "Mapping[str, Union[bytes, str]]",
+        expires_in: Optional[Union[int, datetime.timedelta]],
+    ) -> list[dict[str, Any]]:
+        """Build one row per key for :meth:`set_many`."""
+        expires_at: Optional[datetime.datetime] = None
+        if expires_in is not None:
+            delta = expires_in if isinstance(expires_in, datetime.timedelta) else datetime.timedelta(seconds=expires_in)
+            expires_at = datetime.datetime.now(datetime.timezone.utc) + delta
+        return [
+            {
+                "key": key,
+                "namespace": self.namespace,
+                "value": value if isinstance(value, bytes) else value.encode("utf-8"),
+                "expires_at": expires_at,
+            }
+            for key, value in values.items()
+        ]
+
+    def _batch_update_statement(self) -> "Update":
+        """Return an executemany-friendly ``UPDATE`` for rows of existing keys."""
+        table = cast("Table", self._model.__table__)
+        return (
+            update(table)
+            .where(table.c.key == bindparam("b_key"), table.c.namespace == bindparam("b_namespace"))
+            .values(value=bindparam("b_value"), expires_at=bindparam("b_expires_at"))
+        )
+
+    def _get_many_sync(self, keys: "Sequence[str]") -> dict[str, bytes]:
+        now = datetime.datetime.now(datetime.timezone.utc)
+        found: dict[str, bytes] = {}
+        with self._get_sync_session() as session:
+            if session.bind is None:
+                msg = "Database connection is not available"
+                raise ImproperlyConfiguredException(msg)
+            dialect_name = session.bind.dialect.name
+            for chunk in _chunked(keys):
+                rows = session.execute(
+                    select(self._model.key, self._model.value).where(
+                        self._model.key.in_(chunk),
+                        self._model.namespace == self.namespace,
+                        (self._model.expires_at.is_(None)) | (self._model.expires_at > now),
+                    )
+                )
+                for key, value in rows:
+                    if value:
+                        found[key] = cast("bytes", self._decode_base64_value(value, dialect_name))
+        return found
+
+    async def _get_many_async(self, keys: "Sequence[str]") -> dict[str, bytes]:
+        now = datetime.datetime.now(datetime.timezone.utc)
+        found: dict[str, bytes] = {}
+        async with self._get_async_session() as session:
+            if session.bind is None:  # pyright: ignore[reportUnnecessaryComparison]
+                msg = "Database connection is not available"  # type: ignore[unreachable]
+                raise ImproperlyConfiguredException(msg)
+            dialect_name = session.bind.dialect.name
+            for chunk in _chunked(keys):
+                rows = await session.execute(
+                    select(self._model.key, self._model.value).where(
+                        self._model.key.in_(chunk),
+                        self._model.namespace == self.namespace,
+                        (self._model.expires_at.is_(None)) | (self._model.expires_at > now),
+                    )
+                )
+                for key, value in rows:
+                    if value:
+                        found[key] = cast("bytes", self._decode_base64_value(value, dialect_name))
+        return found
+
+    async def get_many(self, keys: "Iterable[str]") -> dict[str, bytes]:
+        """Get several values at once. Handles both sync and async backends.
+
+        Keys are fetched with one ``IN`` query per batch of up to 500 keys, in a single session.
+
+        Args:
+            keys: The keys to get the values for.
+
+        Returns:
+            A mapping of key to value. Keys that do not exist or have expired are omitted.
+        """
+        unique_keys = list(dict.fromkeys(keys))
+        if not unique_keys:
+            return {}
+        if self._is_async:
+            return await self._get_many_async(unique_keys)
+        return await async_(self._get_many_sync)(unique_keys)
+
+    def _set_many_sync(self, rows: list[dict[str, Any]]) -> None:
+        with self._get_sync_session() as session, session.begin():
+            if session.bind is None:
+                msg = "Database connection is not available"
+                raise ImproperlyConfiguredException(msg)
+            dialect_name = session.bind.dialect.name
+            for chunk in _chunked(rows):
+                if OnConflictUpsert.supports_native_upsert(dialect_name):
+                    session.execute(
+                        OnConflictUpsert.create_upsert(
+                            table=self._model.__table__,  # type: ignore[arg-type]
+                            values=list(chunk),
+                            conflict_columns=["key", "namespace"],
+                            update_columns=["value", "expires_at"],
+                            dialect_name=dialect_name,
+                        )
+                    )
+                    continue
+                # Fallback logic: find existing keys, then update and insert in bulk
+                existing = set(
+                    session.execute(
+                        select(self._model.key).where(
+                            self._model.key.in_([row["key"] for row in chunk]),
+                            self._model.namespace == self.namespace,
+                        )
+                    ).scalars()
+                )
+                updates = [
+                    {f"b_{name}": value for name, value in row.items()} for row in chunk if row["key"] in existing
+                ]
+                inserts = [row for row in chunk if row["key"] not in existing]
+                if updates:
+                    session.execute(self._batch_update_statement(), updates)
+                if inserts:
+                    session.execute(insert(self._model), inserts)
+
+    async def _set_many_async(self, rows: list[dict[str, Any]]) -> None:
+        async with self._get_async_session() as session, session.begin():
+            if session.bind is None:  # pyright: ignore[reportUnnecessaryComparison]
+                msg = "Database connection is not available"  # type: ignore[unreachable]
+                raise ImproperlyConfiguredException(msg)
+            dialect_name = session.bind.dialect.name
+            for chunk in _chunked(rows):
+                if OnConflictUpsert.supports_native_upsert(dialect_name):
+                    await session.execute(
+                        OnConflictUpsert.create_upsert(
+                            table=self._model.__table__,  # type: ignore[arg-type]
+                            values=list(chunk),
+                            conflict_columns=["key", "namespace"],
+                            update_columns=["value", "expires_at"],
+                            dialect_name=dialect_name,
+                        )
+                    )
+                    continue
+                # Fallback logic: find existing keys, then update and insert in bulk
+                existing = set(
+                    (
+                        await session.execute(
+                            select(self._model.key).where(
+                                self._model.key.in_([row["key"] for row in chunk]),
+                                self._model.namespace == self.namespace,
+                            )
+                        )
+                    ).scalars()
+                )
+                updates = [
+                    {f"b_{name}": value for name, value in row.items()} for row in chunk if row["key"] in existing
+                ]
+                inserts = [row for row in chunk if row["key"] not in existing]
+                if updates:
+                    await session.execute(self._batch_update_statement(), updates)
+                if inserts:
+                    await session.execute(insert(self._model), inserts)
+
+    async def set_many(
+        self,
+        values: "Mapping[str, Union[bytes, str]]",
+        expires_in: Optional[Union[int, datetime.timedelta]] = None,
+    ) -> None:
+        """Set several values at once in a single transaction. Handles both sync and async backends.
+
+        On dialects with native upserts, each batch of up to 500 keys is written with one
+        multi-row ``INSERT ... ON CONFLICT`` statement. Other dialects look up the existing
+        keys of the batch and then update and insert them in bulk.
+
+        Args:
+            values: A mapping of key to value.
+            expires_in: Expiry applied to every value, in seconds or as a timedelta.
+        """
+        rows = self._batch_rows(values, expires_in)
+        if not rows:
+            return
+        if self._is_async:
+            await self._set_many_async(rows)
+        else:
+            await async_(self._set_many_sync)(rows)
+
+    def _delete_many_sync(self, keys: "Sequence[str]") -> None:
+        with self._get_sync_session() as session, session.begin():
+            for chunk in _chunked(keys):
+                session.execute(
+                    delete(self._model).where(self._model.key.in_(chunk), self._model.namespace == self.namespace)
+                )
+
+    async def _delete_many_async(self, keys: "Sequence[str]") -> None:
+        async with self._get_async_session() as session, session.begin():
+            for chunk in _chunked(keys):
+                await session.execute(
+                    delete(self._model).where(self._model.key.in_(chunk), self._model.namespace == self.namespace)
+                )
+
+    async def delete_many(self, keys: "Iterable[str]") -> None:
+        """Delete several values at once in a single transaction. Handles both sync and async backends.
+
+        Args:
+            keys: The keys to delete.
+        """
+        unique_keys = list(dict.fromkeys(keys))
+        if not unique_keys:
+            return
+        if self._is_async:
+            await self._delete_many_async(unique_keys)
+        else:
+            await async_(self._delete_many_sync)(unique_keys)
+
     def _delete_all_sync(self) -> None:
         if self.namespace is None:
             msg = "Cannot perform delete operation: No namespace configured"
@@ -503,6 +759,27 @@ class SQLAlchemyStore(NamespacedStore, Generic[SQLAlchemyConfigT]):
         else:
             await async_(self._delete_all_sync)()
 
+    async def delete_expired(self, batch_size: int = 1000) -> int:
+        """Delete all expired values in the namespace in primary-key ordered batches.
+
+        Each batch is deleted in its own transaction. Use an
+        :class:`~advanced_alchemy.extensions.litestar.reaper.ExpiredRowReaper` to run
+        the cleanup on a schedule.
+
+        Args:
+            batch_size: Maximum number of values deleted per transaction.
+
+        Returns:
+            The number of deleted values.
+        """
+        namespace_criterion = (
+            self._model.namespace == self.namespace if self.namespace is not None else self._model.namespace.is_(None)
+        )
+        reaper = ExpiredRowReaper(
+            self._model, self._config, batch_size=batch_size, max_runtime=None, criteria=(namespace_criterion,)
+        )
+        return await reaper.reap()
+
     def _exists_sync(self, key: str) -> bool:
         db_key, db_namespace = self._make_key(key)
         now = datetime.datetime.now(datetime.timezone.utc)
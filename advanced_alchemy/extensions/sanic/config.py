@@ -210,6 +210,7 @@ class SQLAlchemyAsyncConfig(_SQLAlchemyAsyncConfig):
         """Initialize the Sanic application with this configuration."""
         if self.create_all:
             await self.create_all_metadata()
+        await self.prewarm_engines()
 
     def create_session_maker(self) -> Callable[[], "AsyncSession"]:
         """Get a session maker. If none exists yet, create one.
@@ -423,6 +424,7 @@ class SQLAlchemySyncConfig(_SQLAlchemySyncConfig):
         """Initialize the Sanic application with this configuration."""
         if self.create_all:
             await self.create_all_metadata()
+        await asyncio.get_event_loop().run_in_executor(None, self.prewarm_engines)
 
     def create_session_maker(self) -> Callable[[], "Session"]:
         """Get a session maker. If none exists yet, create one.
@@ -241,6 +241,7 @@ class SQLAlchemyAsyncConfig(_SQLAlchemyAsyncConfig):
         """Initialize the Starlette application with this configuration."""
         if self.create_all:
             await self.create_all_metadata()
+        await self.prewarm_engines()
 
     def create_session_maker(self) -> Callable[[], "AsyncSession"]:
         """Get a session maker. If none exists yet, create one.
@@ -404,6 +405,7 @@ class SQLAlchemySyncConfig(_SQLAlchemySyncConfig):
         """Initialize the Starlette application with this configuration."""
         if self.create_all:
             await self.create_all_metadata()
+        await run_in_threadpool(self.prewarm_engines)
 
     def create_session_maker(self) -> Callable[[], "Session"]:
         """Get a session maker. If none exists yet, create one.
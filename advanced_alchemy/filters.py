@@ -21,9 +21,12 @@ See Also:
 
 import datetime
 import logging
+import re
 from abc import ABC, abstractmethod
-from collections.abc import Collection
+from collections.abc import Collection, Sequence
 from dataclasses import dataclass
+from decimal import Decimal
+from functools import lru_cache
 from operator import attrgetter
 from typing import (
     TYPE_CHECKING,
@@ -36,32 +39,53 @@ from typing import (
     Union,
     cast,
 )
+from uuid import UUID
 
 from sqlalchemy import (
+    ARRAY,
     BinaryExpression,
+    BindParameter,
+    Boolean,
     ColumnElement,
     Date,
     Delete,
     Select,
     Update,
+    all_,
     and_,
     any_,
+    bindparam,
+    case,
     exists,
     false,
+    func,
+    literal,
+    literal_column,
     not_,
+    null,
     or_,
     select,
     text,
     true,
 )
+from sqlalchemy.dialects.mysql import match
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.exc import CompileError
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.sql import operators as op
 from sqlalchemy.sql.dml import ReturningDelete, ReturningUpdate
+from sqlalchemy.sql.elements import ClauseList
+from sqlalchemy.sql.visitors import InternalTraversal, cloned_traverse
+from sqlalchemy.types import Float, String
 from typing_extensions import TypeAlias, TypedDict, TypeVar
 
 from advanced_alchemy.base import ModelProtocol
+from advanced_alchemy.mixins.fulltext import fts5_table_name, tsvector_expression
+from advanced_alchemy.operations import validate_identifier
 
 if TYPE_CHECKING:
     from sqlalchemy.orm import InstrumentedAttribute
+    from sqlalchemy.sql.compiler import SQLCompiler
 
     FilterFieldName: TypeAlias = Union[str, ColumnElement[Any], InstrumentedAttribute[Any]]
     InstrumentedField: TypeAlias = Union[ColumnElement[Any], InstrumentedAttribute[Any]]
@@ -79,6 +103,7 @@ __all__ = (
     "FilterGroup",
     "FilterMap",
     "FilterTypes",
+    "FullTextSearchFilter",
     "InAnyFilter",
     "LimitOffset",
     "LogicalOperatorMap",
@@ -95,11 +120,13 @@ __all__ = (
     "StatementFilter",
     "StatementFilterT",
     "StatementTypeT",
+    "VectorSimilarityFilter",
 )
 
 T = TypeVar("T")
 ModelT = TypeVar("ModelT", bound=ModelProtocol)
 StatementFilterT = TypeVar("StatementFilterT", bound="StatementFilter")
+_FullTextExpressionT = TypeVar("_FullTextExpressionT", bound="_FullTextExpression")
 StatementTypeT = TypeVar(
     "StatementTypeT",
     bound=Union[
@@ -124,6 +151,7 @@ class FilterMap(TypedDict):
     order_by: "type[OrderBy]"
     search: "type[SearchFilter]"
     not_in_search: "type[NotInSearchFilter]"
+    full_text_search: "type[FullTextSearchFilter]"
     comparison: "type[ComparisonFilter]"
     exists: "type[ExistsFilter]"
     not_exists: "type[NotExistsFilter]"
@@ -277,13 +305,132 @@ class OnBeforeAfter(StatementFilter):
         return statement
 
 
+def _python_type(field: "InstrumentedField") -> Optional[type[Any]]:
+    try:
+        return cast("Optional[type[Any]]", getattr(field.type, "python_type", None))
+    except NotImplementedError:
+        return None
+
+
+_LITERAL_TYPES = frozenset({int, str, Decimal, UUID, datetime.date, datetime.datetime, datetime.time})
+"""Python types whose values can be rendered as literals by the column type."""
+
+
+def _is_literal_safe(items: "list[Any]", field: "InstrumentedField") -> bool:
+    python_type = _python_type(field)
+    return python_type in _LITERAL_TYPES and all(type(item) is python_type for item in items)
+
+
+class _InValues(ColumnElement[bool]):
+    """Membership test against an inline ``VALUES`` list.
+
+    The values are rendered as literals through the column type, so they bind no
+    parameters.  Statements containing this element are not cached, as each list
+    would add a cache entry.  When the column type cannot render its values as
+    literals on the dialect, a regular ``IN (...)`` is compiled instead.
+    """
+
+    inherit_cache = False
+    _traverse_internals = [
+        ("column", InternalTraversal.dp_clauseelement),
+        ("negate", InternalTraversal.dp_boolean),
+    ]
+
+    def __init__(self, column: InstrumentedField, items: "list[Any]", negate: bool = False) -> None:
+        self.column = column.expression
+        self.items = items
+        self.negate = negate
+        self.type = Boolean()
+
+    def self_group(self, against: Optional[Any] = None) -> "ColumnElement[Any]":
+        return self
+
+
+def _render_values(element: _InValues, compiler: "SQLCompiler", typed: bool) -> str:
+    column_type = element.column.type
+    if not typed or all(type(item) in {int, str} for item in element.items):
+        return ", ".join(f"({compiler.render_literal_value(item, column_type)})" for item in element.items)
+    return ", ".join(
+        f"({compiler.process(literal(item, column_type).cast(column_type), literal_binds=True)})"
+        for item in element.items
+    )
+
+
+def _compile_in_list(element: _InValues, compiler: "SQLCompiler", **kw: Any) -> str:
+    column = element.column
+    return compiler.process(column.not_in(element.items) if element.negate else column.in_(element.items), **kw)
+
+
+@compiles(_InValues)
+def _compile_in_values(element: _InValues, compiler: "SQLCompiler", **kw: Any) -> str:
+    try:
+        values_list = _render_values(element, compiler, typed=True)
+    except (CompileError, NotImplementedError):
+        return _compile_in_list(element, compiler, **kw)
+    operator = "NOT IN" if element.negate else "IN"
+    column = compiler.process(element.column, **kw)
+    return f"({column} {operator} (SELECT value FROM (VALUES {values_list}) AS in_values (value)))"  # noqa: S608
+
+
+@compiles(_InValues, "sqlite")
+def _compile_in_values_sqlite(element: _InValues, compiler: "SQLCompiler", **kw: Any) -> str:
+    # SQLite compares stored values with untyped literals, and ``CAST`` to a date type yields a number.
+    try:
+        values_list = _render_values(element, compiler, typed=False)
+    except (CompileError, NotImplementedError):
+        return _compile_in_list(element, compiler, **kw)
+    operator = "NOT IN" if element.negate else "IN"
+    return f"({compiler.process(element.column, **kw)} {operator} (VALUES {values_list}))"
+
+
 class InAnyFilter(StatementFilter, ABC):
     """Base class for filters using IN or ANY operators.
 
     This abstract class provides common functionality for filters that check
     membership in a collection using either the SQL IN operator or the ANY operator.
+
+    The membership test is chosen per statement:
+
+    * ``= ANY(:values)`` / ``!= ALL(:values)`` with a single array parameter typed as
+      an array of the column type when ``prefer_any`` is set, so each value goes
+      through the column's bind processing.  Repositories only set it for values
+      that are safe to bind as an array.
+    * A join against an inline ``VALUES`` derived table when the collection is
+      larger than ``values_threshold`` and holds integers, strings, decimals, UUIDs,
+      dates or times of the column's type, which keeps large lists clear of driver
+      parameter limits such as SQL Server's 2100.
+    * ``IN (...)`` / ``NOT IN (...)`` otherwise.
     """
 
+    def _get_membership_clause(
+        self,
+        field: "InstrumentedField",
+        collection: "Collection[Any]",
+        negate: bool,
+        prefer_any: bool,
+        values_threshold: Optional[int],
+    ) -> "ColumnElement[bool]":
+        """Build the membership condition for a non-empty collection of values.
+
+        Args:
+            field: The column or expression being tested.
+            collection: Values to test the field against.
+            negate: Whether to test for absence rather than presence.
+            prefer_any: Whether the dialect supports array parameters with ``ANY``.
+            values_threshold: Collection size above which a ``VALUES`` derived table is
+                used, or ``None`` when the dialect does not support one.
+
+        Returns:
+            The membership condition.
+        """
+        items = list(collection)
+        if prefer_any:
+            array = bindparam(None, items, type_=ARRAY(field.type))
+            return all_(array) != field if negate else any_(array) == field
+        if values_threshold is not None and len(items) > values_threshold and _is_literal_safe(items, field):
+            return _InValues(field, items, negate)
+        return field.not_in(items) if negate else field.in_(items)
+
 
 @dataclass
 class CollectionFilter(InAnyFilter, Generic[T]):
@@ -291,8 +438,9 @@ class CollectionFilter(InAnyFilter, Generic[T]):
 
     This filter restricts records based on a field's presence in a collection of values.
 
-    The filter supports both ``IN`` and ``ANY`` operators for collection membership testing.
-    Use ``prefer_any=True`` in ``append_to_statement`` to use the ``ANY`` operator.
+    The filter supports ``IN``, ``ANY`` and ``VALUES`` derived-table membership testing.
+    Use ``prefer_any=True`` in ``append_to_statement`` to use the ``ANY`` operator, and
+    ``values_threshold`` to join large collections against a ``VALUES`` list.
     """
 
     field_name: FilterFieldName
@@ -306,6 +454,7 @@ class CollectionFilter(InAnyFilter, Generic[T]):
         statement: StatementTypeT,
         model: type[ModelT],
         prefer_any: bool = False,
+        values_threshold: Optional[int] = None,
     ) -> StatementTypeT:
         """Apply a WHERE ... IN or WHERE ... ANY (...) clause to the statement.
 
@@ -318,6 +467,9 @@ class CollectionFilter(InAnyFilter, Generic[T]):
         prefer_any : bool, optional
             If True, uses the SQLAlchemy :func:`any_` operator instead of
             :func:`in_` for the filter condition
+        values_threshold : int | None, optional
+            If set, collections of integers or strings larger than this are
+            matched against a ``VALUES`` derived table instead of bound parameters
 
         Returns:
         --------
@@ -327,12 +479,14 @@ class CollectionFilter(InAnyFilter, Generic[T]):
         field = self._get_instrumented_attr(model, self.field_name)
         if self.values is None:
             return statement
+        values: Any = self.values  # a bound parameter when compiled by ``MultiFilter``
+        if isinstance(values, BindParameter):
+            return cast("StatementTypeT", statement.where(field.in_(values)))
         if not self.values:
             # Return empty result set by forcing a false condition
             return cast("StatementTypeT", statement.where(text("1=-1")))
-        if prefer_any:
-            return cast("StatementTypeT", statement.where(any_(self.values) == field))  # type: ignore[arg-type]
-        return cast("StatementTypeT", statement.where(field.in_(self.values)))
+        clause = self._get_membership_clause(field, self.values, False, prefer_any, values_threshold)
+        return cast("StatementTypeT", statement.where(clause))
 
 
 @dataclass
@@ -366,8 +520,9 @@ class NotInCollectionFilter(InAnyFilter, Generic[T]):
 
     This filter restricts records based on a field's absence in a collection of values.
 
-    The filter supports both ``NOT IN`` and ``!= ANY`` operators for collection exclusion.
-    Use ``prefer_any=True`` in ``append_to_statement`` to use the ``ANY`` operator.
+    The filter supports ``NOT IN``, ``!= ALL`` and ``VALUES`` derived-table exclusion.
+    Use ``prefer_any=True`` in ``append_to_statement`` to use the ``ALL`` operator, and
+    ``values_threshold`` to test large collections against a ``VALUES`` list.
 
     Parameters
     ----------
@@ -389,8 +544,9 @@ class NotInCollectionFilter(InAnyFilter, Generic[T]):
         statement: StatementTypeT,
         model: type[ModelT],
         prefer_any: bool = False,
+        values_threshold: Optional[int] = None,
     ) -> StatementTypeT:
-        """Apply a WHERE ... NOT IN or WHERE ... != ANY(...) clause to the statement.
+        """Apply a WHERE ... NOT IN or WHERE ... != ALL(...) clause to the statement.
 
         Parameters
         ----------
@@ -399,8 +555,11 @@ class NotInCollectionFilter(InAnyFilter, Generic[T]):
         model : type[ModelT]
             The SQLAlchemy model class
         prefer_any : bool, optional
-            If True, uses the SQLAlchemy :func:`any_` operator instead of
+            If True, uses the SQLAlchemy :func:`all_` operator instead of
             :func:`notin_` for the filter condition
+        values_threshold : int | None, optional
+            If set, collections of integers or strings larger than this are
+            tested against a ``VALUES`` derived table instead of bound parameters
 
         Returns:
         --------
@@ -408,12 +567,14 @@ class NotInCollectionFilter(InAnyFilter, Generic[T]):
             Modified statement with the appropriate NOT IN conditions
         """
         field = self._get_instrumented_attr(model, self.field_name)
+        values: Any = self.values  # a bound parameter when compiled by ``MultiFilter``
+        if isinstance(values, BindParameter):
+            return cast("StatementTypeT", statement.where(field.not_in(values)))
         if not self.values:
             # If None or empty, we do not modify the statement
             return statement
-        if prefer_any:
-            return cast("StatementTypeT", statement.where(any_(self.values) != field))  # type: ignore[arg-type]
-        return cast("StatementTypeT", statement.where(field.notin_(self.values)))
+        clause = self._get_membership_clause(field, self.values, True, prefer_any, values_threshold)
+        return cast("StatementTypeT", statement.where(clause))
 
 
 @dataclass
@@ -619,16 +780,73 @@ class OrderBy(StatementFilter):
         return statement
 
 
+def _escape_like(value: str) -> str:
+    return value.replace("/", "//").replace("%", "/%").replace("_", "/_")
+
+
+def _search_pattern(value: str, mode: str, ignore_case: Optional[bool]) -> str:
+    if mode == "prefix":
+        pattern = f"{_escape_like(value)}%"
+        return pattern.lower() if ignore_case else pattern
+    return f"%{value}%"
+
+
+class _TrigramMatch(ColumnElement[bool]):
+    """Dialect-deferred trigram similarity match.
+
+    Renders the pg_trgm ``%`` operator on PostgreSQL and a case-insensitive
+    substring ``LIKE`` on other dialects, negated when ``negate`` is set.
+    """
+
+    _traverse_internals = [
+        ("column", InternalTraversal.dp_clauseelement),
+        ("value", InternalTraversal.dp_clauseelement),
+        ("pattern", InternalTraversal.dp_clauseelement),
+        ("negate", InternalTraversal.dp_boolean),
+    ]
+
+    def __init__(self, column: InstrumentedField, value: str, negate: bool = False) -> None:
+        self.column = column.expression
+        self.value = literal(value, String())
+        self.pattern = literal(f"%{value}%", String())
+        self.negate = negate
+        self.type = Boolean()
+
+    def self_group(self, against: Optional[Any] = None) -> "ColumnElement[Any]":
+        return self
+
+
+@compiles(_TrigramMatch)
+def _compile_trigram_match(element: _TrigramMatch, compiler: "SQLCompiler", **kw: Any) -> str:
+    like = element.column.not_ilike if element.negate else element.column.ilike
+    return f"({compiler.process(like(element.pattern), **kw)})"
+
+
+@compiles(_TrigramMatch, "postgresql")
+def _compile_trigram_match_postgresql(element: _TrigramMatch, compiler: "SQLCompiler", **kw: Any) -> str:
+    match = f"({compiler.process(element.column.op('%')(element.value), **kw)})"
+    return f"(NOT {match})" if element.negate else match
+
+
 @dataclass
 class SearchFilter(StatementFilter):
-    """Case-sensitive or case-insensitive substring matching filter.
+    """Case-sensitive or case-insensitive text matching filter.
 
     Implements text search using SQL LIKE or ILIKE operators. Can search across
     multiple fields using OR conditions.
 
     Note:
-        The search pattern automatically adds wildcards before and after the search
-        value, equivalent to SQL pattern '%value%'.
+        ``mode`` selects how the value is matched:
+
+        - ``contains`` adds wildcards before and after the search value, equivalent
+          to the SQL pattern '%value%'.  This can't use a B-tree index.
+        - ``prefix`` matches 'value%' with LIKE wildcards in the value escaped, and
+          compares ``lower()`` of the field when ignoring case.  A B-tree index, or
+          on PostgreSQL :func:`~advanced_alchemy.mixins.fulltext.prefix_index`,
+          serves it.
+        - ``trigram`` uses the pg_trgm ``%`` similarity operator on PostgreSQL,
+          served by :func:`~advanced_alchemy.mixins.fulltext.trigram_index`, and is
+          always case-insensitive.  Other dialects fall back to ``contains``.
 
     See Also:
         - :class:`.NotInSearchFilter`: Opposite filter using NOT LIKE/ILIKE
@@ -642,6 +860,8 @@ class SearchFilter(StatementFilter):
     """Text to match within the field(s)."""
     ignore_case: Optional[bool] = False
     """Whether to use case-insensitive matching."""
+    mode: Literal["contains", "prefix", "trigram"] = "contains"
+    """How the value is matched: as a substring, a prefix or by trigram similarity."""
 
     @property
     def _operator(self) -> Callable[..., ColumnElement[bool]]:
@@ -668,6 +888,35 @@ class SearchFilter(StatementFilter):
         """
         return attrgetter("ilike" if self.ignore_case else "like")
 
+    @property
+    def _case_sensitive_func(self) -> "attrgetter[Callable[..., BinaryExpression[bool]]]":
+        """Return the LIKE operator as a function, regardless of ``ignore_case``.
+
+        Returns:
+            attrgetter: Bound method for LIKE operations
+        """
+        return attrgetter("like")
+
+    def _get_search_clause(self, field: InstrumentedField) -> ColumnElement[bool]:
+        """Generate the clause matching the value in a single field.
+
+        Args:
+            field: The field to search
+
+        Returns:
+            ColumnElement[bool]: The text matching expression
+        """
+        if self.mode == "trigram":
+            return _TrigramMatch(field, self.value)
+        pattern: Any = self.value  # a bound parameter holding the pattern when compiled by ``MultiFilter``
+        if not isinstance(pattern, BindParameter):
+            pattern = _search_pattern(pattern, self.mode, self.ignore_case)
+        if self.mode == "prefix":
+            if self.ignore_case:
+                return self._case_sensitive_func(func.lower(field))(pattern, escape="/")
+            return self._case_sensitive_func(field)(pattern, escape="/")
+        return self._func(field)(pattern)
+
     @property
     def normalized_field_names(self) -> set[str]:
         """Convert field_name to a set if it's a single string.
@@ -677,30 +926,47 @@ class SearchFilter(StatementFilter):
         """
         return {self.field_name} if isinstance(self.field_name, str) else self.field_name
 
-    def get_search_clauses(self, model: type[ModelT]) -> list[BinaryExpression[bool]]:
-        """Generate the LIKE/ILIKE clauses for all specified fields.
+    def get_search_clauses(self, model: type[ModelT]) -> list[ColumnElement[bool]]:
+        """Generate the text matching clauses for all specified fields.
 
         Args:
             model: The SQLAlchemy model class
 
         Returns:
-            list[BinaryExpression[bool]]: List of text matching expressions
+            list[ColumnElement[bool]]: List of text matching expressions
 
         See Also:
             :class:`sqlalchemy.sql.expression.BinaryExpression`: SQLAlchemy expression
         """
-        search_clause: list[BinaryExpression[bool]] = []
+        search_clause: list[ColumnElement[bool]] = []
         for field_name in self.normalized_field_names:
             try:
                 field = self._get_instrumented_attr(model, field_name)
-                search_text = f"%{self.value}%"
-                search_clause.append(self._func(field)(search_text))
+                search_clause.append(self._get_search_clause(field))
             except AttributeError:
                 msg = f"Skipping search for field {field_name}.  It is not found in model {model.__name__}"
                 logger.debug(msg)
                 continue
         return search_clause
 
+    def similarity(self, model: type[ModelT]) -> ColumnElement[Any]:
+        """Generate the pg_trgm similarity of the value to the closest matching field.
+
+        Pass it to :class:`.OrderBy` with ``sort_order="desc"`` to rank ``trigram``
+        matches.  Requires PostgreSQL with the pg_trgm extension.
+
+        Args:
+            model: The SQLAlchemy model class
+
+        Returns:
+            ColumnElement[Any]: The similarity expression, between 0 and 1
+        """
+        scores = [
+            func.similarity(self._get_instrumented_attr(model, field_name), self.value)
+            for field_name in sorted(self.normalized_field_names)
+        ]
+        return scores[0] if len(scores) == 1 else func.greatest(*scores)
+
     def append_to_statement(self, statement: StatementTypeT, model: type[ModelT]) -> StatementTypeT:
         """Append a LIKE/ILIKE clause to the statement.
 
@@ -737,7 +1003,7 @@ operators_map: dict[str, Callable[[Any, Any], ColumnElement[bool]]] = {
     "startswith": op.startswith_op,
     "istartswith": lambda c, v: c.ilike(v + "%"),
     "endswith": op.endswith_op,
-    "iendswith": lambda c, v: c.ilike(v + "%"),
+    "iendswith": lambda c, v: c.ilike("%" + v),
     "dateeq": lambda c, v: cast("Date", c) == v,
 }
 
@@ -803,6 +1069,7 @@ class NotInSearchFilter(SearchFilter):
         field_name: Name or set of names of model attributes to search on
         value: Text to exclude from the field(s)
         ignore_case: If True, uses NOT ILIKE for case-insensitive matching
+        mode: How the value is matched, as for :class:`.SearchFilter`
 
     Note:
         Uses AND for multiple fields, meaning records matching any field will be excluded.
@@ -838,6 +1105,404 @@ class NotInSearchFilter(SearchFilter):
         """
         return attrgetter("not_ilike" if self.ignore_case else "not_like")
 
+    @property
+    def _case_sensitive_func(self) -> "attrgetter[Callable[..., BinaryExpression[bool]]]":
+        """Return the NOT LIKE operator as a function, regardless of ``ignore_case``.
+
+        Returns:
+            attrgetter: Bound method for NOT LIKE operations
+        """
+        return attrgetter("not_like")
+
+    def _get_search_clause(self, field: InstrumentedField) -> ColumnElement[bool]:
+        """Generate the clause excluding the value from a single field.
+
+        Args:
+            field: The field to search
+
+        Returns:
+            ColumnElement[bool]: The negated text matching expression
+        """
+        if self.mode == "trigram":
+            return _TrigramMatch(field, self.value, negate=True)
+        return super()._get_search_clause(field)
+
+
+_WEBSEARCH_TOKEN = re.compile(r'(-?)"([^"]*)"?|(\S+)')
+
+
+def _websearch_to_fts5(value: str) -> str:
+    """Translate ``websearch_to_tsquery`` syntax into an SQLite FTS5 query.
+
+    Words and quoted phrases are required, ``or`` between terms makes either one
+    sufficient and a leading ``-`` excludes a term.  Every term is emitted as a
+    quoted FTS5 string, so user input can't inject FTS5 operators.
+
+    Args:
+        value: The search text.
+
+    Returns:
+        str: The FTS5 query, or an empty string if the text has no required terms.
+    """
+    groups: list[list[str]] = []
+    excluded: list[str] = []
+    pending_or = False
+    for negate, phrase, word in _WEBSEARCH_TOKEN.findall(value):
+        if word:
+            if word.lower() == "or":
+                pending_or = bool(groups)
+                continue
+            negate, phrase = ("-", word[1:]) if word.startswith("-") else ("", word)
+        if not phrase.strip():
+            continue
+        term = '"' + phrase.replace('"', '""') + '"'
+        if negate:
+            excluded.append(term)
+        elif pending_or:
+            groups[-1].append(term)
+        else:
+            groups.append([term])
+        pending_or = False
+    if not groups:
+        return ""
+    query = " ".join(group[0] if len(group) == 1 else f"({' OR '.join(group)})" for group in groups)
+    return " NOT ".join([query, *excluded])
+
+
+class _FullTextExpression(ColumnElement[Any]):
+    """Dialect-deferred full-text search expression.
+
+    The SQL is chosen at compile time:
+
+    - PostgreSQL → ``to_tsvector(...) @@ websearch_to_tsquery(...)``, or the column
+      itself when searching a single ``tsvector`` column
+    - MySQL / MariaDB → ``MATCH (...) AGAINST (... IN NATURAL LANGUAGE MODE)``
+    - SQLite → a ``MATCH`` against the table's FTS5 index
+    - other dialects → case-insensitive ``LIKE`` on each column
+
+    ``_traverse_internals`` keeps statements using the expression cacheable; the
+    search text is carried by bind parameters.
+    """
+
+    _traverse_internals = [
+        ("columns", InternalTraversal.dp_clauseelement),
+        ("value", InternalTraversal.dp_clauseelement),
+        ("fts_query", InternalTraversal.dp_clauseelement),
+        ("pattern", InternalTraversal.dp_clauseelement),
+        ("language", InternalTraversal.dp_string),
+        ("fts_table", InternalTraversal.dp_string),
+    ]
+
+    def __init__(
+        self, columns: "list[ColumnElement[Any]]", value: str, fts_query: str, language: str, fts_table: str
+    ) -> None:
+        self.columns = ClauseList(*columns)
+        self.value = literal(value, String())
+        self.fts_query = literal(fts_query, String())
+        self.pattern = literal(f"%{value}%", String())
+        self.language = language
+        self.fts_table = fts_table
+
+    def _postgresql_operands(self) -> "tuple[ColumnElement[Any], ColumnElement[Any]]":
+        columns = list(self.columns.clauses)
+        if len(columns) == 1 and isinstance(columns[0].type, TSVECTOR):
+            vector = columns[0]
+        else:
+            vector = tsvector_expression(columns, self.language)
+        query = func.websearch_to_tsquery(literal_column(f"'{self.language}'::regconfig"), self.value)
+        return vector, query
+
+    def _mysql_match(self) -> "ColumnElement[Any]":
+        return match(*self.columns.clauses, against=self.value).in_natural_language_mode()
+
+    def _sqlite_names(self, compiler: "SQLCompiler") -> "tuple[str, str]":
+        table = cast("Any", self.columns.clauses[0]).table
+        return compiler.preparer.quote(table.name), compiler.preparer.quote(self.fts_table)
+
+
+class _FullTextMatch(_FullTextExpression):
+    inherit_cache = True
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.type = Boolean()
+
+    def self_group(self, against: Optional[Any] = None) -> "ColumnElement[Any]":
+        # Every dialect renders a parenthesized predicate; never compare it to ``1``.
+        return self
+
+
+class _FullTextRank(_FullTextExpression):
+    inherit_cache = True
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.type = Float()
+
+
+@compiles(_FullTextMatch)
+def _compile_full_text_match(element: _FullTextMatch, compiler: "SQLCompiler", **kw: Any) -> str:
+    clauses = [column.ilike(element.pattern) for column in element.columns.clauses]
+    return f"({compiler.process(or_(*clauses), **kw)})"
+
+
+@compiles(_FullTextMatch, "postgresql")
+def _compile_full_text_match_postgresql(element: _FullTextMatch, compiler: "SQLCompiler", **kw: Any) -> str:
+    vector, query = element._postgresql_operands()  # noqa: SLF001
+    return f"({compiler.process(vector, **kw)} @@ {compiler.process(query, **kw)})"
+
+
+@compiles(_FullTextMatch, "mysql")
+@compiles(_FullTextMatch, "mariadb")
+def _compile_full_text_match_mysql(element: _FullTextMatch, compiler: "SQLCompiler", **kw: Any) -> str:
+    return f"({compiler.process(element._mysql_match(), **kw)})"  # noqa: SLF001
+
+
+@compiles(_FullTextMatch, "sqlite")
+def _compile_full_text_match_sqlite(element: _FullTextMatch, compiler: "SQLCompiler", **kw: Any) -> str:
+    table, fts = element._sqlite_names(compiler)  # noqa: SLF001
+    query = compiler.process(element.fts_query, **kw)
+    return f"({table}.rowid IN (SELECT rowid FROM {fts} WHERE {fts} MATCH {query}))"  # noqa: S608
+
+
+@compiles(_FullTextRank)
+def _compile_full_text_rank(element: _FullTextRank, compiler: "SQLCompiler", **kw: Any) -> str:
+    scores = [
+        compiler.process(
+            case(
+                (column.ilike(element.pattern), literal_column("1")),
+                else_=literal_column("0"),
+            ),
+            **kw,
+        )
+        for column in element.columns.clauses
+    ]
+    return f"({' + '.join(scores)})"
+
+
+@compiles(_FullTextRank, "postgresql")
+def _compile_full_text_rank_postgresql(element: _FullTextRank, compiler: "SQLCompiler", **kw: Any) -> str:
+    vector, query = element._postgresql_operands()  # noqa: SLF001
+    return compiler.process(func.ts_rank(vector, query), **kw)
+
+
+@compiles(_FullTextRank, "mysql")
+@compiles(_FullTextRank, "mariadb")
+def _compile_full_text_rank_mysql(element: _FullTextRank, compiler: "SQLCompiler", **kw: Any) -> str:
+    return f"({compiler.process(element._mysql_match(), **kw)})"  # noqa: SLF001
+
+
+@compiles(_FullTextRank, "sqlite")
+def _compile_full_text_rank_sqlite(element: _FullTextRank, compiler: "SQLCompiler", **kw: Any) -> str:
+    table, fts = element._sqlite_names(compiler)  # noqa: SLF001
+    query = compiler.process(element.fts_query, **kw)
+    return f"(SELECT -bm25({fts}) FROM {fts} WHERE {fts} MATCH {query} AND {fts}.rowid = {table}.rowid)"  # noqa: S608
+
+
+@dataclass
+class FullTextSearchFilter(StatementFilter):
+    """Full-text search filter using each database's native text index.
+
+    The search text accepts ``websearch_to_tsquery`` syntax on every backend: words
+    and ``"quoted phrases"`` are required, ``or`` between terms accepts either and
+    a leading ``-`` excludes a term.
+
+    - PostgreSQL matches ``to_tsvector`` of the fields against
+      ``websearch_to_tsquery``.  A single stored ``tsvector`` field is matched as-is.
+    - MySQL / MariaDB uses ``MATCH ... AGAINST`` in natural language mode, which
+      needs a ``FULLTEXT`` index over exactly these fields.
+    - SQLite matches the FTS5 table ``fts_table``.
+    - Other dialects fall back to case-insensitive substring matching.
+
+    Note:
+        :class:`~advanced_alchemy.mixins.FullTextSearchMixin` creates the matching
+        indexes for all three backends.
+
+    See Also:
+        - :class:`.SearchFilter`: Substring matching with LIKE/ILIKE
+        - :func:`advanced_alchemy.mixins.fulltext.fulltext_indexes`: Index DDL helpers
+    """
+
+    field_name: Union[str, set[str]]
+    """Name or set of names of model attributes to search on."""
+    value: str
+    """Search text."""
+    language: str = "english"
+    """PostgreSQL text search configuration."""
+    order_by_rank: bool = False
+    """Whether to order SELECT results by relevance, best match first."""
+    fts_table: Optional[str] = None
+    """SQLite FTS5 table name.  Defaults to ``<tablename>_fts``."""
+
+    @property
+    def normalized_field_names(self) -> set[str]:
+        """Convert field_name to a set if it's a single string.
+
+        Returns:
+            set[str]: Set of field names to be searched
+        """
+        return {self.field_name} if isinstance(self.field_name, str) else self.field_name
+
+    def _get_expression(
+        self, model: type[ModelT], expression_type: "type[_FullTextExpressionT]"
+    ) -> "Optional[_FullTextExpressionT]":
+        columns: list[ColumnElement[Any]] = []
+        for field_name in self.normalized_field_names:
+            try:
+                columns.append(self._get_instrumented_attr(model, field_name).expression)
+            except AttributeError:
+                msg = f"Skipping full-text search for field {field_name}.  It is not found in model {model.__name__}"
+                logger.debug(msg)
+        fts_query = _websearch_to_fts5(self.value or "")
+        if not columns or not fts_query:
+            return None
+        columns.sort(key=lambda column: str(getattr(column, "name", column)))
+        names = " ".join(validate_identifier(str(getattr(column, "name", "")), "column") for column in columns)
+        table_name = cast("str", getattr(model, "__tablename__", None) or model.__table__.name)  # type: ignore[attr-defined]
+        return expression_type(
+            columns,
+            self.value,
+            f"{{{names}}} : ({fts_query})",
+            validate_identifier(self.language, "text search configuration"),
+            self.fts_table or fts5_table_name(table_name),
+        )
+
+    def get_search_clause(self, model: type[ModelT]) -> Optional[ColumnElement[bool]]:
+        """Generate the full-text match clause.
+
+        Args:
+            model: The SQLAlchemy model class
+
+        Returns:
+            Optional[ColumnElement[bool]]: The match clause, or ``None`` if no field
+            is found or the search text has no terms
+        """
+        return self._get_expression(model, _FullTextMatch)
+
+    def rank(self, model: type[ModelT]) -> ColumnElement[Any]:
+        """Generate the relevance score of each row for the search text.
+
+        Higher is better; pass it to :class:`.OrderBy` with ``sort_order="desc"``.
+        Dialects without a native full-text index score rows by the number of
+        fields containing the search text.
+
+        Args:
+            model: The SQLAlchemy model class
+
+        Returns:
+            ColumnElement[Any]: The relevance expression
+        """
+        expression = self._get_expression(model, _FullTextRank)
+        return expression if expression is not None else null()
+
+    def append_to_statement(self, statement: StatementTypeT, model: type[ModelT]) -> StatementTypeT:
+        """Append a full-text match clause to the statement.
+
+        Args:
+            statement: The SQLAlchemy statement to modify
+            model: The SQLAlchemy model class
+
+        Returns:
+            StatementTypeT: Modified statement with the match clause and, if
+            ``order_by_rank`` is set, ordered by relevance
+        """
+        search_clause = self.get_search_clause(model)
+        if search_clause is None:
+            return statement
+        statement = cast("StatementTypeT", statement.where(search_clause))
+        if self.order_by_rank and isinstance(statement, Select):
+            statement = cast("StatementTypeT", statement.order_by(self.rank(model).desc()))
+        return statement
+
+
+_VECTOR_DISTANCE_METHODS = {
+    "cosine": "cosine_distance",
+    "l2": "l2_distance",
+    "l1": "l1_distance",
+    "inner_product": "max_inner_product",
+}
+
+
+@dataclass
+class VectorSimilarityFilter(StatementFilter):
+    """Nearest-neighbor search on a vector column.
+
+    Orders SELECT statements by the distance between the column and ``vector``,
+    nearest first, and keeps the ``k`` nearest rows.  The distance becomes the
+    primary ordering; any existing ORDER BY columns break ties.
+
+    The column must be a :class:`~advanced_alchemy.types.Vector` (or a pgvector
+    ``Vector``) on PostgreSQL with pgvector or Oracle 23ai.  The query is served
+    by the approximate index from :func:`~advanced_alchemy.types.vector.vector_index`
+    when one matches the metric.
+
+    Note:
+        ``ef_search`` and ``probes`` are passed as the ``hnsw_ef_search`` and
+        ``ivfflat_probes`` execution options, which set ``hnsw.ef_search`` and
+        ``ivfflat.probes`` with ``SET LOCAL`` before the statement runs on
+        PostgreSQL on engines set up with
+        :func:`~advanced_alchemy.types.vector.register_vector_search_options`.  Like
+        any ``SET LOCAL``, they stay in effect until the end of the transaction.
+
+    See Also:
+        - :class:`advanced_alchemy.types.Vector`: Vector column type and distance operators
+    """
+
+    field_name: FilterFieldName
+    """Name or model attribute of the vector column."""
+    vector: Sequence[float]
+    """Query vector."""
+    k: Optional[int] = 10
+    """Number of nearest rows to return.  ``None`` returns every row, nearest first."""
+    metric: Literal["cosine", "l2", "l1", "inner_product"] = "cosine"
+    """Distance metric.  ``inner_product`` orders by the negated inner product."""
+    max_distance: Optional[float] = None
+    """Only match rows within this distance of ``vector``."""
+    ef_search: Optional[int] = None
+    """pgvector HNSW candidate list size (``hnsw.ef_search``)."""
+    probes: Optional[int] = None
+    """pgvector IVFFlat number of lists to search (``ivfflat.probes``)."""
+
+    def distance(self, model: type[ModelT]) -> ColumnElement[float]:
+        """Generate the distance between the column and the query vector.
+
+        Args:
+            model: The SQLAlchemy model class
+
+        Returns:
+            ColumnElement[float]: The distance expression, smaller is nearer
+        """
+        field = self._get_instrumented_attr(model, self.field_name)
+        return cast("ColumnElement[float]", getattr(field, _VECTOR_DISTANCE_METHODS[self.metric])(self.vector))
+
+    def append_to_statement(self, statement: StatementTypeT, model: type[ModelT]) -> StatementTypeT:
+        """Append the nearest-neighbor ordering and limit to the statement.
+
+        Args:
+            statement: The SQLAlchemy statement to modify
+            model: The SQLAlchemy model class
+
+        Returns:
+            StatementTypeT: Modified statement.  Statements other than SELECT only
+            receive the ``max_distance`` condition.
+        """
+        distance = self.distance(model)
+        if self.max_distance is not None:
+            statement = cast("StatementTypeT", statement.where(distance <= self.max_distance))
+        if not isinstance(statement, Select):
+            return statement
+        select_statement: Select[Any] = statement.order_by(None).order_by(distance, *statement._order_by_clauses)  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+        if self.k is not None:
+            select_statement = select_statement.limit(self.k)
+        execution_options: dict[str, Any] = {}
+        if self.ef_search is not None:
+            execution_options["hnsw_ef_search"] = self.ef_search
+        if self.probes is not None:
+            execution_options["ivfflat_probes"] = self.probes
+        if execution_options:
+            select_statement = select_statement.execution_options(**execution_options)
+        return cast("StatementTypeT", select_statement)
+
 
 @dataclass
 class ExistsFilter(StatementFilter):
@@ -1149,6 +1814,89 @@ class FilterGroup(StatementFilter):
         return statement
 
 
+@dataclass(frozen=True)
+class _Slot:
+    """Placeholder for a bound value in a filter tree shape."""
+
+    name: str
+    expanding: bool = False
+    string: bool = False
+
+
+_LIKE_OPERATORS = frozenset({"like", "ilike", "startswith", "istartswith", "endswith", "iendswith"})
+_SHAPE_SCALARS = (str, int, float, bool, type(None), _Slot)
+
+
+def _freeze(value: Any) -> Any:
+    """Convert a parameterized filter tree into a hashable shape.
+
+    Raises:
+        TypeError: If the tree holds values that can't be part of a shape.
+    """
+    if isinstance(value, _SHAPE_SCALARS):
+        return value
+    if isinstance(value, dict):
+        return ("dict", tuple((key, _freeze(item)) for key, item in value.items()))  # pyright: ignore
+    if isinstance(value, list):
+        return ("list", tuple(_freeze(item) for item in value))  # pyright: ignore
+    if isinstance(value, tuple):
+        return ("tuple", tuple(_freeze(item) for item in value))  # pyright: ignore
+    if isinstance(value, (set, frozenset)):
+        return ("set", frozenset(_freeze(item) for item in value))  # pyright: ignore
+    msg = f"{type(value).__name__} values can't be part of a filter tree shape"
+    raise TypeError(msg)
+
+
+def _thaw(shape: Any) -> Any:
+    """Rebuild a filter tree from its shape, with bind parameters in place of slots."""
+    if isinstance(shape, _Slot):
+        return bindparam(shape.name, unique=True, expanding=shape.expanding, type_=String() if shape.string else None)
+    if not isinstance(shape, tuple):
+        return shape
+    kind, items = shape
+    if kind == "dict":
+        return {key: _thaw(item) for key, item in items}
+    if kind == "list":
+        return [_thaw(item) for item in items]
+    if kind == "tuple":
+        return tuple(_thaw(item) for item in items)
+    return {_thaw(item) for item in items}
+
+
+def _rebind(clause: ColumnElement[bool], parameters: dict[str, Any]) -> ColumnElement[bool]:
+    """Copy a compiled filter tree clause with new values for its bind parameters.
+
+    Unlike :meth:`~sqlalchemy.sql.expression.ClauseElement.unique_params`, this keeps
+    the statement's cache key stable, so the compiled SQL is reused.
+    """
+
+    def visit_bindparam(bind: BindParameter[Any]) -> None:
+        name = bind._orig_key  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+        if name in parameters:
+            bind.value = parameters[name]
+            bind.required = False
+
+    return cloned_traverse(clause, {}, {"bindparam": visit_bindparam})
+
+
+@lru_cache(maxsize=256)
+def _compile_filter_tree(
+    filter_class: "type[MultiFilter]", model: type[Any], shape: Any
+) -> Optional[ColumnElement[bool]]:
+    """Build the WHERE clause for a filter tree shape, with a bind parameter per value.
+
+    Args:
+        filter_class: The :class:`MultiFilter` class interpreting the tree.
+        model: The SQLAlchemy model class.
+        shape: The shape of the filter tree, from :func:`_freeze`.
+
+    Returns:
+        The clause, or ``None`` if the tree applies no filters.
+    """
+    statement = filter_class(filters=_thaw(shape))._append_filters(select(), model)  # noqa: SLF001
+    return statement.whereclause
+
+
 @dataclass
 class MultiFilter(StatementFilter):
     """Apply multiple filters to a query based on a JSON/dict input.
@@ -1156,6 +1904,15 @@ class MultiFilter(StatementFilter):
     This filter provides a way to construct complex filter trees from
     a structured dictionary input, supporting nested logical groups and
     various filter types.
+
+    Note:
+        The clause for a tree is compiled once per model and tree shape, then reused
+        with the new values bound.  The shape is the tree with the values listed in
+        ``_bound_arguments`` taken out, so requests that only change those values,
+        such as search text, dates or collection members, skip parsing the tree and
+        building filters, and their statements share SQLAlchemy's compiled cache.
+        ``None`` and empty collections, trigram searches and the arguments of other
+        filter types remain part of the shape.
     """
 
     filters: dict[str, Any]
@@ -1175,6 +1932,7 @@ class MultiFilter(StatementFilter):
         "order_by": OrderBy,
         "search": SearchFilter,
         "not_in_search": NotInSearchFilter,
+        "full_text_search": FullTextSearchFilter,
         "filter_group": FilterGroup,
         "comparison": ComparisonFilter,
         "exists": ExistsFilter,
@@ -1186,6 +1944,19 @@ class MultiFilter(StatementFilter):
         "or_": or_,
     }
 
+    _bound_arguments: ClassVar[dict[str, tuple[str, ...]]] = {
+        "before_after": ("before", "after"),
+        "on_before_after": ("on_or_before", "on_or_after"),
+        "boolean": ("value",),
+        "choices": ("values",),
+        "collection": ("values",),
+        "not_in_collection": ("values",),
+        "search": ("value",),
+        "not_in_search": ("value",),
+        "comparison": ("value",),
+    }
+    """Arguments of each filter type that are bound as parameters instead of being part of the tree shape."""
+
     def append_to_statement(
         self,
         statement: StatementTypeT,
@@ -1193,6 +1964,27 @@ class MultiFilter(StatementFilter):
     ) -> StatementTypeT:
         """Apply the filters to the statement based on the filter definitions.
 
+        Args:
+            statement: The SQLAlchemy statement to modify
+            model: The SQLAlchemy model class
+
+        Returns:
+            StatementTypeT: Modified statement with all filters applied
+        """
+        parameters: dict[str, Any] = {}
+        try:
+            shape = _freeze(self._parameterize(self.filters, parameters))
+            hash(shape)
+        except TypeError:
+            return self._append_filters(statement, model)
+        clause = _compile_filter_tree(type(self), model, shape)
+        if clause is None:
+            return statement
+        return cast("StatementTypeT", statement.where(_rebind(clause, parameters) if parameters else clause))
+
+    def _append_filters(self, statement: StatementTypeT, model: type[ModelT]) -> StatementTypeT:
+        """Build and apply the filters of the tree.
+
         Args:
             statement: The SQLAlchemy statement to modify
             model: The SQLAlchemy model class
@@ -1219,6 +2011,74 @@ class MultiFilter(StatementFilter):
                     statement = filter_group.append_to_statement(statement, model)
         return statement
 
+    def _parameterize(self, tree: Any, parameters: dict[str, Any]) -> Any:
+        """Replace the bound arguments in a filter tree with slots.
+
+        Args:
+            tree: The filter tree, or a node of it.
+            parameters: Receives the value of each slot, keyed by slot name.
+
+        Returns:
+            The tree with slots in place of bound values.
+        """
+        if isinstance(tree, list):
+            return [self._parameterize(node, parameters) for node in tree]  # pyright: ignore
+        if not isinstance(tree, dict):
+            return tree
+        bound_arguments = self._bound_arguments.get(tree.get("type"), ())  # type: ignore[arg-type]  # pyright: ignore
+        return {
+            key: (
+                self._parameterize(value, parameters)
+                if key in self._logical_map
+                else self._bind_argument(tree, value, parameters)  # pyright: ignore
+                if key in bound_arguments
+                else value
+            )
+            for key, value in tree.items()  # pyright: ignore
+        }
+
+    @staticmethod
+    def _bind_argument(condition: dict[str, Any], value: Any, parameters: dict[str, Any]) -> Any:  # noqa: PLR0911
+        """Replace a filter argument with slots for its bound values.
+
+        Args:
+            condition: The filter condition holding the argument.
+            value: The argument value.
+            parameters: Receives the value of each slot, keyed by slot name.
+
+        Returns:
+            A slot, a tuple of slots, or ``value`` if it changes the clause structure.
+        """
+
+        def slot(bound: Any, expanding: bool = False, string: bool = False) -> _Slot:
+            name = f"multi_filter_{len(parameters)}"
+            parameters[name] = bound
+            return _Slot(name, expanding=expanding, string=string)
+
+        filter_type = condition["type"]
+        operator = condition.get("operator")
+        is_list = isinstance(value, (list, tuple, set, frozenset))
+        if value is None:
+            return value
+        if filter_type in {"choices", "collection", "not_in_collection"}:
+            return slot(list(value), expanding=True) if is_list and value else value  # pyright: ignore
+        if filter_type in {"search", "not_in_search"}:
+            mode = condition.get("mode", "contains")
+            if not isinstance(value, str) or mode not in {"contains", "prefix"}:
+                return value
+            return slot(_search_pattern(value, mode, condition.get("ignore_case")), string=True)
+        if filter_type != "comparison":
+            return slot(value)
+        if operator == "between":
+            if isinstance(value, (list, tuple)) and len(value) == 2 and None not in value:  # noqa: PLR2004  # pyright: ignore
+                return tuple(slot(item) for item in value)  # pyright: ignore
+            return value
+        if operator in {"in", "notin"}:
+            return slot(list(value), expanding=True) if is_list else value  # pyright: ignore
+        if operator in _LIKE_OPERATORS:
+            return slot(value, string=True) if isinstance(value, str) else value
+        return slot(value)
+
     def _create_filter(self, condition: dict[str, Any]) -> Optional[StatementFilter]:
         """Create a filter instance from a condition dictionary.
 
@@ -1273,6 +2133,8 @@ FilterTypes: TypeAlias = Union[
     SearchFilter,
     NotInCollectionFilter[Any],
     NotInSearchFilter,
+    FullTextSearchFilter,
+    VectorSimilarityFilter,
     ExistsFilter,
     NotExistsFilter,
     ComparisonFilter,
@@ -0,0 +1,238 @@
+from typing import TYPE_CHECKING, Any, ClassVar, Optional, Union
+
+from sqlalchemy import DDL, Computed, Index, Table, event, func, literal_column
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import declarative_mixin, mapped_column
+
+from advanced_alchemy.operations import validate_identifier
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+    from sqlalchemy import Column, ColumnElement
+    from sqlalchemy.orm import MappedColumn, Mapper
+
+__all__ = (
+    "FullTextSearchMixin",
+    "fts5_table_name",
+    "fulltext_indexes",
+    "prefix_index",
+    "register_fts5_table",
+    "trigram_index",
+    "tsvector_column",
+    "tsvector_expression",
+)
+
+
+def _regconfig(language: str) -> "ColumnElement[Any]":
+    return literal_column(f"'{validate_identifier(language, 'text search configuration')}'::regconfig")
+
+
+def _sorted_columns(columns: "Iterable[ColumnElement[Any]]") -> "list[ColumnElement[Any]]":
+    return sorted(columns, key=lambda column: str(getattr(column, "name", column)))
+
+
+def _is_mysql(*_: Any, **kwargs: Any) -> bool:
+    return kwargs["dialect"].name in {"mysql", "mariadb"}
+
+
+def tsvector_expression(columns: "Iterable[ColumnElement[Any]]", language: str = "english") -> "ColumnElement[Any]":
+    """Build the PostgreSQL ``to_tsvector`` expression for a set of text columns.
+
+    Columns are concatenated in name order so the expression rendered by
+    :class:`~advanced_alchemy.filters.FullTextSearchFilter` is identical to the one
+    indexed by :func:`fulltext_indexes`, which lets the planner use the index.
+
+    Args:
+        columns: Text columns to index or search.
+        language: PostgreSQL text search configuration.
+
+    Returns:
+        The ``to_tsvector`` expression.
+    """
+    document: Optional[ColumnElement[Any]] = None
+    for column in _sorted_columns(columns):
+        part = func.coalesce(column, literal_column("''"))
+        document = part if document is None else document.concat(literal_column("' '")).concat(part)
+    return func.to_tsvector(_regconfig(language), document)
+
+
+def tsvector_column(*column_names: str, language: str = "english", **kwargs: Any) -> "MappedColumn[Any]":
+    """Create a stored generated ``tsvector`` column for PostgreSQL models.
+
+    Args:
+        *column_names: Names of the text columns to index.
+        language: PostgreSQL text search configuration.
+        **kwargs: Additional arguments for :func:`~sqlalchemy.orm.mapped_column`.
+
+    Returns:
+        A mapped column computed from the source columns.
+    """
+    document = " || ' ' || ".join(
+        f"coalesce({validate_identifier(name, 'column')}, '')" for name in sorted(column_names)
+    )
+    computed = Computed(
+        f"to_tsvector('{validate_identifier(language, 'text search configuration')}'::regconfig, {document})",
+        persisted=True,
+    )
+    return mapped_column(TSVECTOR, computed, **kwargs)
+
+
+def fts5_table_name(table_name: str) -> str:
+    """Return the default SQLite FTS5 table name for a content table.
+
+    Args:
+        table_name: Name of the content table.
+
+    Returns:
+        The FTS5 table name.
+    """
+    return f"{table_name}_fts"
+
+
+def fulltext_indexes(
+    table_name: str, columns: "Sequence[Union[Column[Any], ColumnElement[Any]]]", language: str = "english"
+) -> "tuple[Index, Index]":
+    """Create full-text indexes for PostgreSQL and MySQL/MariaDB.
+
+    The PostgreSQL index is a GIN index over :func:`tsvector_expression`; the MySQL
+    index is a ``FULLTEXT`` index over the columns.  Each index is only emitted for
+    its own dialect.
+
+    Args:
+        table_name: Name of the indexed table, used to name the indexes.
+        columns: Text columns to index.
+        language: PostgreSQL text search configuration.
+
+    Returns:
+        The PostgreSQL and MySQL indexes.
+    """
+    return (
+        Index(
+            f"ix_{table_name}_tsvector",
+            tsvector_expression(columns, language),
+            postgresql_using="gin",
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            f"ix_{table_name}_fulltext",
+            *_sorted_columns(columns),
+            mysql_prefix="FULLTEXT",
+            mariadb_prefix="FULLTEXT",
+        ).ddl_if(callable_=_is_mysql),
+    )
+
+
+def prefix_index(table_name: str, column: "Union[str, Column[Any]]", ignore_case: bool = False) -> Index:
+    """Create a PostgreSQL index for prefix searches on a text column.
+
+    Serves :class:`~advanced_alchemy.filters.SearchFilter` with ``mode="prefix"``.
+    PostgreSQL only uses B-tree indexes for ``LIKE 'value%'`` with the ``C``
+    collation, so the index uses ``text_pattern_ops``; with ``ignore_case`` it
+    indexes ``lower(column)``, matching the filter's case-insensitive clause.
+    Other dialects serve prefix searches from a plain index on the column.
+
+    Args:
+        table_name: Name of the indexed table, used to name the index.
+        column: The text column, or its name, to index.
+        ignore_case: Whether to index the lower-cased column.
+
+    Returns:
+        The PostgreSQL index.
+    """
+    name = validate_identifier(column if isinstance(column, str) else column.name, "column")
+    if ignore_case:
+        return Index(
+            f"ix_{table_name}_{name}_lower_prefix",
+            func.lower(literal_column(name) if isinstance(column, str) else column).label(f"{name}_lower"),
+            postgresql_ops={f"{name}_lower": "text_pattern_ops"},
+        ).ddl_if(dialect="postgresql")
+    return Index(
+        f"ix_{table_name}_{name}_prefix",
+        column,
+        postgresql_ops={name: "text_pattern_ops"},
+    ).ddl_if(dialect="postgresql")
+
+
+def trigram_index(table_name: str, column: "Union[str, Column[Any]]") -> Index:
+    """Create a PostgreSQL pg_trgm GIN index on a text column.
+
+    Serves :class:`~advanced_alchemy.filters.SearchFilter` with ``mode="trigram"``,
+    as well as ``contains`` searches with ``ILIKE``.  The pg_trgm extension must be
+    installed in the database.
+
+    Args:
+        table_name: Name of the indexed table, used to name the index.
+        column: The text column, or its name, to index.
+
+    Returns:
+        The PostgreSQL index.
+    """
+    name = validate_identifier(column if isinstance(column, str) else column.name, "column")
+    return Index(
+        f"ix_{table_name}_{name}_trgm",
+        column,
+        postgresql_using="gin",
+        postgresql_ops={name: "gin_trgm_ops"},
+    ).ddl_if(dialect="postgresql")
+
+
+def register_fts5_table(table: Table, column_names: "Sequence[str]", fts_table: Optional[str] = None) -> None:
+    """Create and drop an SQLite FTS5 index alongside a table.
+
+    The FTS5 table uses ``table`` as external content, keyed on ``rowid``, and is
+    kept in sync by insert, update and delete triggers.
+
+    Args:
+        table: The content table.
+        column_names: Names of the text columns to index.
+        fts_table: Name of the FTS5 table.  Defaults to :func:`fts5_table_name`.
+    """
+    content = validate_identifier(table.name, "table")
+    fts = validate_identifier(fts_table or fts5_table_name(table.name), "table")
+    names = [validate_identifier(name, "column") for name in sorted(column_names)]
+    columns = ", ".join(names)
+    new_values = ", ".join(f"new.{name}" for name in names)
+    old_values = ", ".join(f"old.{name}" for name in names)
+    delete_old = f"INSERT INTO {fts}({fts}, rowid, {columns}) VALUES ('delete', old.rowid, {old_values});"  # noqa: S608
+    insert_new = f"INSERT INTO {fts}(rowid, {columns}) VALUES (new.rowid, {new_values});"  # noqa: S608
+    statements = (
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5({columns}, content='{content}', content_rowid='rowid')",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {content} BEGIN {insert_new} END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {content} BEGIN {delete_old} END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE ON {content} BEGIN {delete_old} {insert_new} END",
+        f"INSERT INTO {fts}({fts}) VALUES ('rebuild')",  # noqa: S608
+    )
+    for statement in statements:
+        event.listen(table, "after_create", DDL(statement).execute_if(dialect="sqlite"))  # type: ignore[no-untyped-call]
+    event.listen(
+        table,
+        "before_drop",
+        DDL(f"DROP TABLE IF EXISTS {fts}").execute_if(dialect="sqlite"),  # type: ignore[no-untyped-call]
+    )
+
+
+@declarative_mixin
+class FullTextSearchMixin:
+    """Full-text search index Model Mixin.
+
+    Declares the indexes used by :class:`~advanced_alchemy.filters.FullTextSearchFilter`
+    for the columns named in ``__fulltext_columns__``: a GIN ``tsvector`` index on
+    PostgreSQL, a ``FULLTEXT`` index on MySQL/MariaDB and an FTS5 table on SQLite.
+    """
+
+    __fulltext_columns__: ClassVar["Sequence[str]"] = ()
+    """Names of the text columns to index."""
+    __fulltext_language__: ClassVar[str] = "english"
+    """PostgreSQL text search configuration."""
+
+
+@event.listens_for(FullTextSearchMixin, "after_mapper_constructed", propagate=True)
+def _add_fulltext_indexes(mapper: "Mapper[Any]", class_: "type[FullTextSearchMixin]") -> None:
+    table = mapper.local_table
+    if not class_.__fulltext_columns__ or not isinstance(table, Table) or mapper.inherits is not None:
+        return
+    columns = [table.c[name] for name in class_.__fulltext_columns__]
+    for index in fulltext_indexes(table.name, columns, class_.__fulltext_language__):
+        if index.table is None:
+            index._set_parent(table)  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+    register_fts5_table(table, [column.name for column in columns])
@@ -284,7 +284,7 @@ class OnConflictUpsert:
     @staticmethod
     def create_upsert(
         table: Table,
-        values: dict[str, Any],
+        values: Union[dict[str, Any], list[dict[str, Any]]],
         conflict_columns: list[str],
         update_columns: Optional[list[str]] = None,
         dialect_name: Optional[str] = None,
@@ -294,7 +294,7 @@ class OnConflictUpsert:
 
         Args:
             table: Target table for the upsert
-            values: Values to insert/update
+            values: Values to insert/update, or a list of rows with the same keys for a multi-row upsert
             conflict_columns: Columns that define the conflict condition
             update_columns: Columns to update on conflict (defaults to all non-conflict columns)
             dialect_name: Database dialect name (auto-detected if not provided)
@@ -307,17 +307,18 @@ class OnConflictUpsert:
             NotImplementedError: If the dialect doesn't support native upsert
             ValueError: If validate_identifiers is True and invalid identifiers are found
         """
+        columns = values[0] if isinstance(values, list) else values
         if validate_identifiers:
             for col in conflict_columns:
                 validate_identifier(col, "conflict column")
             if update_columns:
                 for col in update_columns:
                     validate_identifier(col, "update column")
-            for col in values:
+            for col in columns:
                 validate_identifier(col, "column")
 
         if update_columns is None:
-            update_columns = [col for col in values if col not in conflict_columns]
+            update_columns = [col for col in columns if col not in conflict_columns]
 
         if dialect_name in {"postgresql", "sqlite", "duckdb"}:
             from sqlalchemy.dialects.postgresql import insert as pg_insert
@@ -1,12 +1,14 @@
 import contextlib
+import copy
 import datetime
 import random
 import string
-from collections.abc import Iterable, Sequence
+from collections.abc import Awaitable, Iterable, Sequence
 from functools import partial
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
     Final,
     List,
     Literal,
@@ -36,10 +38,11 @@ from sqlalchemy import (
     update,
 )
 from sqlalchemy import func as sql_func
-from sqlalchemy.exc import MissingGreenlet, NoInspectionAvailable
+from sqlalchemy.engine.result import result_tuple
+from sqlalchemy.exc import MissingGreenlet, MultipleResultsFound, NoInspectionAvailable
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.ext.asyncio.scoping import async_scoped_session
-from sqlalchemy.orm import InstrumentedAttribute
+from sqlalchemy.orm import InstrumentedAttribute, class_mapper
 from sqlalchemy.orm.strategy_options import _AbstractLoad  # pyright: ignore[reportPrivateUsage]
 from sqlalchemy.sql import ColumnElement
 from sqlalchemy.sql.dml import ReturningDelete, ReturningUpdate
@@ -50,7 +53,6 @@ from advanced_alchemy.exceptions import ErrorMessages, NotFoundError, Repository
 from advanced_alchemy.filters import StatementFilter, StatementTypeT
 from advanced_alchemy.repository._util import (
     DEFAULT_ERROR_MESSAGE_TEMPLATES,
-    DEFAULT_SAFE_TYPES,
     FilterableRepository,
     FilterableRepositoryProtocol,
     LoadSpec,
@@ -61,19 +63,24 @@ from advanced_alchemy.repository._util import (
     get_abstract_loader_options,
     get_instrumented_attr,
     get_primary_key_info,
+    get_set_column_values,
     is_composite_pk,
     pk_values_present,
     validate_composite_pk_value,
     was_attribute_set,
 )
 from advanced_alchemy.repository.typing import MISSING, ModelT, OrderingPair, PrimaryKeyType, T
+from advanced_alchemy.routing.context import use_bind_group
+from advanced_alchemy.routing.sharding import ShardRouter
 from advanced_alchemy.utils.dataclass import Empty, EmptyType
 from advanced_alchemy.utils.deprecation import warn_deprecation
 from advanced_alchemy.utils.serialization import schema_dump
 from advanced_alchemy.utils.text import slugify
 
 if TYPE_CHECKING:
+    from sqlalchemy import CursorResult
     from sqlalchemy.engine.interfaces import _CoreSingleExecuteParams  # pyright: ignore[reportPrivateUsage]
+    from sqlalchemy.orm import Session
 
     from advanced_alchemy.cache.manager import CacheManager
 
@@ -309,6 +316,7 @@ class SQLAlchemyAsyncRepositoryProtocol(FilterableRepositoryProtocol[ModelT], Pr
         load: Optional[LoadSpec] = None,
         execution_options: Optional[dict[str, Any]] = None,
         bind_group: Optional[str] = None,
+        blind: bool = False,
     ) -> ModelT: ...
 
     async def update_many(
@@ -410,6 +418,18 @@ class SQLAlchemyAsyncRepositoryProtocol(FilterableRepositoryProtocol[ModelT], Pr
         **kwargs: Any,
     ) -> List[ModelT]: ...
 
+    async def get_many_columns(
+        self,
+        columns: Sequence[str],
+        *filters: Union[StatementFilter, ColumnElement[bool]],
+        statement: Optional[Select[tuple[ModelT]]] = None,
+        order_by: Optional[Union[List[OrderingPair], OrderingPair]] = None,
+        error_messages: Optional[Union[ErrorMessages, EmptyType]] = Empty,
+        execution_options: Optional[dict[str, Any]] = None,
+        bind_group: Optional[str] = None,
+        **kwargs: Any,
+    ) -> List[Row[Any]]: ...
+
     async def list(
         self,
         *filters: Union[StatementFilter, ColumnElement[bool]],
@@ -528,6 +548,8 @@ class SQLAlchemyAsyncRepository(SQLAlchemyAsyncRepositoryProtocol[ModelT], Filte
     """Cache manager instance for repository-level caching. Set via ``cache_manager`` kwarg or retrieved from ``session.info``."""
     _bind_group: Optional[str] = None
     """Default bind group for routing operations (e.g., to read replicas). Can be overridden per-method."""
+    _shard_router: Optional[ShardRouter] = None
+    """Shard router for hash-based sharding. Set via ``shard_router`` kwarg or retrieved from ``session.info``."""
 
     def __init__(
         self,
@@ -546,6 +568,7 @@ class SQLAlchemyAsyncRepository(SQLAlchemyAsyncRepositoryProtocol[ModelT], Filte
         count_with_window_function: Optional[bool] = None,
         cache_manager: Optional["CacheManager"] = None,
         bind_group: Optional[str] = None,
+        shard_router: Optional[ShardRouter] = None,
         **kwargs: Any,
     ) -> None:
         """Repository for SQLAlchemy models.
@@ -565,6 +588,7 @@ class SQLAlchemyAsyncRepository(SQLAlchemyAsyncRepositoryProtocol[ModelT], Filte
             count_with_window_function: When false, list and count will use two queries instead of an analytical window function.
             cache_manager: Optional cache manager for repository-level caching. If not provided, retrieved from ``session.info``.
             bind_group: Optional default routing group to use for all operations. Can be overridden per-method.
+            shard_router: Optional shard router for hash-based sharding. If not provided, retrieved from ``session.info``.
             **kwargs: Additional arguments.
 
         """
@@ -595,6 +619,10 @@ class SQLAlchemyAsyncRepository(SQLAlchemyAsyncRepositoryProtocol[ModelT], Filte
         self._cache_manager = cache_manager if cache_manager is not None else session.info.get("cache_manager")
         # Default bind group for all operations (can be overridden per-method)
         self._bind_group = bind_group
+        # Shard router: from explicit param or session.info (set by the routing session makers)
+        if shard_router is None and isinstance(session_router := session.info.get("shard_router"), ShardRouter):
+            shard_router = session_router
+        self._shard_router = shard_router
         # Cache primary key columns for composite key support
         self._pk_columns, self._pk_attr_names = get_primary_key_info(self.model_type)
 
@@ -620,6 +648,227 @@ class SQLAlchemyAsyncRepository(SQLAlchemyAsyncRepositoryProtocol[ModelT], Filte
         """
         return bind_group if bind_group is not None else self._bind_group
 
+    def _resolve_shard_group(
+        self,
+        bind_group: Optional[str],
+        filters: Sequence[Union[StatementFilter, ColumnElement[bool]]],
+        kwargs: dict[str, Any],
+    ) -> Optional[str]:
+        """Resolve the shard targeted by filters and kwargs when no bind group is set.
+
+        Args:
+            bind_group: Optional override for the bind_group setting.
+            filters: Filters of the operation.
+            kwargs: Instance attribute value filters of the operation.
+
+        Returns:
+            The shard bind group, or None if sharding is not configured, a bind group is set, or the
+            operation spans every shard.
+        """
+        if self._shard_router is None or self._resolve_bind_group(bind_group) is not None:
+            return None
+        return self._shard_router.resolve(filters, kwargs)
+
+    def _is_scatter(self, bind_group: Optional[str], shard_group: Optional[str]) -> bool:
+        """Check whether an operation must run on every shard.
+
+        Args:
+            bind_group: Optional override for the bind_group setting.
+            shard_group: The shard resolved for the operation.
+
+        Returns:
+            True if sharding is configured and neither a bind group nor a shard applies.
+        """
+        return self._shard_router is not None and shard_group is None and self._resolve_bind_group(bind_group) is None
+
+    def _resolve_instance_bind_group(self, data: ModelT, bind_group: Optional[str]) -> Optional[str]:
+        """Resolve the bind group for writing an instance, using its shard key when sharding is configured.
+
+        Args:
+            data: The instance being written.
+            bind_group: Optional override for the bind_group setting.
+
+        Raises:
+            RepositoryError: If sharding is configured, no bind group is set and the instance has no
+                shard key value.
+
+        Returns:
+            The bind group to write to, or None for default routing.
+        """
+        if self._shard_router is None or self._resolve_bind_group(bind_group) is not None:
+            return bind_group
+        shard = self._shard_router.resolve_instance(data)
+        if shard is None:
+            raise RepositoryError(detail=self._missing_shard_key_message())
+        return shard
+
+    def _partition_by_shard(self, data: Sequence[T], bind_group: Optional[str]) -> "dict[Optional[str], List[T]]":
+        """Group instances or dicts by the bind group they are written to.
+
+        Args:
+            data: Instances or dicts being written.
+            bind_group: Optional override for the bind_group setting.
+
+        Raises:
+            RepositoryError: If sharding is configured, no bind group is set and an item has no
+                shard key value.
+
+        Returns:
+            Map of bind group to items. Without sharding, or with a bind group, there is a single group.
+        """
+        if self._shard_router is None or self._resolve_bind_group(bind_group) is not None:
+            return {bind_group: list(data)}
+        partitions = self._shard_router.partition(data)
+        if None in partitions:
+            raise RepositoryError(detail=self._missing_shard_key_message())
+        return partitions
+
+    def _missing_shard_key_message(self) -> str:
+        shard_key = cast("ShardRouter", self._shard_router).shard_key
+        return (
+            f"Cannot route {self.model_type.__name__} without a value for the shard key '{shard_key}'. "
+            "Set the shard key or pass a bind_group."
+        )
+
+    @staticmethod
+    def _use_bind_group(bind_group: Optional[str]) -> "contextlib.AbstractContextManager[None]":
+        """Route flushes and refreshes to a bind group.
+
+        Args:
+            bind_group: The bind group, or None for default routing.
+
+        Returns:
+            A context manager applying the bind group.
+        """
+        return use_bind_group(bind_group) if bind_group else contextlib.nullcontext()
+
+    def _get_sync_session(self) -> "Session":
+        """Return the synchronous session underlying this repository's session.
+
+        Returns:
+            The ORM session, unwrapped from any scoped or async proxy.
+        """
+        session = self.session() if isinstance(self.session, async_scoped_session) else self.session
+        return cast("Session", getattr(session, "sync_session", session))
+
+    def _has_uncommitted_writes(self) -> bool:
+        """Check whether this repository's session holds writes other sessions cannot see yet.
+
+        Returns:
+            True if the session has pending changes or its open transaction has written.
+        """
+        if self.session.new or self.session.deleted:
+            return True
+        sync_session = self._get_sync_session()
+        wrote_in_transaction = getattr(sync_session, "wrote_in_transaction", None)
+        if wrote_in_transaction is None:
+            wrote_in_transaction = sync_session.in_transaction()
+        return bool(wrote_in_transaction or self.session.dirty)
+
+    async def _scatter(self, query: Callable[[Any, str], Awaitable[T]], in_session: bool = False) -> List[T]:
+        """Run a query on every shard.
+
+        Each shard is queried concurrently in its own session when the shard router has a
+        session factory. Shards are queried one at a time in this repository's session when
+        there is no factory, when ``in_session`` is set, or when the session holds uncommitted
+        writes, so that those rows stay visible to the query.
+
+        Args:
+            query: Callable receiving a repository and a shard bind group.
+            in_session: Query in this repository's session, e.g. so that row locks are held by it.
+
+        Returns:
+            The query results, in shard order.
+        """
+        router = cast("ShardRouter", self._shard_router)
+        session_factory = router.session_factory
+        if session_factory is None or in_session or self._has_uncommitted_writes():
+            return [await query(self, shard) for shard in router.shards]
+
+        async def _query_shard(shard: str) -> T:
+            async with session_factory() as session:
+                repository = copy.copy(self)
+                repository.session = session
+                return await query(repository, shard)
+
+        return await router.scatter_async(_query_shard)
+
+    async def _write_per_shard(
+        self,
+        write: Callable[..., Awaitable[Sequence[ModelT]]],
+        shard_args: "dict[Optional[str], Sequence[Any]]",
+        *,
+        auto_commit: Optional[bool],
+        auto_expunge: Optional[bool],
+        **kwargs: Any,
+    ) -> List[ModelT]:
+        """Run a write once per shard and commit the shards together.
+
+        Args:
+            write: The repository method, called with the positional arguments and bind group of each shard.
+            shard_args: Map of bind group to the positional arguments for that shard.
+            auto_commit: Commit objects before returning.
+            auto_expunge: Remove object from session before returning.
+            **kwargs: Additional arguments passed to ``write``.
+
+        Returns:
+            The written instances, grouped by shard.
+        """
+        instances: List[ModelT] = []
+        for group, args in shard_args.items():
+            instances.extend(await write(*args, auto_commit=False, auto_expunge=False, bind_group=group, **kwargs))
+        await self._flush_or_commit(auto_commit=auto_commit)
+        for instance in instances:
+            self._expunge(instance, auto_expunge=auto_expunge)
+        return instances
+
+    async def _scatter_one_or_none(
+        self,
+        query: Callable[[Any, str], Awaitable[Optional[ModelT]]],
+        auto_expunge: Optional[bool],
+        in_session: bool = False,
+    ) -> Optional[ModelT]:
+        """Run a single-row query on every shard.
+
+        Args:
+            query: Callable receiving a repository and a shard bind group.
+            auto_expunge: Remove object from session before returning.
+            in_session: Query in this repository's session, e.g. so that row locks are held by it.
+
+        Raises:
+            MultipleResultsFound: If more than one shard returns a row.
+
+        Returns:
+            The instance found on one of the shards, or None.
+        """
+        instances = [instance for instance in await self._scatter(query, in_session=in_session) if instance is not None]
+        if len(instances) > 1:
+            msg = "Multiple rows were found when one or none was required"
+            raise MultipleResultsFound(msg)
+        if not instances:
+            return None
+        return (await self._attach_scattered(instances, auto_expunge=auto_expunge))[0]
+
+    async def _attach_scattered(self, instances: List[ModelT], auto_expunge: Optional[bool]) -> List[ModelT]:
+        """Attach instances loaded in per-shard sessions to this repository's session.
+
+        Args:
+            instances: The merged scatter results.
+            auto_expunge: Remove object from session before returning.
+
+        Returns:
+            The instances, attached unless they should be expunged.
+        """
+        resolved_auto_expunge = self.auto_expunge if auto_expunge is None else auto_expunge
+        if resolved_auto_expunge:
+            return instances
+        return [
+            instance
+            if instance in self.session
+            else await self._attach_to_session(instance, strategy="merge", load=False)
+            for instance in instances
+        ]
+
     def _queue_cache_invalidation(self, entity_id: Any, bind_group: Optional[str] = None) -> None:
         """Queue a cache invalidation for an entity.
 
@@ -646,37 +895,6 @@ class SQLAlchemyAsyncRepository(SQLAlchemyAsyncRepositoryProtocol[ModelT], Filte
             if tracker is not None:
                 tracker.add_invalidation(cast("str", model_name), entity_id, bind_group)
 
-    def _type_must_use_in_instead_of_any(self, matched_values: "List[Any]", field_type: "Any" = None) -> bool:
-        """Determine if field.in_() should be used instead of any_() for compatibility.
-
-        Uses SQLAlchemy's type introspection to detect types that may have DBAPI
-        serialization issues with the ANY() operator. Checks if actual values match
-        the column's expected python_type - mismatches indicate complex types that
-        need the safer IN() operator. Falls back to Python type checking when
-        SQLAlchemy type information is unavailable.
-
-        Args:
-            matched_values: Values to be used in the filter
-            field_type: Optional SQLAlchemy TypeEngine from the column
-
-        Returns:
-            bool: True if field.in_() should be used instead of any_()
-        """
-        if not matched_values:
-            return False
-
-        if field_type is not None:
-            try:
-                expected_python_type = getattr(field_type, "python_type", None)
-                if expected_python_type is not None:
-                    for value in matched_values:
-                        if value is not None and not isinstance(value, expected_python_type):
-                            return True
-            except (AttributeError, NotImplementedError):
-                return True
-
-        return any(value is not None and type(value) not in DEFAULT_SAFE_TYPES for value in matched_values)
-
     def _get_unique_values(self, values: "List[Any]") -> "List[Any]":
         """Get unique values from a list, handling unhashable types safely.
 
@@ -958,18 +1176,22 @@ class SQLAlchemyAsyncRepository(SQLAlchemyAsyncRepositoryProtocol[ModelT], Filte
             auto_commit: Commit objects before returning.
             error_messages: An optional dictionary of templates to use
                 for friendlier error messages to clients
-            bind_group: Optional routing group for multi-master configurations.
+            bind_group: Optional routing group for multi-master configurations. Defaults to the
+                instance's shard when sharding is configured.
 
         Returns:
             The added instance.
         """
-        _ = bind_group  # Reserved for future multi-master routing
+        bind_group = self._resolve_instance_bind_group(data, bind_group)
         error_messages = self._get_error_messages(
             error_messages=error_messages,
             default_messages=self.error_messages,
         )
-        with wrap_sqlalchemy_exception(
-            error_messages=error_messages, dialect_name=self._dialect.name, wrap_exceptions=self.wrap_exceptions
+        with (
+            wrap_sqlalchemy_exception(
+                error_messages=error_messages, dialect_name=self._dialect.name, wrap_exceptions=self.wrap_exceptions
+            ),
+            self._use_bind_group(bind_group),
         ):
             instance = await self._attach_to_session(data)
             await self._flush_or_commit(auto_commit=auto_commit)
@@ -994,12 +1216,17 @@ class SQLAlchemyAsyncRepository(SQLAlchemyAsyncRepositoryProtocol[ModelT], Filte
             auto_commit: Commit objects before returning.
             error_messages: An optional dictionary of templates to use
                 for friendlier error messages to clients
-            bind_group: Optional routing group for multi-master configurations.
+            bind_group: Optional routing group for multi-master configurations. When sharding is
+                configured and no group is given, instances are flushed to their own shards.
+
+        Note:
+            A sharded batch spanning several shards is not atomic. Each shard commits its own
+            transaction, so a failure on one shard does not roll back rows already committed
+            on another.
 
         Returns:
             The added instances.
         """
-        _ = bind_group  # Reserved for future multi-master routing
         error_messages = self._get_error_messages(
             error_messages=error_messages,
             default_messages=self.error_messages,
@@ -1007,8 +1234,18 @@ class SQLAlchemyAsyncRepository(SQLAlchemyAsyncRepositoryProtocol[ModelT], Filte
         with wrap_sqlalchemy_exception(
             error_messages=error_messages, dialect_name=self._dialect.name, wrap_exceptions=self.wrap_exceptions
         ):
-            self.session.add_all(data)
-            await self._flush_or_commit(auto_commit=auto_commit)
+            partitions = self._partition_by_shard(data, bind_group)
+            if len(partitions) == 1:
+                ((group, group_data),) = partitions.items()
+                with self._use_bind_group(group):
+                    self.session.add_all(group_data)
+                    await self._flush_or_commit(auto_commit=auto_commit)
+            else:
+                for group, group_data in partitions.items():
+                    with self._use_bind_group(group):
+                        self.session.add_all(group_data)
+                        await self._flush_or_commit(auto_commit=False)
+                await self._flush_or_commit(auto_commit=auto_commit)
             for datum in data:
                 self._expunge(datum, auto_expunge=auto_expunge)
             return data
@@ -1075,8 +1312,9 @@ class SQLAlchemyAsyncRepository(SQLAlchemyAsyncRepositoryProtocol[ModelT], Filte
                 execution_options=execution_options,
                 bind_group=bind_group,
             )
-            await self.session.delete(instance)
-            await self._flush_or_commit(auto_commit=auto_commit)
+            with self._use_bind_group(self._resolve_instance_bind_group(instance, bind_group)):
+                await self.session.delete(instance)
+                await self._flush_or_commit(auto_commit=auto_commit)
             self._expunge(instance, auto_expunge=auto_expunge)
             # Queue cache invalidation (processed on commit)
             self._queue_cache_invalidation(item_id, bind_group)
@@ -1148,6 +1386,20 @@ class SQLAlchemyAsyncRepository(SQLAlchemyAsyncRepositoryProtocol[ModelT], Filte
             error_messages=error_messages,
             default_messages=self.error_messages,
         )
+        if self._is_scatter(bind_group, None):
+            # Identifiers alone do not name a shard, so the delete runs on every shard
+            return await self._write_per_shard(
+                self.delete_many,
+                dict.fromkeys(cast("ShardRouter", self._shard_router).shards, (item_ids,)),
+                auto_commit=auto_commit,
+                auto_expunge=auto_expunge,
+                id_attribute=id_attribute,
+                chunk_size=chunk_size,
+                error_messages=error_messages,
+                load=load,
+                execution_options=execution_options,
+                uniquify=uniquify,
+            )
         with wrap_sqlalchemy_exception(
             error_messages=error_messages, dialect_name=self._dialect.name, wrap_exceptions=self.wrap_exceptions
         ):
@@ -1299,6 +1551,21 @@ class SQLAlchemyAsyncRepository(SQLAlchemyAsyncRepositoryProtocol[ModelT], Filte
             error_messages=error_messages,
             default_messages=self.error_messages,
         )
+        shard_group = self._resolve_shard_group(bind_group, filters, kwargs)
+        if self._is_scatter(bind_group, shard_group):
+            return await self._write_per_shard(
+                self.delete_where,
+                dict.fromkeys(cast("ShardRouter", self._shard_router).shards, filters),
+                auto_commit=auto_commit,
+                auto_expunge=auto_expunge,
+                error_messages=error_messages,
+                sanity_check=sanity_check,
+                load=load,
+                execution_options=execution_options,
+                uniquify=uniquify,
+                **kwargs,
+            )
+        bind_group = shard_group or bind_group
         with wrap_sqlalchemy_exception(
             error_messages=error_messages, dialect_name=self._dialect.name, wrap_exceptions=self.wrap_exceptions
         ):
@@ -1568,6 +1835,32 @@ class SQLAlchemyAsyncRepository(SQLAlchemyAsyncRepositoryProtocol[ModelT], Filte
     ) -> List[ModelT]:
         """Fetch a list of entities from the database without using cache."""
         self._uniquify = self._get_uniquify(uniquify)
+        shard_group = self._resolve_shard_group(bind_group, filters, kwargs)
+        if self._is_scatter(bind_group, shard_group):
+            orderings = order_by if order_by is not None else self.order_by
+            shard_filters, pagination = ShardRouter.split_pagination(filters, orderings)
+            results = await self._scatter(
+                lambda repository, shard: repository._get_many_from_db(  # noqa: SLF001
+                    filters=shard_filters,
+                    auto_expunge=auto_expunge,
+                    statement=statement,
+                    order_by=order_by,
+                    error_messages=error_messages,
+                    load=load,
+                    execution_options=execution_options,
+                    kwargs=kwargs,
+                    uniquify=uniquify,
+                    bind_group=shard,
+                )
+            )
+            instances = ShardRouter.merge(
+                results,
+                order_by=orderings,
+                nulls_last=self._dialect.name in {"postgresql", "oracle", "cockroachdb"},
+                pagination=pagination,
+            )
+            return await self._attach_scattered(instances, auto_expunge=auto_expunge)
+        bind_group = shard_group or bind_group
         with wrap_sqlalchemy_exception(
             error_messages=error_messages, dialect_name=self._dialect.name, wrap_exceptions=self.wrap_exceptions
         ):
@@ -1660,6 +1953,35 @@ class SQLAlchemyAsyncRepository(SQLAlchemyAsyncRepositoryProtocol[ModelT], Filte
     ) -> tuple[List[ModelT], int]:
         """Fetch a list+count payload from the database without using cache."""
         self._uniquify = self._get_uniquify(uniquify)
+        shard_group = self._resolve_shard_group(bind_group, filters, kwargs)
+        if self._is_scatter(bind_group, shard_group):
+            orderings = order_by if order_by is not None else self.order_by
+            shard_filters, pagination = ShardRouter.split_pagination(filters, orderings)
+            results = await self._scatter(
+                lambda repository, shard: repository._get_many_and_count_from_db(  # noqa: SLF001
+                    filters=shard_filters,
+                    auto_expunge=auto_expunge,
+                    statement=statement,
+                    count_with_window_function=count_with_window_function,
+                    order_by=order_by,
+                    error_messages=error_messages,
+                    load=load,
+                    execution_options=execution_options,
+                    kwargs=kwargs,
+                    uniquify=uniquify,
+                    bind_group=shard,
+                )
+            )
+            instances = ShardRouter.merge(
+                [shard_instances for shard_instances, _ in results],
+                order_by=orderings,
+                nulls_last=self._dialect.name in {"postgresql", "oracle", "cockroachdb"},
+                pagination=pagination,
+            )
+            return await self._attach_scattered(instances, auto_expunge=auto_expunge), sum(
+                count for _, count in results
+            )
+        bind_group = shard_group or bind_group
         resolved_bind_group = self._resolve_bind_group(bind_group)
         if resolved_bind_group:
             execution_options = dict(execution_options) if execution_options else {}
@@ -1802,6 +2124,38 @@ class SQLAlchemyAsyncRepository(SQLAlchemyAsyncRepositoryProtocol[ModelT], Filte
             default_messages=self.error_messages,
         )
 
+        if self._is_scatter(bind_group, None):
+            # Identifiers alone do not name a shard, so every shard is searched
+            async def _get_from_shard(repository: Any, shard: str) -> Optional[ModelT]:
+                try:
+                    return cast(
+                        "ModelT",
+                        await repository._get_from_db(  # noqa: SLF001
+                            item_id,
+                            auto_expunge=auto_expunge,
+                            statement=statement,
+                            id_attribute=id_attribute,
+                            error_messages=resolved_error_messages,
+                            load=load,
+                            execution_options=execution_options,
+                            with_for_update=with_for_update,
+                            bind_group=shard,
+                        ),
+                    )
+                except NotFoundError:
+                    return None
+
+            with wrap_sqlalchemy_exception(
+                error_messages=resolved_error_messages,
+                dialect_name=self._dialect.name,
+                wrap_exceptions=self.wrap_exceptions,
+            ):
+                return self.check_not_found(
+                    await self._scatter_one_or_none(
+                        _get_from_shard, auto_expunge=auto_expunge, in_session=with_for_update is not None
+                    )
+                )
+
         resolved_auto_expunge = self.auto_expunge if auto_expunge is None else auto_expunge
         resolved_id_attribute: Optional[Union[str, InstrumentedAttribute[Any]]] = id_attribute
         if isinstance(resolved_id_attribute, InstrumentedAttribute):
@@ -1902,6 +2256,22 @@ class SQLAlchemyAsyncRepository(SQLAlchemyAsyncRepositoryProtocol[ModelT], Filte
             error_messages=error_messages,
             default_messages=self.error_messages,
         )
+        shard_group = self._resolve_shard_group(bind_group, filters, kwargs)
+        if self._is_scatter(bind_group, shard_group):
+            return self.check_not_found(
+                await self.get_one_or_none(
+                    *filters,
+                    auto_expunge=auto_expunge,
+                    statement=statement,
+                    error_messages=error_messages,
+                    load=load,
+                    execution_options=execution_options,
+                    uniquify=uniquify,
+                    with_for_update=with_for_update,
+                    **kwargs,
+                )
+            )
+        bind_group = shard_group or bind_group
         with wrap_sqlalchemy_exception(
             error_messages=error_messages, dialect_name=self._dialect.name, wrap_exceptions=self.wrap_exceptions
         ):
@@ -1960,9 +2330,28 @@ class SQLAlchemyAsyncRepository(SQLAlchemyAsyncRepositoryProtocol[ModelT], Filte
             error_messages=error_messages,
             default_messages=self.error_messages,
         )
+        shard_group = self._resolve_shard_group(bind_group, filters, kwargs)
         with wrap_sqlalchemy_exception(
             error_messages=error_messages, dialect_name=self._dialect.name, wrap_exceptions=self.wrap_exceptions
         ):
+            if self._is_scatter(bind_group, shard_group):
+                return await self._scatter_one_or_none(
+                    lambda repository, shard: repository.get_one_or_none(
+                        *filters,
+                        auto_expunge=auto_expunge,
+                        statement=statement,
+                        error_messages=error_messages,
+                        load=load,
+                        execution_options=execution_options,
+                        uniquify=uniquify,
+                        with_for_update=with_for_update,
+                        bind_group=shard,
+                        **kwargs,
+                    ),
+                    auto_expunge=auto_expunge,
+                    in_session=with_for_update is not None,
+                )
+            bind_group = shard_group or bind_group
             if bind_group:
                 execution_options = dict(execution_options) if execution_options else {}
                 execution_options["bind_group"] = bind_group
@@ -2070,14 +2459,15 @@ class SQLAlchemyAsyncRepository(SQLAlchemyAsyncRepositoryProtocol[ModelT], Filte
                     field = getattr(existing, field_name, MISSING)
                     if field is not MISSING and not compare_values(field, new_field_value):  # pragma: no cover
                         setattr(existing, field_name, new_field_value)
-                existing = await self._attach_to_session(existing, strategy="merge")
-                await self._flush_or_commit(auto_commit=auto_commit)
-                await self._refresh(
-                    existing,
-                    attribute_names=attribute_names,
-                    with_for_update=with_for_update,
-                    auto_refresh=auto_refresh,
-                )
+                with self._use_bind_group(self._resolve_instance_bind_group(existing, bind_group)):
+                    existing = await self._attach_to_session(existing, strategy="merge")
+                    await self._flush_or_commit(auto_commit=auto_commit)
+                    await self._refresh(
+                        existing,
+                        attribute_names=attribute_names,
+                        with_for_update=with_for_update,
+                        auto_refresh=auto_refresh,
+                    )
                 self._expunge(existing, auto_expunge=auto_expunge)
             return existing, False
 
@@ -2149,14 +2539,15 @@ class SQLAlchemyAsyncRepository(SQLAlchemyAsyncRepositoryProtocol[ModelT], Filte
                 if field is not MISSING and not compare_values(field, new_field_value):  # pragma: no cover
                     updated = True
                     setattr(existing, field_name, new_field_value)
-            existing = await self._attach_to_session(existing, strategy="merge")
-            await self._flush_or_commit(auto_commit=auto_commit)
-            await self._refresh(
-                existing,
-                attribute_names=attribute_names,
-                with_for_update=with_for_update,
-                auto_refresh=auto_refresh,
-            )
+            with self._use_bind_group(self._resolve_instance_bind_group(existing, bind_group)):
+                existing = await self._attach_to_session(existing, strategy="merge")
+                await self._flush_or_commit(auto_commit=auto_commit)
+                await self._refresh(
+                    existing,
+                    attribute_names=attribute_names,
+                    with_for_update=with_for_update,
+                    auto_refresh=auto_refresh,
+                )
             self._expunge(existing, auto_expunge=auto_expunge)
             return existing, updated
 
@@ -2192,6 +2583,22 @@ class SQLAlchemyAsyncRepository(SQLAlchemyAsyncRepositoryProtocol[ModelT], Filte
             error_messages=error_messages,
             default_messages=self.error_messages,
         )
+        shard_group = self._resolve_shard_group(bind_group, filters, kwargs)
+        if self._is_scatter(bind_group, shard_group):
+            counts = await self._scatter(
+                lambda repository, shard: repository.count(
+                    *filters,
+                    statement=statement,
+                    error_messages=error_messages,
+                    load=load,
+                    execution_options=execution_options,
+                    uniquify=uniquify,
+                    bind_group=shard,
+                    **kwargs,
+                )
+            )
+            return sum(counts)
+        bind_group = shard_group or bind_group
         with wrap_sqlalchemy_exception(
             error_messages=error_messages, dialect_name=self._dialect.name, wrap_exceptions=self.wrap_exceptions
         ):
@@ -2231,6 +2638,7 @@ class SQLAlchemyAsyncRepository(SQLAlchemyAsyncRepositoryProtocol[ModelT], Filte
         execution_options: Optional[dict[str, Any]] = None,
         uniquify: Optional[bool] = None,
         bind_group: Optional[str] = None,
+        blind: bool = False,
     ) -> ModelT:
         """Update instance with the attribute values present on `data`.
 
@@ -2252,12 +2660,24 @@ class SQLAlchemyAsyncRepository(SQLAlchemyAsyncRepositoryProtocol[ModelT], Filte
             load: Set relationships to be loaded
             execution_options: Set default execution options
             uniquify: Optionally apply the ``unique()`` method to results before returning.
-            bind_group: Optional routing group for multi-master configurations.
+            bind_group: Optional routing group for multi-master configurations. Defaults to the
+                instance's shard when sharding is configured.
+            blind: Skip loading the existing row and issue a single ``UPDATE ... RETURNING`` for
+                the column values explicitly set on ``data``. ``with_for_update``,
+                ``attribute_names`` and ``auto_refresh`` are ignored, and relationships cannot be
+                changed in this mode.
+
+        Raises:
+            NotFoundError: If ``blind`` is set and no row matches the identifier.
+            RepositoryError: If ``blind`` is set and ``data`` has relationships assigned.
 
         Returns:
             The updated instance.
         """
         self._uniquify = self._get_uniquify(uniquify)
+        if blind or self._shard_router is None or self._shard_router.resolve_instance(data) is not None:
+            # Without a shard key on ``data``, the shard is taken from the row loaded below
+            bind_group = self._resolve_instance_bind_group(data, bind_group)
         error_messages = self._get_error_messages(
             error_messages=error_messages,
             default_messages=self.error_messages,
@@ -2273,6 +2693,17 @@ class SQLAlchemyAsyncRepository(SQLAlchemyAsyncRepositoryProtocol[ModelT], Filte
                     data,
                     id_attribute=id_attribute,
                 )
+            if blind:
+                return await self._update_blind(
+                    data,
+                    item_id,
+                    auto_commit=auto_commit,
+                    auto_expunge=auto_expunge,
+                    id_attribute=id_attribute,
+                    load=load,
+                    execution_options=execution_options,
+                    bind_group=bind_group,
+                )
             existing_instance = await self.get(
                 item_id,
                 id_attribute=id_attribute,
@@ -2281,6 +2712,7 @@ class SQLAlchemyAsyncRepository(SQLAlchemyAsyncRepositoryProtocol[ModelT], Filte
                 with_for_update=with_for_update,
                 bind_group=bind_group,
             )
+            bind_group = self._resolve_instance_bind_group(existing_instance, bind_group)
             mapper = None
             with (
                 self.session.no_autoflush,
@@ -2337,20 +2769,105 @@ class SQLAlchemyAsyncRepository(SQLAlchemyAsyncRepositoryProtocol[ModelT], Filte
                             else:
                                 setattr(existing_instance, relationship.key, new_value)
 
-            instance = await self._attach_to_session(existing_instance, strategy="merge")
-
-            await self._flush_or_commit(auto_commit=auto_commit)
-            await self._refresh(
-                instance,
-                attribute_names=attribute_names,
-                with_for_update=with_for_update,
-                auto_refresh=auto_refresh,
-            )
+            with self._use_bind_group(bind_group):
+                instance = await self._attach_to_session(existing_instance, strategy="merge")
+                await self._flush_or_commit(auto_commit=auto_commit)
+                await self._refresh(
+                    instance,
+                    attribute_names=attribute_names,
+                    with_for_update=with_for_update,
+                    auto_refresh=auto_refresh,
+                )
             self._expunge(instance, auto_expunge=auto_expunge)
             # Queue cache invalidation (processed on commit)
             self._queue_cache_invalidation(self.get_primary_key_value(instance), bind_group)
             return instance
 
+    async def _update_blind(
+        self,
+        data: ModelT,
+        item_id: Any,
+        *,
+        auto_commit: Optional[bool],
+        auto_expunge: Optional[bool],
+        id_attribute: Optional[Union[str, InstrumentedAttribute[Any]]],
+        load: Optional[LoadSpec],
+        execution_options: Optional[dict[str, Any]],
+        bind_group: Optional[str],
+    ) -> ModelT:
+        """Update the row identified by ``item_id`` without loading it first.
+
+        On dialects supporting ``UPDATE ... RETURNING`` the modified row comes back in the same
+        round trip; otherwise it is selected after the update.
+
+        Returns:
+            The updated instance.
+        """
+        state = inspect(data)
+        if any(
+            not relationship.viewonly and was_attribute_set(data, state, relationship.key)
+            for relationship in state.mapper.relationships  # type: ignore[union-attr]  # pyright: ignore[reportOptionalMemberAccess]
+        ):
+            msg = "Blind updates cannot modify relationships; use a regular update instead."
+            raise RepositoryError(msg)
+        values = get_set_column_values(data)
+        if not values:
+            return await self.get(
+                item_id,
+                auto_expunge=auto_expunge,
+                id_attribute=id_attribute,
+                load=load,
+                execution_options=execution_options,
+                use_cache=False,
+                bind_group=bind_group,
+            )
+        resolved_bind_group = self._resolve_bind_group(bind_group)
+        if resolved_bind_group:
+            execution_options = dict(execution_options) if execution_options else {}
+            execution_options["bind_group"] = resolved_bind_group
+        resolved_execution_options = self._get_execution_options(execution_options)
+        loader_options = self._get_loader_options(load)[0]
+        criteria = (
+            self._build_pk_filter(item_id)
+            if id_attribute is None
+            else get_instrumented_attr(self.model_type, id_attribute) == item_id
+        )
+        statement = self._get_base_stmt(
+            statement=update(self.model_type)
+            .where(criteria)
+            .values({get_instrumented_attr(self.model_type, key): value for key, value in values.items()}),
+            loader_options=loader_options,
+            execution_options=resolved_execution_options,
+        )
+        with self._use_bind_group(bind_group):
+            if self._dialect.update_returning:
+                instance = self.check_not_found(
+                    (
+                        await self.session.scalars(
+                            statement.returning(self.model_type).execution_options(populate_existing=True),
+                            execution_options=resolved_execution_options,
+                        )
+                    ).one_or_none()
+                )
+            else:
+                result = await self.session.execute(statement, execution_options=resolved_execution_options)
+                if not cast("CursorResult[Any]", result).rowcount:
+                    self.check_not_found(None)
+                instance = await self.get(
+                    item_id,
+                    auto_expunge=False,
+                    id_attribute=id_attribute,
+                    load=load,
+                    execution_options=execution_options,
+                    use_cache=False,
+                    bind_group=bind_group,
+                )
+            await self._flush_or_commit(auto_commit=auto_commit)
+        self._expunge(instance, auto_expunge=auto_expunge)
+        # Queue cache invalidation (processed on commit)
+        self._queue_cache_invalidation(self.get_primary_key_value(instance), bind_group)
+        return instance
+
     async def update_many(
         self,
         data: List[ModelT],
@@ -2379,7 +2896,12 @@ class SQLAlchemyAsyncRepository(SQLAlchemyAsyncRepositoryProtocol[ModelT], Filte
             load: Set default relationships to be loaded
             execution_options: Set default execution options
             uniquify: Optionally apply the ``unique()`` method to results before returning.
-            bind_group: Optional routing group for multi-master configurations.
+            bind_group: Optional routing group for multi-master configurations. When sharding is
+                configured and no group is given, items are updated on their own shards.
+
+        Raises:
+            RepositoryError: If sharding is configured, no bind group is given and an item has no
+                shard key value.
 
         Returns:
             The updated instances.
@@ -2389,6 +2911,17 @@ class SQLAlchemyAsyncRepository(SQLAlchemyAsyncRepositoryProtocol[ModelT], Filte
             error_messages=error_messages,
             default_messages=self.error_messages,
         )
+        if self._is_scatter(bind_group, None):
+            return await self._write_per_shard(
+                self.update_many,
+                {group: (group_data,) for group, group_data in self._partition_by_shard(data, None).items()},
+                auto_commit=auto_commit,
+                auto_expunge=auto_expunge,
+                error_messages=error_messages,
+                load=load,
+                execution_options=execution_options,
+                uniquify=uniquify,
+            )
         supports_updated_at = hasattr(self.model_type, "updated_at")
         data_to_update: List[dict[str, Any]] = []
         for v in data:
@@ -2414,21 +2947,24 @@ class SQLAlchemyAsyncRepository(SQLAlchemyAsyncRepositoryProtocol[ModelT], Filte
                 execution_options=execution_options,
             )
             if supports_returning:
-                instances = list(
-                    await self.session.scalars(
-                        statement,
-                        cast("_CoreSingleExecuteParams", data_to_update),  # this is not correct but the only way
-                        # currently to deal with an SQLAlchemy typing issue. See
-                        # https://github.com/sqlalchemy/sqlalchemy/discussions/9925
-                        execution_options=execution_options,
-                    ),
-                )
-                await self._flush_or_commit(auto_commit=auto_commit)
+                # Bulk updates by primary key resolve their bind from the mapper, not the statement
+                with self._use_bind_group(resolved_bind_group):
+                    instances = list(
+                        await self.session.scalars(
+                            statement,
+                            cast("_CoreSingleExecuteParams", data_to_update),  # this is not correct but the only way
+                            # currently to deal with an SQLAlchemy typing issue. See
+                            # https://github.com/sqlalchemy/sqlalchemy/discussions/9925
+                            execution_options=execution_options,
+                        ),
+                    )
+                    await self._flush_or_commit(auto_commit=auto_commit)
                 for instance in instances:
                     self._expunge(instance, auto_expunge=auto_expunge)
                 return instances
-            await self.session.execute(statement, data_to_update, execution_options=execution_options)
-            await self._flush_or_commit(auto_commit=auto_commit)
+            with self._use_bind_group(resolved_bind_group):
+                await self.session.execute(statement, data_to_update, execution_options=execution_options)
+                await self._flush_or_commit(auto_commit=auto_commit)
 
             # For non-RETURNING backends, fetch updated instances from database
             if self.has_composite_pk:
@@ -2883,14 +3419,15 @@ class SQLAlchemyAsyncRepository(SQLAlchemyAsyncRepositoryProtocol[ModelT], Filte
                 field = getattr(existing, field_name, MISSING)
                 if field is not MISSING and not compare_values(field, new_field_value):  # pragma: no cover
                     setattr(existing, field_name, new_field_value)
-            instance = await self._attach_to_session(existing, strategy="merge")
-            await self._flush_or_commit(auto_commit=auto_commit)
-            await self._refresh(
-                instance,
-                attribute_names=attribute_names,
-                with_for_update=with_for_update,
-                auto_refresh=auto_refresh,
-            )
+            with self._use_bind_group(self._resolve_instance_bind_group(existing, bind_group)):
+                instance = await self._attach_to_session(existing, strategy="merge")
+                await self._flush_or_commit(auto_commit=auto_commit)
+                await self._refresh(
+                    instance,
+                    attribute_names=attribute_names,
+                    with_for_update=with_for_update,
+                    auto_refresh=auto_refresh,
+                )
             self._expunge(instance, auto_expunge=auto_expunge)
             # Queue cache invalidation (processed on commit)
             self._queue_cache_invalidation(self.get_primary_key_value(instance), bind_group)
@@ -2932,7 +3469,12 @@ class SQLAlchemyAsyncRepository(SQLAlchemyAsyncRepositoryProtocol[ModelT], Filte
             load: Set default relationships to be loaded
             execution_options: Set default execution options
             uniquify: Optionally apply the ``unique()`` method to results before returning.
-            bind_group: Optional routing group to use for the operation.
+            bind_group: Optional routing group to use for the operation. When sharding is
+                configured and no group is given, instances are upserted on their own shards.
+
+        Raises:
+            RepositoryError: If sharding is configured, no bind group is given and an instance has
+                no shard key value.
 
         Returns:
             The updated or created instance.
@@ -2942,6 +3484,19 @@ class SQLAlchemyAsyncRepository(SQLAlchemyAsyncRepositoryProtocol[ModelT], Filte
             error_messages=error_messages,
             default_messages=self.error_messages,
         )
+        if self._is_scatter(bind_group, None):
+            return await self._write_per_shard(
+                self.upsert_many,
+                {group: (group_data,) for group, group_data in self._partition_by_shard(data, None).items()},
+                auto_commit=auto_commit,
+                auto_expunge=auto_expunge,
+                no_merge=no_merge,
+                match_fields=match_fields,
+                error_messages=error_messages,
+                load=load,
+                execution_options=execution_options,
+                uniquify=uniquify,
+            )
         instances: List[ModelT] = []
         data_to_update: List[ModelT] = []
         data_to_insert: List[ModelT] = []
@@ -3159,6 +3714,100 @@ class SQLAlchemyAsyncRepository(SQLAlchemyAsyncRepositoryProtocol[ModelT], Filte
             ),
         )
 
+    async def get_many_columns(
+        self,
+        columns: Sequence[str],
+        *filters: Union[StatementFilter, ColumnElement[bool]],
+        statement: Optional[Select[tuple[ModelT]]] = None,
+        order_by: Optional[Union[List[OrderingPair], OrderingPair]] = None,
+        error_messages: Optional[Union[ErrorMessages, EmptyType]] = Empty,
+        execution_options: Optional[dict[str, Any]] = None,
+        bind_group: Optional[str] = None,
+        **kwargs: Any,
+    ) -> List[Row[Any]]:
+        """Get the values of some columns as rows, without building model instances.
+
+        Selecting rows skips instrumentation, the identity map and expunging, which makes it
+        the cheapest way to read large pages for read-only use.
+
+        Args:
+            columns: Names of the column attributes to select, in order.
+            *filters: Types for specific filtering operations.
+            statement: To facilitate customization of the underlying select query. Its columns
+                are replaced by ``columns``.
+            order_by: Set default order options for queries.
+            error_messages: An optional dictionary of templates to use
+                for friendlier error messages to clients
+            execution_options: Set default execution options
+            bind_group: Optional routing group to use for the operation.
+            **kwargs: Instance attribute value filters.
+
+        Raises:
+            RepositoryError: If a name in ``columns`` is not a column attribute of the model.
+
+        Returns:
+            The selected rows, after filtering applied.
+        """
+        column_keys = {prop.key for prop in class_mapper(self.model_type).column_attrs}
+        if unknown := [name for name in columns if name not in column_keys]:
+            msg = f"Not column attributes of {self.model_type.__name__}: {', '.join(unknown)}"
+            raise RepositoryError(msg)
+        error_messages = self._get_error_messages(
+            error_messages=error_messages,
+            default_messages=self.error_messages,
+        )
+        shard_group = self._resolve_shard_group(bind_group, filters, kwargs)
+        if self._is_scatter(bind_group, shard_group):
+            orderings = order_by if order_by is not None else self.order_by
+            shard_filters, pagination = ShardRouter.split_pagination(filters, orderings)
+            # Ordering columns that are not selected are selected too, so shard rows can be merged
+            sort_columns = [name for name, _ in ShardRouter.ordering_columns(orderings) if name not in columns]
+            selected = [*columns, *dict.fromkeys(sort_columns)]
+            results = await self._scatter(
+                lambda repository, shard: repository.get_many_columns(
+                    selected,
+                    *shard_filters,
+                    statement=statement,
+                    order_by=order_by,
+                    error_messages=error_messages,
+                    execution_options=execution_options,
+                    bind_group=shard,
+                    **kwargs,
+                )
+            )
+            rows = ShardRouter.merge(
+                results,
+                order_by=orderings,
+                nulls_last=self._dialect.name in {"postgresql", "oracle", "cockroachdb"},
+                pagination=pagination,
+                row_columns=selected,
+            )
+            if not sort_columns:
+                return rows
+            make_row = result_tuple(columns)
+            return [make_row(row[: len(columns)]) for row in rows]
+        bind_group = shard_group or bind_group
+        with wrap_sqlalchemy_exception(
+            error_messages=error_messages, dialect_name=self._dialect.name, wrap_exceptions=self.wrap_exceptions
+        ):
+            resolved_bind_group = self._resolve_bind_group(bind_group)
+            if resolved_bind_group:
+                execution_options = dict(execution_options) if execution_options else {}
+                execution_options["bind_group"] = resolved_bind_group
+            resolved_statement = self._get_base_stmt(
+                statement=(self.statement if statement is None else statement).with_only_columns(
+                    *(get_instrumented_attr(self.model_type, name) for name in columns)
+                ),
+                loader_options=None,
+                execution_options=self._get_execution_options(execution_options),
+            )
+            if order_by is None:
+                order_by = self.order_by if self.order_by is not None else []
+            resolved_statement = self._apply_order_by(statement=resolved_statement, order_by=order_by)
+            resolved_statement = self._apply_filters(*filters, statement=resolved_statement)
+            resolved_statement = self._filter_select_by_kwargs(resolved_statement, kwargs)
+            return list((await self.session.execute(resolved_statement)).all())
+
     async def list_and_count(
         self,
         *filters: Union[StatementFilter, ColumnElement[bool]],
@@ -7,6 +7,8 @@ from collections.abc import Iterable, Mapping, Sequence
 from typing import Any, Final, Literal, Optional, Protocol, Union, cast, overload
 
 from sqlalchemy import (
+    BinaryExpression,
+    BindParameter,
     Column,
     Delete,
     Dialect,
@@ -25,26 +27,32 @@ from sqlalchemy.orm import (
     lazyload,
     selectinload,
 )
+from sqlalchemy.orm.exc import UnmappedColumnError
 from sqlalchemy.orm.strategy_options import (
     _AbstractLoad,  # pyright: ignore[reportPrivateUsage]  # pyright: ignore[reportPrivateUsage]
 )
 from sqlalchemy.sql import ColumnElement, ColumnExpressionArgument
+from sqlalchemy.sql import operators as op
 from sqlalchemy.sql.base import ExecutableOption
 from sqlalchemy.sql.dml import ReturningDelete, ReturningUpdate
 from sqlalchemy.sql.elements import Label
+from sqlalchemy.sql.visitors import replacement_traverse
 from typing_extensions import TypeAlias
 
 from advanced_alchemy.base import ModelProtocol
-from advanced_alchemy.exceptions import ErrorMessages
+from advanced_alchemy.exceptions import ErrorMessages, RepositoryError
 from advanced_alchemy.exceptions import wrap_sqlalchemy_exception as _wrap_sqlalchemy_exception
 from advanced_alchemy.filters import (
+    CollectionFilter,
     InAnyFilter,
+    NotInCollectionFilter,
     PaginationFilter,
     StatementFilter,
     StatementTypeT,
 )
 from advanced_alchemy.repository._typing import arrays_equal, is_numpy_array
 from advanced_alchemy.repository.typing import ModelT, OrderingPair, PrimaryKeyType
+from advanced_alchemy.types.encrypted_string import get_blind_indexes
 from advanced_alchemy.utils.serialization import encode_complex_type, encode_json
 
 DEFAULT_SAFE_TYPES: Final[set[type[Any]]] = {
@@ -662,6 +670,10 @@ class FilterableRepository(FilterableRepositoryProtocol[ModelT]):
     """The SQLAlchemy model class this repository manages."""
     prefer_any_dialects: Optional[tuple[str]] = ("postgresql",)
     """List of dialects that prefer to use ``field.id = ANY(:1)`` instead of ``field.id IN (...)``."""
+    values_join_dialects: Optional[tuple[str, ...]] = ("postgresql", "sqlite", "mssql")
+    """List of dialects that match large collections against a ``VALUES`` derived table instead of ``IN (...)``."""
+    values_join_threshold: int = 500
+    """Collection size above which :class:`~advanced_alchemy.filters.InAnyFilter` filters use a ``VALUES`` derived table."""
     order_by: Optional[Union[list[OrderingPair], OrderingPair]] = None
     """List or single :class:`~advanced_alchemy.repository.typing.OrderingPair` to use for sorting."""
     _prefer_any: bool = False
@@ -669,6 +681,64 @@ class FilterableRepository(FilterableRepositoryProtocol[ModelT]):
     _dialect: Dialect
     """The SQLAlchemy :class:`sqlalchemy.dialects.Dialect` being used."""
 
+    @property
+    def _values_join_threshold(self) -> Optional[int]:
+        """Collection size above which ``VALUES`` derived tables are used, if the dialect supports them."""
+        dialect = getattr(self, "_dialect", None)
+        if dialect is None or dialect.name not in (self.values_join_dialects or ()):
+            return None
+        return self.values_join_threshold
+
+    def _type_must_use_in_instead_of_any(self, matched_values: "list[Any]", field_type: "Any" = None) -> bool:
+        """Determine if field.in_() should be used instead of any_() for compatibility.
+
+        Uses SQLAlchemy's type introspection to detect types that may have DBAPI
+        serialization issues with the ANY() operator. Checks if actual values match
+        the column's expected python_type - mismatches indicate complex types that
+        need the safer IN() operator. Falls back to Python type checking when
+        SQLAlchemy type information is unavailable.
+
+        Args:
+            matched_values: Values to be used in the filter
+            field_type: Optional SQLAlchemy TypeEngine from the column
+
+        Returns:
+            bool: True if field.in_() should be used instead of any_()
+        """
+        if not matched_values:
+            return False
+
+        if field_type is not None:
+            try:
+                expected_python_type = getattr(field_type, "python_type", None)
+                if expected_python_type is not None:
+                    for value in matched_values:
+                        if value is not None and not isinstance(value, expected_python_type):
+                            return True
+            except (AttributeError, NotImplementedError):
+                return True
+
+        return any(value is not None and type(value) not in DEFAULT_SAFE_TYPES for value in matched_values)
+
+    def _filter_prefers_any(self, filter_: InAnyFilter) -> bool:
+        """Determine if a collection filter should bind its values as an array with ``ANY``.
+
+        Args:
+            filter_: The collection filter being applied.
+
+        Returns:
+            bool: True if the dialect prefers ``ANY`` and the values are safe to bind as an array
+        """
+        if not self._prefer_any:
+            return False
+        if not isinstance(filter_, (CollectionFilter, NotInCollectionFilter)):
+            return True
+        values: Any = filter_.values
+        if values is None or isinstance(values, BindParameter):
+            return True
+        field = filter_._get_instrumented_attr(self.model_type, filter_.field_name)  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+        return not self._type_must_use_in_instead_of_any(list(values), field.type)
+
     @overload
     def _apply_filters(
         self,
@@ -722,9 +792,14 @@ class FilterableRepository(FilterableRepositoryProtocol[ModelT]):
                 if apply_pagination:
                     statement = filter_.append_to_statement(statement, self.model_type)
             elif isinstance(filter_, (InAnyFilter,)):
-                statement = filter_.append_to_statement(statement, self.model_type)
+                statement = self._use_blind_index_filter(filter_).append_to_statement(
+                    statement,
+                    self.model_type,
+                    prefer_any=self._filter_prefers_any(filter_),
+                    values_threshold=self._values_join_threshold,
+                )
             elif isinstance(filter_, ColumnElement):
-                statement = cast("StatementTypeT", statement.where(filter_))
+                statement = cast("StatementTypeT", statement.where(self._use_blind_index(filter_)))
             else:
                 statement = filter_.append_to_statement(statement, self.model_type)
         return statement
@@ -746,9 +821,100 @@ class FilterableRepository(FilterableRepositoryProtocol[ModelT]):
         """
         for key, val in dict(kwargs).items():
             field = get_instrumented_attr(self.model_type, key)
-            statement = cast("StatementTypeT", statement.where(field == val))
+            statement = cast("StatementTypeT", statement.where(self._get_equality_clause(field.key, val)))
         return statement
 
+    def _get_equality_clause(self, key: str, value: Any) -> ColumnElement[bool]:
+        """Compare an attribute with a value, through its blind index if it has one.
+
+        Args:
+            key: Name of the model attribute.
+            value: The value to compare with.
+
+        Returns:
+            ColumnElement[bool]: The equality clause.
+        """
+        blind_indexes = get_blind_indexes(self.model_type).get(key) if value is not None else None
+        if blind_indexes:
+            index_key, index = blind_indexes[0]
+            return get_instrumented_attr(self.model_type, index_key) == index.digest(value)
+        return cast("ColumnElement[bool]", get_instrumented_attr(self.model_type, key) == value)
+
+    def _use_blind_index(self, clause: ColumnElement[bool]) -> ColumnElement[bool]:
+        """Rewrite comparisons of blind-indexed attributes in a filter clause to use their index.
+
+        ``==``, ``!=``, ``in_()`` and ``not_in()`` against values compare the index column
+        with the digests of the values, including inside ``and_()`` / ``or_()`` groups.
+
+        Args:
+            clause: The filter clause.
+
+        Raises:
+            RepositoryError: If a blind-indexed attribute is compared with another operator.
+
+        Returns:
+            ColumnElement[bool]: The clause to apply.
+        """
+        if not get_blind_indexes(self.model_type):
+            return clause
+        return replacement_traverse(clause, {}, self._use_blind_index_comparison)
+
+    def _use_blind_index_comparison(self, element: Any, **_: Any) -> Optional[ColumnElement[bool]]:
+        if not (
+            isinstance(element, BinaryExpression)
+            and isinstance(element.left, Column)
+            and isinstance(element.right, BindParameter)
+        ):
+            return None
+        try:
+            key = class_mapper(self.model_type).get_property_by_column(element.left).key
+        except UnmappedColumnError:
+            return None
+        blind_indexes = get_blind_indexes(self.model_type).get(key)
+        if not blind_indexes:
+            return None
+        value = element.right.effective_value
+        if element.operator is op.eq:
+            return self._get_equality_clause(key, value)
+        index_key, index = blind_indexes[0]
+        index_column = get_instrumented_attr(self.model_type, index_key)
+        if element.operator is op.ne:
+            return index_column != index.digest(value)
+        if element.operator in {op.in_op, op.not_in_op}:
+            digests = [index.digest(item) for item in value or () if item is not None]
+            return index_column.in_(digests) if element.operator is op.in_op else index_column.not_in(digests)
+        msg = (
+            f"{self.model_type.__name__}.{key} is encrypted and can only be filtered with ==, !=, in_() "
+            "and not_in() through its blind index"
+        )
+        raise RepositoryError(detail=msg)
+
+    def _use_blind_index_filter(self, filter_: InAnyFilter) -> InAnyFilter:
+        """Point a collection filter on a blind-indexed attribute at its index.
+
+        Args:
+            filter_: The ``IN`` / ``NOT IN`` filter.
+
+        Returns:
+            InAnyFilter: A copy of the filter on the index column with digested values, or the
+            filter itself when its field has no blind index.
+        """
+        field_name: Any = getattr(filter_, "field_name", None)
+        if isinstance(field_name, InstrumentedAttribute) and field_name.class_ is self.model_type:
+            field_name = field_name.key
+        blind_indexes = get_blind_indexes(self.model_type).get(field_name) if isinstance(field_name, str) else None
+        values: Any = getattr(filter_, "values", None)
+        if not blind_indexes or values is None:
+            return filter_
+        if isinstance(values, BindParameter):
+            values = values.effective_value
+        index_key, index = blind_indexes[0]
+        return dataclasses.replace(  # type: ignore[type-var]
+            filter_,
+            field_name=index_key,
+            values=[index.digest(value) for value in values if value is not None],
+        )
+
     def _apply_order_by(
         self,
         statement: StatementTypeT,
@@ -863,6 +1029,31 @@ def was_attribute_set(instance: Any, mapper: Any, attr_name: str) -> bool:
         return True
 
 
+def get_set_column_values(instance: Any) -> dict[str, Any]:
+    """Collect the column values explicitly set on a model instance.
+
+    Primary key columns are excluded, as are columns with defaults or update handlers
+    that are set to ``None``, matching what a regular update copies onto the existing row.
+
+    Args:
+        instance: The model instance to read.
+
+    Returns:
+        A mapping of attribute names to the values that were set.
+    """
+    state = inspect(instance)
+    values: dict[str, Any] = {}
+    for prop in state.mapper.column_attrs:
+        column = prop.columns[0]
+        if getattr(column, "primary_key", False) or not was_attribute_set(instance, state, prop.key):
+            continue
+        value = getattr(instance, prop.key)
+        if value is None and column_has_defaults(column):
+            continue
+        values[prop.key] = value
+    return values
+
+
 def compare_values(existing_value: Any, new_value: Any) -> bool:
     """Safely compare two values, handling numpy arrays and other special types.
 
@@ -1,6 +1,8 @@
 # Do not edit this file directly. It has been autogenerated from
 # advanced_alchemy/repository/memory/_async.py
 import datetime
+import heapq
+import math
 import random
 import re
 import string
@@ -14,12 +16,15 @@ from sqlalchemy import (
     Dialect,
     Select,
     StatementLambdaElement,
+    UnaryExpression,
     Update,
 )
+from sqlalchemy.engine.result import result_tuple
 from sqlalchemy.orm import InstrumentedAttribute, Session, class_mapper
 from sqlalchemy.orm.scoping import scoped_session
 from sqlalchemy.orm.strategy_options import _AbstractLoad  # pyright: ignore[reportPrivateUsage]
 from sqlalchemy.sql.dml import ReturningUpdate
+from sqlalchemy.sql.operators import desc_op
 from sqlalchemy.sql.selectable import ForUpdateParameter
 from typing_extensions import Self
 
@@ -27,6 +32,7 @@ from advanced_alchemy.exceptions import ErrorMessages, IntegrityError, NotFoundE
 from advanced_alchemy.filters import (
     BeforeAfter,
     CollectionFilter,
+    FullTextSearchFilter,
     LimitOffset,
     NotInCollectionFilter,
     NotInSearchFilter,
@@ -34,6 +40,7 @@ from advanced_alchemy.filters import (
     OrderBy,
     SearchFilter,
     StatementFilter,
+    VectorSimilarityFilter,
 )
 from advanced_alchemy.repository._sync import SQLAlchemySyncRepositoryProtocol, SQLAlchemySyncSlugRepositoryProtocol
 from advanced_alchemy.repository._util import (
@@ -52,6 +59,7 @@ from advanced_alchemy.repository.memory.base import (
     SQLAlchemyMultiStore,
 )
 from advanced_alchemy.repository.typing import MISSING, ModelT, OrderingPair, PrimaryKeyType
+from advanced_alchemy.types.vector import vector_distances
 from advanced_alchemy.utils.dataclass import Empty, EmptyType
 from advanced_alchemy.utils.deprecation import warn_deprecation
 from advanced_alchemy.utils.text import slugify
@@ -378,13 +386,22 @@ class SQLAlchemySyncMockRepository(SQLAlchemySyncRepositoryProtocol[ModelT]):
         return result_
 
     @staticmethod
+    def _search_pattern(value: str, ignore_case: bool, mode: str) -> "re.Pattern[str]":
+        flags = re.IGNORECASE if ignore_case or mode == "trigram" else 0
+        if mode == "prefix":
+            return re.compile(rf"{re.escape(value)}.*", flags)
+        return re.compile(rf".*{value}.*", flags)
+
+    @classmethod
     def _filter_by_like(
+        cls,
         result: List[ModelT],
         field_name: Union[str, set[str]],
         value: str,
         ignore_case: bool,
+        mode: str = "contains",
     ) -> List[ModelT]:
-        pattern = re.compile(rf".*{value}.*", re.IGNORECASE) if ignore_case else re.compile(rf".*{value}.*")
+        pattern = cls._search_pattern(value, ignore_case, mode)
         fields = {field_name} if isinstance(field_name, str) else field_name
         items: List[ModelT] = []
         for field in fields:
@@ -398,13 +415,44 @@ class SQLAlchemySyncMockRepository(SQLAlchemySyncRepositoryProtocol[ModelT]):
         return list(set(items))
 
     @staticmethod
+    def _filter_by_full_text(
+        result: List[ModelT],
+        field_name: Union[str, set[str]],
+        value: str,
+    ) -> List[ModelT]:
+        fields = {field_name} if isinstance(field_name, str) else field_name
+        words = [word.strip('"') for word in value.lower().split() if word != "or"]
+        required = [word for word in words if word and not word.startswith("-")]
+        excluded = [word[1:] for word in words if word.startswith("-") and len(word) > 1]
+        items: List[ModelT] = []
+        for item in result:
+            document = " ".join(str(getattr(item, field, None) or "") for field in fields).lower()
+            if all(word in document for word in required) and not any(word in document for word in excluded):
+                items.append(item)
+        return items
+
+    def _filter_by_vector_similarity(self, result: List[ModelT], filter_: VectorSimilarityFilter) -> List[ModelT]:
+        field_str = self._extract_field_name(filter_.field_name)
+        items = [item for item in result if getattr(item, field_str) is not None]
+        distances = vector_distances(filter_.vector, [getattr(item, field_str) for item in items], filter_.metric)
+        ranked = [
+            (distance, index)
+            for index, distance in enumerate(distances)
+            if not math.isnan(distance) and (filter_.max_distance is None or distance <= filter_.max_distance)
+        ]
+        ranked = heapq.nsmallest(filter_.k, ranked) if filter_.k is not None else sorted(ranked)
+        return [items[index] for _, index in ranked]
+
+    @classmethod
     def _filter_by_not_like(
+        cls,
         result: List[ModelT],
         field_name: Union[str, set[str]],
         value: str,
         ignore_case: bool,
+        mode: str = "contains",
     ) -> List[ModelT]:
-        pattern = re.compile(rf".*{value}.*", re.IGNORECASE) if ignore_case else re.compile(rf".*{value}.*")
+        pattern = cls._search_pattern(value, ignore_case, mode)
         fields = {field_name} if isinstance(field_name, str) else field_name
         items: List[ModelT] = []
         for field in fields:
@@ -481,6 +529,7 @@ class SQLAlchemySyncMockRepository(SQLAlchemySyncRepositoryProtocol[ModelT]):
                     filter_.field_name,
                     value=filter_.value,
                     ignore_case=bool(filter_.ignore_case),
+                    mode=filter_.mode,
                 )
             elif isinstance(filter_, SearchFilter):
                 result = self._filter_by_like(
@@ -488,7 +537,12 @@ class SQLAlchemySyncMockRepository(SQLAlchemySyncRepositoryProtocol[ModelT]):
                     filter_.field_name,
                     value=filter_.value,
                     ignore_case=bool(filter_.ignore_case),
+                    mode=filter_.mode,
                 )
+            elif isinstance(filter_, FullTextSearchFilter):
+                result = self._filter_by_full_text(result, filter_.field_name, value=filter_.value)
+            elif isinstance(filter_, VectorSimilarityFilter):
+                result = self._filter_by_vector_similarity(result, filter_)
             elif not isinstance(filter_, ColumnElement):
                 msg = f"Unexpected filter: {filter_}"
                 raise RepositoryError(msg)
@@ -746,6 +800,7 @@ class SQLAlchemySyncMockRepository(SQLAlchemySyncRepositoryProtocol[ModelT]):
         execution_options: Optional[dict[str, Any]] = None,
         uniquify: Optional[bool] = None,
         bind_group: Optional[str] = None,
+        blind: bool = False,
     ) -> ModelT:
         pk_value = self.get_primary_key_value(data)
         self._find_or_raise_not_found(pk_value)
@@ -920,6 +975,33 @@ class SQLAlchemySyncMockRepository(SQLAlchemySyncRepositoryProtocol[ModelT]):
         result = self._apply_filters(result, *filters)
         return self._filter_result_by_kwargs(result, kwargs)
 
+    def get_many_columns(
+        self,
+        columns: "abc.Sequence[str]",
+        *filters: Union[StatementFilter, ColumnElement[bool]],
+        statement: Optional[Select[tuple[ModelT]]] = None,
+        order_by: Optional[Union[List[OrderingPair], OrderingPair]] = None,
+        error_messages: Optional[Union[ErrorMessages, EmptyType]] = Empty,
+        execution_options: Optional[dict[str, Any]] = None,
+        bind_group: Optional[str] = None,
+        **kwargs: Any,
+    ) -> List[Any]:
+        column_keys = {prop.key for prop in class_mapper(self.model_type).column_attrs}
+        if unknown := [name for name in columns if name not in column_keys]:
+            msg = f"Not column attributes of {self.model_type.__name__}: {', '.join(unknown)}"
+            raise RepositoryError(msg)
+        result = self.get_many(*filters, **kwargs)
+        orderings = order_by if order_by is not None else self.order_by
+        if orderings is not None:
+            # Sort by the last key first; ``sorted`` is stable, so earlier keys take precedence.
+            for ordering in reversed(orderings if isinstance(orderings, list) else [orderings]):
+                if isinstance(ordering, UnaryExpression):
+                    result = self._order_by(result, ordering.element, sort_desc=ordering.modifier is desc_op)
+                else:
+                    result = self._order_by(result, ordering[0], sort_desc=ordering[1])
+        make_row = result_tuple(columns)
+        return [make_row([getattr(item, name) for name in columns]) for item in result]
+
     def list(
         self,
         *filters: Union[StatementFilter, ColumnElement[bool]],
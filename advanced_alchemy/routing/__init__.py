@@ -34,36 +34,79 @@ Example:
 """
 
 from advanced_alchemy.routing.context import (
+    clear_replication_token,
     force_primary_var,
+    get_replication_token,
     primary_context,
     replica_context,
+    replication_token_context,
     reset_routing_context,
+    set_replication_token,
     stick_to_primary_var,
     use_bind_group,
 )
+from advanced_alchemy.routing.health import (
+    AsyncReplicaHealthMonitor,
+    CircuitBreaker,
+    CircuitState,
+    SyncReplicaHealthMonitor,
+)
 from advanced_alchemy.routing.maker import (
     RoutingAsyncSessionMaker,
     RoutingSyncSessionMaker,
     dispose_session_maker_async,
     dispose_session_maker_sync,
 )
-from advanced_alchemy.routing.selectors import RandomSelector, ReplicaSelector, RoundRobinSelector
+from advanced_alchemy.routing.replication import (
+    FakePositionProbe,
+    MySQLGTIDProbe,
+    PostgresLSNProbe,
+    ReplicaPositionTracker,
+    ReplicationPositionProbe,
+    ReplicationTokenMiddleware,
+)
+from advanced_alchemy.routing.selectors import (
+    LatencyEWMASelector,
+    LeastConnectionsSelector,
+    RandomSelector,
+    ReplicaSelector,
+    RoundRobinSelector,
+)
 from advanced_alchemy.routing.session import RoutingAsyncSession, RoutingSyncSession
+from advanced_alchemy.routing.sharding import ConsistentHashRing, ShardRouter
 
 __all__ = (
+    "AsyncReplicaHealthMonitor",
+    "CircuitBreaker",
+    "CircuitState",
+    "ConsistentHashRing",
+    "FakePositionProbe",
+    "LatencyEWMASelector",
+    "LeastConnectionsSelector",
+    "MySQLGTIDProbe",
+    "PostgresLSNProbe",
     "RandomSelector",
+    "ReplicaPositionTracker",
     "ReplicaSelector",
+    "ReplicationPositionProbe",
+    "ReplicationTokenMiddleware",
     "RoundRobinSelector",
     "RoutingAsyncSession",
     "RoutingAsyncSessionMaker",
     "RoutingSyncSession",
     "RoutingSyncSessionMaker",
+    "ShardRouter",
+    "SyncReplicaHealthMonitor",
+    "clear_replication_token",
     "dispose_session_maker_async",
     "dispose_session_maker_sync",
     "force_primary_var",
+    "get_replication_token",
     "primary_context",
     "replica_context",
+    "replication_token_context",
     "reset_routing_context",
+    "set_replication_token",
     "stick_to_primary_var",
     "use_bind_group",
 )
@@ -4,17 +4,25 @@ This module provides the context-based state management for routing decisions,
 including the sticky-to-primary behavior after writes.
 """
 
+import time
 from collections.abc import Generator
 from contextlib import contextmanager
 from contextvars import ContextVar, Token
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from advanced_alchemy.config.routing import StickyWindow
 
 __all__ = (
     "bind_group_var",
+    "clear_replication_token",
     "force_primary_var",
+    "get_replication_token",
     "primary_context",
     "replica_context",
+    "replication_token_context",
     "reset_routing_context",
+    "set_replication_token",
     "stick_to_primary_var",
     "use_bind_group",
 )
@@ -27,6 +35,12 @@ When ``True``, all operations (including reads) will use the primary database
 until the context is reset (typically after commit/rollback).
 """
 
+sticky_started_at_var: ContextVar[Optional[float]] = ContextVar("sticky_started_at", default=None)
+"""Context variable holding the monotonic time at which stickiness was last set."""
+
+sticky_statement_count_var: ContextVar[int] = ContextVar("sticky_statement_count", default=0)
+"""Context variable counting statements routed to primary because of stickiness."""
+
 force_primary_var: ContextVar[bool] = ContextVar("force_primary", default=False)
 """Context variable for explicitly forcing all operations to primary.
 
@@ -42,6 +56,23 @@ engine group (e.g., "analytics", "reader").
 """
 
 
+class _ReplicationTokenHolder:
+    """Mutable holder so token updates made in copied contexts (e.g. thread pools) stay visible."""
+
+    __slots__ = ("token",)
+
+    def __init__(self, token: Optional[str]) -> None:
+        self.token = token
+
+
+_replication_token_var: ContextVar[Optional[_ReplicationTokenHolder]] = ContextVar("replication_token", default=None)
+"""Context variable holding the replication token for read-your-writes routing.
+
+Unlike the other routing state, the token is not cleared by :func:`reset_routing_context`:
+it is a consistency floor carried for the whole request, not a routing override.
+"""
+
+
 @contextmanager
 def primary_context() -> Generator[None, None, None]:
     """Force all operations to use primary within this context.
@@ -134,8 +165,8 @@ def use_bind_group(name: str) -> Generator[None, None, None]:
 def reset_routing_context() -> None:
     """Reset all routing context variables to their defaults.
 
-    This is typically called after a commit or rollback to allow
-    subsequent reads to use replicas again.
+    Unlike commit and rollback, which only clear stickiness, this also clears
+    the overrides set by :func:`primary_context` and :func:`use_bind_group`.
 
     Example:
         Manual reset after transaction::
@@ -146,6 +177,8 @@ def reset_routing_context() -> None:
             reset_routing_context()
     """
     stick_to_primary_var.set(False)
+    sticky_started_at_var.set(None)
+    sticky_statement_count_var.set(0)
     force_primary_var.set(False)
     bind_group_var.set(None)
 
@@ -154,9 +187,51 @@ def set_sticky_primary() -> None:
     """Set the sticky-to-primary flag.
 
     This is called internally after write operations to ensure
-    subsequent reads use the primary database.
+    subsequent reads use the primary database. Each call restarts
+    the sticky window.
     """
     stick_to_primary_var.set(True)
+    sticky_started_at_var.set(time.monotonic())
+    sticky_statement_count_var.set(0)
+
+
+def clear_sticky_primary() -> None:
+    """Clear the sticky-to-primary flag and its window.
+
+    This is called internally after commit and rollback. Overrides set by
+    :func:`primary_context` and :func:`use_bind_group` are left to their
+    context managers.
+    """
+    stick_to_primary_var.set(False)
+    sticky_started_at_var.set(None)
+    sticky_statement_count_var.set(0)
+
+
+def consume_sticky_primary(window: "Optional[StickyWindow]") -> bool:
+    """Check whether stickiness still applies, counting the current statement against the window.
+
+    Expired stickiness is cleared so that later reads use replicas again.
+
+    Args:
+        window: The sticky window limits, or ``None`` for stickiness that lasts for the whole context.
+
+    Returns:
+        ``True`` if the current statement should stick to primary.
+    """
+    if not stick_to_primary_var.get():
+        return False
+    if window is None:
+        return True
+    started_at = sticky_started_at_var.get()
+    count = sticky_statement_count_var.get()
+    expired = (
+        window.seconds is not None and started_at is not None and time.monotonic() - started_at >= window.seconds
+    ) or (window.statements is not None and count >= window.statements)
+    if expired:
+        clear_sticky_primary()
+        return False
+    sticky_statement_count_var.set(count + 1)
+    return True
 
 
 def should_use_primary() -> bool:
@@ -166,3 +241,65 @@ def should_use_primary() -> bool:
         ``True`` if routing should use primary (due to force or stickiness).
     """
     return force_primary_var.get() or stick_to_primary_var.get()
+
+
+def get_replication_token() -> Optional[str]:
+    """Get the replication token of the current context.
+
+    Returns:
+        The primary replication position recorded after the last write, or ``None``.
+    """
+    holder = _replication_token_var.get()
+    return holder.token if holder is not None else None
+
+
+def set_replication_token(token: Optional[str]) -> None:
+    """Set the replication token of the current context.
+
+    This is called internally after a committed write when a replication probe is
+    configured, and can be used to restore a token received from a client.
+
+    Args:
+        token: The replication position reads must observe, or ``None`` to clear it.
+    """
+    holder = _replication_token_var.get()
+    if holder is None:
+        _replication_token_var.set(_ReplicationTokenHolder(token))
+    else:
+        holder.token = token
+
+
+def clear_replication_token() -> None:
+    """Clear the replication token of the current context."""
+    set_replication_token(None)
+
+
+@contextmanager
+def replication_token_context(token: Optional[str] = None) -> Generator[None, None, None]:
+    """Scope a replication token to a block, e.g. a single request.
+
+    Tokens recorded by writes inside the block do not leak to the enclosing context.
+
+    Example:
+        Restoring a token received from the client::
+
+            from advanced_alchemy.routing import (
+                replication_token_context,
+            )
+
+            with replication_token_context(
+                request.headers.get("x-replication-token")
+            ):
+                user = await repo.get(user_id)
+
+    Args:
+        token: The initial token for the block.
+
+    Yields:
+        None
+    """
+    reset_token = _replication_token_var.set(_ReplicationTokenHolder(token))
+    try:
+        yield
+    finally:
+        _replication_token_var.reset(reset_token)
@@ -0,0 +1,456 @@
+"""Background health checks and circuit breaking for routed engines.
+
+This module provides monitors that periodically probe replica engines and
+eject unhealthy ones from their :class:`~advanced_alchemy.routing.selectors.EngineSelector`.
+Each engine is guarded by a :class:`CircuitBreaker`; once every replica in a
+group is ejected, routing sessions fall back to the default (primary) engine.
+
+Probes open their own unpooled connection with the engine's connection settings,
+so a replica whose pool is saturated by application load is not mistaken for an
+unhealthy one.
+"""
+
+import asyncio
+import contextlib
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures import wait as wait_for_futures
+from enum import Enum, auto
+from typing import TYPE_CHECKING, Any, Callable, Generic, Optional
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+
+from advanced_alchemy.routing.selectors import EngineT
+
+if TYPE_CHECKING:
+    from sqlalchemy import Engine, TextClause
+    from sqlalchemy.ext.asyncio import AsyncEngine
+
+    from advanced_alchemy.config.routing import HealthCheckConfig
+    from advanced_alchemy.routing.selectors import EngineSelector
+
+__all__ = (
+    "AsyncReplicaHealthMonitor",
+    "CircuitBreaker",
+    "CircuitState",
+    "SyncReplicaHealthMonitor",
+)
+
+logger = logging.getLogger("advanced_alchemy")
+
+
+class CircuitState(Enum):
+    """State of a :class:`CircuitBreaker`."""
+
+    CLOSED = auto()
+    """The engine is healthy and in rotation."""
+
+    OPEN = auto()
+    """The engine is ejected and not probed until the recovery timeout elapses."""
+
+    HALF_OPEN = auto()
+    """The engine is ejected but probed to decide whether to re-admit it."""
+
+
+class CircuitBreaker:
+    """Per-engine circuit breaker driven by health probe results.
+
+    Example:
+        Tracking probe outcomes::
+
+            breaker = CircuitBreaker(
+                failure_threshold=3, recovery_timeout=30.0
+            )
+            breaker.record_failure()
+            if breaker.allow_probe():
+                ...
+    """
+
+    __slots__ = (
+        "_clock",
+        "_consecutive_failures",
+        "_consecutive_successes",
+        "_opened_at",
+        "_state",
+        "failure_threshold",
+        "recovery_timeout",
+        "success_threshold",
+    )
+
+    def __init__(
+        self,
+        failure_threshold: int = 3,
+        recovery_timeout: float = 30.0,
+        success_threshold: int = 1,
+        clock: "Callable[[], float]" = time.monotonic,
+    ) -> None:
+        """Initialize the circuit breaker.
+
+        Args:
+            failure_threshold: Consecutive failures before the circuit opens.
+            recovery_timeout: Seconds to stay open before allowing half-open probes.
+            success_threshold: Consecutive half-open successes before the circuit closes.
+            clock: Monotonic time source (for testing).
+        """
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.success_threshold = success_threshold
+        self._clock = clock
+        self._state = CircuitState.CLOSED
+        self._consecutive_failures = 0
+        self._consecutive_successes = 0
+        self._opened_at = 0.0
+
+    @property
+    def state(self) -> CircuitState:
+        """Get the current circuit state.
+
+        Returns:
+            The circuit state.
+        """
+        return self._state
+
+    def allow_probe(self) -> bool:
+        """Check whether the engine should be probed now.
+
+        An open circuit moves to half-open once the recovery timeout has elapsed.
+
+        Returns:
+            ``True`` unless the circuit is open and still cooling down.
+        """
+        if self._state is CircuitState.OPEN:
+            if self._clock() - self._opened_at < self.recovery_timeout:
+                return False
+            self._state = CircuitState.HALF_OPEN
+            self._consecutive_successes = 0
+        return True
+
+    def record_success(self) -> bool:
+        """Record a successful probe.
+
+        Returns:
+            ``True`` if this success closed the circuit.
+        """
+        self._consecutive_failures = 0
+        if self._state is CircuitState.HALF_OPEN:
+            self._consecutive_successes += 1
+            if self._consecutive_successes >= self.success_threshold:
+                self._state = CircuitState.CLOSED
+                return True
+        return False
+
+    def record_failure(self) -> bool:
+        """Record a failed probe.
+
+        Returns:
+            ``True`` if this failure opened the circuit.
+        """
+        self._consecutive_successes = 0
+        if self._state is CircuitState.HALF_OPEN:
+            self._open()
+            return True
+        self._consecutive_failures += 1
+        if self._state is CircuitState.CLOSED and self._consecutive_failures >= self.failure_threshold:
+            self._open()
+            return True
+        return False
+
+    def _open(self) -> None:
+        self._state = CircuitState.OPEN
+        self._opened_at = self._clock()
+        self._consecutive_failures = 0
+
+
+def _health_check_statement(dialect_name: str) -> "TextClause":
+    """Get the probe statement for a dialect.
+
+    Mirrors the repository ``check_health`` statement.
+
+    Args:
+        dialect_name: Name of the engine dialect.
+
+    Returns:
+        The health check statement.
+    """
+    if dialect_name == "oracle":
+        return text("SELECT 1 FROM DUAL")
+    return text("SELECT 1")
+
+
+class _ReplicaHealthMonitorBase(Generic[EngineT]):
+    """Shared circuit bookkeeping for sync and async monitors."""
+
+    __slots__ = ("_breakers", "_config", "_probe_engines", "_targets")
+
+    def __init__(self, selectors: "dict[str, EngineSelector[EngineT]]", config: "HealthCheckConfig") -> None:
+        """Initialize the monitor.
+
+        Args:
+            selectors: Map of group names to the selectors whose engines are probed.
+            config: Health check configuration.
+        """
+        self._config = config
+        self._targets: list[tuple[EngineSelector[EngineT], EngineT]] = [
+            (selector, engine) for selector in selectors.values() for engine in selector.engines
+        ]
+        self._breakers: dict[int, CircuitBreaker] = {
+            id(engine): CircuitBreaker(
+                failure_threshold=config.failure_threshold,
+                recovery_timeout=config.recovery_timeout,
+                success_threshold=config.success_threshold,
+            )
+            for _, engine in self._targets
+        }
+        self._probe_engines: dict[int, EngineT] = {}
+
+    def breaker_for(self, engine: EngineT) -> CircuitBreaker:
+        """Get the circuit breaker guarding an engine.
+
+        Args:
+            engine: A monitored engine.
+
+        Returns:
+            The engine's circuit breaker.
+        """
+        return self._breakers[id(engine)]
+
+    def _due_targets(self) -> "list[tuple[EngineSelector[EngineT], EngineT]]":
+        return [(selector, engine) for selector, engine in self._targets if self._breakers[id(engine)].allow_probe()]
+
+    def _record(self, selector: "EngineSelector[EngineT]", engine: EngineT, healthy: bool) -> None:
+        breaker = self._breakers[id(engine)]
+        if healthy:
+            if breaker.record_success():
+                selector.readmit(engine)
+                logger.info("Re-admitted engine %s after successful health checks", _engine_label(engine))
+        elif breaker.record_failure():
+            selector.eject(engine)
+            logger.warning("Ejected engine %s after failed health checks", _engine_label(engine))
+
+
+def _unpooled_pool(engine: "Engine") -> NullPool:
+    """Build an unpooled pool that connects like ``engine``'s own pool.
+
+    Reusing the pool's connection factory keeps ``connect_args`` and custom creators, while
+    bypassing the engine's checkout queue.
+
+    Args:
+        engine: The (sync) engine whose connection settings are reused.
+
+    Returns:
+        A :class:`~sqlalchemy.pool.NullPool` with the engine's connection factory.
+    """
+    return NullPool(engine.pool._creator)  # noqa: SLF001
+
+
+def _engine_label(engine: Any) -> str:
+    url = getattr(engine, "url", None)
+    render = getattr(url, "render_as_string", None)
+    return str(render(hide_password=True)) if callable(render) else repr(engine)
+
+
+class SyncReplicaHealthMonitor(_ReplicaHealthMonitorBase["Engine"]):
+    """Health monitor that probes sync engines from a daemon thread.
+
+    Example:
+        Probing replicas in the background::
+
+            monitor = SyncReplicaHealthMonitor(
+                {"read": selector}, HealthCheckConfig()
+            )
+            monitor.start()
+            ...
+            monitor.stop()
+    """
+
+    __slots__ = ("_probes", "_stop_event", "_thread")
+
+    def __init__(self, selectors: "dict[str, EngineSelector[Engine]]", config: "HealthCheckConfig") -> None:
+        """Initialize the monitor.
+
+        Args:
+            selectors: Map of group names to the selectors whose engines are probed.
+            config: Health check configuration.
+        """
+        super().__init__(selectors, config)
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._probes: dict[int, Future[bool]] = {}
+
+    @property
+    def is_running(self) -> bool:
+        """Check whether the probe thread is running.
+
+        Returns:
+            ``True`` if the monitor has been started and not stopped.
+        """
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start probing in a daemon thread (no-op if already running)."""
+        if self.is_running:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="advanced-alchemy-health", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the probe thread and wait for it to exit.
+
+        Probes still running are awaited for up to ``timeout`` seconds before the probe
+        engines are disposed. The engines of probes that outlast it are kept until a
+        later ``stop``, so an in-flight check never loses its engine.
+        """
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        pending = [probe for probe in self._probes.values() if not probe.done()]
+        if pending:
+            wait_for_futures(pending, timeout=self._config.timeout)
+        for key in list(self._probe_engines):
+            probe = self._probes.get(key)
+            if probe is None or probe.done():
+                self._probe_engines.pop(key).dispose()
+                self._probes.pop(key, None)
+
+    def check_now(self) -> None:
+        """Run a single probe round, concurrently, for every engine that is due.
+
+        Probes still running after ``timeout`` seconds count as failures. A probe that hangs
+        keeps its thread until the driver gives up, and no new probe of that engine is started
+        until it finishes.
+        """
+        targets = [(selector, engine, self._start_probe(engine)) for selector, engine in self._due_targets()]
+        deadline = time.monotonic() + self._config.timeout
+        for selector, engine, probe in targets:
+            try:
+                healthy = probe.result(timeout=max(deadline - time.monotonic(), 0.0))
+            except FutureTimeoutError:
+                healthy = False
+            self._record(selector, engine, healthy)
+
+    def _start_probe(self, engine: "Engine") -> "Future[bool]":
+        probe = self._probes.get(id(engine))
+        if probe is None or probe.done():
+            probe = Future()
+            self._probes[id(engine)] = probe
+            threading.Thread(
+                target=self._run_probe, args=(engine, probe), name="advanced-alchemy-health-probe", daemon=True
+            ).start()
+        return probe
+
+    def _run_probe(self, engine: "Engine", probe: "Future[bool]") -> None:
+        probe.set_result(self._probe(engine))
+
+    def _probe_engine(self, engine: "Engine") -> "Engine":
+        probe_engine = self._probe_engines.get(id(engine))
+        if probe_engine is None:
+            probe_engine = create_engine(engine.url, pool=_unpooled_pool(engine))
+            self._probe_engines[id(engine)] = probe_engine
+        return probe_engine
+
+    def _probe(self, engine: "Engine") -> bool:
+        try:
+            with self._probe_engine(engine).connect() as conn:
+                return bool(conn.execute(_health_check_statement(engine.dialect.name)).scalar_one() == 1)
+        except Exception:  # noqa: BLE001
+            return False
+
+    def _run(self) -> None:
+        while not self._stop_event.is_set():
+            self.check_now()
+            self._stop_event.wait(self._config.interval)
+
+
+class AsyncReplicaHealthMonitor(_ReplicaHealthMonitorBase["AsyncEngine"]):
+    """Health monitor that probes async engines from an ``asyncio`` task.
+
+    Example:
+        Probing replicas in the background::
+
+            monitor = AsyncReplicaHealthMonitor(
+                {"read": selector}, HealthCheckConfig()
+            )
+            monitor.start()
+            ...
+            await monitor.stop()
+    """
+
+    __slots__ = ("_task",)
+
+    def __init__(self, selectors: "dict[str, EngineSelector[AsyncEngine]]", config: "HealthCheckConfig") -> None:
+        """Initialize the monitor.
+
+        Args:
+            selectors: Map of group names to the selectors whose engines are probed.
+            config: Health check configuration.
+        """
+        super().__init__(selectors, config)
+        self._task: Optional[asyncio.Task[None]] = None
+
+    @property
+    def is_running(self) -> bool:
+        """Check whether the probe task is running.
+
+        Returns:
+            ``True`` if the monitor has been started and not stopped.
+        """
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start probing in a task on the running event loop (no-op if already running).
+
+        Must be called from within a running event loop.
+        """
+        if self.is_running:
+            return
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Cancel the probe task and wait for it to exit."""
+        task, self._task = self._task, None
+        if task is not None and not task.done():
+            task.cancel()
+            if task.get_loop() is asyncio.get_running_loop():
+                with contextlib.suppress(asyncio.CancelledError):
+                    await task
+        probe_engines = list(self._probe_engines.values())
+        self._probe_engines.clear()
+        for probe_engine in probe_engines:
+            await probe_engine.dispose()
+
+    async def check_now(self) -> None:
+        """Run a single probe round, concurrently, for every engine that is due."""
+        targets = self._due_targets()
+        results = await asyncio.gather(*(self._probe(engine) for _, engine in targets))
+        for (selector, engine), healthy in zip(targets, results):
+            self._record(selector, engine, healthy)
+
+    def _probe_engine(self, engine: "AsyncEngine") -> "AsyncEngine":
+        probe_engine = self._probe_engines.get(id(engine))
+        if probe_engine is None:
+            probe_engine = create_async_engine(engine.url, pool=_unpooled_pool(engine.sync_engine))
+            self._probe_engines[id(engine)] = probe_engine
+        return probe_engine
+
+    async def _probe(self, engine: "AsyncEngine") -> bool:
+        async def _execute() -> bool:
+            async with self._probe_engine(engine).connect() as conn:
+                result = await conn.execute(_health_check_statement(engine.dialect.name))
+                return bool(result.scalar_one() == 1)
+
+        try:
+            return await asyncio.wait_for(_execute(), timeout=self._config.timeout)
+        except Exception:  # noqa: BLE001
+            return False
+
+    async def _run(self) -> None:
+        while True:
+            await self.check_now()
+            await asyncio.sleep(self._config.interval)
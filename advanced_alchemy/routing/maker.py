@@ -4,15 +4,36 @@ This module provides session maker classes that create routing-aware sessions
 with properly configured primary and replica engines.
 """
 
-from typing import Any, Callable, Optional
+import asyncio
+from typing import TYPE_CHECKING, Any, Callable, Optional
 
 from sqlalchemy import Engine, create_engine
 from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 
 from advanced_alchemy.config.routing import RoutingConfig, RoutingStrategy
 from advanced_alchemy.exceptions import ImproperConfigurationError
-from advanced_alchemy.routing.selectors import EngineSelector, RandomSelector, RoundRobinSelector
+from advanced_alchemy.routing.health import AsyncReplicaHealthMonitor, SyncReplicaHealthMonitor
+from advanced_alchemy.routing.replication import ReplicaPositionTracker
+from advanced_alchemy.routing.selectors import (
+    EngineSelector,
+    LatencyEWMASelector,
+    LeastConnectionsSelector,
+    RandomSelector,
+    RoundRobinSelector,
+)
 from advanced_alchemy.routing.session import RoutingAsyncSession, RoutingSyncSession
+from advanced_alchemy.routing.sharding import ShardRouter
+from advanced_alchemy.utils.pool import (
+    PoolMonitor,
+    PoolStats,
+    prewarm_engine_async,
+    prewarm_engine_sync,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from advanced_alchemy.utils.pool import PoolEventHook
 
 __all__ = (
     "RoutingAsyncSessionMaker",
@@ -48,9 +69,13 @@ class RoutingSyncSessionMaker:
         "_default_engine",
         "_engine_config",
         "_engines",
+        "_health_monitor",
+        "_pool_monitors",
+        "_position_tracker",
         "_routing_config",
         "_selectors",
         "_session_config",
+        "_shard_router",
     )
 
     def __init__(
@@ -59,6 +84,9 @@ class RoutingSyncSessionMaker:
         engine_config: Optional[dict[str, Any]] = None,
         session_config: Optional[dict[str, Any]] = None,
         create_engine_callable: Callable[[str], Engine] = create_engine,
+        instrument_pool: bool = False,
+        pool_event_hooks: "Sequence[PoolEventHook]" = (),
+        enable_vector_search: bool = False,
     ) -> None:
         """Initialize the session maker.
 
@@ -67,6 +95,10 @@ class RoutingSyncSessionMaker:
             engine_config: Configuration options for engine creation.
             session_config: Configuration options for session creation.
             create_engine_callable: Callable to create engines (for testing).
+            instrument_pool: Collect connection pool statistics for every engine, see :meth:`pool_stats`.
+            pool_event_hooks: Hooks notified of pool events on every engine. Implies ``instrument_pool``.
+            enable_vector_search: Instrument every engine for vector search, see ``register_vector_search_options``
+                and ``register_sqlite_vector_functions``.
         """
         self._routing_config = routing_config
         self._engine_config = engine_config or {}
@@ -80,6 +112,14 @@ class RoutingSyncSessionMaker:
             engines_for_group: list[Engine] = []
             for config in routing_config.get_engine_configs(group):
                 engine = self._create_engine(config.connection_string, create_engine_callable)
+                if enable_vector_search:
+                    from advanced_alchemy.types.vector import (
+                        register_sqlite_vector_functions,
+                        register_vector_search_options,
+                    )
+
+                    register_vector_search_options(engine)
+                    register_sqlite_vector_functions(engine)
                 engines_for_group.append(engine)
 
             if engines_for_group:
@@ -103,6 +143,37 @@ class RoutingSyncSessionMaker:
             raise ImproperConfigurationError(msg)
 
         self._default_engine = self._engines[default_group][0]
+        self._health_monitor: Optional[SyncReplicaHealthMonitor] = None
+        # Shards hold disjoint data with no fallback, so they are never ejected
+        shard_groups = set(routing_config.sharding.shards) if routing_config.sharding is not None else set()
+        if routing_config.health_check is not None:
+            self._health_monitor = SyncReplicaHealthMonitor(
+                {
+                    group: selector
+                    for group, selector in self._selectors.items()
+                    if group != default_group and group not in shard_groups
+                },
+                routing_config.health_check,
+            )
+        self._position_tracker: Optional[ReplicaPositionTracker] = (
+            ReplicaPositionTracker(routing_config.replication_probe)
+            if routing_config.replication_probe is not None
+            else None
+        )
+        self._shard_router: Optional[ShardRouter] = (
+            ShardRouter.from_config(routing_config.sharding, session_factory=self)
+            if routing_config.sharding is not None
+            else None
+        )
+        self._pool_monitors: dict[str, PoolMonitor] = (
+            {
+                f"{group}[{index}]": PoolMonitor(engine, label=f"{group}[{index}]", hooks=pool_event_hooks)
+                for group, engine_list in self._engines.items()
+                for index, engine in enumerate(engine_list)
+            }
+            if instrument_pool or pool_event_hooks
+            else {}
+        )
 
     def _create_engine(
         self,
@@ -142,23 +213,32 @@ class RoutingSyncSessionMaker:
         """
         if strategy == RoutingStrategy.RANDOM:
             return RandomSelector(engines)
+        if strategy == RoutingStrategy.LEAST_CONNECTIONS:
+            return LeastConnectionsSelector(engines)
+        if strategy == RoutingStrategy.LATENCY_EWMA:
+            return LatencyEWMASelector(engines)
         return RoundRobinSelector(engines)
 
     def __call__(self) -> RoutingSyncSession:
         """Create a new routing session.
 
         Any ``bind`` passed in the session config is ignored because
-        routing controls bind selection.
+        routing controls bind selection. Health checks, when configured,
+        are started on first use.
 
         Returns:
             A new :class:`RoutingSyncSession` instance.
         """
+        self.start_health_checks()
         session_config = self._session_config.copy()
         session_config.pop("bind", None)
+        if self._shard_router is not None:
+            session_config["info"] = {**session_config.get("info", {}), "shard_router": self._shard_router}
         return RoutingSyncSession(
             routing_config=self._routing_config,
             selectors=self._selectors,
             default_engine=self._default_engine,
+            position_tracker=self._position_tracker,
             **session_config,
         )
 
@@ -180,11 +260,60 @@ class RoutingSyncSessionMaker:
         """
         return self._engines.get(self._routing_config.read_group, [])
 
+    @property
+    def shard_router(self) -> Optional[ShardRouter]:
+        """Get the shard router, if sharding is configured.
+
+        Returns:
+            The shard router or ``None``.
+        """
+        return self._shard_router
+
+    @property
+    def health_monitor(self) -> Optional[SyncReplicaHealthMonitor]:
+        """Get the replica health monitor, if health checks are configured.
+
+        Returns:
+            The health monitor or ``None``.
+        """
+        return self._health_monitor
+
+    def start_health_checks(self) -> None:
+        """Start background replica health checks (no-op if not configured or already running)."""
+        if self._health_monitor is not None:
+            self._health_monitor.start()
+
+    def pool_stats(self) -> dict[str, PoolStats]:
+        """Get connection pool statistics for every engine.
+
+        Engines are labelled ``"<group>[<index>]"``, e.g. ``"read[1]"`` for the
+        second replica of the ``read`` group.
+
+        Returns:
+            Statistics by engine label, empty unless pool instrumentation is enabled.
+        """
+        return {label: monitor.stats() for label, monitor in self._pool_monitors.items()}
+
+    def prewarm(self, connections: int) -> int:
+        """Open and validate pooled connections on every engine, replicas included.
+
+        Args:
+            connections: Number of connections to open per engine, capped at the pool size.
+
+        Returns:
+            The total number of connections opened and validated.
+        """
+        return sum(
+            prewarm_engine_sync(engine, connections) for engine_list in self._engines.values() for engine in engine_list
+        )
+
     def close_all(self) -> None:
         """Close all engines and release connections.
 
         Call this when shutting down to properly release database connections.
         """
+        if self._health_monitor is not None:
+            self._health_monitor.stop()
         for engine_list in self._engines.values():
             for engine in engine_list:
                 engine.dispose()
@@ -217,9 +346,13 @@ class RoutingAsyncSessionMaker:
         "_default_engine",
         "_engine_config",
         "_engines",
+        "_health_monitor",
+        "_pool_monitors",
+        "_position_tracker",
         "_routing_config",
         "_selectors",
         "_session_config",
+        "_shard_router",
     )
 
     def __init__(
@@ -228,6 +361,9 @@ class RoutingAsyncSessionMaker:
         engine_config: Optional[dict[str, Any]] = None,
         session_config: Optional[dict[str, Any]] = None,
         create_engine_callable: Callable[[str], AsyncEngine] = create_async_engine,
+        instrument_pool: bool = False,
+        pool_event_hooks: "Sequence[PoolEventHook]" = (),
+        enable_vector_search: bool = False,
     ) -> None:
         """Initialize the async session maker.
 
@@ -236,6 +372,10 @@ class RoutingAsyncSessionMaker:
             engine_config: Configuration options for engine creation.
             session_config: Configuration options for session creation.
             create_engine_callable: Callable to create async engines (for testing).
+            instrument_pool: Collect connection pool statistics for every engine, see :meth:`pool_stats`.
+            pool_event_hooks: Hooks notified of pool events on every engine. Implies ``instrument_pool``.
+            enable_vector_search: Instrument every engine for vector search, see ``register_vector_search_options``
+                and ``register_sqlite_vector_functions``.
         """
         self._routing_config = routing_config
         self._engine_config = engine_config or {}
@@ -249,6 +389,14 @@ class RoutingAsyncSessionMaker:
             engines_for_group: list[AsyncEngine] = []
             for config in routing_config.get_engine_configs(group):
                 engine = self._create_engine(config.connection_string, create_engine_callable)
+                if enable_vector_search:
+                    from advanced_alchemy.types.vector import (
+                        register_sqlite_vector_functions,
+                        register_vector_search_options,
+                    )
+
+                    register_vector_search_options(engine)
+                    register_sqlite_vector_functions(engine)
                 engines_for_group.append(engine)
 
             if engines_for_group:
@@ -268,6 +416,37 @@ class RoutingAsyncSessionMaker:
             raise ImproperConfigurationError(msg)
 
         self._default_engine = self._engines[default_group][0]
+        self._health_monitor: Optional[AsyncReplicaHealthMonitor] = None
+        # Shards hold disjoint data with no fallback, so they are never ejected
+        shard_groups = set(routing_config.sharding.shards) if routing_config.sharding is not None else set()
+        if routing_config.health_check is not None:
+            self._health_monitor = AsyncReplicaHealthMonitor(
+                {
+                    group: selector
+                    for group, selector in self._selectors.items()
+                    if group != default_group and group not in shard_groups
+                },
+                routing_config.health_check,
+            )
+        self._position_tracker: Optional[ReplicaPositionTracker] = (
+            ReplicaPositionTracker(routing_config.replication_probe)
+            if routing_config.replication_probe is not None
+            else None
+        )
+        self._shard_router: Optional[ShardRouter] = (
+            ShardRouter.from_config(routing_config.sharding, session_factory=self)
+            if routing_config.sharding is not None
+            else None
+        )
+        self._pool_monitors: dict[str, PoolMonitor] = (
+            {
+                f"{group}[{index}]": PoolMonitor(engine, label=f"{group}[{index}]", hooks=pool_event_hooks)
+                for group, engine_list in self._engines.items()
+                for index, engine in enumerate(engine_list)
+            }
+            if instrument_pool or pool_event_hooks
+            else {}
+        )
 
     def _create_engine(
         self,
@@ -307,23 +486,32 @@ class RoutingAsyncSessionMaker:
         """
         if strategy == RoutingStrategy.RANDOM:
             return RandomSelector(engines)
+        if strategy == RoutingStrategy.LEAST_CONNECTIONS:
+            return LeastConnectionsSelector(engines)
+        if strategy == RoutingStrategy.LATENCY_EWMA:
+            return LatencyEWMASelector(engines)
         return RoundRobinSelector(engines)
 
     def __call__(self) -> RoutingAsyncSession:
         """Create a new async routing session.
 
         Any ``bind`` passed in the session config is ignored because
-        routing controls bind selection.
+        routing controls bind selection. Health checks, when configured,
+        are started on first use from within a running event loop.
 
         Returns:
             A new :class:`RoutingAsyncSession` instance.
         """
+        self.start_health_checks()
         session_config = self._session_config.copy()
         session_config.pop("bind", None)
+        if self._shard_router is not None:
+            session_config["info"] = {**session_config.get("info", {}), "shard_router": self._shard_router}
         return RoutingAsyncSession(
             routing_config=self._routing_config,
             selectors=self._selectors,
             default_engine=self._default_engine,
+            position_tracker=self._position_tracker,
             **session_config,
         )
 
@@ -345,11 +533,74 @@ class RoutingAsyncSessionMaker:
         """
         return self._engines.get(self._routing_config.read_group, [])
 
+    @property
+    def shard_router(self) -> Optional[ShardRouter]:
+        """Get the shard router, if sharding is configured.
+
+        Returns:
+            The shard router or ``None``.
+        """
+        return self._shard_router
+
+    @property
+    def health_monitor(self) -> Optional[AsyncReplicaHealthMonitor]:
+        """Get the replica health monitor, if health checks are configured.
+
+        Returns:
+            The health monitor or ``None``.
+        """
+        return self._health_monitor
+
+    def start_health_checks(self) -> None:
+        """Start background replica health checks on the running event loop.
+
+        No-op if health checks are not configured, already running, or no event
+        loop is running.
+        """
+        if self._health_monitor is None or self._health_monitor.is_running:
+            return
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._health_monitor.start()
+
+    def pool_stats(self) -> dict[str, PoolStats]:
+        """Get connection pool statistics for every engine.
+
+        Engines are labelled ``"<group>[<index>]"``, e.g. ``"read[1]"`` for the
+        second replica of the ``read`` group.
+
+        Returns:
+            Statistics by engine label, empty unless pool instrumentation is enabled.
+        """
+        return {label: monitor.stats() for label, monitor in self._pool_monitors.items()}
+
+    async def prewarm(self, connections: int) -> int:
+        """Open and validate pooled connections on every engine concurrently, replicas included.
+
+        Args:
+            connections: Number of connections to open per engine, capped at the pool size.
+
+        Returns:
+            The total number of connections opened and validated.
+        """
+        counts = await asyncio.gather(
+            *(
+                prewarm_engine_async(engine, connections)
+                for engine_list in self._engines.values()
+                for engine in engine_list
+            )
+        )
+        return sum(counts)
+
     async def close_all(self) -> None:
         """Close all engines and release connections.
 
         Call this when shutting down to properly release database connections.
         """
+        if self._health_monitor is not None:
+            await self._health_monitor.stop()
         for engine_list in self._engines.values():
             for engine in engine_list:
                 await engine.dispose()
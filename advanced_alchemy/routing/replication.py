@@ -0,0 +1,459 @@
+"""Replication-position tracking for lag-aware read-your-writes routing.
+
+After a transaction that wrote to the primary commits, the primary's
+replication position (PostgreSQL WAL LSN, MySQL GTID set, ...) is recorded as
+a *replication token*. Later reads carrying that token are routed only to
+replicas whose replay position has caught up with it, falling back to the
+primary when none has.
+
+Positions are read through a pluggable :class:`ReplicationPositionProbe`.
+The token can be carried across requests with :class:`ReplicationTokenMiddleware`.
+"""
+
+import re
+import threading
+from collections.abc import Awaitable, MutableMapping
+from typing import TYPE_CHECKING, Any, Callable, Optional, Protocol, Union, runtime_checkable
+from urllib.parse import quote, unquote
+
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+
+from advanced_alchemy.routing.context import get_replication_token, replication_token_context
+
+if TYPE_CHECKING:
+    from sqlalchemy import Connection, Engine
+    from sqlalchemy.ext.asyncio import AsyncEngine
+
+__all__ = (
+    "FakePositionProbe",
+    "MySQLGTIDProbe",
+    "PostgresLSNProbe",
+    "ReplicaPositionTracker",
+    "ReplicationPositionProbe",
+    "ReplicationTokenMiddleware",
+)
+
+_ASGIMessage = MutableMapping[str, Any]
+_ASGIReceive = Callable[[], Awaitable[_ASGIMessage]]
+_ASGISend = Callable[[_ASGIMessage], Awaitable[None]]
+_ASGIApp = Callable[[MutableMapping[str, Any], _ASGIReceive, _ASGISend], Awaitable[None]]
+
+_LSN_PATTERN = re.compile(r"[0-9A-Fa-f]{1,8}/[0-9A-Fa-f]{1,8}")
+_GTID_SOURCE_PATTERN = re.compile(r"[0-9A-Fa-f-]+")
+_GTID_TAG_PATTERN = re.compile(r"[A-Za-z_][A-Za-z0-9_]{0,31}")
+_GTID_INTERVAL_PATTERN = re.compile(r"[0-9]+(?:-[0-9]+)?")
+_TOKEN_PATTERN = re.compile(r"[0-9A-Za-z:/,._-]{1,4096}")
+
+
+@runtime_checkable
+class ReplicationPositionProbe(Protocol):
+    """Protocol for reading and comparing replication positions.
+
+    Positions are opaque strings so that they can be carried in cookies or headers.
+    """
+
+    def primary_position(self, connection: "Connection") -> Optional[str]:
+        """Read the current replication position on the primary.
+
+        Args:
+            connection: A connection to the primary.
+
+        Returns:
+            The primary's position, or ``None`` if it cannot be determined.
+        """
+        ...
+
+    def replica_position(self, connection: "Connection") -> Optional[str]:
+        """Read the replayed replication position on a replica.
+
+        Args:
+            connection: A connection to the replica.
+
+        Returns:
+            The replica's replay position, or ``None`` if it cannot be determined.
+        """
+        ...
+
+    def is_caught_up(self, replica_position: str, token: str) -> bool:
+        """Check whether a replica position includes everything up to a token.
+
+        Args:
+            replica_position: A position returned by :meth:`replica_position`.
+            token: A position returned by :meth:`primary_position`.
+
+        Returns:
+            ``True`` if the replica has replayed the token's position.
+
+        Raises:
+            ValueError: If either position is malformed.
+        """
+        ...
+
+
+class PostgresLSNProbe:
+    """Replication probe for PostgreSQL streaming replication based on WAL LSNs."""
+
+    __slots__ = ()
+
+    @staticmethod
+    def _lsn_to_int(lsn: str) -> int:
+        if not _LSN_PATTERN.fullmatch(lsn):
+            msg = f"Invalid WAL LSN: {lsn!r}"
+            raise ValueError(msg)
+        high, _, low = lsn.partition("/")
+        return (int(high, 16) << 32) + int(low, 16)
+
+    def primary_position(self, connection: "Connection") -> Optional[str]:
+        """Read ``pg_current_wal_lsn()`` on the primary.
+
+        Args:
+            connection: A connection to the primary.
+
+        Returns:
+            The current WAL LSN.
+        """
+        position = connection.execute(text("SELECT pg_current_wal_lsn()::text")).scalar_one_or_none()
+        return str(position) if position is not None else None
+
+    def replica_position(self, connection: "Connection") -> Optional[str]:
+        """Read ``pg_last_wal_replay_lsn()`` on a replica.
+
+        Args:
+            connection: A connection to the replica.
+
+        Returns:
+            The last replayed WAL LSN, or ``None`` if the server is not in recovery.
+        """
+        position = connection.execute(text("SELECT pg_last_wal_replay_lsn()::text")).scalar_one_or_none()
+        return str(position) if position is not None else None
+
+    def is_caught_up(self, replica_position: str, token: str) -> bool:
+        """Compare two WAL LSNs.
+
+        Args:
+            replica_position: The replica's replay LSN.
+            token: The primary LSN recorded after a write.
+
+        Returns:
+            ``True`` if the replica LSN is at or past the token.
+
+        Raises:
+            ValueError: If either LSN is malformed.
+        """
+        return self._lsn_to_int(replica_position) >= self._lsn_to_int(token)
+
+
+class MySQLGTIDProbe:
+    """Replication probe for MySQL GTID-based replication.
+
+    Positions are normalized ``gtid_executed`` sets; a replica has caught up when the
+    token's GTID set is a subset of the replica's executed set.
+    """
+
+    __slots__ = ()
+
+    _statement = "SELECT @@GLOBAL.gtid_executed"
+
+    @staticmethod
+    def _parse(gtid_set: str) -> dict[tuple[str, str], list[tuple[int, int]]]:
+        intervals: dict[tuple[str, str], list[tuple[int, int]]] = {}
+        for member in filter(None, gtid_set.split(",")):
+            source, *parts = member.split(":")
+            if not _GTID_SOURCE_PATTERN.fullmatch(source) or not parts or not parts[-1][:1].isdigit():
+                msg = f"Invalid GTID set member: {member!r}"
+                raise ValueError(msg)
+            tag = ""
+            for part in parts:
+                if _GTID_TAG_PATTERN.fullmatch(part):
+                    tag = part.lower()
+                    continue
+                if not _GTID_INTERVAL_PATTERN.fullmatch(part):
+                    msg = f"Invalid GTID set member: {member!r}"
+                    raise ValueError(msg)
+                start, _, end = part.partition("-")
+                intervals.setdefault((source.lower(), tag), []).append((int(start), int(end or start)))
+        return intervals
+
+    def _read(self, connection: "Connection") -> Optional[str]:
+        position = connection.execute(text(self._statement)).scalar_one_or_none()
+        return re.sub(r"\s+", "", str(position)) if position is not None else None
+
+    def primary_position(self, connection: "Connection") -> Optional[str]:
+        """Read ``gtid_executed`` on the primary.
+
+        Args:
+            connection: A connection to the primary.
+
+        Returns:
+            The executed GTID set.
+        """
+        return self._read(connection)
+
+    def replica_position(self, connection: "Connection") -> Optional[str]:
+        """Read ``gtid_executed`` on a replica.
+
+        Args:
+            connection: A connection to the replica.
+
+        Returns:
+            The executed GTID set.
+        """
+        return self._read(connection)
+
+    def is_caught_up(self, replica_position: str, token: str) -> bool:
+        """Check that the token GTID set is contained in the replica's set.
+
+        Args:
+            replica_position: The replica's executed GTID set.
+            token: The primary GTID set recorded after a write.
+
+        Returns:
+            ``True`` if every transaction in the token was executed on the replica.
+
+        Raises:
+            ValueError: If either GTID set is malformed.
+        """
+        executed = self._parse(replica_position)
+        for key, required in self._parse(token).items():
+            available = executed.get(key, [])
+            for start, end in required:
+                if not any(low <= start and end <= high for low, high in available):
+                    return False
+        return True
+
+
+class FakePositionProbe:
+    """In-memory replication probe for tests.
+
+    Positions are integers kept per engine; nothing is executed on the connection.
+
+    Example:
+        Simulating a lagging replica::
+
+            probe = FakePositionProbe()
+            probe.primary = 10
+            probe.set_replica_position(replica_engine, 5)
+    """
+
+    __slots__ = ("_replicas", "primary")
+
+    def __init__(self, primary: int = 0) -> None:
+        """Initialize the fake probe.
+
+        Args:
+            primary: Initial primary position.
+        """
+        self.primary = primary
+        self._replicas: dict[int, int] = {}
+
+    def set_replica_position(self, engine: "Union[Engine, AsyncEngine]", position: int) -> None:
+        """Set the replay position reported for a replica engine.
+
+        Args:
+            engine: The replica engine (sync or async).
+            position: The replica's replay position.
+        """
+        self._replicas[id(getattr(engine, "sync_engine", engine))] = position
+
+    def primary_position(self, connection: "Connection") -> Optional[str]:
+        """Report the fake primary position.
+
+        Args:
+            connection: Ignored.
+
+        Returns:
+            The primary position.
+        """
+        return str(self.primary)
+
+    def replica_position(self, connection: "Connection") -> Optional[str]:
+        """Report the fake position of the connection's engine.
+
+        Args:
+            connection: A connection to the replica.
+
+        Returns:
+            The replica position, or ``None`` if it was never set.
+        """
+        position = self._replicas.get(id(connection.engine))
+        return str(position) if position is not None else None
+
+    def is_caught_up(self, replica_position: str, token: str) -> bool:
+        """Compare two integer positions.
+
+        Args:
+            replica_position: The replica position.
+            token: The recorded primary position.
+
+        Returns:
+            ``True`` if the replica position is at or past the token.
+
+        Raises:
+            ValueError: If either position is not an integer.
+        """
+        return int(replica_position) >= int(token)
+
+
+class ReplicaPositionTracker:
+    """Records primary positions and checks replicas against them.
+
+    Replica positions only move forward, so the last observed position of each
+    replica is cached and a replica is only probed again when the cached
+    position does not satisfy a token.
+    """
+
+    __slots__ = ("_lock", "_positions", "probe")
+
+    def __init__(self, probe: ReplicationPositionProbe) -> None:
+        """Initialize the tracker.
+
+        Args:
+            probe: The probe used to read and compare positions.
+        """
+        self.probe = probe
+        self._positions: dict[int, str] = {}
+        self._lock = threading.Lock()
+
+    def primary_position(self, engine: "Engine") -> Optional[str]:
+        """Read the primary's current position.
+
+        Args:
+            engine: The primary engine.
+
+        Returns:
+            The primary position, or ``None`` if it could not be read.
+        """
+        try:
+            with engine.connect() as conn:
+                return self.probe.primary_position(conn)
+        except SQLAlchemyError:
+            return None
+
+    def has_caught_up(self, engine: "Engine", token: str) -> bool:
+        """Check whether a replica has replayed at least up to ``token``.
+
+        Args:
+            engine: The replica engine.
+            token: The replication token to satisfy.
+
+        Returns:
+            ``True`` if the replica can serve reads for the token. A malformed token is
+            never satisfied, so reads carrying it go to the primary.
+        """
+        key = id(engine)
+        cached = self._positions.get(key)
+        try:
+            if cached is not None and self.probe.is_caught_up(cached, token):
+                return True
+            with engine.connect() as conn:
+                position = self.probe.replica_position(conn)
+            if position is None:
+                return False
+            with self._lock:
+                self._positions[key] = position
+            return self.probe.is_caught_up(position, token)
+        except (SQLAlchemyError, ValueError):
+            return False
+
+
+class ReplicationTokenMiddleware:
+    """Pure ASGI middleware carrying the replication token across requests.
+
+    The incoming token is read from a request header and/or cookie and made
+    available to routing sessions for the duration of the request. When the
+    request commits a write, the new token is returned in the same header
+    and/or cookie so the client's next request reads its own writes.
+
+    .. note::
+        The token is client supplied and is only trusted as far as its format.
+        Tokens that are too long, contain unexpected characters or, when a
+        ``probe`` is given, cannot be parsed by it are dropped. A well-formed
+        forged token can still send the client's reads to the primary (a token
+        far ahead of the primary) or to a lagging replica (a token behind the
+        client's own writes), so it only affects that client's consistency.
+
+    Example:
+        Carrying the token in a header and cookie::
+
+            app = ReplicationTokenMiddleware(
+                app, header_name="x-replication-token", cookie_name="rt"
+            )
+    """
+
+    __slots__ = ("app", "cookie_max_age", "cookie_name", "header_name", "probe")
+
+    def __init__(
+        self,
+        app: "_ASGIApp",
+        header_name: Optional[str] = "x-replication-token",
+        cookie_name: Optional[str] = None,
+        cookie_max_age: int = 60,
+        probe: Optional[ReplicationPositionProbe] = None,
+    ) -> None:
+        """Initialize the middleware.
+
+        Args:
+            app: The ASGI application to wrap.
+            header_name: Request/response header carrying the token, or ``None`` to disable.
+            cookie_name: Cookie carrying the token, or ``None`` to disable.
+            cookie_max_age: Lifetime of the token cookie in seconds.
+            probe: The routing config's replication probe, used to drop incoming tokens
+                it cannot parse.
+        """
+        self.app = app
+        self.header_name = header_name.lower() if header_name else None
+        self.cookie_name = cookie_name
+        self.cookie_max_age = cookie_max_age
+        self.probe = probe
+
+    def _is_valid_token(self, token: str) -> bool:
+        if not _TOKEN_PATTERN.fullmatch(token):
+            return False
+        if self.probe is None:
+            return True
+        try:
+            self.probe.is_caught_up(token, token)
+        except ValueError:
+            return False
+        return True
+
+    def _incoming_token(self, scope: "MutableMapping[str, Any]") -> Optional[str]:
+        token: Optional[str] = None
+        for raw_name, raw_value in scope.get("headers", ()):
+            name = raw_name.decode("latin-1").lower()
+            value = raw_value.decode("latin-1")
+            if self.header_name and name == self.header_name:
+                token = unquote(value.strip())
+                break
+            if self.cookie_name and name == "cookie":
+                for chunk in value.split(";"):
+                    key, _, cookie_value = chunk.strip().partition("=")
+                    if key == self.cookie_name and cookie_value:
+                        token = unquote(cookie_value)
+        return token if token and self._is_valid_token(token) else None
+
+    async def __call__(self, scope: "MutableMapping[str, Any]", receive: "_ASGIReceive", send: "_ASGISend") -> None:
+        if scope["type"] not in {"http", "websocket"}:
+            await self.app(scope, receive, send)
+            return
+
+        incoming = self._incoming_token(scope)
+
+        async def send_wrapper(message: "_ASGIMessage") -> None:
+            token = get_replication_token()
+            if message["type"] == "http.response.start" and token and token != incoming:
+                headers = list(message.get("headers", []))
+                encoded = quote(token, safe="")
+                if self.header_name:
+                    headers.append((self.header_name.encode("latin-1"), encoded.encode("latin-1")))
+                if self.cookie_name:
+                    cookie = (
+                        f"{self.cookie_name}={encoded}; Max-Age={self.cookie_max_age}; Path=/; HttpOnly; SameSite=Lax"
+                    )
+                    headers.append((b"set-cookie", cookie.encode("latin-1")))
+                message["headers"] = headers
+            await send(message)
+
+        with replication_token_context(incoming):
+            await self.app(scope, receive, send_wrapper)
@@ -4,20 +4,28 @@ This module provides different strategies for selecting which read replica
 to use for read operations.
 """
 
+import math
 import secrets
 import threading
+import time
 from abc import ABC, abstractmethod
 from itertools import cycle
-from typing import TYPE_CHECKING, Generic, TypeVar, Union
+from typing import TYPE_CHECKING, Any, Generic, Optional, TypeVar, Union
+
+from sqlalchemy import event
+from sqlalchemy.exc import InterfaceError, OperationalError
 
 if TYPE_CHECKING:
     from collections.abc import Iterator
 
     from sqlalchemy import Engine
+    from sqlalchemy.engine import ExceptionContext
     from sqlalchemy.ext.asyncio import AsyncEngine
 
 
 __all__ = (
+    "LatencyEWMASelector",
+    "LeastConnectionsSelector",
     "RandomSelector",
     "ReplicaSelector",
     "RoundRobinSelector",
@@ -27,17 +35,39 @@ __all__ = (
 EngineT = TypeVar("EngineT", bound="Union[Engine, AsyncEngine]")
 
 
+def _checked_out_connections(engine: "Union[Engine, AsyncEngine]") -> int:
+    """Return the number of connections checked out from an engine's pool.
+
+    Args:
+        engine: The engine to inspect.
+
+    Returns:
+        The checked-out connection count, or ``0`` if the pool does not track it.
+    """
+    checkedout = getattr(engine.pool, "checkedout", None)
+    if checkedout is None:
+        return 0
+    try:
+        return int(checkedout())
+    except (TypeError, ValueError):
+        return 0
+
+
 class EngineSelector(ABC, Generic[EngineT]):
     """Abstract base class for engine selection strategies.
 
     Subclasses implement different algorithms for choosing which
     engine to use for operations.
 
+    Engines can be temporarily removed from rotation with :meth:`eject`
+    (e.g. by a health monitor) and returned with :meth:`readmit`.
+
     Attributes:
         _engines: List of engines to select from.
+        _ejected: Identities of engines currently removed from rotation.
     """
 
-    __slots__ = ("_engines",)
+    __slots__ = ("_ejected", "_engines")
 
     def __init__(self, engines: list[EngineT]) -> None:
         """Initialize the selector with a list of engines.
@@ -46,14 +76,15 @@ class EngineSelector(ABC, Generic[EngineT]):
             engines: List of database engines.
         """
         self._engines = engines
+        self._ejected: set[int] = set()
 
     def has_engines(self) -> bool:
-        """Check if any engines are configured.
+        """Check if any engines are available for selection.
 
         Returns:
-            ``True`` if at least one engine is available.
+            ``True`` if at least one engine is configured and not ejected.
         """
-        return len(self._engines) > 0
+        return any(id(engine) not in self._ejected for engine in self._engines)
 
     def has_replicas(self) -> bool:
         """Check if any replicas are configured (alias for has_engines).
@@ -68,7 +99,7 @@ class EngineSelector(ABC, Generic[EngineT]):
         """Get the list of engines.
 
         Returns:
-            List of configured engines.
+            List of configured engines, including ejected ones.
         """
         return self._engines
 
@@ -81,6 +112,42 @@ class EngineSelector(ABC, Generic[EngineT]):
         """
         return self.engines
 
+    @property
+    def available_engines(self) -> list[EngineT]:
+        """Get the engines that are currently in rotation.
+
+        Returns:
+            List of configured engines that have not been ejected.
+        """
+        return [engine for engine in self._engines if id(engine) not in self._ejected]
+
+    def eject(self, engine: EngineT) -> None:
+        """Remove an engine from rotation.
+
+        Args:
+            engine: The engine to stop selecting.
+        """
+        self._ejected.add(id(engine))
+
+    def readmit(self, engine: EngineT) -> None:
+        """Return a previously ejected engine to rotation.
+
+        Args:
+            engine: The engine to select again.
+        """
+        self._ejected.discard(id(engine))
+
+    def is_ejected(self, engine: EngineT) -> bool:
+        """Check whether an engine is currently removed from rotation.
+
+        Args:
+            engine: The engine to check.
+
+        Returns:
+            ``True`` if the engine has been ejected.
+        """
+        return id(engine) in self._ejected
+
     @abstractmethod
     def next(self) -> EngineT:
         """Select the next engine to use.
@@ -142,7 +209,12 @@ class RoundRobinSelector(EngineSelector[EngineT]):
             msg = "No engines configured for round-robin selection"
             raise RuntimeError(msg)
         with self._lock:
-            return next(self._cycle)
+            for _ in range(len(self._engines)):
+                engine = next(self._cycle)
+                if id(engine) not in self._ejected:
+                    return engine
+        msg = "No healthy engines available for round-robin selection"
+        raise RuntimeError(msg)
 
 
 class RandomSelector(EngineSelector[EngineT]):
@@ -173,4 +245,248 @@ class RandomSelector(EngineSelector[EngineT]):
         if not self._engines:
             msg = "No engines configured for random selection"
             raise RuntimeError(msg)
-        return secrets.choice(self._engines)
+        candidates = self.available_engines
+        if not candidates:
+            msg = "No healthy engines available for random selection"
+            raise RuntimeError(msg)
+        return secrets.choice(candidates)
+
+
+class LeastConnectionsSelector(EngineSelector[EngineT]):
+    """Least-outstanding-requests engine selection.
+
+    Selects the engine whose connection pool currently has the fewest
+    checked-out connections. A session holds its connection for the lifetime
+    of its transaction, so the checkout count is a good proxy for the number
+    of in-flight requests on each engine.
+
+    Ties are broken in round-robin order so that idle engines share load
+    evenly. Pools that do not track checkouts (e.g. ``NullPool``) count as
+    idle.
+
+    This selector is thread-safe.
+
+    Example:
+        Creating a least-connections selector::
+
+            selector = LeastConnectionsSelector(engines)
+            engine = selector.next()
+    """
+
+    __slots__ = ("_lock", "_offset")
+
+    def __init__(self, engines: list[EngineT]) -> None:
+        """Initialize the least-connections selector.
+
+        Args:
+            engines: List of database engines.
+        """
+        super().__init__(engines)
+        self._offset = 0
+        self._lock = threading.Lock()
+
+    def next(self) -> EngineT:
+        """Select the engine with the fewest checked-out connections.
+
+        Returns:
+            The least loaded engine.
+
+        Raises:
+            RuntimeError: If no engines are configured.
+        """
+        if not self._engines:
+            msg = "No engines configured for least-connections selection"
+            raise RuntimeError(msg)
+        with self._lock:
+            offset = self._offset
+            self._offset = (offset + 1) % len(self._engines)
+        candidates = [
+            engine for engine in self._engines[offset:] + self._engines[:offset] if id(engine) not in self._ejected
+        ]
+        if not candidates:
+            msg = "No healthy engines available for least-connections selection"
+            raise RuntimeError(msg)
+        return min(candidates, key=_checked_out_connections)
+
+
+class LatencyEWMASelector(EngineSelector[EngineT]):
+    """Latency-aware engine selection using an exponentially weighted moving average.
+
+    Statement latency is measured per engine through the ``before_cursor_execute``
+    and ``after_cursor_execute`` engine events and folded into an EWMA. Each
+    selection picks the engine with the lowest score, where the score is the
+    EWMA multiplied by the number of checked-out connections plus one, so that
+    a fast engine that is already busy does not absorb all traffic.
+
+    A statement that fails with a connectivity error (a disconnect,
+    ``OperationalError`` or ``InterfaceError``) is recorded as taking at least
+    ``error_penalty`` seconds, so an engine that keeps failing is avoided like a
+    slow one. Other errors, such as integrity violations, are not recorded.
+
+    Measurements lose weight as they age: a score decays towards zero with the
+    time since the engine was last observed, so an engine that was slow in the
+    past is retried once its measurement becomes stale. Engines without any
+    measurement are preferred until they have been sampled. Ties, such as
+    between engines that have not been measured yet, are broken in round-robin
+    order.
+
+    This selector is thread-safe.
+
+    Example:
+        Creating a latency-aware selector::
+
+            selector = LatencyEWMASelector(
+                engines, alpha=0.3, decay_seconds=10.0
+            )
+            engine = selector.next()
+    """
+
+    __slots__ = ("_alpha", "_decay_seconds", "_error_penalty", "_latencies", "_lock", "_observed_at", "_offset")
+
+    def __init__(
+        self,
+        engines: list[EngineT],
+        alpha: float = 0.3,
+        decay_seconds: float = 10.0,
+        error_penalty: float = 1.0,
+    ) -> None:
+        """Initialize the latency-aware selector.
+
+        Args:
+            engines: List of database engines.
+            alpha: Smoothing factor for new samples, between ``0`` and ``1``.
+                Higher values react faster to latency changes.
+            decay_seconds: Time constant after which an unrefreshed measurement
+                has lost roughly two thirds of its weight.
+            error_penalty: Minimum latency in seconds recorded for a statement
+                that raised a connectivity error.
+
+        Raises:
+            ValueError: If ``alpha``, ``decay_seconds`` or ``error_penalty`` are out of range.
+        """
+        if not 0 < alpha <= 1:
+            msg = f"alpha must be in the range (0, 1], got {alpha}"
+            raise ValueError(msg)
+        if decay_seconds <= 0:
+            msg = f"decay_seconds must be positive, got {decay_seconds}"
+            raise ValueError(msg)
+        if error_penalty < 0:
+            msg = f"error_penalty must not be negative, got {error_penalty}"
+            raise ValueError(msg)
+        super().__init__(engines)
+        self._alpha = alpha
+        self._decay_seconds = decay_seconds
+        self._error_penalty = error_penalty
+        self._offset = 0
+        self._latencies: dict[int, float] = {}
+        self._observed_at: dict[int, float] = {}
+        self._lock = threading.Lock()
+        for engine in engines:
+            self._instrument(engine)
+
+    def _instrument(self, engine: EngineT) -> None:
+        """Attach latency tracking listeners to an engine.
+
+        Args:
+            engine: The engine to instrument.
+        """
+        key = id(engine)
+        sync_engine = getattr(engine, "sync_engine", engine)
+
+        def before_cursor_execute(conn: Any, *_: Any) -> None:
+            conn.info.setdefault("_aa_query_start", []).append(time.perf_counter())
+
+        def after_cursor_execute(conn: Any, *_: Any) -> None:
+            starts = conn.info.get("_aa_query_start")
+            if starts:
+                self._record(key, time.perf_counter() - starts.pop())
+
+        def handle_error(context: "ExceptionContext") -> None:
+            latency = 0.0
+            if context.connection is not None and context.execution_context is not None:
+                starts = context.connection.info.get("_aa_query_start")
+                if starts:
+                    latency = time.perf_counter() - starts.pop()
+            if context.is_disconnect or isinstance(context.sqlalchemy_exception, (OperationalError, InterfaceError)):
+                self._record(key, max(latency, self._error_penalty))
+
+        event.listen(sync_engine, "before_cursor_execute", before_cursor_execute)
+        event.listen(sync_engine, "after_cursor_execute", after_cursor_execute)
+        event.listen(sync_engine, "handle_error", handle_error)
+
+    def record(self, engine: EngineT, latency: float) -> None:
+        """Fold a latency sample into an engine's moving average.
+
+        Samples are recorded automatically from engine events; this method is
+        useful for seeding measurements or for engines executed out-of-band.
+
+        Args:
+            engine: The engine the sample belongs to.
+            latency: Observed statement latency in seconds.
+        """
+        self._record(id(engine), latency)
+
+    def _record(self, key: int, latency: float) -> None:
+        """Fold a latency sample into the moving average stored under ``key``.
+
+        Args:
+            key: The ``id()`` of the engine.
+            latency: Observed statement latency in seconds.
+        """
+        with self._lock:
+            previous = self._latencies.get(key)
+            self._latencies[key] = latency if previous is None else self._alpha * latency + (1 - self._alpha) * previous
+            self._observed_at[key] = time.monotonic()
+
+    def latency(self, engine: EngineT) -> Optional[float]:
+        """Get the current moving average latency for an engine.
+
+        Args:
+            engine: The engine to look up.
+
+        Returns:
+            The EWMA latency in seconds, or ``None`` if the engine has not been measured.
+        """
+        return self._latencies.get(id(engine))
+
+    def _score(self, engine: EngineT, now: float) -> float:
+        """Compute the selection score for an engine (lower is better).
+
+        Args:
+            engine: The engine to score.
+            now: The current monotonic time.
+
+        Returns:
+            The decayed latency weighted by outstanding connections.
+        """
+        key = id(engine)
+        ewma = self._latencies.get(key)
+        if ewma is None:
+            return 0.0
+        age = now - self._observed_at.get(key, now)
+        decayed = ewma * math.exp(-age / self._decay_seconds)
+        return decayed * (_checked_out_connections(engine) + 1)
+
+    def next(self) -> EngineT:
+        """Select the engine with the lowest latency score.
+
+        Returns:
+            The engine expected to respond fastest.
+
+        Raises:
+            RuntimeError: If no engines are configured.
+        """
+        if not self._engines:
+            msg = "No engines configured for latency-aware selection"
+            raise RuntimeError(msg)
+        now = time.monotonic()
+        with self._lock:
+            offset = self._offset
+            self._offset = (offset + 1) % len(self._engines)
+            candidates = [
+                engine for engine in self._engines[offset:] + self._engines[:offset] if id(engine) not in self._ejected
+            ]
+            if not candidates:
+                msg = "No healthy engines available for latency-aware selection"
+                raise RuntimeError(msg)
+            return min(candidates, key=lambda engine: self._score(engine, now))
@@ -10,12 +10,15 @@ from sqlalchemy import Delete, Insert, Update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from advanced_alchemy.exceptions import AdvancedAlchemyError
 from advanced_alchemy.routing.context import (
     bind_group_var,
+    clear_sticky_primary,
+    consume_sticky_primary,
     force_primary_var,
-    reset_routing_context,
+    get_replication_token,
+    set_replication_token,
     set_sticky_primary,
-    stick_to_primary_var,
 )
 
 if TYPE_CHECKING:
@@ -24,6 +27,7 @@ if TYPE_CHECKING:
     from sqlalchemy.orm import Mapper
 
     from advanced_alchemy.config.routing import RoutingConfig
+    from advanced_alchemy.routing.replication import ReplicaPositionTracker
     from advanced_alchemy.routing.selectors import EngineSelector
 
 
@@ -44,22 +48,27 @@ class RoutingSyncSession(Session):
     2. Context variables (``bind_group``, ``force_primary``)
     3. Stickiness state
     4. Operation type (Write vs Read)
+    5. Replication token (only replicas that have caught up, when a position tracker is set)
 
     Attributes:
         _default_engine: The default (write) database engine.
         _selectors: Map of group names to engine selectors.
         _routing_config: Configuration for routing behavior.
+        _position_tracker: Optional tracker for lag-aware read-your-writes.
     """
 
     _default_engine: "Engine"
     _selectors: "dict[str, EngineSelector[Engine]]"
     _routing_config: "RoutingConfig"
+    _position_tracker: "Optional[ReplicaPositionTracker]"
+    _wrote_in_transaction: bool
 
     def __init__(
         self,
         routing_config: "RoutingConfig",
         selectors: "dict[str, EngineSelector[Engine]]",
         default_engine: "Engine",
+        position_tracker: "Optional[ReplicaPositionTracker]" = None,
         **kwargs: Any,
     ) -> None:
         """Initialize the routing session.
@@ -68,6 +77,7 @@ class RoutingSyncSession(Session):
             routing_config: Configuration for routing behavior.
             selectors: Map of group names to engine selectors.
             default_engine: The default (fallback/write) engine.
+            position_tracker: Optional tracker used for lag-aware read-your-writes.
             **kwargs: Additional arguments passed to the parent Session.
         """
         kwargs.pop("bind", None)
@@ -76,6 +86,8 @@ class RoutingSyncSession(Session):
         self._default_engine = default_engine
         self._selectors = selectors
         self._routing_config = routing_config
+        self._position_tracker = position_tracker
+        self._wrote_in_transaction = False
 
     def get_bind(
         self,
@@ -93,29 +105,92 @@ class RoutingSyncSession(Session):
         Returns:
             The selected engine.
         """
+        is_write = self._flushing or isinstance(clause, (Insert, Update, Delete))
+        if is_write:
+            # Recorded on every route so that commit captures a replication token
+            self._wrote_in_transaction = True
+
         # 1. Check for explicit bind group in execution options
         if clause is not None and hasattr(clause, "_execution_options"):
             bind_group = clause._execution_options.get("bind_group")  # noqa: SLF001
             if bind_group:
-                return self._get_engine_for_group(bind_group)
+                return self._get_engine_for_group(bind_group, strict=self._is_shard_group(bind_group))
 
         # 2. Check context variable for bind group
         bind_group = bind_group_var.get()
         if bind_group:
-            return self._get_engine_for_group(bind_group)
+            return self._get_engine_for_group(bind_group, strict=self._is_shard_group(bind_group))
 
         # 3. Check if we should force/stick to default (writer)
-        if self._should_use_default_group(clause):
+        if self._should_use_default_group(clause, is_write):
             return self._get_engine_for_group(self._routing_config.default_group)
 
-        # 4. Read operation -> use read group
+        # 4. Read operation with a replication token -> replica that has caught up
+        token = get_replication_token() if self._position_tracker is not None else None
+        if token is not None:
+            return self._get_caught_up_engine(self._routing_config.read_group, token)
+
+        # 5. Read operation -> use read group
         return self._get_engine_for_group(self._routing_config.read_group)
 
-    def _get_engine_for_group(self, group: str) -> "Engine":
+    @property
+    def wrote_in_transaction(self) -> bool:
+        """Check whether the current transaction has flushed or executed a write.
+
+        Returns:
+            ``True`` if a write was routed since the last commit or rollback.
+        """
+        return self._wrote_in_transaction
+
+    def _is_shard_group(self, group: str) -> bool:
+        """Check whether a bind group is a configured shard.
+
+        Args:
+            group: Name of the engine group.
+
+        Returns:
+            ``True`` if sharding is configured and ``group`` is one of its shards.
+        """
+        sharding = self._routing_config.sharding
+        return sharding is not None and group in sharding.shards
+
+    def _get_caught_up_engine(self, group: str, token: str) -> "Engine":
+        """Get an engine from the group that has replayed the replication token.
+
+        Candidates are tried in the selector's order; the default engine is used
+        when no replica has caught up.
+
+        Args:
+            group: Name of the engine group.
+            token: The replication token reads must observe.
+
+        Returns:
+            A caught-up replica engine, or the default engine.
+        """
+        selector = self._selectors.get(group)
+        tracker = self._position_tracker
+        if selector is None or tracker is None:
+            return self._default_engine
+        for _ in range(len(selector.available_engines)):
+            try:
+                engine = selector.next()
+            except RuntimeError:
+                break
+            if tracker.has_caught_up(engine, token):
+                return engine
+        return self._default_engine
+
+    def _get_engine_for_group(self, group: str, strict: bool = False) -> "Engine":
         """Get an engine for the specified group.
 
         Args:
             group: Name of the engine group.
+            strict: Raise instead of falling back to the default engine when every engine of a
+                configured group is ejected. Used for shard groups, whose data does not live on
+                the default engine.
+
+        Raises:
+            AdvancedAlchemyError: If ``strict`` and every engine of the group is ejected.
 
         Returns:
             An engine from the group, or the default engine if group not found.
@@ -123,17 +198,25 @@ class RoutingSyncSession(Session):
         if group in self._selectors:
             selector = self._selectors[group]
             if selector.has_engines():
-                return selector.next()
+                try:
+                    return selector.next()
+                except RuntimeError:
+                    # Every engine was ejected by the health monitor after the check above
+                    pass
+            if strict:
+                msg = f"No healthy engines available in bind group '{group}'"
+                raise AdvancedAlchemyError(msg)
 
         # Fallback to default engine if group has no selector/engines
-        # or if it's the default group and we want to be safe
+        # (e.g. all replicas ejected as unhealthy) or if it's the default group and we want to be safe
         return self._default_engine
 
-    def _should_use_default_group(self, clause: Optional[Any]) -> bool:
+    def _should_use_default_group(self, clause: Optional[Any], is_write: bool) -> bool:
         """Determine if the operation should use the default (writer) group.
 
         Args:
             clause: The SQL clause being executed.
+            is_write: Whether the operation is a flush or DML statement.
 
         Returns:
             ``True`` if default group should be used.
@@ -144,17 +227,12 @@ class RoutingSyncSession(Session):
         if force_primary_var.get():
             return True
 
-        if stick_to_primary_var.get():
-            return True
-
-        if self._flushing:
+        if is_write:
             if self._routing_config.sticky_after_write:
                 set_sticky_primary()
             return True
 
-        if clause is not None and isinstance(clause, (Insert, Update, Delete)):
-            if self._routing_config.sticky_after_write:
-                set_sticky_primary()
+        if consume_sticky_primary(self._routing_config.sticky_window):
             return True
 
         return self._has_for_update(clause)
@@ -174,15 +252,31 @@ class RoutingSyncSession(Session):
         return for_update_arg is not None
 
     def commit(self) -> None:
-        """Commit the transaction and reset routing state."""
+        """Commit the transaction and reset routing state.
+
+        Bind groups and forced primary routing set by context managers stay in effect, so
+        work after the commit inside ``use_bind_group()`` or ``primary_context()`` is routed
+        the same way. Stickiness is reset only when ``reset_stickiness_on_commit`` is enabled. When a
+        position tracker is configured and the transaction wrote, the primary's replication
+        position is recorded as the replication token. If it cannot be read, reads stick to
+        the primary instead.
+        """
         super().commit()
+        wrote, self._wrote_in_transaction = self._wrote_in_transaction, False
         if self._routing_config.reset_stickiness_on_commit:
-            reset_routing_context()
+            clear_sticky_primary()
+        if wrote and self._position_tracker is not None:
+            position = self._position_tracker.primary_position(self._default_engine)
+            if position is None:
+                set_sticky_primary()
+            else:
+                set_replication_token(position)
 
     def rollback(self) -> None:
-        """Rollback the transaction and reset routing state."""
+        """Rollback the transaction and reset stickiness."""
         super().rollback()
-        reset_routing_context()
+        self._wrote_in_transaction = False
+        clear_sticky_primary()
 
 
 class RoutingAsyncSession(AsyncSession):
@@ -198,6 +292,7 @@ class RoutingAsyncSession(AsyncSession):
         routing_config: "RoutingConfig",
         selectors: "dict[str, EngineSelector[AsyncEngine]]",
         default_engine: "AsyncEngine",
+        position_tracker: "Optional[ReplicaPositionTracker]" = None,
         **kwargs: Any,
     ) -> None:
         """Initialize the async routing session.
@@ -206,6 +301,7 @@ class RoutingAsyncSession(AsyncSession):
             routing_config: Configuration for routing behavior.
             selectors: Map of group names to async engine selectors.
             default_engine: The default (fallback/write) async engine.
+            position_tracker: Optional tracker used for lag-aware read-your-writes.
             **kwargs: Additional arguments passed to the parent AsyncSession.
         """
         kwargs.pop("bind", None)
@@ -219,8 +315,11 @@ class RoutingAsyncSession(AsyncSession):
             routing_config=routing_config,
             selectors=sync_selectors,
             default_engine=default_engine.sync_engine,
+            position_tracker=position_tracker,
             **kwargs,
         )
+        # Routing controls bind selection; like the sync session, expose no fixed bind
+        self.bind = None  # type: ignore[assignment]
         self._default_engine = default_engine
         self._selectors = selectors
         self._routing_config = routing_config
@@ -276,6 +375,15 @@ class _SyncEngineSelectorWrapper:
         """
         return self.has_engines()
 
+    @property
+    def available_engines(self) -> "list[Engine]":
+        """Get the sync engines that are currently in rotation.
+
+        Returns:
+            List of sync engines that have not been ejected.
+        """
+        return [engine.sync_engine for engine in self._async_selector.available_engines]
+
     def next(self) -> "Engine":
         """Get the next engine's sync engine.
 
@@ -0,0 +1,434 @@
+"""Hash-based horizontal sharding for routed sessions.
+
+A :class:`ShardRouter` maps the value of a shard key column (for example
+``tenant_id``) to one of several bind groups using a consistent-hash ring.
+Repositories use it to route single-shard operations automatically from
+keyword arguments, filters or instances, and to scatter queries without a
+shard key to every shard concurrently before merging the results in
+``order_by`` order.
+"""
+
+import asyncio
+import bisect
+import hashlib
+import heapq
+from collections.abc import Awaitable, Iterable, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, Optional, TypeVar, Union
+
+from sqlalchemy import BinaryExpression, BindParameter, BooleanClauseList, UnaryExpression
+from sqlalchemy.sql import operators
+
+from advanced_alchemy.exceptions import ImproperConfigurationError, RepositoryError
+from advanced_alchemy.filters import CollectionFilter, LimitOffset
+
+if TYPE_CHECKING:
+    from advanced_alchemy.config.routing import ShardingConfig
+    from advanced_alchemy.repository.typing import OrderingPair
+
+__all__ = (
+    "ConsistentHashRing",
+    "ShardRouter",
+)
+
+T = TypeVar("T")
+
+
+def _key_bytes(value: Any) -> bytes:
+    if isinstance(value, bytes):
+        return value
+    return str(value).encode("utf-8")
+
+
+class ConsistentHashRing:
+    """Consistent-hash ring mapping keys to nodes.
+
+    Each node is placed on the ring ``virtual_nodes`` times so that keys are
+    spread evenly and adding or removing a node only moves the keys of that
+    node's ranges.
+
+    Example:
+        Mapping tenants to shards::
+
+            ring = ConsistentHashRing(["shard_a", "shard_b", "shard_c"])
+            ring.node_for(tenant_id)
+    """
+
+    __slots__ = ("_hashes", "_nodes", "virtual_nodes")
+
+    def __init__(self, nodes: Iterable[str], virtual_nodes: int = 100) -> None:
+        """Initialize the ring.
+
+        Args:
+            nodes: Node names to place on the ring.
+            virtual_nodes: Number of ring positions per node.
+
+        Raises:
+            ValueError: If ``virtual_nodes`` is not positive.
+        """
+        if virtual_nodes < 1:
+            msg = "virtual_nodes must be at least 1"
+            raise ValueError(msg)
+        self.virtual_nodes = virtual_nodes
+        self._hashes: list[int] = []
+        self._nodes: list[str] = []
+        for node in nodes:
+            self.add_node(node)
+
+    @staticmethod
+    def _hash(data: bytes) -> int:
+        return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "big")
+
+    @property
+    def nodes(self) -> list[str]:
+        """Get the distinct nodes on the ring.
+
+        Returns:
+            Sorted node names.
+        """
+        return sorted(set(self._nodes))
+
+    def add_node(self, node: str) -> None:
+        """Place a node on the ring.
+
+        Args:
+            node: Name of the node.
+        """
+        for replica in range(self.virtual_nodes):
+            position = self._hash(f"{node}#{replica}".encode())
+            index = bisect.bisect(self._hashes, position)
+            self._hashes.insert(index, position)
+            self._nodes.insert(index, node)
+
+    def remove_node(self, node: str) -> None:
+        """Remove a node from the ring.
+
+        Args:
+            node: Name of the node.
+        """
+        kept = [(position, name) for position, name in zip(self._hashes, self._nodes) if name != node]
+        self._hashes = [position for position, _ in kept]
+        self._nodes = [name for _, name in kept]
+
+    def node_for(self, key: Any) -> str:
+        """Get the node owning a key.
+
+        Args:
+            key: The key to place; non-``bytes`` keys are hashed by their ``str()`` form.
+
+        Raises:
+            LookupError: If the ring is empty.
+
+        Returns:
+            The name of the node owning the key.
+        """
+        if not self._hashes:
+            msg = "The hash ring has no nodes"
+            raise LookupError(msg)
+        index = bisect.bisect(self._hashes, self._hash(_key_bytes(key))) % len(self._hashes)
+        return self._nodes[index]
+
+
+class _MergeKey:
+    """Sort key honouring per-column direction for the k-way merge."""
+
+    __slots__ = ("descending", "nulls_last", "values")
+
+    def __init__(self, values: "tuple[Any, ...]", descending: "tuple[bool, ...]", nulls_last: bool) -> None:
+        self.values = values
+        self.descending = descending
+        self.nulls_last = nulls_last
+
+    def __lt__(self, other: "_MergeKey") -> bool:
+        for value, other_value, descending in zip(self.values, other.values, self.descending):
+            if value == other_value:
+                continue
+            if value is None or other_value is None:
+                # NULL sorts as the largest value when ``nulls_last`` and as the smallest otherwise
+                is_less = (other_value is None) if self.nulls_last else (value is None)
+            else:
+                is_less = value < other_value
+            return is_less != descending
+        return False
+
+
+class ShardRouter:
+    """Routes operations to shard bind groups by a shard key.
+
+    Example:
+        Routing by tenant::
+
+            router = ShardRouter(
+                shard_key="tenant_id",
+                shards=["shard_a", "shard_b"],
+            )
+            router.shard_for(tenant_id)  # -> "shard_a" or "shard_b"
+    """
+
+    __slots__ = ("_ring", "session_factory", "shard_key", "shards")
+
+    def __init__(
+        self,
+        shard_key: str,
+        shards: Sequence[str],
+        virtual_nodes: int = 100,
+        session_factory: Optional[Callable[[], Any]] = None,
+    ) -> None:
+        """Initialize the router.
+
+        Args:
+            shard_key: Name of the model attribute holding the shard key.
+            shards: Bind group names of the shards.
+            virtual_nodes: Number of ring positions per shard.
+            session_factory: Optional factory for extra sessions, used to query shards concurrently.
+                Without it, scatter queries run one shard at a time on the caller's session.
+
+        Raises:
+            ImproperConfigurationError: If no shards are given.
+        """
+        if not shards:
+            msg = "ShardRouter requires at least one shard"
+            raise ImproperConfigurationError(msg)
+        self.shard_key = shard_key
+        self.shards = list(shards)
+        self.session_factory = session_factory
+        self._ring = ConsistentHashRing(self.shards, virtual_nodes=virtual_nodes)
+
+    @classmethod
+    def from_config(
+        cls, config: "ShardingConfig", session_factory: Optional[Callable[[], Any]] = None
+    ) -> "ShardRouter":
+        """Create a router from a sharding configuration.
+
+        Args:
+            config: The sharding configuration.
+            session_factory: Optional factory for extra sessions used by scatter queries.
+
+        Returns:
+            A new router.
+        """
+        return cls(
+            shard_key=config.shard_key,
+            shards=config.shards,
+            virtual_nodes=config.virtual_nodes,
+            session_factory=session_factory,
+        )
+
+    def shard_for(self, value: Any) -> str:
+        """Get the shard bind group for a shard key value.
+
+        Args:
+            value: The shard key value.
+
+        Returns:
+            The bind group owning the value.
+        """
+        return self._ring.node_for(value)
+
+    def resolve(
+        self,
+        filters: "Sequence[Any]" = (),
+        kwargs: "Optional[dict[str, Any]]" = None,
+    ) -> Optional[str]:
+        """Resolve the single shard targeted by repository filters and keyword arguments.
+
+        The shard key is looked up in ``kwargs``, in ``column == value`` criteria
+        (including inside ``and_()``), and in :class:`~advanced_alchemy.filters.CollectionFilter`
+        instances whose values all belong to the same shard.
+
+        Args:
+            filters: Repository filters and column criteria.
+            kwargs: Repository keyword filters.
+
+        Returns:
+            The bind group, or ``None`` if the operation is not limited to one shard.
+        """
+        if kwargs and self.shard_key in kwargs:
+            return self.shard_for(kwargs[self.shard_key])
+        for filter_ in filters:
+            shard = self._resolve_filter(filter_)
+            if shard is not None:
+                return shard
+        return None
+
+    def _resolve_filter(self, filter_: Any) -> Optional[str]:
+        if isinstance(filter_, CollectionFilter):
+            field_name = getattr(filter_.field_name, "key", filter_.field_name)
+            if field_name != self.shard_key or not filter_.values:
+                return None
+            shards = {self.shard_for(value) for value in filter_.values}
+            return shards.pop() if len(shards) == 1 else None
+        if isinstance(filter_, BooleanClauseList) and filter_.operator is operators.and_:
+            for clause in filter_.clauses:
+                shard = self._resolve_filter(clause)
+                if shard is not None:
+                    return shard
+            return None
+        if isinstance(filter_, BinaryExpression) and filter_.operator is operators.eq:
+            for column, value in ((filter_.left, filter_.right), (filter_.right, filter_.left)):
+                if getattr(column, "key", None) == self.shard_key and isinstance(value, BindParameter):
+                    return self.shard_for(value.effective_value)
+        return None
+
+    def resolve_instance(self, instance: Any) -> Optional[str]:
+        """Resolve the shard of a model instance from its shard key attribute.
+
+        Args:
+            instance: A model instance, or a mapping of attribute names to values.
+
+        Returns:
+            The bind group, or ``None`` if the instance has no shard key value.
+        """
+        if isinstance(instance, Mapping):
+            value = instance.get(self.shard_key)
+        else:
+            value = getattr(instance, self.shard_key, None)
+        return self.shard_for(value) if value is not None else None
+
+    def partition(self, instances: "Iterable[T]") -> "dict[Optional[str], list[T]]":
+        """Group instances by shard.
+
+        Args:
+            instances: Model instances.
+
+        Returns:
+            Map of bind group (``None`` for instances without a shard key) to instances.
+        """
+        partitions: dict[Optional[str], list[T]] = {}
+        for instance in instances:
+            partitions.setdefault(self.resolve_instance(instance), []).append(instance)
+        return partitions
+
+    @staticmethod
+    def ordering_columns(order_by: "Union[list[OrderingPair], OrderingPair, None]") -> "list[tuple[str, bool]]":
+        """Get the attributes a scatter query is merged by.
+
+        Args:
+            order_by: The ordering applied on every shard.
+
+        Returns:
+            The attribute name and whether it is sorted descending, for each ordering.
+        """
+        if order_by is not None and not isinstance(order_by, list):
+            order_by = [order_by]
+        return [_ordering_column(ordering) for ordering in order_by or []]
+
+    @staticmethod
+    def split_pagination(
+        filters: "Sequence[Any]",
+        order_by: "Union[list[OrderingPair], OrderingPair, None]" = None,
+    ) -> "tuple[list[Any], Optional[LimitOffset]]":
+        """Rewrite limit/offset pagination for a scatter query.
+
+        Each shard must return its first ``offset + limit`` rows so that the merged
+        result can be paginated globally.
+
+        Args:
+            filters: Repository filters.
+            order_by: The ordering applied on every shard.
+
+        Raises:
+            RepositoryError: If the query is paginated without an ordering, since shard results
+                have no global order to take a page from.
+
+        Returns:
+            The per-shard filters and the original pagination filter, if any.
+        """
+        pagination: Optional[LimitOffset] = None
+        shard_filters: list[Any] = []
+        for filter_ in filters:
+            if isinstance(filter_, LimitOffset):
+                pagination = filter_
+                filter_ = LimitOffset(limit=filter_.limit + filter_.offset, offset=0)
+            shard_filters.append(filter_)
+        if pagination is not None and not ShardRouter.ordering_columns(order_by):
+            msg = "Paginating a query across every shard requires an order_by"
+            raise RepositoryError(msg)
+        return shard_filters, pagination
+
+    @staticmethod
+    def merge(
+        results: "Iterable[Sequence[T]]",
+        order_by: "Union[list[OrderingPair], OrderingPair, None]" = None,
+        nulls_last: bool = False,
+        pagination: Optional[LimitOffset] = None,
+        row_columns: "Optional[Sequence[str]]" = None,
+    ) -> "list[T]":
+        """K-way merge per-shard results that are each sorted by ``order_by``.
+
+        Args:
+            results: Sorted results from each shard.
+            order_by: The ordering applied on every shard. Without it, results are concatenated.
+            nulls_last: Whether the database sorts ``NULL`` after non-null values in ascending order.
+            pagination: Optional global limit/offset to apply to the merged result.
+            row_columns: Names of the selected columns when results are rows. Sort values are then
+                read by position instead of by attribute, and every ordering attribute must be selected.
+
+        Returns:
+            The merged results.
+        """
+        columns = ShardRouter.ordering_columns(order_by)
+        if columns:
+            descending = tuple(direction for _, direction in columns)
+            if row_columns is not None:
+                positions = tuple(list(row_columns).index(name) for name, _ in columns)
+
+                def sort_key(item: Any) -> _MergeKey:
+                    return _MergeKey(tuple(item[position] for position in positions), descending, nulls_last)
+
+            else:
+                names = tuple(name for name, _ in columns)
+
+                def sort_key(item: Any) -> _MergeKey:
+                    return _MergeKey(tuple(getattr(item, name) for name in names), descending, nulls_last)
+
+            merged: list[T] = list(heapq.merge(*results, key=sort_key))
+        else:
+            merged = [item for result in results for item in result]
+        if pagination is not None:
+            return merged[pagination.offset : pagination.offset + pagination.limit]
+        return merged
+
+    async def scatter_async(self, query: "Callable[[str], Awaitable[T]]") -> "list[T]":
+        """Run a query against every shard concurrently.
+
+        Args:
+            query: Coroutine function called with each shard's bind group.
+
+        Returns:
+            The results, in shard order.
+        """
+        return list(await asyncio.gather(*(query(shard) for shard in self.shards)))
+
+    def scatter_sync(self, query: "Callable[[str], T]") -> "list[T]":
+        """Run a query against every shard concurrently from a thread pool.
+
+        Args:
+            query: Function called with each shard's bind group.
+
+        Returns:
+            The results, in shard order.
+        """
+        with ThreadPoolExecutor(max_workers=len(self.shards), thread_name_prefix="advanced-alchemy-shard") as pool:
+            return list(pool.map(query, self.shards))
+
+
+def _ordering_column(ordering: Any) -> "tuple[str, bool]":
+    """Get the attribute name and direction of an ordering pair or expression.
+
+    Args:
+        ordering: An :data:`~advanced_alchemy.repository.typing.OrderingPair`.
+
+    Returns:
+        The attribute name and whether it is sorted descending.
+    """
+    if isinstance(ordering, UnaryExpression):
+        descending = False
+        element: Any = ordering
+        while isinstance(element, UnaryExpression):
+            if element.modifier is operators.desc_op:
+                descending = True
+            element = element.element
+        return str(element.key), descending
+    field, descending = ordering
+    return str(getattr(field, "key", field)), bool(descending)
@@ -19,7 +19,13 @@ from advanced_alchemy.service._sync import (
     SQLAlchemySyncRepositoryReadService,
     SQLAlchemySyncRepositoryService,
 )
-from advanced_alchemy.service._util import ResultConverter, find_filter
+from advanced_alchemy.service._util import (
+    ResultConverter,
+    RowConverter,
+    find_filter,
+    get_row_converter,
+    get_schema_loader_options,
+)
 from advanced_alchemy.service.pagination import OffsetPagination
 from advanced_alchemy.typing import ATTRS_INSTALLED
 from advanced_alchemy.utils.serialization import (
@@ -72,6 +78,7 @@ __all__ = (
     "OffsetPagination",
     "OrderingPair",
     "ResultConverter",
+    "RowConverter",
     "SQLAlchemyAsyncQueryService",
     "SQLAlchemyAsyncRepositoryReadService",
     "SQLAlchemyAsyncRepositoryService",
@@ -82,6 +89,8 @@ __all__ = (
     "SupportedSchemaModel",
     "fields",
     "find_filter",
+    "get_row_converter",
+    "get_schema_loader_options",
     "is_attrs_instance",
     "is_attrs_instance_with_field",
     "is_attrs_instance_without_field",
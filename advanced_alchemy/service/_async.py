@@ -25,15 +25,20 @@ from advanced_alchemy.filters import StatementFilter
 from advanced_alchemy.repository import (
     SQLAlchemyAsyncQueryRepository,
 )
-from advanced_alchemy.repository._util import LoadSpec, model_from_dict
+from advanced_alchemy.repository._util import LoadSpec, model_from_dict, validate_composite_pk_value
 from advanced_alchemy.repository.typing import MISSING, ModelT, OrderingPair, PrimaryKeyType, SQLAlchemyAsyncRepositoryT
-from advanced_alchemy.service._util import ResultConverter, resolve_item_ids
+from advanced_alchemy.service._util import (
+    ResultConverter,
+    get_row_converter,
+    resolve_item_ids,
+)
 from advanced_alchemy.utils.dataclass import Empty, EmptyType
 from advanced_alchemy.utils.deprecation import warn_deprecation
 from advanced_alchemy.utils.serialization import (
     BulkModelDictT,
     ModelDictListT,
     ModelDictT,
+    ModelDTOT,
     SchemaDumpConfig,
     is_attrs_instance,
     is_dataclass,
@@ -702,6 +707,51 @@ class SQLAlchemyAsyncRepositoryReadService(ResultConverter, Generic[ModelT, SQLA
             ),
         )
 
+    async def get_many_as(
+        self,
+        schema_type: "type[ModelDTOT]",
+        *filters: Union[StatementFilter, ColumnElement[bool]],
+        statement: Optional[Select[tuple[ModelT]]] = None,
+        order_by: Optional[Union[List[OrderingPair], OrderingPair]] = None,
+        error_messages: Optional[Union[ErrorMessages, EmptyType]] = Empty,
+        execution_options: Optional[dict[str, Any]] = None,
+        bind_group: Optional[str] = None,
+        **kwargs: Any,
+    ) -> "list[ModelDTOT]":
+        """Select only the fields of ``schema_type`` and build schema instances straight from the rows.
+
+        No model instances are created, so instrumentation, the identity map, expunging and
+        :meth:`to_schema` are all skipped. Use it for read-only endpoints returning large pages.
+        Every field of the schema must be a column attribute of the model; with ``dict``, all
+        columns are selected.
+
+        Args:
+            schema_type: A msgspec, pydantic, attrs or dataclass schema, or ``dict``.
+            *filters: Types for specific filtering operations.
+            statement: To facilitate customization of the underlying select query.
+            order_by: Set default order options for queries.
+            error_messages: An optional dictionary of templates to use
+                for friendlier error messages to clients
+            execution_options: Set default execution options
+            bind_group: Optional routing group to use for the operation.
+            **kwargs: Instance attribute value filters.
+
+        Returns:
+            The schema instances.
+        """
+        converter = get_row_converter(self.model_type, schema_type)  # type: ignore[arg-type]
+        rows = await self.repository.get_many_columns(
+            converter.columns,
+            *filters,
+            statement=statement,
+            order_by=order_by,
+            error_messages=error_messages,
+            execution_options=execution_options,
+            bind_group=bind_group,
+            **kwargs,
+        )
+        return cast("list[ModelDTOT]", converter.many(rows))
+
     async def list(
         self,
         *filters: Union[StatementFilter, ColumnElement[bool]],
@@ -846,6 +896,7 @@ class SQLAlchemyAsyncRepositoryService(
         uniquify: Optional[bool] = None,
         bind_group: Optional[str] = None,
         schema_dump_config: Optional[SchemaDumpConfig] = None,
+        blind: bool = False,
     ) -> "ModelT":
         """Wrap repository update operation.
 
@@ -869,6 +920,9 @@ class SQLAlchemyAsyncRepositoryService(
             uniquify: Optionally apply the ``unique()`` method to results before returning.
             bind_group: Optional routing group to use for the operation.
             schema_dump_config: Optional schema dump behavior for this operation.
+            blind: When ``item_id`` is provided, write the explicitly set columns with a single
+                ``UPDATE ... RETURNING`` instead of loading and merging the existing instance.
+                Raises :exc:`~advanced_alchemy.exceptions.NotFoundError` when no row matches.
 
         Raises:
             RepositoryError: If no configuration or session is provided.
@@ -881,7 +935,16 @@ class SQLAlchemyAsyncRepositoryService(
         # and that to_model_on_update() is properly invoked via the operation_map
         data = await self.to_model(data, "update", schema_dump_config=schema_dump_config)
 
-        if item_id is not None:
+        if item_id is not None and blind:
+            # Identify the row on the converted model and let the repository issue the UPDATE directly
+            if id_attribute is None and self.repository.has_composite_pk:
+                pk_attr_names = self.repository.pk_attr_names
+                pk_values = validate_composite_pk_value(item_id, pk_attr_names, self.repository.model_type.__name__)
+                for attr_name, value in zip(pk_attr_names, pk_values):
+                    setattr(data, attr_name, value)
+            else:
+                data = self.repository.set_id_attribute_value(item_id, data, id_attribute=id_attribute)
+        elif item_id is not None:
             # When item_id is provided, update existing instance rather than replacing it
             # This preserves relationships and database-managed fields
             existing_instance: ModelT = await self.repository.get(
@@ -938,6 +1001,7 @@ class SQLAlchemyAsyncRepositoryService(
                 execution_options=execution_options,
                 uniquify=self._get_uniquify(uniquify),
                 bind_group=bind_group,
+                blind=blind,
             ),
         )
 
@@ -4,14 +4,20 @@ RepositoryService object is generic on the domain model type which
 should be a SQLAlchemy model.
 """
 
+import dataclasses
 import datetime
 from collections.abc import Sequence
 from enum import Enum
 from functools import lru_cache, partial
+from inspect import Parameter, signature
 from pathlib import Path, PurePath
-from typing import TYPE_CHECKING, Any, Callable, Optional, Union, cast, overload
+from typing import TYPE_CHECKING, Any, Callable, Optional, Union, cast, get_args, get_type_hints, overload
 from uuid import UUID
 
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.engine.row import Row
+from sqlalchemy.orm import joinedload, load_only, selectinload
+
 from advanced_alchemy.exceptions import AdvancedAlchemyError
 from advanced_alchemy.filters import LimitOffset, StatementFilter
 from advanced_alchemy.repository.typing import PrimaryKeyType
@@ -37,12 +43,19 @@ from advanced_alchemy.utils.serialization import (
 
 if TYPE_CHECKING:
     from sqlalchemy import ColumnElement, RowMapping
-    from sqlalchemy.engine.row import Row
+    from sqlalchemy.orm.strategy_options import _AbstractLoad  # pyright: ignore[reportPrivateUsage]
 
     from advanced_alchemy.base import ModelProtocol
     from advanced_alchemy.repository.typing import ModelOrRowMappingT
 
-__all__ = ("ResultConverter", "find_filter", "resolve_item_ids")
+__all__ = (
+    "ResultConverter",
+    "RowConverter",
+    "find_filter",
+    "get_row_converter",
+    "get_schema_loader_options",
+    "resolve_item_ids",
+)
 
 DEFAULT_TYPE_DECODERS = [  # pyright: ignore[reportUnknownVariableType]
     (lambda x: x is UUID, lambda t, v: t(v.hex)),  # pyright: ignore[reportUnknownLambdaType,reportUnknownMemberType]
@@ -94,6 +107,35 @@ def resolve_item_ids(
     return item_ids if resolved_item_ids is None else resolved_item_ids
 
 
+@lru_cache(maxsize=256)
+def get_schema_loader_options(model_type: "type[Any]", schema_type: "type[Any]") -> "tuple[_AbstractLoad, ...]":
+    """Derive loader options that fetch exactly what ``schema_type`` serializes from ``model_type``.
+
+    Fields of the schema (msgspec, pydantic, attrs or dataclass) that name columns become a
+    ``load_only`` option, and fields that name relationships are eagerly loaded, with
+    ``selectinload`` for collections and ``joinedload`` for scalar relationships. Nested schema
+    types on relationship fields are planned recursively. When the schema has a field that is
+    neither a column nor a relationship (a property, for example), all columns are loaded,
+    since the field may read any of them. Results are cached per ``(model_type, schema_type)``.
+
+    Example:
+        Passing the options as ``load``::
+
+            users = await user_service.list(
+                load=get_schema_loader_options(User, UserRead)
+            )
+            return user_service.to_schema(users, schema_type=UserRead)
+
+    Args:
+        model_type: The mapped model being queried.
+        schema_type: The schema the results are converted to.
+
+    Returns:
+        Loader options to pass as ``load`` to repository and service methods.
+    """
+    return tuple(_plan_loader_options(model_type, schema_type, frozenset()))
+
+
 class ResultConverter:
     """Simple mixin to help convert to a paginated response model.
 
@@ -238,53 +280,12 @@ class ResultConverter:
                 "OffsetPagination[ModelOrRowMappingT]",
                 _create_pagination(cast("Sequence[ModelOrRowMappingT]", data), filters, total),
             )
-        if MSGSPEC_INSTALLED and issubclass(schema_type, Struct):
+        library = _get_schema_library(schema_type)
+        if library is not None:
             if not isinstance(data, Sequence):
-                return cast(
-                    "ModelDTOT",
-                    convert(
-                        obj=data,
-                        type=schema_type,
-                        from_attributes=True,
-                        dec_hook=partial(
-                            _default_msgspec_deserializer,
-                            type_decoders=DEFAULT_TYPE_DECODERS,
-                        ),
-                    ),
-                )
-            converted_items = convert(
-                obj=data,
-                type=list[schema_type],  # type: ignore[valid-type]
-                from_attributes=True,
-                dec_hook=partial(
-                    _default_msgspec_deserializer,
-                    type_decoders=DEFAULT_TYPE_DECODERS,
-                ),
-            )
-            return cast("OffsetPagination[ModelDTOT]", _create_pagination(converted_items, filters, total))
-
-        if PYDANTIC_INSTALLED and issubclass(schema_type, BaseModel):
-            if not isinstance(data, Sequence):
-                return cast(
-                    "ModelDTOT",
-                    get_type_adapter(schema_type).validate_python(data, from_attributes=True),
-                )
-            validated_items = get_type_adapter(list[schema_type]).validate_python(data, from_attributes=True)  # type: ignore[valid-type] # pyright: ignore[reportUnknownArgumentType]
-            return cast("OffsetPagination[ModelDTOT]", _create_pagination(validated_items, filters, total))
-        if CATTRS_INSTALLED and is_attrs_schema(schema_type):
-            if not isinstance(data, Sequence):
-                return cast("ModelDTOT", structure(schema_dump(data), schema_type))
-            structured_items = [cast("ModelDTOT", structure(schema_dump(item), schema_type)) for item in data]
-            return cast("OffsetPagination[ModelDTOT]", _create_pagination(structured_items, filters, total))
-
-        if ATTRS_INSTALLED and is_attrs_schema(schema_type):
-            # Cache field names for performance
-            field_names = _get_attrs_field_names(schema_type)  # type: ignore[arg-type]
-
-            if not isinstance(data, Sequence):
-                return cast("ModelDTOT", _convert_attrs_item(data, schema_type, field_names))
-
-            converted_items = [_convert_attrs_item(item, schema_type, field_names) for item in data]
+                return cast("ModelDTOT", _get_schema_converter(type(data), schema_type, library).one(data))  # type: ignore[arg-type]
+            source_type = type(data[0]) if data else type(None)
+            converted_items = _get_schema_converter(source_type, schema_type, library).many(data)  # type: ignore[arg-type]
             return cast("OffsetPagination[ModelDTOT]", _create_pagination(converted_items, filters, total))
 
         if not MSGSPEC_INSTALLED and not PYDANTIC_INSTALLED and not ATTRS_INSTALLED:
@@ -366,6 +367,160 @@ def _convert_attrs_item(item: Any, schema_type: "type[ModelDTOT]", field_names:
     return schema_type(**filtered_dict)  # type: ignore[return-value]
 
 
+def _is_mapped_model(source_type: "type[Any]") -> bool:
+    """Check whether instances of ``source_type`` keep their loaded column values in ``__dict__``.
+
+    Args:
+        source_type: Type of the items being converted.
+
+    Returns:
+        ``True`` for SQLAlchemy mapped classes that are not also pydantic models (SQLModel).
+    """
+    if getattr(source_type, "__mapper__", None) is None:
+        return False
+    return not (PYDANTIC_INSTALLED and issubclass(source_type, BaseModel))
+
+
+def _get_schema_library(schema_type: "type[Any]") -> "Optional[str]":
+    """Get the library converting to a schema type.
+
+    Args:
+        schema_type: Target schema type.
+
+    Returns:
+        ``msgspec``, ``pydantic``, ``cattrs`` or ``attrs``, or ``None`` if no installed library handles the type.
+    """
+    if MSGSPEC_INSTALLED and issubclass(schema_type, Struct):
+        return "msgspec"
+    if PYDANTIC_INSTALLED and issubclass(schema_type, BaseModel):
+        return "pydantic"
+    if CATTRS_INSTALLED and is_attrs_schema(schema_type):
+        return "cattrs"
+    if ATTRS_INSTALLED and is_attrs_schema(schema_type):
+        # Cache field names for performance
+        _get_attrs_field_names(schema_type)  # type: ignore[arg-type]
+        return "attrs"
+    return None
+
+
+class _SchemaConverter:
+    """Converts items of one source type to one schema type.
+
+    Built once per ``(source type, schema type, library)`` by :func:`_get_schema_converter`
+    so that type dispatch and field lookups are not repeated for every call.
+    """
+
+    __slots__ = ("many", "one")
+
+    def __init__(self, one: "Callable[[Any], Any]", many: "Callable[[Sequence[Any]], list[Any]]") -> None:
+        self.one = one
+        self.many = many
+
+
+_MSGSPEC_DEC_HOOK = partial(_default_msgspec_deserializer, type_decoders=DEFAULT_TYPE_DECODERS)
+
+
+def _msgspec_converter(source_type: "type[Any]", schema_type: "type[Any]") -> _SchemaConverter:
+    list_type = list[schema_type]  # type: ignore[valid-type]
+    use_loaded_state = (
+        _is_mapped_model(source_type)
+        and schema_type.__struct_fields__ == schema_type.__struct_encode_fields__
+        and not schema_type.__struct_config__.forbid_unknown_fields
+    )
+
+    def one(item: Any) -> Any:
+        return convert(obj=item, type=schema_type, from_attributes=True, dec_hook=_MSGSPEC_DEC_HOOK)
+
+    if not use_loaded_state:
+
+        def many(items: "Sequence[Any]") -> "list[Any]":
+            return cast(
+                "list[Any]", convert(obj=items, type=list_type, from_attributes=True, dec_hook=_MSGSPEC_DEC_HOOK)
+            )
+
+        return _SchemaConverter(one, many)
+
+    names = frozenset(schema_type.__struct_fields__)
+
+    def many_loaded(items: "Sequence[Any]") -> "list[Any]":
+        # Instances whose ``__dict__`` already holds every field are converted as mappings, which
+        # avoids an instrumented attribute lookup per field; the rest fall back to attribute access.
+        prepared = [state if names <= (state := getattr(item, "__dict__", {})).keys() else item for item in items]
+        return cast(
+            "list[Any]", convert(obj=prepared, type=list_type, from_attributes=True, dec_hook=_MSGSPEC_DEC_HOOK)
+        )
+
+    return _SchemaConverter(one, many_loaded)
+
+
+def _pydantic_converter(schema_type: "type[Any]") -> _SchemaConverter:
+    item_adapter = get_type_adapter(schema_type)  # type: ignore[arg-type]
+    list_adapter = get_type_adapter(list[schema_type])  # type: ignore[valid-type]
+
+    def one(item: Any) -> Any:
+        return item_adapter.validate_python(item, from_attributes=True)
+
+    def many(items: "Sequence[Any]") -> "list[Any]":
+        return cast("list[Any]", list_adapter.validate_python(items, from_attributes=True))
+
+    return _SchemaConverter(one, many)
+
+
+def _cattrs_converter(schema_type: "type[Any]") -> _SchemaConverter:
+    list_type = list[schema_type]  # type: ignore[valid-type]
+
+    def one(item: Any) -> Any:
+        return structure(schema_dump(item), schema_type)
+
+    def many(items: "Sequence[Any]") -> "list[Any]":
+        return cast("list[Any]", structure([schema_dump(item) for item in items], list_type))
+
+    return _SchemaConverter(one, many)
+
+
+def _attrs_converter(source_type: "type[Any]", schema_type: "type[Any]") -> _SchemaConverter:
+    field_names = _get_attrs_field_names(schema_type)  # type: ignore[arg-type]
+    if not _is_mapped_model(source_type):
+
+        def one(item: Any) -> Any:
+            return _convert_attrs_item(item, schema_type, field_names)
+
+    else:
+        names = tuple(sorted(field_names))
+
+        def one(item: Any) -> Any:
+            if type(item) is not source_type:
+                return _convert_attrs_item(item, schema_type, field_names)
+            state = item.__dict__
+            return schema_type(**{name: state[name] for name in names if name in state})
+
+    def many(items: "Sequence[Any]") -> "list[Any]":
+        return [one(item) for item in items]
+
+    return _SchemaConverter(one, many)
+
+
+@lru_cache(maxsize=256)
+def _get_schema_converter(source_type: "type[Any]", schema_type: "type[Any]", library: str) -> _SchemaConverter:
+    """Build and cache the converter for a source type, schema type and schema library.
+
+    Args:
+        source_type: Type of the items being converted.
+        schema_type: Target schema type.
+        library: Schema library handling ``schema_type``: ``msgspec``, ``pydantic``, ``cattrs`` or ``attrs``.
+
+    Returns:
+        The converter.
+    """
+    if library == "msgspec":
+        return _msgspec_converter(source_type, schema_type)
+    if library == "pydantic":
+        return _pydantic_converter(schema_type)
+    if library == "cattrs":
+        return _cattrs_converter(schema_type)
+    return _attrs_converter(source_type, schema_type)
+
+
 def _create_pagination(items: Any, filters: Any, total: "Optional[int]") -> "OffsetPagination[Any]":
     """Create OffsetPagination with consistent limit_offset logic.
 
@@ -384,3 +539,194 @@ def _create_pagination(items: Any, filters: Any, total: "Optional[int]") -> "Off
         offset=limit_offset.offset,
         total=total or len(items),
     )
+
+
+def _get_schema_field_names(schema_type: Any) -> "Optional[tuple[str, ...]]":
+    """Get the field names of a msgspec, pydantic, attrs or dataclass schema.
+
+    Returns:
+        The field names, or ``None`` if ``schema_type`` is not a supported schema class.
+    """
+    if not isinstance(schema_type, type):
+        return None
+    if MSGSPEC_INSTALLED and issubclass(schema_type, Struct):
+        return tuple(schema_type.__struct_fields__)
+    if PYDANTIC_INSTALLED and issubclass(schema_type, BaseModel):
+        return tuple(schema_type.model_fields)
+    if ATTRS_INSTALLED and is_attrs_schema(schema_type):
+        return tuple(field.name for field in fields(schema_type))
+    if dataclasses.is_dataclass(schema_type):
+        return tuple(field.name for field in dataclasses.fields(schema_type))
+    return None
+
+
+def _get_nested_schema_type(annotation: Any) -> "Optional[type[Any]]":
+    """Find the schema class inside an annotation such as ``Optional[X]`` or ``list[X]``.
+
+    Returns:
+        The first schema class found, or ``None``.
+    """
+    if _get_schema_field_names(annotation) is not None:
+        return cast("type[Any]", annotation)
+    for arg in get_args(annotation):
+        nested = _get_nested_schema_type(arg)
+        if nested is not None:
+            return nested
+    return None
+
+
+def _plan_loader_options(
+    model_type: "type[Any]", schema_type: "type[Any]", seen: "frozenset[tuple[type[Any], type[Any]]]"
+) -> "list[_AbstractLoad]":
+    field_names = _get_schema_field_names(schema_type)
+    mapper = sa_inspect(model_type, raiseerr=False)
+    if field_names is None or mapper is None:
+        return []
+    try:
+        annotations = get_type_hints(schema_type)
+    except Exception:  # noqa: BLE001
+        annotations = {}
+    seen = seen | {(model_type, schema_type)}
+    column_keys = {prop.key for prop in mapper.column_attrs}
+    columns: list[str] = []
+    options: list[_AbstractLoad] = []
+    project_columns = True
+    for name in field_names:
+        if name in column_keys:
+            columns.append(name)
+            continue
+        relationship = mapper.relationships.get(name)
+        if relationship is None:
+            project_columns = False
+            continue
+        if relationship.lazy in {"dynamic", "write_only"}:
+            continue
+        columns.extend(
+            prop.key
+            for column in relationship.local_columns
+            if (prop := mapper.get_property_by_column(column)) is not None
+        )
+        attribute = getattr(model_type, name)
+        loader = selectinload(attribute) if relationship.uselist else joinedload(attribute)
+        nested_schema = _get_nested_schema_type(annotations.get(name))
+        related_model = relationship.mapper.class_
+        if nested_schema is not None and (related_model, nested_schema) not in seen:
+            nested_options = _plan_loader_options(related_model, nested_schema, seen)
+            if nested_options:
+                loader = loader.options(*nested_options)
+        options.append(loader)
+    if project_columns and columns:
+        options.insert(0, load_only(*(getattr(model_type, key) for key in dict.fromkeys(columns))))
+    return options
+
+
+class RowConverter:
+    """Builds schema instances directly from rows of the selected ``columns``.
+
+    Built once per ``(model type, schema type)`` by :func:`get_row_converter`.
+    """
+
+    __slots__ = ("columns", "many")
+
+    def __init__(self, columns: "tuple[str, ...]", many: "Callable[[Sequence[Any]], list[Any]]") -> None:
+        self.columns = columns
+        self.many = many
+
+
+def _has_column_types(model_type: "type[Any]", schema_type: "type[Any]", columns: "tuple[str, ...]") -> bool:
+    """Check that every field is annotated with the Python type of its column, so conversion would not change it.
+
+    Returns:
+        Whether the selected values can be passed to the schema constructor as they are.
+    """
+    try:
+        annotations = get_type_hints(schema_type, include_extras=True)
+    except Exception:  # noqa: BLE001
+        return False
+    column_attrs = sa_inspect(model_type).column_attrs
+    for name in columns:
+        try:
+            python_type = column_attrs[name].columns[0].type.python_type
+        except NotImplementedError:
+            return False
+        if annotations.get(name) not in {python_type, Optional[python_type]}:
+            return False
+    return True
+
+
+def _row_constructor(schema_type: "type[Any]", columns: "tuple[str, ...]") -> "Callable[[Sequence[Any]], list[Any]]":
+    """Build a constructor passing each row's values positionally, or by name if the fields are keyword-only.
+
+    Returns:
+        The constructor for a list of rows.
+    """
+    parameters = signature(schema_type).parameters.values()
+    positional = tuple(
+        parameter.name
+        for parameter in parameters
+        if parameter.kind in {Parameter.POSITIONAL_ONLY, Parameter.POSITIONAL_OR_KEYWORD}
+    )
+    if positional[: len(columns)] == columns:
+
+        def many_positional(rows: "Sequence[Any]") -> "list[Any]":
+            return [schema_type(*row) for row in rows]
+
+        return many_positional
+
+    def many_named(rows: "Sequence[Any]") -> "list[Any]":
+        return [schema_type(**row._mapping) for row in rows]  # noqa: SLF001
+
+    return many_named
+
+
+@lru_cache(maxsize=256)
+def get_row_converter(model_type: "type[Any]", schema_type: "type[Any]") -> RowConverter:
+    """Build and cache the columns to select and the row constructor for a schema type.
+
+    Rows, as returned by ``get_many_columns``, are converted exactly as
+    :meth:`ResultConverter.to_schema` converts a model instance, so msgspec
+    ``dec_hook`` coercion, pydantic validation and cattrs structuring apply the
+    same way.  Msgspec, pydantic and cattrs read the rows directly.  Msgspec,
+    attrs and dataclass schemas whose fields are annotated with their columns'
+    Python types are built by calling the schema class with the row values, as
+    conversion would not change them; so are attrs schemas without cattrs, and
+    dataclasses without msgspec.
+
+    Args:
+        model_type: The mapped model being queried.
+        schema_type: A msgspec, pydantic, attrs or dataclass schema, or ``dict``.
+
+    Raises:
+        AdvancedAlchemyError: If ``schema_type`` is not a supported schema type.
+
+    Returns:
+        The row converter.
+    """
+    if schema_type is dict:
+        columns = tuple(prop.key for prop in sa_inspect(model_type).column_attrs)
+
+        def many_dicts(rows: "Sequence[Any]") -> "list[Any]":
+            return [dict(zip(columns, row)) for row in rows]
+
+        return RowConverter(columns, many_dicts)
+    library = _get_schema_library(schema_type) if isinstance(schema_type, type) else None
+    if library in {"cattrs", "attrs"}:
+        columns = tuple(field.name for field in fields(schema_type) if field.init)
+    elif library is not None:
+        columns = cast("tuple[str, ...]", _get_schema_field_names(schema_type))
+    elif dataclasses.is_dataclass(schema_type):
+        columns = tuple(field.name for field in dataclasses.fields(schema_type) if field.init)
+        library = "msgspec" if MSGSPEC_INSTALLED else None
+    else:
+        msg = "`schema_type` should be a valid Pydantic, Msgspec, attrs or dataclass schema, or `dict`"
+        raise AdvancedAlchemyError(msg)
+    if library in {None, "attrs"} or (library != "pydantic" and _has_column_types(model_type, schema_type, columns)):
+        return RowConverter(columns, _row_constructor(schema_type, columns))
+    if library == "cattrs":
+        list_type = list[schema_type]  # type: ignore[valid-type]
+
+        def many_structured(rows: "Sequence[Any]") -> "list[Any]":
+            return cast("list[Any]", structure([row._mapping for row in rows], list_type))  # noqa: SLF001
+
+        return RowConverter(columns, many_structured)
+    return RowConverter(columns, _get_schema_converter(Row, schema_type, library).many)  # type: ignore[arg-type]
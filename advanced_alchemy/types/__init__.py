@@ -4,10 +4,13 @@ from advanced_alchemy.types import encrypted_string, file_object, password_hash,
 from advanced_alchemy.types.boolean import Bool
 from advanced_alchemy.types.datetime import DateTimeUTC
 from advanced_alchemy.types.encrypted_string import (
+    BlindIndex,
     EncryptedString,
     EncryptedText,
+    EncryptedValue,
     EncryptionBackend,
     FernetBackend,
+    decrypt_results,
 )
 from advanced_alchemy.types.file_object import (
     FileObject,
@@ -29,7 +32,7 @@ from advanced_alchemy.types.password_hash.one_time_code import (
     generate_one_time_code,
 )
 from advanced_alchemy.types.totp import TOTPProvider, TOTPSecret, generate_totp_secret
-from advanced_alchemy.types.vector import Vector
+from advanced_alchemy.types.vector import Vector, vector_index
 
 __all__ = (
     "GUID",
@@ -37,10 +40,12 @@ __all__ = (
     "ORA_JSONB",
     "UUID_UTILS_INSTALLED",
     "BigIntIdentity",
+    "BlindIndex",
     "Bool",
     "DateTimeUTC",
     "EncryptedString",
     "EncryptedText",
+    "EncryptedValue",
     "EncryptionBackend",
     "FernetBackend",
     "FileObject",
@@ -58,6 +63,7 @@ __all__ = (
     "TOTPProvider",
     "TOTPSecret",
     "Vector",
+    "decrypt_results",
     "encrypted_string",
     "file_object",
     "generate_one_time_code",
@@ -65,4 +71,5 @@ __all__ = (
     "password_hash",
     "storages",
     "totp",
+    "vector_index",
 )
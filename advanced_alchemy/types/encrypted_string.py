@@ -1,20 +1,47 @@
 import abc
 import base64
+import hashlib
+import hmac
 import os
-from typing import TYPE_CHECKING, Any, Callable, Optional, Union
+import unicodedata
+import weakref
+from typing import TYPE_CHECKING, Any, Callable, Optional, TypeVar, Union
 
-from sqlalchemy import String, Text, TypeDecorator
+from sqlalchemy import String, Text, TypeDecorator, event, inspect
 from sqlalchemy import func as sql_func
+from sqlalchemy.orm import Mapper
+from sqlalchemy.orm.attributes import set_committed_value
 
 from advanced_alchemy.exceptions import IntegrityError, MissingDependencyError
 from advanced_alchemy.typing import CRYPTOGRAPHY_INSTALLED
 from advanced_alchemy.utils.deprecation import warn_deprecation
+from advanced_alchemy.utils.sync_tools import async_
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
     from sqlalchemy.engine import Dialect
 
+    from advanced_alchemy.utils.sync_tools import CapacityLimiter
+
+
+__all__ = (
+    "BlindIndex",
+    "EncryptedString",
+    "EncryptedText",
+    "EncryptedValue",
+    "EncryptionBackend",
+    "FernetBackend",
+    "PGCryptoBackend",
+    "decrypt_results",
+    "get_blind_indexes",
+)
+
+T = TypeVar("T")
 
-__all__ = ("EncryptedString", "EncryptedText", "EncryptionBackend", "FernetBackend", "PGCryptoBackend")
+_blind_indexes: "weakref.WeakKeyDictionary[Mapper[Any], dict[str, list[tuple[str, BlindIndex]]]]" = (
+    weakref.WeakKeyDictionary()
+)
 
 
 class EncryptionBackend(abc.ABC):
@@ -76,6 +103,20 @@ class EncryptionBackend(abc.ABC):
             NotImplementedError: If the method is not implemented by the subclass.
         """
 
+    def decrypt_many(self, values: "Sequence[Any]") -> "list[str]":
+        """Decrypts a batch of values.
+
+        Backends can override this to decrypt a batch more efficiently than one
+        :meth:`decrypt` call per value.
+
+        Args:
+            values (Sequence[Any]): The values to decrypt.
+
+        Returns:
+            list[str]: The decrypted values, in the same order.
+        """
+        return [self.decrypt(value) for value in values]
+
     def bind_expression(self, bindvalue: Any) -> "Optional[Any]":
         """Returns a SQL expression that encrypts the bound parameter server-side.
 
@@ -264,6 +305,18 @@ class FernetBackend(EncryptionBackend):
             decrypted = decrypted.decode("utf-8")  # pyright: ignore[reportAttributeAccessIssue]
         return decrypted
 
+    def decrypt_many(self, values: "Sequence[Any]") -> "list[str]":
+        """Decrypts a batch of values with the same Fernet instance.
+
+        Args:
+            values (Sequence[Any]): The values to decrypt.
+
+        Returns:
+            list[str]: The decrypted values, in the same order.
+        """
+        decrypt = self.fernet.decrypt
+        return [decrypt((value if isinstance(value, str) else str(value)).encode()).decode("utf-8") for value in values]
+
 
 DEFAULT_ENCRYPTION_KEY = os.urandom(32)
 
@@ -278,12 +331,14 @@ class EncryptedString(TypeDecorator[str]):
         key (str | bytes | Callable[[], str | bytes] | None): The encryption key. Can be a string, bytes, or callable returning either. Defaults to os.urandom(32).
         backend (Type[EncryptionBackend] | None): The encryption backend class to use. Defaults to FernetBackend.
         length (int | None): The length of the unencrypted string. This is used for documentation and validation purposes only, as encrypted strings will be longer.
+        deferred (bool): Load values as :class:`EncryptedValue` proxies that decrypt on first use, so result sets can be decrypted in batches with :func:`decrypt_results`. Defaults to False.
         **kwargs (Any | None): Additional arguments passed to the underlying String type.
 
     Attributes:
         key (str | bytes | Callable[[], str | bytes]): The encryption key.
         backend (EncryptionBackend): The encryption backend instance.
         length (int | None): The unencrypted string length.
+        deferred (bool): Whether loaded values are returned as :class:`EncryptedValue` proxies.
     """
 
     impl = String
@@ -294,6 +349,7 @@ class EncryptedString(TypeDecorator[str]):
         key: "Union[str, bytes, Callable[[], Union[str, bytes]]]" = DEFAULT_ENCRYPTION_KEY,
         backend: "type[EncryptionBackend]" = FernetBackend,
         length: "Optional[int]" = None,
+        deferred: bool = False,
         **kwargs: Any,
     ) -> None:
         """Initializes the EncryptedString TypeDecorator.
@@ -302,6 +358,7 @@ class EncryptedString(TypeDecorator[str]):
             key (str | bytes | Callable[[], str | bytes] | None): The encryption key. Can be a string, bytes, or callable returning either. Defaults to os.urandom(32).
             backend (Type[EncryptionBackend] | None): The encryption backend class to use. Defaults to FernetBackend.
             length (int | None): The length of the unencrypted string. This is used for documentation and validation purposes only.
+            deferred (bool): Load values as :class:`EncryptedValue` proxies instead of decrypting each value as it is read.
             **kwargs (Any | None): Additional arguments passed to the underlying String type.
         """
         super().__init__()
@@ -317,7 +374,9 @@ class EncryptedString(TypeDecorator[str]):
         self.key = key
         self.backend = backend()
         self.length = length
+        self.deferred = deferred
         self._vault_mounted = False
+        self._mounted_key: Union[str, bytes, None] = None
 
     def __repr__(self) -> str:
         """Return a reconstructable representation of the type.
@@ -374,6 +433,11 @@ class EncryptedString(TypeDecorator[str]):
         """
         if value is None:
             return value
+        if isinstance(value, EncryptedValue):
+            if value.type.key == self.key and type(value.type.backend) is type(self.backend):
+                # Loaded with the same key and backend: store the original ciphertext.
+                return str(value.ciphertext)
+            value = value.get()
 
         # Validate length if specified
         if self.length is not None and len(str(value)) > self.length:
@@ -393,23 +457,82 @@ class EncryptedString(TypeDecorator[str]):
             dialect (Dialect): The SQLAlchemy dialect.
 
         Returns:
-            str | None: The decrypted value or None if the input is None.
+            str | EncryptedValue | None: The decrypted value, an :class:`EncryptedValue` proxy when
+            the type is ``deferred``, or None if the input is None.
         """
         if value is None:
             return value
+        if self.deferred:
+            return EncryptedValue(value, self)  # type: ignore[return-value]
         self.mount_vault()
         return self.backend.decrypt(value)
 
+    def decrypt_many(self, values: "Sequence[Any]") -> "list[Optional[str]]":
+        """Decrypts a batch of stored values.
+
+        The vault is mounted once for the whole batch. ``None`` values are passed through.
+
+        Args:
+            values (Sequence[Any]): The stored (encrypted) values.
+
+        Returns:
+            list[str | None]: The decrypted values, in the same order.
+        """
+        self.mount_vault()
+        return self._decrypt_values(values)
+
+    async def decrypt_many_async(
+        self,
+        values: "Sequence[Any]",
+        *,
+        chunk_size: int = 1000,
+        limiter: "Optional[CapacityLimiter]" = None,
+    ) -> "list[Optional[str]]":
+        """Decrypts a batch of stored values in worker threads.
+
+        The values are split into chunks of ``chunk_size`` that are decrypted one
+        after another, each in a worker thread, so a large result set does not
+        block the event loop. Chunks are not decrypted in parallel, as the
+        threads would only contend for the GIL.
+
+        Args:
+            values (Sequence[Any]): The stored (encrypted) values.
+            chunk_size (int): The number of values decrypted per worker call. Defaults to 1000.
+            limiter (CapacityLimiter | None): Limits the number of worker threads in use across
+                concurrent callers. Defaults to the shared limiter of
+                :func:`~advanced_alchemy.utils.sync_tools.async_`.
+
+        Returns:
+            list[str | None]: The decrypted values, in the same order.
+        """
+        self.mount_vault()
+        decrypt_chunk = async_(self._decrypt_values, limiter=limiter)
+        decrypted: list[Optional[str]] = []
+        for start in range(0, len(values), chunk_size):
+            decrypted.extend(await decrypt_chunk(values[start : start + chunk_size]))
+        return decrypted
+
+    def _decrypt_values(self, values: "Sequence[Any]") -> "list[Optional[str]]":
+        present = [value for value in values if value is not None]
+        if len(present) == len(values):
+            return list(self.backend.decrypt_many(present))
+        decrypted = iter(self.backend.decrypt_many(present))
+        return [None if value is None else next(decrypted) for value in values]
+
     def mount_vault(self) -> None:
         """Mounts the vault with the encryption key.
 
         For a static key the cipher is derived once and reused. For a callable
-        key it is re-resolved on every call so rotated keys take effect.
+        key it is re-resolved on every call, and the cipher is derived again
+        only when the key has changed, so rotated keys take effect.
         """
         if self._vault_mounted and not callable(self.key):
             return
         key = self.key() if callable(self.key) else self.key
+        if self._vault_mounted and key == self._mounted_key:
+            return
         self.backend.mount_vault(key)
+        self._mounted_key = key
         self._vault_mounted = True
 
     def bind_expression(self, bindparam: Any) -> "Optional[Any]":
@@ -471,3 +594,253 @@ class EncryptedText(EncryptedString):
             Any: The dialect-specific Text type descriptor.
         """
         return dialect.type_descriptor(Text())
+
+
+_NOT_DECRYPTED: Any = object()
+
+
+class EncryptedValue:
+    """A value loaded from a ``deferred`` :class:`EncryptedString` column.
+
+    The stored ciphertext is kept until the value is first used, and is decrypted once
+    on demand.  :func:`decrypt_results` decrypts the values of a whole result set in
+    worker threads and replaces them with plain strings.
+
+    The proxy compares equal to its plaintext and forwards string methods to it.  Its
+    ``repr`` never includes the plaintext.
+
+    Args:
+        ciphertext (Any): The value as stored in the database.
+        type_ (EncryptedString): The column type that loaded the value.
+
+    Attributes:
+        ciphertext (Any): The value as stored in the database.
+        type (EncryptedString): The column type that loaded the value.
+    """
+
+    __slots__ = ("_plaintext", "ciphertext", "type")
+
+    def __init__(self, ciphertext: Any, type_: "EncryptedString") -> None:
+        self.ciphertext = ciphertext
+        self.type = type_
+        self._plaintext: str = _NOT_DECRYPTED
+
+    @property
+    def is_decrypted(self) -> bool:
+        """Whether the plaintext has already been decrypted."""
+        return self._plaintext is not _NOT_DECRYPTED
+
+    def get(self) -> str:
+        """Returns the plaintext, decrypting it on first use.
+
+        Returns:
+            str: The decrypted value.
+        """
+        if self._plaintext is _NOT_DECRYPTED:
+            self.type.mount_vault()
+            self._plaintext = self.type.backend.decrypt(self.ciphertext)
+        return self._plaintext
+
+    def __str__(self) -> str:
+        return self.get()
+
+    def __repr__(self) -> str:
+        return f"EncryptedValue(decrypted={self.is_decrypted})"
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, EncryptedValue):
+            return self.ciphertext == other.ciphertext or self.get() == other.get()
+        return self.get() == other
+
+    def __hash__(self) -> int:
+        return hash(self.get())
+
+    def __len__(self) -> int:
+        return len(self.get())
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.get(), name)
+
+
+async def decrypt_results(
+    results: "Iterable[T]",
+    *,
+    chunk_size: int = 1000,
+    limiter: "Optional[CapacityLimiter]" = None,
+) -> "list[T]":
+    """Decrypts the ``deferred`` encrypted attributes of loaded instances in worker threads.
+
+    Every :class:`EncryptedValue` still waiting to be decrypted is collected from the
+    instances, decrypted in chunks with :meth:`EncryptedString.decrypt_many_async`, and
+    replaced by its plaintext without marking the instance as modified.
+
+    Args:
+        results (Iterable[T]): ORM instances, e.g. as returned by a repository ``get_many``.
+        chunk_size (int): The number of values decrypted per worker call. Defaults to 1000.
+        limiter (CapacityLimiter | None): Limits the number of worker threads in use across
+            concurrent callers.
+
+    Returns:
+        list[T]: The instances, with their encrypted attributes decrypted.
+    """
+    instances = list(results)
+    pending: dict[EncryptedString, list[tuple[Any, str, EncryptedValue]]] = {}
+    for instance in instances:
+        state = inspect(instance, raiseerr=False)
+        if state is None:
+            continue
+        for key, value in state.dict.items():
+            if isinstance(value, EncryptedValue) and not value.is_decrypted:
+                pending.setdefault(value.type, []).append((state, key, value))
+    for type_, entries in pending.items():
+        for start in range(0, len(entries), chunk_size):
+            chunk = entries[start : start + chunk_size]
+            plaintexts = await type_.decrypt_many_async(
+                [value.ciphertext for _, _, value in chunk], chunk_size=chunk_size, limiter=limiter
+            )
+            for (state, key, value), plaintext in zip(chunk, plaintexts):
+                value._plaintext = plaintext  # type: ignore[assignment]  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+                if key not in state.committed_state:
+                    set_committed_value(state.obj(), key, plaintext)
+    return instances
+
+
+class BlindIndex(TypeDecorator[str]):
+    """SQLAlchemy TypeDecorator for a blind index of an encrypted column.
+
+    Encrypted columns use randomized encryption, so the same plaintext never produces the
+    same ciphertext and equality lookups cannot use an index.  A blind index column stores
+    a keyed HMAC-SHA256 of the normalized plaintext of another attribute, which can be
+    indexed and compared for equality without revealing the plaintext.
+
+    The index is maintained whenever the source attribute is set on an instance, and the
+    repositories look up ``source == value``, ``!=``, ``in_()`` and ``not_in()`` through it.  Statements that set the source
+    column directly, such as a bulk ``update()``, must also set the index column to
+    :meth:`digest` of the new value.
+
+    Args:
+        source (str): Name of the attribute holding the plaintext, usually an
+            :class:`EncryptedString` column.
+        key (str | bytes | Callable[[], str | bytes]): The HMAC key.  Use a different key
+            from the one encrypting the source column.
+        normalize (Callable[[str], str] | None): Normalizes the plaintext before hashing,
+            e.g. ``str.casefold`` for case-insensitive lookups.  Defaults to Unicode NFC
+            normalization.
+
+    Attributes:
+        source (str): The source attribute name.
+        key (str | bytes | Callable[[], str | bytes]): The HMAC key.
+        normalize (Callable[[str], str] | None): The plaintext normalizer.
+    """
+
+    impl = String
+    cache_ok = True
+
+    def __init__(
+        self,
+        source: str,
+        key: "Union[str, bytes, Callable[[], Union[str, bytes]]]",
+        normalize: "Optional[Callable[[str], str]]" = None,
+    ) -> None:
+        """Initializes the BlindIndex TypeDecorator.
+
+        Args:
+            source (str): Name of the attribute holding the plaintext.
+            key (str | bytes | Callable[[], str | bytes]): The HMAC key.
+            normalize (Callable[[str], str] | None): Normalizes the plaintext before hashing.
+        """
+        super().__init__()
+        self.source = source
+        self.key = key
+        self.normalize = normalize
+        self._hmac: Optional[hmac.HMAC] = None
+
+    def __repr__(self) -> str:
+        """Return a reconstructable representation of the type."""
+        key_repr = self.key.__name__ if callable(self.key) else repr(self.key)
+        return f"{type(self).__name__}(source={self.source!r}, key={key_repr})"
+
+    @property
+    def python_type(self) -> type[str]:
+        """Returns the Python type for this type decorator.
+
+        Returns:
+            Type[str]: The Python string type.
+        """
+        return str
+
+    def load_dialect_impl(self, dialect: "Dialect") -> Any:
+        """Loads a string column sized for a hex-encoded SHA-256 digest.
+
+        Args:
+            dialect (Dialect): The SQLAlchemy dialect.
+
+        Returns:
+            Any: The dialect-specific type descriptor.
+        """
+        return dialect.type_descriptor(String(length=64))
+
+    def digest(self, value: Any) -> str:
+        """Computes the blind index of a plaintext value.
+
+        Args:
+            value (Any): The plaintext value.  Non-string values are hashed as their
+                ``repr``, matching how :class:`FernetBackend` encrypts them.
+
+        Returns:
+            str: The hex-encoded HMAC-SHA256 of the normalized value.
+        """
+        if isinstance(value, EncryptedValue):
+            value = value.get()
+        text = value if isinstance(value, str) else repr(value)
+        text = self.normalize(text) if self.normalize is not None else unicodedata.normalize("NFC", text)
+        mac = self._get_hmac().copy()
+        mac.update(text.encode("utf-8"))
+        return mac.hexdigest()
+
+    def _get_hmac(self) -> hmac.HMAC:
+        if self._hmac is not None:
+            return self._hmac
+        key = self.key() if callable(self.key) else self.key
+        mac = hmac.new(key.encode() if isinstance(key, str) else key, digestmod=hashlib.sha256)
+        if not callable(self.key):
+            self._hmac = mac
+        return mac
+
+
+def get_blind_indexes(model: Any) -> "dict[str, list[tuple[str, BlindIndex]]]":
+    """Return the blind indexes of a mapped class.
+
+    Args:
+        model (Any): The mapped class.
+
+    Returns:
+        dict[str, list[tuple[str, BlindIndex]]]: The blind index attribute names and
+        types, keyed by the name of their source attribute.
+    """
+    mapper: Optional[Mapper[Any]] = inspect(model, raiseerr=False)
+    if mapper is None:
+        return {}
+    indexes = _blind_indexes.get(mapper)
+    if indexes is None:
+        indexes = {}
+        for prop in mapper.column_attrs:
+            column_type = prop.columns[0].type
+            if isinstance(column_type, BlindIndex):
+                indexes.setdefault(column_type.source, []).append((prop.key, column_type))
+        _blind_indexes[mapper] = indexes
+    return indexes
+
+
+def _blind_index_setter(indexes: "list[tuple[str, BlindIndex]]") -> "Callable[..., None]":
+    def set_indexes(target: Any, value: Any, *_: Any) -> None:
+        for key, index in indexes:
+            setattr(target, key, None if value is None else index.digest(value))
+
+    return set_indexes
+
+
+@event.listens_for(Mapper, "mapper_configured")
+def _maintain_blind_indexes(_: "Mapper[Any]", class_: type[Any]) -> None:
+    for source, indexes in get_blind_indexes(class_).items():
+        event.listen(getattr(class_, source), "set", _blind_index_setter(indexes))
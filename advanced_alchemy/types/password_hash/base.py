@@ -1,9 +1,35 @@
 """Base classes for password hashing backends."""
 
 import abc
-from typing import Any, Optional, Union, cast
+import asyncio
+import os
+import weakref
+from itertools import chain
+from typing import TYPE_CHECKING, Any, Optional, Union, cast
 
-from sqlalchemy import BinaryExpression, ColumnElement, FunctionElement, String, TypeDecorator
+from sqlalchemy import BinaryExpression, ColumnElement, FunctionElement, String, TypeDecorator, inspect
+
+from advanced_alchemy._listeners import setup_password_hash_listeners
+from advanced_alchemy.utils.sync_tools import CapacityLimiter, async_
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from sqlalchemy.orm import Mapper, Session
+
+__all__ = (
+    "HashedPassword",
+    "HashingBackend",
+    "PasswordHash",
+    "prehash_passwords_async",
+    "prehash_passwords_sync",
+    "setup_password_hash_listeners",
+)
+
+_default_limiter = CapacityLimiter(os.cpu_count() or 1)
+_password_columns: "weakref.WeakKeyDictionary[Mapper[Any], tuple[tuple[str, PasswordHash], ...]]" = (
+    weakref.WeakKeyDictionary()
+)
 
 
 class HashingBackend(abc.ABC):
@@ -11,8 +37,15 @@ class HashingBackend(abc.ABC):
 
     This class defines the interface that all password hashing backends must implement.
     Concrete implementations should provide the actual hashing and verification logic.
+
+    The ``*_async`` methods run the blocking implementations in worker threads.  The
+    number of hashes running at once is bounded by :attr:`limiter`, which defaults to a
+    limiter shared by all backends with one token per CPU.
     """
 
+    limiter: "Optional[CapacityLimiter]" = None
+    """Limits how many :meth:`hash_async` and :meth:`verify_async` calls run at once."""
+
     @staticmethod
     def _ensure_bytes(value: Union[str, bytes]) -> bytes:
         if isinstance(value, str):
@@ -42,6 +75,29 @@ class HashingBackend(abc.ABC):
             True if the plain text matches the hash, False otherwise.
         """
 
+    async def hash_async(self, value: "Union[str, bytes]") -> "Union[str, Any]":
+        """Hash the given value in a worker thread.
+
+        Args:
+            value: The plain text value to hash.
+
+        Returns:
+            The result of :meth:`hash`.
+        """
+        return await async_(self.hash, limiter=self.limiter or _default_limiter)(value)
+
+    async def verify_async(self, plain: "Union[str, bytes]", hashed: str) -> bool:
+        """Verify a plain text value against a hash in a worker thread.
+
+        Args:
+            plain: The plain text value to verify.
+            hashed: The hash to verify against.
+
+        Returns:
+            True if the plain text matches the hash, False otherwise.
+        """
+        return await async_(self.verify, limiter=self.limiter or _default_limiter)(plain, hashed)
+
     @abc.abstractmethod
     def needs_rehash(self, hashed: str) -> bool:
         """Return True if the stored hash should be regenerated with current parameters.
@@ -120,6 +176,32 @@ class HashedPassword:
             return (True, str(self.backend.hash(plain_password)))
         return (True, None)
 
+    async def verify_async(self, plain_password: "Union[str, bytes]") -> bool:
+        """Verify a plain text password against this hash without blocking the event loop.
+
+        Args:
+            plain_password: The plain text password to verify.
+
+        Returns:
+            True if the password matches the hash, False otherwise.
+        """
+        return await self.backend.verify_async(plain_password, self.hash_string)
+
+    async def verify_and_update_async(self, plain_password: "Union[str, bytes]") -> "tuple[bool, Optional[str]]":
+        """Verify a password and rehash a stale hash without blocking the event loop.
+
+        Args:
+            plain_password: The plain text password to verify.
+
+        Returns:
+            The same result as :meth:`verify_and_update`.
+        """
+        if not await self.backend.verify_async(plain_password, self.hash_string):
+            return (False, None)
+        if self.backend.needs_rehash(self.hash_string):
+            return (True, str(await self.backend.hash_async(plain_password)))
+        return (True, None)
+
 
 class PasswordHash(TypeDecorator[str]):
     """SQLAlchemy TypeDecorator for storing hashed passwords in a database.
@@ -165,6 +247,7 @@ class PasswordHash(TypeDecorator[str]):
         This method hashes the value using the specified backend.
         If the backend returns a SQLAlchemy FunctionElement (for DB-side hashing),
         it is returned directly. Otherwise, the hashed string is returned.
+        A :class:`HashedPassword` is already hashed and is stored as is.
 
         Args:
             value: The value to process.
@@ -175,6 +258,8 @@ class PasswordHash(TypeDecorator[str]):
         """
         if value is None:
             return value
+        if isinstance(value, HashedPassword):
+            return value.hash_string
 
         hashed_value = self.backend.hash(value)
 
@@ -223,3 +308,71 @@ class PasswordHash(TypeDecorator[str]):
             NotImplementedError: For all shipped backends.
         """
         return self.backend.compare_expression(column, plain_password)
+
+
+def _get_password_columns(state: Any) -> "tuple[tuple[str, PasswordHash], ...]":
+    mapper = state.mapper
+    columns = _password_columns.get(mapper)
+    if columns is None:
+        columns = tuple(
+            (prop.key, prop.columns[0].type)
+            for prop in mapper.column_attrs
+            if isinstance(prop.columns[0].type, PasswordHash)
+        )
+        _password_columns[mapper] = columns
+    return columns
+
+
+def _pending_password_instances(session: "Session") -> "list[Any]":
+    return [
+        instance
+        for instance in chain(session.new, session.dirty)
+        if (state := inspect(instance, raiseerr=False)) is not None and _get_password_columns(state)
+    ]
+
+
+def _get_plain_passwords(instances: "Iterable[Any]") -> "list[tuple[Any, str, PasswordHash, Union[str, bytes]]]":
+    plain_passwords: list[tuple[Any, str, PasswordHash, Union[str, bytes]]] = []
+    for instance in instances:
+        state = inspect(instance, raiseerr=False)
+        if state is None:
+            continue
+        for key, type_ in _get_password_columns(state):
+            value = state.dict.get(key)
+            if isinstance(value, (str, bytes)):
+                plain_passwords.append((instance, key, type_, value))
+    return plain_passwords
+
+
+async def prehash_passwords_async(instances: "Iterable[Any]") -> None:
+    """Hash the plain text passwords assigned to instances in worker threads.
+
+    :class:`PasswordHash` columns hash plain text values when they are flushed, which
+    blocks the event loop of an async session.  Calling this before the flush hashes
+    the values concurrently with :meth:`HashingBackend.hash_async` and replaces them
+    with :class:`HashedPassword` objects, which are stored without hashing again.
+
+    Args:
+        instances: ORM instances, e.g. the ``new`` and ``dirty`` instances of a session.
+    """
+    plain_passwords = _get_plain_passwords(instances)
+    if not plain_passwords:
+        return
+    hashes = await asyncio.gather(*(type_.backend.hash_async(value) for _, _, type_, value in plain_passwords))
+    for (instance, key, type_, _), hashed in zip(plain_passwords, hashes):
+        if isinstance(hashed, str):
+            setattr(instance, key, HashedPassword(hashed, type_.backend))
+
+
+def prehash_passwords_sync(instances: "Iterable[Any]") -> None:
+    """Hash the plain text passwords assigned to instances.
+
+    The synchronous counterpart of :func:`prehash_passwords_async`.
+
+    Args:
+        instances: ORM instances, e.g. the ``new`` and ``dirty`` instances of a session.
+    """
+    for instance, key, type_, value in _get_plain_passwords(instances):
+        hashed = type_.backend.hash(value)
+        if isinstance(hashed, str):
+            setattr(instance, key, HashedPassword(hashed, type_.backend))
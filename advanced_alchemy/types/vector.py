@@ -6,7 +6,9 @@ appropriate backend representation per dialect:
 - Oracle 23ai → ``sqlalchemy.dialects.oracle.VECTOR(dim, storage_format)``
 - PostgreSQL / CockroachDB → ``pgvector.sqlalchemy.Vector(dim)`` when
   ``pgvector`` is importable, otherwise the cross-dialect JSON fallback.
-- All other dialects → ``sqlalchemy.types.JSON`` round-trip as a JSON array.
+- All other dialects → ``sqlalchemy.types.JSON`` round-trip as a JSON array, or
+  with ``fallback_format="binary"``, packed little-endian float32 in a
+  ``LargeBinary`` column.
 
 The pattern mirrors :class:`advanced_alchemy.types.guid.GUID`: one
 ``TypeDecorator`` with a single constructor, and ``load_dialect_impl`` selects
@@ -15,24 +17,50 @@ inside ``load_dialect_impl`` so ``from advanced_alchemy.types import Vector``
 never requires ``pgvector`` or ``oracledb`` to be installed.
 """
 
-from typing import TYPE_CHECKING, Any, Optional
+import json
+import math
+import sys
+from array import array
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Literal, Optional, Union, cast
 
-from sqlalchemy import Float, literal
-from sqlalchemy.engine import Dialect
+from sqlalchemy import Float, Index, event, literal
+from sqlalchemy.engine import Dialect, Engine
 from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.sql.expression import ColumnElement
 from sqlalchemy.sql.visitors import InternalTraversal
-from sqlalchemy.types import JSON, TypeDecorator, TypeEngine
+from sqlalchemy.types import JSON, LargeBinary, TypeDecorator, TypeEngine
+
+from advanced_alchemy.typing import NUMPY_INSTALLED
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
+    from sqlalchemy import Column
+    from sqlalchemy.engine import Connection
+    from sqlalchemy.engine.interfaces import DBAPICursor, ExecutionContext
+    from sqlalchemy.ext.asyncio import AsyncEngine
     from sqlalchemy.sql.compiler import SQLCompiler
 
-__all__ = ("Vector",)
+__all__ = (
+    "Vector",
+    "register_sqlite_vector_functions",
+    "register_vector_search_options",
+    "vector_distances",
+    "vector_index",
+)
 
 _PGVECTOR_OPERATORS = {"cosine": "<=>", "l2": "<->", "l1": "<+>", "inner_product": "<#>"}
 _ORACLE_METRICS = {"cosine": "COSINE", "l2": "EUCLIDEAN", "l1": "MANHATTAN", "inner_product": "DOT"}
+_PGVECTOR_OPCLASSES = {
+    "cosine": "vector_cosine_ops",
+    "l2": "vector_l2_ops",
+    "l1": "vector_l1_ops",
+    "inner_product": "vector_ip_ops",
+}
+_PGVECTOR_SEARCH_SETTINGS = {"hnsw_ef_search": "hnsw.ef_search", "ivfflat_probes": "ivfflat.probes"}
+_SQLITE_DISTANCE_FUNCTION = "aa_vector_distance"
+_DISTANCE_CHUNK_SIZE = 4096
 
 
 class Vector(TypeDecorator[list[float]]):
@@ -43,6 +71,11 @@ class Vector(TypeDecorator[list[float]]):
         storage_format: Oracle 23ai storage format name (matched against
             :class:`sqlalchemy.dialects.oracle.VectorStorageFormat`).
             Defaults to ``"FLOAT32"``. Ignored on non-Oracle backends.
+        fallback_format: Storage used where the backend has no native vector
+            type. ``"json"`` (the default) stores a JSON array; ``"binary"``
+            stores packed little-endian float32 values in a ``LargeBinary``
+            column, about a quarter of the size and much faster to decode.
+            Binary storage keeps float32 precision only.
     """
 
     impl = JSON
@@ -52,10 +85,13 @@ class Vector(TypeDecorator[list[float]]):
     def python_type(self) -> type[list[float]]:
         return list
 
-    def __init__(self, dim: int, *, storage_format: str = "FLOAT32") -> None:
+    def __init__(
+        self, dim: int, *, storage_format: str = "FLOAT32", fallback_format: Literal["json", "binary"] = "json"
+    ) -> None:
         super().__init__()
         self.dim = dim
         self.storage_format = storage_format
+        self.fallback_format = fallback_format
 
     def load_dialect_impl(self, dialect: Dialect) -> TypeEngine[Any]:
         if dialect.name == "oracle":
@@ -67,13 +103,25 @@ class Vector(TypeDecorator[list[float]]):
             try:
                 from pgvector.sqlalchemy import Vector as PgVector  # pyright: ignore[reportMissingTypeStubs]
             except ImportError:
-                return dialect.type_descriptor(JSON())
+                return self._fallback_impl(dialect)
             return dialect.type_descriptor(PgVector(self.dim))
+        return self._fallback_impl(dialect)
+
+    def _fallback_impl(self, dialect: Dialect) -> TypeEngine[Any]:
+        if self.fallback_format == "binary":
+            return dialect.type_descriptor(LargeBinary())
         return dialect.type_descriptor(JSON())
 
+    def process_bind_param(self, value: Any, dialect: Dialect) -> Any:
+        if value is None or not isinstance(self.impl_instance, LargeBinary):
+            return value
+        return _pack_float32(value)
+
     def process_result_value(self, value: Any, dialect: Dialect) -> Optional[list[float]]:
         if value is None:
             return None
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            return _unpack_float32(value)
         if hasattr(value, "tolist"):
             return list(value.tolist())
         return list(value)
@@ -104,6 +152,24 @@ class Vector(TypeDecorator[list[float]]):
     comparator_factory = Comparator  # pyright: ignore[reportIncompatibleMethodOverride,reportAssignmentType]
 
 
+def _pack_float32(value: Any) -> bytes:
+    if hasattr(value, "astype"):
+        return bytes(value.astype("<f4").tobytes())
+    packed = array("f", value)
+    if sys.byteorder == "big":
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def _unpack_float32(value: "Union[bytes, bytearray, memoryview]") -> list[float]:
+    if sys.byteorder == "little":
+        return cast("list[float]", memoryview(value).cast("B").cast("f").tolist())
+    unpacked = array("f")
+    unpacked.frombytes(value)
+    unpacked.byteswap()
+    return unpacked.tolist()
+
+
 class _VectorDistance(ColumnElement[float]):
     """Dialect-deferred vector distance expression.
 
@@ -112,6 +178,8 @@ class _VectorDistance(ColumnElement[float]):
 
     - PostgreSQL / CockroachDB → ``<=>`` / ``<->`` / ``<+>`` / ``<#>`` (pgvector)
     - Oracle 23ai → ``VECTOR_DISTANCE(col, :vec, COSINE | EUCLIDEAN | MANHATTAN | DOT)``
+    - SQLite → ``aa_vector_distance(col, :vec, 'cosine')``, a Python function
+      registered on every SQLite connection (brute force, no index)
     - other dialects → :exc:`NotImplementedError` (no native vector backend)
 
     ``max_inner_product`` (pgvector ``<#>``, Oracle ``DOT``) returns the *negated*
@@ -156,3 +224,230 @@ def compile_vector_distance_pgvector(element: _VectorDistance, compiler: "SQLCom
 def compile_vector_distance_oracle(element: _VectorDistance, compiler: "SQLCompiler", **kw: Any) -> str:
     metric = _ORACLE_METRICS[element.metric]
     return f"VECTOR_DISTANCE({compiler.process(element.left, **kw)}, {compiler.process(element.right, **kw)}, {metric})"
+
+
+@compiles(_VectorDistance, "sqlite")
+def compile_vector_distance_sqlite(element: _VectorDistance, compiler: "SQLCompiler", **kw: Any) -> str:
+    left, right = compiler.process(element.left, **kw), compiler.process(element.right, **kw)
+    return f"{_SQLITE_DISTANCE_FUNCTION}({left}, {right}, '{element.metric}')"
+
+
+def vector_distances(
+    query: "Sequence[float]",
+    vectors: "Sequence[Sequence[float]]",
+    metric: Literal["cosine", "l2", "l1", "inner_product"] = "cosine",
+) -> list[float]:
+    """Compute the distance from a query vector to each of a list of vectors.
+
+    Matches the database distance operators: cosine distance, Euclidean (``l2``)
+    and Manhattan (``l1``) distance, and the negated inner product.  Cosine
+    distances involving a zero vector are ``nan``.  With NumPy installed, the
+    vectors are processed as matrices in chunks of a few thousand rows.
+
+    Args:
+        query: The query vector.
+        vectors: The vectors to compare with the query.
+        metric: Distance metric.
+
+    Returns:
+        The distances, in the order of ``vectors``.
+    """
+    if not NUMPY_INSTALLED:
+        return [_python_distance(query, vector, metric) for vector in vectors]
+    import numpy as np
+
+    target = np.asarray(query, dtype=np.float64)
+    distances: list[float] = []
+    for start in range(0, len(vectors), _DISTANCE_CHUNK_SIZE):
+        matrix = np.asarray(vectors[start : start + _DISTANCE_CHUNK_SIZE], dtype=np.float64).reshape(-1, len(target))
+        distances.extend(_numpy_distances(target, matrix, metric).tolist())
+    return distances
+
+
+def _numpy_distances(target: Any, matrix: Any, metric: str) -> Any:
+    import numpy as np
+
+    if metric == "l2":
+        return np.linalg.norm(matrix - target, axis=1)
+    if metric == "l1":
+        return np.abs(matrix - target).sum(axis=1)
+    if metric == "inner_product":
+        return -(matrix @ target)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return 1.0 - (matrix @ target) / (np.linalg.norm(matrix, axis=1) * np.linalg.norm(target))
+
+
+def _python_distance(query: "Sequence[float]", vector: "Sequence[float]", metric: str) -> float:
+    if metric == "l2":
+        return math.dist(query, vector)
+    if metric == "l1":
+        return math.fsum(abs(a - b) for a, b in zip(query, vector))
+    dot = math.fsum(a * b for a, b in zip(query, vector))
+    if metric == "inner_product":
+        return -dot
+    norms = math.hypot(*query) * math.hypot(*vector)
+    return 1.0 - dot / norms if norms else math.nan
+
+
+def _decode_sqlite_vector(value: "Union[str, bytes]") -> Any:
+    if NUMPY_INSTALLED:
+        import numpy as np
+
+        if isinstance(value, bytes):
+            return np.frombuffer(value, dtype="<f4").astype(np.float64)
+        return np.asarray(json.loads(value), dtype=np.float64)
+    return _unpack_float32(value) if isinstance(value, bytes) else json.loads(value)
+
+
+_decode_sqlite_query = lru_cache(maxsize=64)(_decode_sqlite_vector)
+
+
+def _sqlite_vector_distance(
+    left: "Optional[Union[str, bytes]]", right: "Optional[Union[str, bytes]]", metric: str
+) -> float:
+    """Compute a vector distance for SQLite, decoding JSON or binary vectors.
+
+    The query vector, bound once per statement, is decoded once and cached.
+    Missing vectors and undefined distances are infinite rather than ``NULL``,
+    which SQLite would sort first.
+    """
+    if left is None or right is None or left == "null":
+        return math.inf
+    query, vector = _decode_sqlite_query(right), _decode_sqlite_vector(left)
+    if NUMPY_INSTALLED:
+        distance = float(_numpy_distances(query, vector.reshape(1, -1), metric)[0])
+    else:
+        distance = _python_distance(query, vector, metric)
+    return math.inf if math.isnan(distance) else distance
+
+
+def _create_sqlite_vector_functions(dbapi_connection: Any, connection_record: Any) -> None:  # noqa: ARG001
+    """Create the ``aa_vector_distance`` function on a new SQLite connection."""
+    dbapi_connection.create_function(_SQLITE_DISTANCE_FUNCTION, 3, _sqlite_vector_distance, deterministic=True)
+
+
+def register_sqlite_vector_functions(engine: "Union[Engine, AsyncEngine]") -> None:
+    """Create the ``aa_vector_distance`` function on each new connection of a SQLite engine.
+
+    The function backs vector distances, and so
+    :class:`~advanced_alchemy.filters.VectorSimilarityFilter`, on SQLite.  Other
+    engines are left alone; the SQLAlchemy configs and routing session makers call
+    this for the engines they create when ``enable_vector_search`` is set, and calling
+    it again is a no-op.  Register it before the engine opens its first connection.
+
+    Args:
+        engine: The engine (sync or async) to instrument.
+    """
+    sync_engine = cast("Engine", getattr(engine, "sync_engine", engine))
+    if (
+        isinstance(sync_engine, Engine)
+        and sync_engine.dialect.name == "sqlite"
+        and not event.contains(sync_engine, "connect", _create_sqlite_vector_functions)
+    ):
+        event.listen(sync_engine, "connect", _create_sqlite_vector_functions)
+
+
+def _is_vector_index_dialect(*_: Any, **kwargs: Any) -> bool:
+    return kwargs["dialect"].name in {"postgresql", "oracle"}
+
+
+def vector_index(
+    table_name: str,
+    column: "Union[str, Column[Any]]",
+    metric: Literal["cosine", "l2", "l1", "inner_product"] = "cosine",
+    method: Literal["hnsw", "ivfflat"] = "hnsw",
+    *,
+    m: Optional[int] = None,
+    ef_construction: Optional[int] = None,
+    lists: Optional[int] = None,
+    target_accuracy: Optional[int] = None,
+) -> Index:
+    """Create an approximate nearest-neighbor index on a vector column.
+
+    Serves :class:`~advanced_alchemy.filters.VectorSimilarityFilter` searches with the
+    same ``metric``.  The index is only emitted on PostgreSQL, as a pgvector HNSW or
+    IVFFlat index, and on Oracle 23ai, as an in-memory neighbor graph (HNSW) or
+    neighbor partition (IVF) vector index.
+
+    In migrations, pass the index options to ``op.create_index``::
+
+        index = vector_index("document", "embedding")
+        op.create_index(
+            index.name,
+            "document",
+            ["embedding"],
+            **index.dialect_kwargs,
+        )
+
+    Args:
+        table_name: Name of the indexed table, used to name the index.
+        column: The vector column, or its name, to index.
+        metric: Distance metric the index is built for.
+        method: ``"hnsw"`` or ``"ivfflat"`` (Oracle ``IVF``).
+        m: HNSW maximum connections per node.
+        ef_construction: HNSW candidate list size while building the index.
+        lists: IVFFlat number of lists (Oracle neighbor partitions).
+        target_accuracy: Oracle target accuracy percentage.
+
+    Returns:
+        The vector index.
+    """
+    from sqlalchemy.dialects.oracle import VectorDistanceType, VectorIndexConfig, VectorIndexType
+
+    name = column if isinstance(column, str) else column.name
+    options = {"m": m, "ef_construction": ef_construction} if method == "hnsw" else {"lists": lists}
+    oracle_vector = VectorIndexConfig(
+        index_type=VectorIndexType.HNSW if method == "hnsw" else VectorIndexType.IVF,
+        distance=VectorDistanceType[_ORACLE_METRICS[metric]],
+        accuracy=target_accuracy,
+        hnsw_neighbors=m,
+        hnsw_efconstruction=ef_construction,
+        ivf_neighbor_partitions=lists,
+    )
+    return Index(
+        f"ix_{table_name}_{name}_{method}",
+        column,
+        postgresql_using=method,
+        postgresql_ops={name: _PGVECTOR_OPCLASSES[metric]},
+        postgresql_with={key: value for key, value in options.items() if value is not None},
+        oracle_vector=oracle_vector,
+    ).ddl_if(callable_=_is_vector_index_dialect)
+
+
+def _apply_vector_search_options(
+    conn: "Connection",  # noqa: ARG001
+    cursor: "DBAPICursor",
+    statement: str,  # noqa: ARG001
+    parameters: Any,  # noqa: ARG001
+    context: "Optional[ExecutionContext]",
+    executemany: bool,  # noqa: ARG001
+) -> None:
+    """Set the pgvector search settings requested through execution options."""
+    if context is None:
+        return
+    options = context.execution_options
+    for option, setting in _PGVECTOR_SEARCH_SETTINGS.items():
+        if options.get(option) is not None:
+            cursor.execute(f"SET LOCAL {setting} = {int(options[option])}")
+
+
+def register_vector_search_options(engine: "Union[Engine, AsyncEngine]") -> None:
+    """Apply the ``hnsw_ef_search`` and ``ivfflat_probes`` execution options on an engine.
+
+    Statements executed with these options (as set by
+    :class:`~advanced_alchemy.filters.VectorSimilarityFilter`) first run
+    ``SET LOCAL hnsw.ef_search`` / ``SET LOCAL ivfflat.probes``.  Only PostgreSQL
+    engines are instrumented; the SQLAlchemy configs and routing session makers call
+    this for the engines they create when ``enable_vector_search`` is set, and calling
+    it again is a no-op.
+
+    Args:
+        engine: The engine (sync or async) to instrument.
+    """
+    sync_engine = cast("Engine", getattr(engine, "sync_engine", engine))
+    if (
+        isinstance(sync_engine, Engine)
+        and sync_engine.dialect.name == "postgresql"
+        and not event.contains(sync_engine, "before_cursor_execute", _apply_vector_search_options)
+    ):
+        event.listen(sync_engine, "before_cursor_execute", _apply_vector_search_options)
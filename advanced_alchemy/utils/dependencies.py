@@ -87,6 +87,14 @@ class FilterConfig(TypedDict):
     """Fields to enable search on."""
     search_ignore_case: NotRequired[bool]
     """Whether search should be case-insensitive."""
+    search_mode: NotRequired[Literal["contains", "prefix", "trigram"]]
+    """How search values are matched.  Defaults to ``contains``."""
+    full_text_search: NotRequired[Union[str, set[str], list[str]]]
+    """Fields to enable full-text search on."""
+    full_text_search_language: NotRequired[str]
+    """PostgreSQL text search configuration used for full-text search."""
+    full_text_search_order_by_rank: NotRequired[bool]
+    """Whether full-text search results are ordered by relevance."""
     created_at: NotRequired[bool]
     """Enable created-at range filtering."""
     updated_at: NotRequired[bool]
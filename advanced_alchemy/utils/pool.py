@@ -0,0 +1,412 @@
+"""Connection pool helpers.
+
+Pools fill lazily, so the first requests after a deploy pay the connect,
+TLS and authentication cost of every connection. The prewarm helpers in this
+module open and validate pooled connections up front, typically from an
+application's startup hook.
+
+:class:`PoolMonitor` collects per-engine pool statistics from SQLAlchemy pool
+events so that saturated pools can be spotted, and forwards the raw events to
+:class:`PoolEventHook` implementations such as metrics exporters.
+"""
+
+import asyncio
+import bisect
+import contextlib
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Optional, Protocol, Union, cast, runtime_checkable
+
+from sqlalchemy import event
+from sqlalchemy.pool import NullPool
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from sqlalchemy import Connection, Engine
+    from sqlalchemy.ext.asyncio import AsyncEngine
+    from sqlalchemy.pool import Pool
+
+__all__ = (
+    "DEFAULT_CHECKOUT_WAIT_BUCKETS",
+    "PoolEventHook",
+    "PoolMonitor",
+    "PoolStats",
+    "prewarm_engine_async",
+    "prewarm_engine_sync",
+)
+
+logger = logging.getLogger("advanced_alchemy")
+
+DEFAULT_CHECKOUT_WAIT_BUCKETS: "tuple[float, ...]" = (
+    0.001,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+"""Default upper bounds, in seconds, of the checkout wait histogram buckets."""
+
+
+def _prewarm_count(engine: "Engine", connections: int) -> int:
+    """Get the number of connections worth opening for an engine's pool.
+
+    Args:
+        engine: The engine whose pool is warmed.
+        connections: The requested number of connections.
+
+    Returns:
+        ``connections`` capped at the pool size; ``0`` for pools that do not keep connections.
+    """
+    pool = engine.pool
+    if connections < 1 or isinstance(pool, NullPool):
+        return 0
+    size = getattr(pool, "size", None)
+    return min(connections, size()) if callable(size) else 1
+
+
+def _ping(connection: "Connection") -> None:
+    """Validate a connection with the dialect's pre-ping check.
+
+    Args:
+        connection: The connection to validate.
+
+    Raises:
+        ConnectionError: If the ping fails.
+    """
+    dbapi_connection = connection.connection.dbapi_connection
+    if dbapi_connection is None or not connection.dialect.do_ping(dbapi_connection):
+        msg = "Connection failed validation"
+        raise ConnectionError(msg)
+
+
+def _engine_label(engine: "Engine") -> str:
+    return engine.url.render_as_string(hide_password=True)
+
+
+def prewarm_engine_sync(engine: "Engine", connections: int) -> int:
+    """Open and validate pooled connections on a sync engine.
+
+    All connections are held at once so the pool keeps ``connections`` distinct
+    connections, then returned to it. Failures are logged rather than raised so
+    an unreachable replica does not prevent application startup.
+
+    Args:
+        engine: The engine to warm.
+        connections: Number of connections to open, capped at the pool size.
+
+    Returns:
+        The number of connections opened and validated.
+    """
+    count = _prewarm_count(engine, connections)
+    if count == 0:
+        return 0
+    try:
+        with contextlib.ExitStack() as stack:
+            for _ in range(count):
+                _ping(stack.enter_context(engine.connect()))
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("Could not pre-warm connection pool for %s: %s", _engine_label(engine), exc)
+        return 0
+    return count
+
+
+async def prewarm_engine_async(engine: "AsyncEngine", connections: int) -> int:
+    """Open and validate pooled connections on an async engine.
+
+    Connections are opened concurrently and held at once so the pool keeps
+    ``connections`` distinct connections, then returned to it. Every connection
+    that opened is returned even when others fail. Failures are logged rather
+    than raised so an unreachable replica does not prevent application startup.
+
+    Args:
+        engine: The async engine to warm.
+        connections: Number of connections to open, capped at the pool size.
+
+    Returns:
+        The number of connections opened and validated.
+    """
+    count = _prewarm_count(engine.sync_engine, connections)
+    if count == 0:
+        return 0
+    pending = [engine.connect() for _ in range(count)]
+    results = await asyncio.gather(*(connection.start() for connection in pending), return_exceptions=True)
+    opened = [connection for connection, result in zip(pending, results) if not isinstance(result, BaseException)]
+    failures = [result for result in results if isinstance(result, BaseException)]
+    try:
+        if not failures:
+            for connection in opened:
+                await connection.run_sync(_ping)
+    except Exception as exc:  # noqa: BLE001
+        failures.append(exc)
+    finally:
+        await asyncio.gather(*(connection.close() for connection in opened), return_exceptions=True)
+    if failures:
+        if not isinstance(failures[0], Exception):
+            raise failures[0]
+        logger.warning("Could not pre-warm connection pool for %s: %s", _engine_label(engine.sync_engine), failures[0])
+        return 0
+    return count
+
+
+@runtime_checkable
+class PoolEventHook(Protocol):
+    """Protocol for receiving connection pool events as they happen.
+
+    Hooks are called synchronously on the thread that checks out or opens the
+    connection, so implementations should only record the values, e.g. into a
+    metrics client.
+    """
+
+    def on_checkout(self, engine: str, wait: float) -> None:
+        """Handle a connection checkout.
+
+        Args:
+            engine: Label of the engine whose pool served the checkout.
+            wait: Seconds spent obtaining the connection from the pool.
+        """
+        ...
+
+    def on_connect(self, engine: str, latency: float) -> None:
+        """Handle a new DBAPI connection being opened by the pool.
+
+        Args:
+            engine: Label of the engine that opened the connection.
+            latency: Seconds spent establishing the connection.
+        """
+        ...
+
+    def on_invalidate(self, engine: str, soft: bool) -> None:
+        """Handle a pooled connection being invalidated.
+
+        Args:
+            engine: Label of the engine that owns the connection.
+            soft: ``True`` for a soft invalidation, which recycles the connection on its next checkout.
+        """
+        ...
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    """Point-in-time statistics for one engine's connection pool."""
+
+    engine: str
+    """Label of the engine."""
+    size: Optional[int]
+    """Configured pool size, or ``None`` for pools without a fixed size."""
+    in_use: int
+    """Connections currently checked out."""
+    idle: int
+    """Connections currently checked in and available."""
+    overflow: int
+    """Connections currently open beyond the configured pool size."""
+    checkouts: int
+    """Total number of checkouts."""
+    checkout_wait_total: float
+    """Total seconds spent obtaining connections from the pool."""
+    checkout_wait_histogram: "dict[float, int]" = field(default_factory=dict)
+    """Cumulative checkout wait histogram: number of checkouts that waited at most each bound, in seconds."""
+    connects: int = 0
+    """Total number of DBAPI connections opened."""
+    connect_time_total: float = 0.0
+    """Total seconds spent opening DBAPI connections."""
+    invalidations: int = 0
+    """Total number of hard and soft connection invalidations."""
+
+    @property
+    def checkout_wait_mean(self) -> float:
+        """Mean seconds spent per checkout."""
+        return self.checkout_wait_total / self.checkouts if self.checkouts else 0.0
+
+    @property
+    def connect_time_mean(self) -> float:
+        """Mean seconds spent opening a DBAPI connection."""
+        return self.connect_time_total / self.connects if self.connects else 0.0
+
+
+def _pool_metric(pool: "Pool", name: str) -> Optional[int]:
+    method = getattr(pool, name, None)
+    return int(method()) if callable(method) else None
+
+
+class PoolMonitor:
+    """Collects connection pool statistics for an engine from pool events.
+
+    Checkout wait is the time spent obtaining a connection from the pool,
+    including opening a new connection when the pool grows. Connect latency is
+    measured between the ``do_connect`` dialect event and the pool ``connect``
+    event. The monitor follows the engine across :meth:`Engine.dispose
+    <sqlalchemy.engine.Engine.dispose>`.
+
+    This class is thread-safe.
+
+    Example:
+        Monitoring an engine's pool::
+
+            monitor = PoolMonitor(engine, hooks=[PrometheusPoolHook()])
+            stats = monitor.stats()
+            print(stats.in_use, stats.checkout_wait_mean)
+    """
+
+    __slots__ = (
+        "_buckets",
+        "_checkout_wait_total",
+        "_checkouts",
+        "_connect_time_total",
+        "_connects",
+        "_engine",
+        "_hooks",
+        "_in_use",
+        "_invalidations",
+        "_lock",
+        "_wait_counts",
+        "label",
+    )
+
+    def __init__(
+        self,
+        engine: "Union[Engine, AsyncEngine]",
+        label: Optional[str] = None,
+        hooks: "Sequence[PoolEventHook]" = (),
+        buckets: "Sequence[float]" = DEFAULT_CHECKOUT_WAIT_BUCKETS,
+    ) -> None:
+        """Initialize the monitor and attach its listeners to the engine.
+
+        Args:
+            engine: The engine (sync or async) whose pool is monitored.
+            label: Label used in statistics and hook calls. Defaults to the engine URL without password.
+            hooks: Hooks notified of every checkout, connect and invalidation.
+            buckets: Upper bounds, in seconds, of the checkout wait histogram buckets.
+        """
+        self._engine = cast("Engine", getattr(engine, "sync_engine", engine))
+        self.label = label or _engine_label(self._engine)
+        self._hooks = tuple(hooks)
+        self._buckets = tuple(sorted(buckets))
+        self._wait_counts = [0] * (len(self._buckets) + 1)
+        self._checkouts = 0
+        self._checkout_wait_total = 0.0
+        self._connects = 0
+        self._connect_time_total = 0.0
+        self._invalidations = 0
+        self._in_use = 0
+        self._lock = threading.Lock()
+        self._instrument()
+
+    def _instrument(self) -> None:
+        engine = self._engine
+
+        def do_connect(_: Any, connection_record: Any, *__: Any) -> None:
+            connection_record.info["_aa_connect_start"] = time.perf_counter()
+
+        def on_connect(_: Any, connection_record: Any) -> None:
+            start = connection_record.info.pop("_aa_connect_start", None)
+            if start is not None:
+                self._record_connect(time.perf_counter() - start)
+
+        def on_checkout(*_: Any) -> None:
+            with self._lock:
+                self._in_use += 1
+
+        def on_checkin(*_: Any) -> None:
+            with self._lock:
+                self._in_use = max(0, self._in_use - 1)
+
+        def on_invalidate(*_: Any) -> None:
+            self._record_invalidation(soft=False)
+
+        def on_soft_invalidate(*_: Any) -> None:
+            self._record_invalidation(soft=True)
+
+        def on_engine_disposed(disposed: Any) -> None:
+            self._time_checkouts(disposed.pool)
+
+        event.listen(engine, "do_connect", do_connect)
+        event.listen(engine, "connect", on_connect)
+        event.listen(engine, "checkout", on_checkout)
+        event.listen(engine, "checkin", on_checkin)
+        event.listen(engine, "invalidate", on_invalidate)
+        event.listen(engine, "soft_invalidate", on_soft_invalidate)
+        event.listen(engine, "engine_disposed", on_engine_disposed)
+        self._time_checkouts(engine.pool)
+
+    def _time_checkouts(self, pool: "Pool") -> None:
+        """Wrap ``pool.connect`` to measure checkout wait.
+
+        SQLAlchemy has no event that fires before a checkout starts, so the
+        pool's bound ``connect`` is wrapped instead.
+
+        Args:
+            pool: The pool to time.
+        """
+        connect = pool.connect
+
+        def timed_connect() -> Any:
+            start = time.perf_counter()
+            connection = connect()
+            self._record_checkout(time.perf_counter() - start)
+            return connection
+
+        pool.connect = timed_connect  # type: ignore[method-assign]
+
+    def _notify(self, method: str, *args: Any) -> None:
+        for hook in self._hooks:
+            try:
+                getattr(hook, method)(self.label, *args)
+            except Exception:
+                logger.warning("Pool event hook %r failed in %s", hook, method, exc_info=True)
+
+    def _record_checkout(self, wait: float) -> None:
+        with self._lock:
+            self._checkouts += 1
+            self._checkout_wait_total += wait
+            self._wait_counts[bisect.bisect_left(self._buckets, wait)] += 1
+        self._notify("on_checkout", wait)
+
+    def _record_connect(self, latency: float) -> None:
+        with self._lock:
+            self._connects += 1
+            self._connect_time_total += latency
+        self._notify("on_connect", latency)
+
+    def _record_invalidation(self, soft: bool) -> None:
+        with self._lock:
+            self._invalidations += 1
+        self._notify("on_invalidate", soft)
+
+    def stats(self) -> PoolStats:
+        """Get a snapshot of the pool statistics.
+
+        Returns:
+            The current statistics.
+        """
+        pool = self._engine.pool
+        idle = _pool_metric(pool, "checkedin")
+        overflow = _pool_metric(pool, "overflow")
+        with self._lock:
+            running = 0
+            histogram: dict[float, int] = {}
+            for bound, count in zip((*self._buckets, float("inf")), self._wait_counts):
+                running += count
+                histogram[bound] = running
+            return PoolStats(
+                engine=self.label,
+                size=_pool_metric(pool, "size"),
+                in_use=self._in_use,
+                idle=idle or 0,
+                overflow=max(0, overflow or 0),
+                checkouts=self._checkouts,
+                checkout_wait_total=self._checkout_wait_total,
+                checkout_wait_histogram=histogram,
+                connects=self._connects,
+                connect_time_total=self._connect_time_total,
+                invalidations=self._invalidations,
+            )
@@ -19,7 +19,7 @@ from litestar.middleware.session import SessionMiddleware
 from litestar.middleware.session.server_side import ServerSideSessionConfig
 from litestar.stores.base import Store
 from litestar.testing import AsyncTestClient
-from sqlalchemy import Engine, select
+from sqlalchemy import Engine, event, select, update
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 from sqlalchemy.orm import DeclarativeBase, Session
 
@@ -447,6 +447,95 @@ async def test_async_session_backend_delete_expired(
         assert remaining_ids == set(active_ids)
 
 
+async def test_async_session_backend_skips_unchanged_writes(
+    async_session_config: SQLAlchemyAsyncConfig,
+    async_test_session_model: "type[SessionModelMixin]",
+    async_session: AsyncSession,
+    mock_store: Store,
+) -> None:
+    """Test that unchanged data is not written and expiry is only renewed below the threshold."""
+    if getattr(async_session.bind.dialect, "name", "") in {"mock", "spanner+spanner"}:
+        pytest.skip("Requires a real database with unique constraints")
+
+    backend = SQLAlchemyAsyncSessionBackend(
+        config=ServerSideSessionConfig(max_age=3600),
+        alchemy_config=async_session_config,
+        model=async_test_session_model,
+        renewal_threshold=0.5,
+    )
+    statements: list[str] = []
+    sync_engine = async_session_config.get_engine().sync_engine
+
+    def _record(*args: object) -> None:
+        statements.append(str(args[2]).lstrip().split(" ", 1)[0].upper())
+
+    session_id = str(uuid.uuid4())
+    await backend.set(session_id, b"data", mock_store)
+    event.listen(sync_engine, "before_cursor_execute", _record)
+    try:
+        assert await backend.get(session_id, mock_store) == b"data"
+        await backend.set(session_id, b"data", mock_store)
+        assert statements == ["SELECT"]
+
+        await backend.set(session_id, b"changed", mock_store)
+        assert len(statements) > 1
+
+        async with backend.alchemy.get_session() as db_session:
+            await db_session.execute(
+                update(async_test_session_model)
+                .where(async_test_session_model.session_id == session_id)
+                .values(expires_at=datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(seconds=60))
+            )
+            await db_session.commit()
+        assert await backend.get(session_id, mock_store) == b"changed"
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", _record)
+
+    async with backend.alchemy.get_session() as db_session:
+        expires_at = (
+            await db_session.execute(
+                select(async_test_session_model.expires_at).where(async_test_session_model.session_id == session_id)
+            )
+        ).scalar_one()
+    remaining = expires_at.replace(tzinfo=datetime.timezone.utc) - datetime.datetime.now(datetime.timezone.utc)
+    assert remaining > datetime.timedelta(seconds=3000)
+
+
+async def test_sync_session_backend_renews_expiry_without_rewriting_data(
+    sync_session_config: SQLAlchemySyncConfig,
+    test_session_model: "type[SessionModelMixin]",
+    session: Session,
+    mock_store: Store,
+) -> None:
+    """Test that storing unchanged data only renews the expiry, and skips it entirely when disabled."""
+    if session.bind is not None and getattr(session.bind.dialect, "name", "") in {"mock", "spanner+spanner"}:
+        pytest.skip("Requires a real database with unique constraints")
+
+    backend = SQLAlchemySyncSessionBackend(
+        config=ServerSideSessionConfig(max_age=3600),
+        alchemy_config=sync_session_config,
+        model=test_session_model,
+    )
+    statements: list[str] = []
+    engine = sync_session_config.get_engine()
+
+    def _record(*args: object) -> None:
+        statements.append(str(args[2]))
+
+    session_id = str(uuid.uuid4())
+    await backend.set(session_id, b"data", mock_store)
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        await backend.set(session_id, b"data", mock_store)
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+
+    assert len(statements) == 1
+    assert statements[0].lstrip().upper().startswith("UPDATE")
+    assert "data" not in statements[0].split("WHERE")[0].split("SET")[1]
+    assert await backend.get(session_id, mock_store) == b"data"
+
+
 # Litestar Integration Tests
 async def test_async_session_middleware_integration(
     async_engine: AsyncEngine,
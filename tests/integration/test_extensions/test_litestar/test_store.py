@@ -482,3 +482,73 @@ async def test_store_renew_functionality(
     expires_time = await async_store.expires_in(key)
     assert expires_time is not None
     assert expires_time > 6000  # Should be close to 7200 seconds (renewed time)
+
+
+async def test_async_store_batch_operations(
+    async_store: SQLAlchemyStore,
+    setup_async_database: None,
+) -> None:
+    """Test get_many, set_many and delete_many with an async store."""
+    engine_instance = async_store._config.engine_instance
+    if engine_instance is not None and getattr(engine_instance.dialect, "name", "") == "mock":
+        pytest.skip("Mock engine cannot test real database operations")
+
+    await async_store.set("existing", "old", expires_in=3600)
+    await async_store.set_many({"existing": "new", "other": b"value", "third": "3"}, expires_in=3600)
+
+    assert await async_store.get_many(["existing", "other", "missing", "existing"]) == {
+        "existing": b"new",
+        "other": b"value",
+    }
+    expires_time = await async_store.expires_in("third")
+    assert expires_time is not None
+    assert expires_time > 3500
+
+    await async_store.delete_many(["existing", "third"])
+
+    assert await async_store.get_many(["existing", "other", "third"]) == {"other": b"value"}
+
+
+async def test_sync_store_batch_operations(
+    sync_store: SQLAlchemyStore,
+    setup_sync_database: None,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test the batch operations with a sync store, including the non-upsert fallback."""
+    engine_instance = sync_store._config.engine_instance
+    if engine_instance is not None and getattr(engine_instance.dialect, "name", "") == "mock":
+        pytest.skip("Mock engine cannot test real database operations")
+
+    await sync_store.set_many({f"key_{i}": f"value_{i}" for i in range(3)}, expires_in=60)
+    monkeypatch.setattr(
+        "advanced_alchemy.extensions.litestar.store.OnConflictUpsert.supports_native_upsert", lambda _: False
+    )
+    await sync_store.set_many({"key_0": "updated", "key_3": "value_3"}, expires_in=60)
+
+    assert await sync_store.get_many(f"key_{i}" for i in range(5)) == {
+        "key_0": b"updated",
+        "key_1": b"value_1",
+        "key_2": b"value_2",
+        "key_3": b"value_3",
+    }
+    await sync_store.delete_many(["key_1", "key_2"])
+    assert set(await sync_store.get_many(f"key_{i}" for i in range(5))) == {"key_0", "key_3"}
+
+
+async def test_sync_store_delete_expired(
+    sync_store: SQLAlchemyStore,
+    setup_sync_database: None,
+) -> None:
+    """Test that delete_expired removes expired values of the namespace in batches."""
+    engine_instance = sync_store._config.engine_instance
+    if engine_instance is not None and getattr(engine_instance.dialect, "name", "") == "mock":
+        pytest.skip("Mock engine cannot test real database operations")
+
+    other = sync_store.with_namespace("other")
+    await sync_store.set_many({f"old_{i}": "value" for i in range(5)}, expires_in=-60)
+    await sync_store.set("fresh", "value", expires_in=3600)
+    await other.set("old", "value", expires_in=-60)
+
+    assert await sync_store.delete_expired(batch_size=2) == 5
+    assert await sync_store.exists("fresh")
+    assert await other.delete_expired() == 1
@@ -22,6 +22,7 @@ from advanced_alchemy.filters import (
     MultiFilter,
     NotExistsFilter,
     NotInCollectionFilter,
+    NotInSearchFilter,
     NotNullFilter,
     NullFilter,
     OnBeforeAfter,
@@ -612,6 +613,36 @@ def test_search_filter(session: Session, movie_model_sync: type[DeclarativeBase]
     assert len(results) == 1
 
 
+def test_search_filter_modes(session: Session, movie_model_sync: type[DeclarativeBase]) -> None:
+    """Test prefix and trigram search modes and their negated forms."""
+    Movie = movie_model_sync
+
+    # Skip mock engines
+    if getattr(session.bind.dialect, "name", "") == "mock":
+        pytest.skip("Mock engines not supported for filter tests")
+
+    session.execute(Movie.__table__.delete())
+    session.commit()
+    setup_movie_data(session, Movie)
+
+    def titles(filter_: SearchFilter) -> set[str]:
+        return set(session.execute(filter_.append_to_statement(select(Movie.title), Movie)).scalars())
+
+    assert titles(SearchFilter(field_name="title", value="The ", mode="prefix")) == {"The Matrix", "The Hangover"}
+    assert titles(SearchFilter(field_name="title", value="the m", ignore_case=True, mode="prefix")) == {"The Matrix"}
+    assert titles(SearchFilter(field_name="title", value="Matrix", mode="prefix")) == set()
+    assert titles(SearchFilter(field_name="title", value="The_", mode="prefix")) == set()
+    assert titles(NotInSearchFilter(field_name="title", value="the", ignore_case=True, mode="prefix")) == {
+        "Shawshank Redemption"
+    }
+    if getattr(session.bind.dialect, "name", "") != "postgresql":
+        assert titles(SearchFilter(field_name="title", value="hangover", mode="trigram")) == {"The Hangover"}
+        assert titles(NotInSearchFilter(field_name="title", value="hangover", mode="trigram")) == {
+            "The Matrix",
+            "Shawshank Redemption",
+        }
+
+
 def test_filter_group_logical_operators(session: Session, movie_model_sync: type[DeclarativeBase]) -> None:
     Movie = movie_model_sync
 
@@ -1109,6 +1140,14 @@ def test_comparison_filter(session: Session, movie_model_sync: type[DeclarativeB
     assert len(results) == 2
     assert {r.title for r in results} == {"The Matrix", "Shawshank Redemption"}
 
+    # Test case-insensitive prefix and suffix operators
+    istartswith_filter = ComparisonFilter(field_name="title", operator="istartswith", value="the")
+    statement = istartswith_filter.append_to_statement(select(Movie), Movie)
+    assert {r.title for r in session.execute(statement).scalars().all()} == {"The Matrix", "The Hangover"}
+    iendswith_filter = ComparisonFilter(field_name="title", operator="iendswith", value="MATRIX")
+    statement = iendswith_filter.append_to_statement(select(Movie), Movie)
+    assert [r.title for r in session.execute(statement).scalars().all()] == ["The Matrix"]
+
     # Test invalid operator (should raise ValueError)
     invalid_filter = ComparisonFilter(field_name="genre", operator="invalid", value="Action")
     with pytest.raises(ValueError) as exc_info:
@@ -1,6 +1,7 @@
 """Integration tests for the SQLAlchemy Repository implementation using session-based fixtures."""
 
 import asyncio
+import dataclasses
 import datetime
 from collections.abc import Generator
 from typing import TYPE_CHECKING, Any, Literal, Optional, Union, cast
@@ -381,6 +382,45 @@ async def test_service_update_with_dict_data_refreshes_timestamp(
     assert updated_author.updated_at > original_updated_at
 
 
+async def test_service_blind_update(seeded_test_session_async: "tuple[AsyncSession, dict[str, type]]") -> None:
+    """Blind updates write the supplied columns without merging into a loaded instance."""
+    author_service = get_service_from_session(seeded_test_session_async, "author")
+
+    authors = await maybe_async(author_service.get_many())
+    author = authors[0]
+    original_created_at = author.created_at
+
+    updated_author = await maybe_async(author_service.update({"name": "Blind Update"}, item_id=author.id, blind=True))
+
+    assert updated_author.id == author.id
+    assert updated_author.name == "Blind Update"
+    assert updated_author.created_at == original_created_at
+    assert (await maybe_async(author_service.get(author.id))).name == "Blind Update"
+
+    missing_id = 999_999 if isinstance(author.id, int) else UUID(int=0)
+    with pytest.raises(NotFoundError):
+        await maybe_async(author_service.update({"name": "Missing"}, item_id=missing_id, blind=True))
+
+
+async def test_service_get_many_as(seeded_test_session_async: "tuple[AsyncSession, dict[str, type]]") -> None:
+    """Rows are converted to schemas and dicts without building model instances."""
+    author_service = get_service_from_session(seeded_test_session_async, "author")
+    authors = await maybe_async(author_service.get_many(order_by=("name", False)))
+
+    @dataclasses.dataclass
+    class AuthorRow:
+        id: Any
+        name: str
+
+    rows = await maybe_async(author_service.get_many_as(AuthorRow, order_by=("name", False)))
+    assert rows == [AuthorRow(id=author.id, name=author.name) for author in authors]
+
+    dicts = await maybe_async(author_service.get_many_as(dict, name=authors[0].name))
+    assert len(dicts) == 1
+    assert dicts[0]["id"] == authors[0].id
+    assert dicts[0]["dob"] == authors[0].dob
+
+
 async def test_repo_update_many_method_stale_data_fix(
     seeded_test_session_async: "tuple[AsyncSession, dict[str, type]]",
 ) -> None:
@@ -38,6 +38,7 @@ from advanced_alchemy.filters import (
     ChoicesFilter,
     CollectionFilter,
     FilterTypes,
+    FullTextSearchFilter,
     LimitOffset,
     OrderBy,
     SearchFilter,
@@ -273,6 +274,30 @@ def test_create_filter_dependencies_all_filters() -> None:
     assert DEPENDENCY_DEFAULTS.ORDER_BY_FILTER_DEPENDENCY_KEY in sig.parameters
 
 
+def test_full_text_search_filter_dependency() -> None:
+    """Test that full-text search reads ``searchQuery`` and is skipped without it."""
+
+    dep_cache.dependencies.clear()
+    deps = provide_filters({"full_text_search": ["name", "description"], "full_text_search_order_by_rank": False})
+    assert DEPENDENCY_DEFAULTS.FULL_TEXT_SEARCH_FILTER_DEPENDENCY_KEY in inspect.signature(deps).parameters
+
+    app = FastAPI()
+
+    @app.get("/items")
+    async def get_items(filters: Annotated[list[FilterTypes], Depends(deps)]) -> list[str]:
+        return [
+            f"{sorted(f.field_name)}:{f.value}:{f.order_by_rank}"
+            for f in filters
+            if isinstance(f, FullTextSearchFilter)
+        ]
+
+    client = TestClient(app)
+    assert client.get("/items", params={"searchQuery": "red apple"}).json() == [
+        "['description', 'name']:red apple:False"
+    ]
+    assert client.get("/items").json() == []
+
+
 # --- Integration Test with OpenAPI Schema Check --- #
 
 
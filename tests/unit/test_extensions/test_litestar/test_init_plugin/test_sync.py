@@ -120,6 +120,24 @@ async def test_create_all(monkeypatch: MonkeyPatch) -> None:
             create_all_metadata_mock.assert_called_once()
 
 
+async def test_prewarm_engines_runs_off_the_event_loop() -> None:
+    """Test that the lifespan prewarms the sync pool in a worker thread."""
+    import threading
+
+    config = SQLAlchemySyncConfig(connection_string="sqlite://")
+    plugin = SQLAlchemyInitPlugin(config=config)
+    app = Litestar(route_handlers=[], plugins=[plugin])
+    prewarm_threads: list[int] = []
+    with patch.object(
+        config,
+        "prewarm_engines",
+        side_effect=lambda: prewarm_threads.append(threading.get_ident()),
+    ):
+        async with LifespanManager(app) as _client:  # type: ignore[arg-type]  # pyright: ignore[reportArgumentType]
+            assert len(prewarm_threads) == 1
+            assert prewarm_threads[0] != threading.get_ident()
+
+
 def test_before_send_handler_success_response(create_scope: Callable[..., Scope]) -> None:
     """Test that the session is committed given a success response."""
     config = SQLAlchemySyncConfig(connection_string="sqlite://", before_send_handler=autocommit_before_send_handler)
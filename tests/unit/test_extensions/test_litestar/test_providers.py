@@ -40,6 +40,7 @@ from advanced_alchemy.filters import (
     ChoicesFilter,
     CollectionFilter,
     FilterTypes,
+    FullTextSearchFilter,
     LimitOffset,
     NotInCollectionFilter,
     OrderBy,
@@ -428,6 +429,30 @@ def test_search_filter() -> None:
     assert f.ignore_case is True
 
 
+def test_full_text_search_filter() -> None:
+    """Test creating full-text search filter dependency."""
+    config = cast(
+        FilterConfig,
+        {"full_text_search": "name,description", "full_text_search_language": "simple"},
+    )
+    deps = _create_statement_filters(config)
+
+    assert "full_text_search_filter" in deps
+
+    provider_func = deps["full_text_search_filter"].dependency
+    f = provider_func(search_query="red apple")
+    assert isinstance(f, FullTextSearchFilter)
+    assert f.field_name == {"name", "description"}
+    assert f.value == "red apple"
+    assert f.language == "simple"
+    assert f.order_by_rank is True
+
+    aggregate_func = _create_filter_aggregate_function(config)
+    assert "full_text_search_filter" in inspect.signature(aggregate_func).parameters
+    assert aggregate_func(full_text_search_filter=f) == [f]
+    assert aggregate_func(full_text_search_filter=provider_func(search_query=None)) == []
+
+
 def test_limit_offset_filter() -> None:
     """Test creating limit_offset filter dependency."""
     config = cast(FilterConfig, {"pagination_type": "limit_offset", "default_limit": 10, "max_limit": 100})
@@ -0,0 +1,121 @@
+"""Unit tests for the batched expired-row reaper."""
+
+import datetime
+import time
+from pathlib import Path
+
+import pytest
+from litestar import Litestar
+from litestar.exceptions import ImproperlyConfiguredException
+from litestar.testing import TestClient
+from sqlalchemy import String, func, insert, select
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
+from advanced_alchemy.extensions.litestar import SQLAlchemyAsyncConfig, SQLAlchemyInitPlugin, SQLAlchemySyncConfig
+from advanced_alchemy.extensions.litestar.reaper import ExpiredRowReaper
+from advanced_alchemy.types import DateTimeUTC
+
+
+class _Base(DeclarativeBase):
+    pass
+
+
+class Entry(_Base):
+    __tablename__ = "reaper_entry"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    namespace: Mapped[str] = mapped_column(String(20))
+    expires_at: Mapped[datetime.datetime] = mapped_column(DateTimeUTC(timezone=True))
+
+
+def _rows(expired: int, live: int, namespace: str = "a") -> "list[dict[str, object]]":
+    now = datetime.datetime.now(datetime.timezone.utc)
+    past, future = now - datetime.timedelta(hours=1), now + datetime.timedelta(hours=1)
+    return [{"namespace": namespace, "expires_at": past} for _ in range(expired)] + [
+        {"namespace": namespace, "expires_at": future} for _ in range(live)
+    ]
+
+
+@pytest.fixture
+def sync_config(tmp_path: Path) -> SQLAlchemySyncConfig:
+    config = SQLAlchemySyncConfig(connection_string=f"sqlite:///{tmp_path / 'reaper.db'}")
+    with config.get_engine().begin() as conn:
+        _Base.metadata.create_all(conn)
+        conn.execute(insert(Entry), _rows(expired=25, live=5))
+    return config
+
+
+def _count(config: SQLAlchemySyncConfig) -> int:
+    with config.get_session() as session:
+        return session.execute(select(func.count()).select_from(Entry)).scalar_one()
+
+
+async def test_reap_deletes_expired_rows_in_batches(sync_config: SQLAlchemySyncConfig) -> None:
+    """Test that a run deletes every expired row in bounded batches and records stats."""
+    reaper = ExpiredRowReaper(Entry, sync_config, batch_size=10)
+
+    assert await reaper.reap() == 25
+
+    stats = reaper.stats
+    assert _count(sync_config) == 5
+    assert (stats.table, stats.runs, stats.batches, stats.deleted, stats.last_run_deleted) == (
+        "reaper_entry",
+        1,
+        3,
+        25,
+        25,
+    )
+    assert stats.last_run_at is not None
+
+
+async def test_reap_stops_after_max_runtime(sync_config: SQLAlchemySyncConfig) -> None:
+    """Test that a run stops starting new batches once max_runtime is exceeded."""
+    reaper = ExpiredRowReaper(Entry, sync_config, batch_size=10, max_runtime=0)
+
+    assert await reaper.reap() == 10
+    assert await reaper.reap() == 10
+    assert reaper.stats.deleted == 20
+
+
+async def test_reap_async_config_with_criteria(tmp_path: Path) -> None:
+    """Test reaping through an async config, restricted by extra criteria."""
+    config = SQLAlchemyAsyncConfig(connection_string=f"sqlite+aiosqlite:///{tmp_path / 'reaper.db'}")
+    async with config.get_engine().begin() as conn:
+        await conn.run_sync(_Base.metadata.create_all)
+        await conn.execute(insert(Entry), [*_rows(expired=4, live=1), *_rows(expired=3, live=0, namespace="b")])
+    reaper = ExpiredRowReaper(Entry, config, batch_size=2, criteria=[Entry.namespace == "a"])
+
+    assert await reaper.reap() == 4
+
+    async with config.get_session() as session:
+        remaining = (await session.execute(select(Entry.namespace))).scalars().all()
+    assert sorted(remaining) == ["a", "b", "b", "b"]
+    await config.get_engine().dispose()
+
+
+async def test_reaper_validation() -> None:
+    """Test that invalid settings and a missing config are rejected."""
+    with pytest.raises(ValueError, match="batch_size"):
+        ExpiredRowReaper(Entry, batch_size=0)
+    with pytest.raises(ValueError, match="interval"):
+        ExpiredRowReaper(Entry, interval=0)
+    with pytest.raises(ImproperlyConfiguredException):
+        await ExpiredRowReaper(Entry).reap()
+
+
+def test_reaper_runs_in_plugin_lifespan(sync_config: SQLAlchemySyncConfig) -> None:
+    """Test that configured reapers are bound, started and stopped by the plugin lifespan."""
+    reaper = ExpiredRowReaper(Entry, batch_size=10, interval=0.01)
+    sync_config.reapers = [reaper]
+    app = Litestar(plugins=[SQLAlchemyInitPlugin(config=sync_config)])
+
+    with TestClient(app=app):
+        deadline = time.monotonic() + 5
+        while reaper.stats.runs == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert reaper.is_running
+
+    assert reaper.config is sync_config
+    assert not reaper.is_running
+    assert reaper.stats.deleted == 25
+    assert _count(sync_config) == 5
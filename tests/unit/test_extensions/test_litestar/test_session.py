@@ -4,6 +4,7 @@ from typing import Any, Callable, TypeVar
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
+from litestar.exceptions import ImproperlyConfiguredException
 from litestar.middleware.session.server_side import ServerSideSessionConfig
 from pytest import MonkeyPatch
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -115,6 +116,51 @@ def test_backend_config_post_init_valid(
     assert config.alchemy is mock_async_config
 
 
+@pytest.mark.parametrize("threshold", [0, -0.5, 1.5])
+def test_backend_rejects_invalid_renewal_threshold(
+    mock_session_model: type[SessionModelMixin], mock_async_config: MagicMock, threshold: float
+) -> None:
+    """Test that renewal thresholds outside (0, 1] are rejected."""
+    with pytest.raises(ImproperlyConfiguredException):
+        SQLAlchemyAsyncSessionBackend(
+            model=mock_session_model,
+            alchemy_config=mock_async_config,
+            config=ServerSideSessionConfig(max_age=1000),
+            renewal_threshold=threshold,
+        )
+
+
+def test_backend_renewal_threshold(mock_session_model: type[SessionModelMixin], mock_async_config: MagicMock) -> None:
+    """Test that expiry is only renewed once the remaining lifetime drops below the threshold."""
+    backend = SQLAlchemyAsyncSessionBackend(
+        model=mock_session_model,
+        alchemy_config=mock_async_config,
+        config=ServerSideSessionConfig(max_age=1000),
+        renewal_threshold=0.25,
+    )
+    now = datetime.datetime.now(datetime.timezone.utc)
+
+    assert not backend._needs_renewal(now + datetime.timedelta(seconds=300), now)  # pyright: ignore[reportPrivateUsage]
+    assert backend._needs_renewal(now + datetime.timedelta(seconds=200), now)  # pyright: ignore[reportPrivateUsage]
+    assert backend._needs_renewal(now.replace(tzinfo=None), now)  # pyright: ignore[reportPrivateUsage]
+
+
+def test_backend_tracks_content_hash(mock_session_model: type[SessionModelMixin], mock_async_config: MagicMock) -> None:
+    """Test that the tracked expiry is only returned for identical data."""
+    backend = SQLAlchemyAsyncSessionBackend(
+        model=mock_session_model,
+        alchemy_config=mock_async_config,
+        config=ServerSideSessionConfig(max_age=1000),
+    )
+    expires_at = datetime.datetime.now(datetime.timezone.utc)
+    backend._track("sid", b"data", expires_at)  # pyright: ignore[reportPrivateUsage]
+
+    assert backend._tracked_expiry("sid", b"data") == expires_at  # pyright: ignore[reportPrivateUsage]
+    assert backend._tracked_expiry("sid", b"other") is None  # pyright: ignore[reportPrivateUsage]
+    backend._forget("sid")  # pyright: ignore[reportPrivateUsage]
+    assert backend._tracked_expiry("sid", b"data") is None  # pyright: ignore[reportPrivateUsage]
+
+
 def test_backend_config_backend_class_async(
     mock_session_model: type[SessionModelMixin], mock_async_config: MagicMock
 ) -> None:
@@ -393,25 +439,24 @@ async def test_async_backend_delete_expired(
     async_backend: SQLAlchemyAsyncSessionBackend,
     mock_async_config: MagicMock,
     mock_session_model: type[SessionModelMixin],
-    monkeypatch: MonkeyPatch,
     mock_async_session: MagicMock,
 ) -> None:
-    """Test deleting expired sessions."""
+    """Test deleting expired sessions in primary-key ordered batches."""
     mock_async_session = mock_async_config.get_session.return_value
     mock_async_session.__aenter__.return_value = mock_async_session
     mock_async_session.__aexit__.return_value = None
-
-    fixed_time = datetime.datetime.now(datetime.timezone.utc)
-    mock_datetime = MockDateTime(fixed_time)
-    monkeypatch.setattr("advanced_alchemy.extensions.litestar.session.datetime.datetime", mock_datetime)
+    select_result = MagicMock()
+    select_result.scalars.return_value.all.return_value = ["a", "b"]
+    mock_async_session.execute.side_effect = [select_result, MagicMock(rowcount=2)]
 
     await async_backend.delete_expired()
 
-    mock_async_session.execute.assert_awaited_once()
-    call_args, _ = mock_async_session.execute.call_args
-    delete_stmt = call_args[0]
-    assert str(delete_stmt).startswith(f"DELETE FROM {mock_session_model.__tablename__}")
-    assert "WHERE" in str(delete_stmt) and "now() >" in str(delete_stmt)
+    assert mock_async_session.execute.await_count == 2
+    select_stmt = str(mock_async_session.execute.call_args_list[0][0][0])
+    delete_stmt = str(mock_async_session.execute.call_args_list[1][0][0])
+    assert "ORDER BY" in select_stmt and "LIMIT" in select_stmt
+    assert delete_stmt.startswith(f"DELETE FROM {mock_session_model.__tablename__}")
+    assert " IN " in delete_stmt and "expires_at <" in delete_stmt
     mock_async_session.commit.assert_awaited_once()
 
 
@@ -516,20 +561,26 @@ async def test_sync_backend_delete_all_wraps_sync_call(
 
 
 @pytest.mark.asyncio()
-async def test_sync_backend_delete_expired_wraps_sync_call(
+async def test_sync_backend_delete_expired_uses_sync_session(
     sync_backend: SQLAlchemySyncSessionBackend,
     mock_sync_config: MagicMock,
+    mock_session_model: type[SessionModelMixin],
     mock_sync_session: MagicMock,
 ) -> None:
-    """Test that sync backend's async delete_expired() calls the internal _delete_expired_sync."""
+    """Test that sync backend's delete_expired() deletes batches through the sync session."""
     mock_sync_session = mock_sync_config.get_session.return_value
     mock_sync_session.__enter__.return_value = mock_sync_session
     mock_sync_session.__exit__.return_value = None
+    select_result = MagicMock()
+    select_result.scalars.return_value.all.return_value = ["a"]
+    mock_sync_session.execute.side_effect = [select_result, MagicMock(rowcount=1)]
 
-    mock_delete_expired_sync = MagicMock()
-    with patch.object(sync_backend, "_delete_expired_sync", mock_delete_expired_sync):
-        await sync_backend.delete_expired()
-        mock_delete_expired_sync.assert_called_once()
+    await sync_backend.delete_expired()
+
+    assert mock_sync_session.execute.call_count == 2
+    delete_stmt = str(mock_sync_session.execute.call_args_list[1][0][0])
+    assert delete_stmt.startswith(f"DELETE FROM {mock_session_model.__tablename__}")
+    mock_sync_session.commit.assert_called_once()
 
 
 # --- Internal Sync Method Tests (_get_sync, _set_sync etc.) ---
@@ -765,41 +816,6 @@ def test_sync_backend_internal_delete_all_sync(
     mock_sync_session.commit.assert_called_once()
 
 
-def test_sync_backend_internal_delete_expired_sync(
-    sync_backend: SQLAlchemySyncSessionBackend,
-    mock_sync_config: MagicMock,
-    mock_session_model: type[SessionModelMixin],
-    monkeypatch: MonkeyPatch,
-    mock_sync_session: MagicMock,
-) -> None:
-    """Test the internal _delete_expired_sync method."""
-    mock_sync_session = MagicMock(spec=SyncSession)
-    mock_sync_session.__enter__.return_value = mock_sync_session
-    mock_sync_session.__exit__.return_value = None
-
-    # Add mock bind and dialect to avoid AttributeError in session backend
-    mock_dialect = MagicMock()
-    mock_dialect.name = "sqlite"
-    mock_bind = MagicMock()
-    mock_bind.dialect = mock_dialect
-    mock_sync_session.bind = mock_bind
-
-    mock_sync_config.get_session.return_value = mock_sync_session
-
-    fixed_time = datetime.datetime.now(datetime.timezone.utc)
-    mock_datetime = MockDateTime(fixed_time)
-    monkeypatch.setattr("advanced_alchemy.extensions.litestar.session.datetime.datetime", mock_datetime)
-
-    sync_backend._delete_expired_sync()  # pyright: ignore [reportPrivateUsage]
-
-    mock_sync_session.execute.assert_called_once()
-    call_args, _ = mock_sync_session.execute.call_args
-    delete_stmt = call_args[0]
-    assert str(delete_stmt).startswith(f"DELETE FROM {mock_session_model.__tablename__}")
-    assert "WHERE" in str(delete_stmt) and "now() >" in str(delete_stmt)
-    mock_sync_session.commit.assert_called_once()
-
-
 # --- SessionModelMixin Edge Cases ---
 
 
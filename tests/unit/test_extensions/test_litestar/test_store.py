@@ -1,13 +1,13 @@
 import datetime
 from collections.abc import Awaitable, Generator
-from typing import Any, Callable, TypeVar
+from typing import Any, Callable, Optional, TypeVar
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from litestar.exceptions import ImproperlyConfiguredException
 from litestar.types import Empty
 from pytest import MonkeyPatch
-from sqlalchemy import Dialect
+from sqlalchemy import Dialect, Update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session as SyncSession
 
@@ -300,6 +300,43 @@ async def test_store_get_sync(
 
     assert result == expected_value
     mock_sync_session.execute.assert_called_once()
+    mock_sync_session.begin.assert_not_called()
+    mock_sync_session.commit.assert_not_called()
+
+
+@pytest.mark.asyncio()
+async def test_store_get_with_renew_uses_update_returning(
+    sync_store_with_mock_async: SQLAlchemyStore[SQLAlchemySyncConfig], mock_sync_session: MagicMock
+) -> None:
+    """Test that get-and-renew is a single ``UPDATE ... RETURNING`` on dialects supporting it."""
+    mock_sync_session.bind.dialect.update_returning = True
+    mock_sync_session.execute.return_value.scalar_one_or_none.return_value = b"test_value"
+
+    result = await sync_store_with_mock_async.get("test_key", renew_for=60)
+
+    assert result == b"test_value"
+    mock_sync_session.execute.assert_called_once()
+    statement = mock_sync_session.execute.call_args.args[0]
+    assert isinstance(statement, Update)
+    assert statement._returning  # pyright: ignore[reportPrivateUsage]
+    mock_sync_session.begin.assert_called_once()
+
+
+@pytest.mark.asyncio()
+async def test_store_get_with_renew_without_returning(
+    sync_store_with_mock_async: SQLAlchemyStore[SQLAlchemySyncConfig], mock_sync_session: MagicMock
+) -> None:
+    """Test that dialects without ``UPDATE ... RETURNING`` read first and only renew hits."""
+    mock_sync_session.bind.dialect.update_returning = False
+    mock_sync_session.execute.return_value.scalar_one_or_none.return_value = None
+
+    assert await sync_store_with_mock_async.get("missing", renew_for=60) is None
+    mock_sync_session.execute.assert_called_once()
+    mock_sync_session.commit.assert_not_called()
+
+    mock_sync_session.execute.return_value.scalar_one_or_none.return_value = b"test_value"
+    assert await sync_store_with_mock_async.get("test_key", renew_for=60) == b"test_value"
+    assert isinstance(mock_sync_session.execute.call_args.args[0], Update)
     mock_sync_session.commit.assert_called_once()
 
 
@@ -441,6 +478,58 @@ async def test_store_expires_in_sync(
     mock_sync_session.execute.assert_called_once()
 
 
+@pytest.mark.asyncio()
+async def test_store_batch_operations_chunk_keys(
+    sync_store_with_mock_async: SQLAlchemyStore[SQLAlchemySyncConfig], mock_sync_session: MagicMock
+) -> None:
+    """Test that batch operations issue one statement per chunk of keys in one session."""
+    mock_sync_session.execute.return_value = []
+    keys = [f"key_{i}" for i in range(1200)]
+
+    assert await sync_store_with_mock_async.get_many(keys + keys[:10]) == {}
+    assert mock_sync_session.execute.call_count == 3
+
+    mock_sync_session.execute.reset_mock()
+    await sync_store_with_mock_async.delete_many(keys)
+    assert mock_sync_session.execute.call_count == 3
+    mock_sync_session.begin.assert_called_once()
+
+    mock_sync_session.execute.reset_mock()
+    await sync_store_with_mock_async.set_many(dict.fromkeys(keys, b"value"), expires_in=60)
+    assert mock_sync_session.execute.call_count == 3
+
+
+@pytest.mark.asyncio()
+async def test_store_batch_operations_skip_empty_input(
+    async_store: SQLAlchemyStore[SQLAlchemyAsyncConfig], mock_async_config: MagicMock
+) -> None:
+    """Test that empty batches do not open a session."""
+    assert await async_store.get_many([]) == {}
+    await async_store.set_many({})
+    await async_store.delete_many([])
+
+    mock_async_config.get_session.assert_not_called()
+
+
+@pytest.mark.asyncio()
+@pytest.mark.parametrize(
+    ("namespace", "expected"),
+    [("LITESTAR", "mock_store.namespace = :namespace_1"), (None, "mock_store.namespace IS NULL")],
+)
+async def test_store_delete_expired_is_scoped_to_namespace(
+    mock_async_config: MagicMock, namespace: Optional[str], expected: str
+) -> None:
+    """Test that delete_expired only reaps rows of the store's namespace, including the null namespace."""
+    store = SQLAlchemyStore(config=mock_async_config, model=MockStoreModel, namespace=namespace)
+
+    with patch("advanced_alchemy.extensions.litestar.store.ExpiredRowReaper") as reaper_type:
+        reaper_type.return_value.reap = AsyncMock(return_value=3)
+        assert await store.delete_expired() == 3
+
+    (criterion,) = reaper_type.call_args.kwargs["criteria"]
+    assert str(criterion) == expected
+
+
 def test_store_with_namespace() -> None:
     """Test creating a new store with nested namespace."""
     store = SQLAlchemyStore(config=MagicMock(spec=SQLAlchemyAsyncConfig), model=MockStoreModel, namespace="base")
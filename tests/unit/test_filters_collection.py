@@ -0,0 +1,154 @@
+"""Unit tests for the membership strategies of collection filters."""
+
+import datetime
+from collections.abc import Generator
+from typing import TYPE_CHECKING, Optional
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy import String, create_engine, event, select
+from sqlalchemy.dialects import mssql, postgresql
+from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column
+
+from advanced_alchemy.filters import CollectionFilter, InAnyFilter, NotInCollectionFilter
+from advanced_alchemy.repository import SQLAlchemySyncRepository
+from advanced_alchemy.types import GUID, DateTimeUTC
+
+if TYPE_CHECKING:
+    from sqlalchemy.engine import Compiled, Engine
+
+pytestmark = [pytest.mark.unit]
+
+
+class _Base(DeclarativeBase):
+    pass
+
+
+class Item(_Base):
+    __tablename__ = "collection_item"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    code: Mapped[str] = mapped_column(String(20))
+    created_at: Mapped[Optional[datetime.datetime]] = mapped_column(DateTimeUTC(timezone=True))
+
+
+class Widget(_Base):
+    __tablename__ = "collection_widget"
+
+    id: Mapped[UUID] = mapped_column(GUID, primary_key=True)
+
+
+class ItemRepository(SQLAlchemySyncRepository[Item]):
+    model_type = Item
+    values_join_threshold = 10
+
+
+@pytest.fixture
+def sqlite_engine() -> "Generator[Engine, None, None]":
+    engine = create_engine("sqlite://")
+    _Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def session(sqlite_engine: "Engine") -> Generator[Session, None, None]:
+    engine = sqlite_engine
+    with Session(engine) as session:
+        session.add_all([Item(id=index, code=f"c-{index}'") for index in range(100)])
+        session.commit()
+        yield session
+
+
+def _where(filter_: InAnyFilter, dialect: object, **kwargs: object) -> str:
+    statement = filter_.append_to_statement(select(Item.id), Item, **kwargs)  # type: ignore[call-arg]
+    return str(statement.compile(dialect=dialect)).split("WHERE ")[1]  # type: ignore[arg-type]
+
+
+def test_prefer_any_binds_a_single_typed_array() -> None:
+    """Test that ANY and ALL bind one array of the column type, whatever the collection size."""
+    dialect = postgresql.dialect()
+
+    assert (
+        _where(CollectionFilter("id", list(range(1000))), dialect, prefer_any=True)
+        == "collection_item.id = ANY (%(param_1)s::INTEGER[])"
+    )
+    assert (
+        _where(NotInCollectionFilter("id", list(range(1000))), dialect, prefer_any=True)
+        == "collection_item.id != ALL (%(param_1)s::INTEGER[])"
+    )
+
+
+def test_repository_binds_arrays_only_for_safe_values(session: Session) -> None:
+    """Test that the repository uses ANY for plain values, with the column's bind processing."""
+    repository = ItemRepository(session=session)
+    repository._prefer_any = True
+
+    def compile_filter(filter_: InAnyFilter) -> "Compiled":
+        statement = repository._apply_filters(filter_, statement=select(Item.id))
+        return statement.compile(dialect=postgresql.dialect())
+
+    at = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+    typed = compile_filter(CollectionFilter("created_at", [at]))
+
+    assert "collection_item.created_at = ANY (%(param_1)s::TIMESTAMP WITH TIME ZONE[])" in str(typed)
+    assert isinstance(typed.binds["param_1"].type.item_type, DateTimeUTC)  # type: ignore[attr-defined]
+    assert "IN (__[POSTCOMPILE" in str(compile_filter(CollectionFilter("id", ["1", 2])))
+    assert "NOT IN (__[POSTCOMPILE" in str(compile_filter(NotInCollectionFilter("created_at", [at.date()])))
+
+
+def test_values_threshold_renders_inline_values() -> None:
+    """Test that large collections are matched against a literal VALUES list."""
+    where = _where(NotInCollectionFilter("code", ["a", "b'c"]), mssql.dialect(), values_threshold=1)
+
+    assert where == "(collection_item.code NOT IN (SELECT value FROM (VALUES ('a'), ('b''c')) AS in_values (value)))"
+    assert "IN (__[POSTCOMPILE" in _where(CollectionFilter("code", ["a"]), mssql.dialect(), values_threshold=1)
+    assert "IN (__[POSTCOMPILE" in _where(CollectionFilter("id", [1.5, 2.5]), mssql.dialect(), values_threshold=1)
+
+
+def test_values_threshold_renders_uuid_and_datetime_literals() -> None:
+    """Test that UUID and datetime collections bind no parameters on SQL Server."""
+    ids = [uuid4() for _ in range(3000)]
+    at = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+    by_id = CollectionFilter("id", ids).append_to_statement(select(Widget.id), Widget, values_threshold=500)
+    by_date = NotInCollectionFilter("created_at", [at]).append_to_statement(select(Item.id), Item, values_threshold=0)
+
+    compiled = by_id.compile(dialect=mssql.dialect())
+    assert not compiled.params
+    assert f"(VALUES (CAST('{ids[0]}' AS UNIQUEIDENTIFIER)), " in str(compiled)
+    assert str(by_date.compile(dialect=mssql.dialect())).split("WHERE ")[1] == (
+        "(collection_item.created_at NOT IN (SELECT value FROM "
+        "(VALUES (CAST('2024-01-01 00:00:00+00:00' AS DATETIMEOFFSET))) AS in_values (value)))"
+    )
+
+
+def test_values_threshold_falls_back_when_literals_cannot_render(sqlite_engine: "Engine") -> None:
+    """Test that column types without literal rendering on the dialect use a regular IN."""
+    ids = [uuid4() for _ in range(5)]
+    with Session(sqlite_engine) as session:
+        session.add_all([Widget(id=id_) for id_ in ids])
+        session.flush()
+        statement = CollectionFilter("id", ids[:3]).append_to_statement(select(Widget.id), Widget, values_threshold=1)
+
+        assert "IN (__[POSTCOMPILE" in str(statement.compile(dialect=sqlite_engine.dialect))
+        assert set(session.scalars(statement)) == set(ids[:3])
+
+
+@pytest.mark.parametrize(("filter_type", "expected"), [(CollectionFilter, 60), (NotInCollectionFilter, 40)])
+def test_repository_uses_values_join_above_threshold(
+    session: Session, filter_type: "type[InAnyFilter]", expected: int
+) -> None:
+    """Test that the repository switches to a VALUES join for large collections on SQLite."""
+    statements: list[str] = []
+    event.listen(session.get_bind(), "before_cursor_execute", lambda *args: statements.append(args[2]))
+    repository = ItemRepository(session=session)
+
+    by_id = repository.get_many(filter_type("id", list(range(60))))  # type: ignore[call-arg]
+    by_code = repository.get_many(filter_type("code", [f"c-{index}'" for index in range(60)]))  # type: ignore[call-arg]
+    small = repository.count(filter_type("id", [1, 2]))  # type: ignore[call-arg]
+
+    assert len(by_id) == len(by_code) == expected
+    assert small == (2 if filter_type is CollectionFilter else 98)
+    assert "(VALUES (0), (1)," in statements[0]
+    assert "(VALUES ('c-0'''), ('c-1''')," in statements[1]
+    assert "VALUES" not in statements[2]
@@ -0,0 +1,157 @@
+"""Unit tests for full-text search filtering."""
+
+from collections.abc import Generator
+from typing import Optional
+
+import pytest
+from sqlalchemy import String, create_engine, select
+from sqlalchemy.dialects import mssql, mysql, postgresql
+from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column
+from sqlalchemy.schema import CreateIndex, CreateTable
+
+from advanced_alchemy.filters import FullTextSearchFilter, MultiFilter, OrderBy
+from advanced_alchemy.mixins import FullTextSearchMixin
+from advanced_alchemy.mixins.fulltext import tsvector_column
+
+pytestmark = [pytest.mark.unit]
+
+
+class _Base(DeclarativeBase):
+    pass
+
+
+class Article(FullTextSearchMixin, _Base):
+    __tablename__ = "fts_article"
+    __fulltext_columns__ = ("title", "body")
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    title: Mapped[str] = mapped_column(String(100))
+    body: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
+
+
+class Document(_Base):
+    __tablename__ = "fts_document"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    content: Mapped[str] = mapped_column(String(500))
+    search_vector: Mapped[str] = tsvector_column("content", language="simple")
+
+
+@pytest.fixture
+def session() -> Generator[Session, None, None]:
+    engine = create_engine("sqlite://")
+    Article.metadata.create_all(engine, tables=[Article.__table__])  # type: ignore[list-item]
+    with Session(engine) as session:
+        session.add_all(
+            [
+                Article(id=1, title="Quick fox", body="jumps over the lazy dog"),
+                Article(id=2, title="Dog days", body="a dog in the summer heat"),
+                Article(id=3, title="Cats", body=None),
+            ]
+        )
+        session.commit()
+        yield session
+    Article.metadata.drop_all(engine, tables=[Article.__table__])  # type: ignore[list-item]
+    engine.dispose()
+
+
+def _titles(session: Session, filter_: FullTextSearchFilter) -> "list[str]":
+    return list(session.scalars(filter_.append_to_statement(select(Article.title), Article)))
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("dog", {"Quick fox", "Dog days"}),
+        ("dog -summer", {"Quick fox"}),
+        ('"lazy dog"', {"Quick fox"}),
+        ('"dog lazy"', set()),
+        ("summer or cats", {"Dog days", "Cats"}),
+        ('fox" OR *', {"Quick fox"}),
+    ],
+)
+def test_full_text_search_sqlite(session: Session, value: str, expected: "set[str]") -> None:
+    """Test websearch syntax against the SQLite FTS5 index."""
+    assert set(_titles(session, FullTextSearchFilter(field_name={"title", "body"}, value=value))) == expected
+
+
+def test_full_text_search_sqlite_ranks_and_follows_writes(session: Session) -> None:
+    """Test relevance ordering and that the FTS5 index tracks updates and deletes."""
+    filter_ = FullTextSearchFilter(field_name={"title", "body"}, value="dog", order_by_rank=True)
+    assert _titles(session, filter_) == ["Dog days", "Quick fox"]
+
+    session.get_one(Article, 3).body = "the dog sleeps"
+    session.delete(session.get_one(Article, 2))
+    session.commit()
+
+    assert set(_titles(session, FullTextSearchFilter(field_name="body", value="dog"))) == {"Quick fox", "Cats"}
+    ranked = select(Article.title).order_by(FullTextSearchFilter(field_name="body", value="dog").rank(Article).desc())
+    assert set(session.scalars(ranked)) == {"Quick fox", "Cats"}
+
+
+def test_full_text_search_skips_empty_queries_and_unknown_fields(session: Session) -> None:
+    """Test that text without required terms or fields leaves the statement unchanged."""
+    statement = select(Article)
+
+    assert FullTextSearchFilter(field_name="title", value=" -dog ").append_to_statement(statement, Article) is statement
+    assert FullTextSearchFilter(field_name="missing", value="dog").append_to_statement(statement, Article) is statement
+
+
+def test_full_text_search_from_multi_filter(session: Session) -> None:
+    """Test that full-text filters can be built from JSON filter trees."""
+    multi = MultiFilter(filters={"and_": [{"type": "full_text_search", "field_name": "title", "value": "fox"}]})
+
+    assert list(session.scalars(multi.append_to_statement(select(Article.title), Article))) == ["Quick fox"]
+
+
+def test_full_text_search_postgresql_matches_index_expression() -> None:
+    """Test that the PostgreSQL predicate reuses the indexed ``tsvector`` expression."""
+    filter_ = FullTextSearchFilter(field_name={"title", "body"}, value="dog", order_by_rank=True)
+    sql = str(filter_.append_to_statement(select(Article.id), Article).compile(dialect=postgresql.dialect()))
+    index = next(index for index in Article.__table__.indexes if index.name == "ix_fts_article_tsvector")  # type: ignore[attr-defined]
+    ddl = str(CreateIndex(index).compile(dialect=postgresql.dialect()))
+
+    expression = "to_tsvector('english'::regconfig, coalesce(body, '') || ' ' || coalesce(title, ''))"
+    assert f"USING gin ({expression})" in ddl
+    assert expression.replace("(body", "(fts_article.body").replace("(title", "(fts_article.title") in sql
+    assert "@@ websearch_to_tsquery('english'::regconfig, %(param_1)s)" in sql
+    assert "ORDER BY ts_rank(" in sql
+
+
+def test_full_text_search_postgresql_uses_stored_tsvector() -> None:
+    """Test that a single ``tsvector`` field is matched directly."""
+    filter_ = FullTextSearchFilter(field_name="search_vector", value="dog", language="simple")
+    sql = str(filter_.append_to_statement(select(Document.id), Document).compile(dialect=postgresql.dialect()))
+
+    assert "WHERE (fts_document.search_vector @@ websearch_to_tsquery('simple'::regconfig" in sql
+    assert (
+        "search_vector TSVECTOR GENERATED ALWAYS AS (to_tsvector('simple'::regconfig, coalesce(content, ''))) STORED"
+    ) in str(CreateTable(Document.__table__).compile(dialect=postgresql.dialect()))  # type: ignore[arg-type]
+
+
+def test_full_text_search_mysql_and_fallback_dialects() -> None:
+    """Test MATCH ... AGAINST on MySQL and LIKE matching elsewhere."""
+    filter_ = FullTextSearchFilter(field_name={"title", "body"}, value="dog", order_by_rank=True)
+    statement = filter_.append_to_statement(select(Article.id), Article)
+    mysql_sql = str(statement.compile(dialect=mysql.dialect()))
+    mssql_sql = str(statement.compile(dialect=mssql.dialect()))
+    index = next(index for index in Article.__table__.indexes if index.name == "ix_fts_article_fulltext")  # type: ignore[attr-defined]
+
+    assert "WHERE (MATCH (fts_article.body, fts_article.title) AGAINST (%s IN NATURAL LANGUAGE MODE))" in mysql_sql
+    assert str(CreateIndex(index).compile(dialect=mysql.dialect())).startswith("CREATE FULLTEXT INDEX")
+    assert "lower(fts_article.title) LIKE lower(" in mssql_sql
+    assert "ORDER BY (CASE WHEN" in mssql_sql
+
+
+def test_full_text_search_rank_with_order_by() -> None:
+    """Test that the rank expression composes with ``OrderBy``."""
+    rank = FullTextSearchFilter(field_name="title", value="dog").rank(Article)
+    statement = OrderBy(field_name=rank, sort_order="desc").append_to_statement(select(Article.id), Article)
+
+    assert "bm25" in str(statement.compile(dialect=create_engine("sqlite://").dialect))
+
+
+def test_full_text_search_rejects_unsafe_language() -> None:
+    """Test that the text search configuration is validated before being inlined."""
+    with pytest.raises(ValueError):
+        FullTextSearchFilter(field_name="title", value="dog", language="english'; --").get_search_clause(Article)
@@ -0,0 +1,112 @@
+"""Unit tests for compiled MultiFilter trees."""
+
+import datetime
+from collections.abc import Generator
+from typing import Any
+
+import pytest
+from sqlalchemy import String, create_engine, select
+from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column
+
+from advanced_alchemy.filters import MultiFilter, _compile_filter_tree
+
+pytestmark = [pytest.mark.unit]
+
+
+class _Base(DeclarativeBase):
+    pass
+
+
+class Book(_Base):
+    __tablename__ = "multi_filter_book"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    title: Mapped[str] = mapped_column(String(50))
+    pages: Mapped[int]
+    published: Mapped[datetime.date]
+
+
+@pytest.fixture
+def session() -> Generator[Session, None, None]:
+    engine = create_engine("sqlite://")
+    _Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all(
+            [
+                Book(id=1, title="Dune", pages=412, published=datetime.date(1965, 8, 1)),
+                Book(id=2, title="Dune Messiah", pages=256, published=datetime.date(1969, 10, 1)),
+                Book(id=3, title="Emma", pages=474, published=datetime.date(1815, 12, 23)),
+                Book(id=4, title="Ulysses", pages=730, published=datetime.date(1922, 2, 2)),
+            ]
+        )
+        session.commit()
+        yield session
+    engine.dispose()
+
+
+def _tree(title: str, ids: "list[int]", pages: "list[int]", after: Any = None) -> "dict[str, Any]":
+    return {
+        "and_": [
+            {"type": "search", "field_name": "title", "value": title, "ignore_case": True},
+            {
+                "or_": [
+                    {"type": "collection", "field_name": "id", "values": ids},
+                    {"type": "comparison", "field_name": "pages", "operator": "between", "value": pages},
+                ]
+            },
+            {"type": "before_after", "field_name": "published", "before": None, "after": after},
+        ]
+    }
+
+
+def _ids(session: Session, *filters: MultiFilter) -> "list[int]":
+    statement = select(Book.id).order_by(Book.id)
+    for filter_ in filters:
+        statement = filter_.append_to_statement(statement, Book)
+    return list(session.scalars(statement))
+
+
+def test_trees_of_the_same_shape_share_a_compiled_clause(session: Session) -> None:
+    """Test that trees differing only in values are compiled once and rebound."""
+    _compile_filter_tree.cache_clear()
+
+    assert _ids(session, MultiFilter(_tree("dune", [1], [0, 300]))) == [1, 2]
+    assert _ids(session, MultiFilter(_tree("E", [3, 4], [700, 800]))) == [3, 4]
+    assert _ids(session, MultiFilter(_tree("e", [], [0, 100]))) == []
+
+    info = _compile_filter_tree.cache_info()
+    assert (info.misses, info.hits) == (2, 1)
+
+
+def test_compiled_statements_share_sqlalchemy_cache_key() -> None:
+    """Test that rebinding values keeps the statement's cache key."""
+    first = MultiFilter(_tree("dune", [1], [0, 300])).append_to_statement(select(Book), Book)
+    second = MultiFilter(_tree("emma", [2, 3, 4], [1, 2])).append_to_statement(select(Book), Book)
+
+    first_key, second_key = first._generate_cache_key(), second._generate_cache_key()
+    assert first_key is not None
+    assert second_key is not None
+    assert first_key.key == second_key.key
+
+
+def test_none_values_are_part_of_the_shape(session: Session) -> None:
+    """Test that ``None`` arguments, which drop clauses, compile a separate clause."""
+    _compile_filter_tree.cache_clear()
+
+    assert _ids(session, MultiFilter(_tree("u", [4], [0, 1], after=datetime.date(1900, 1, 1)))) == [4]
+    assert _ids(session, MultiFilter(_tree("e", [3], [0, 1]))) == [3]
+    assert _compile_filter_tree.cache_info().misses == 2
+
+
+def test_repeated_trees_bind_separate_values(session: Session) -> None:
+    """Test that two filters of the same shape in one statement keep their own values."""
+    assert _ids(session, MultiFilter(_tree("dune", [1, 2], [0, 1])), MultiFilter(_tree("", [2, 3], [0, 1]))) == [2]
+
+
+def test_unhashable_trees_are_built_directly(session: Session) -> None:
+    """Test that trees holding model attributes skip the compile step."""
+    _compile_filter_tree.cache_clear()
+    tree = {"and_": [{"type": "comparison", "field_name": Book.pages, "operator": "gt", "value": 450}]}
+
+    assert _ids(session, MultiFilter(tree)) == [3, 4]
+    assert _compile_filter_tree.cache_info().currsize == 0
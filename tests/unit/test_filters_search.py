@@ -0,0 +1,91 @@
+"""Unit tests for SearchFilter modes and their index helpers."""
+
+import pytest
+from sqlalchemy import String, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+from sqlalchemy.schema import CreateIndex
+
+from advanced_alchemy.filters import NotInSearchFilter, OrderBy, SearchFilter
+from advanced_alchemy.mixins.fulltext import prefix_index, trigram_index
+
+pytestmark = [pytest.mark.unit]
+
+
+class _Base(DeclarativeBase):
+    pass
+
+
+class Customer(_Base):
+    __tablename__ = "search_customer"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str] = mapped_column(String(100))
+    email: Mapped[str] = mapped_column(String(100))
+
+    __table_args__ = (
+        prefix_index("search_customer", "name"),
+        prefix_index("search_customer", "email", ignore_case=True),
+        trigram_index("search_customer", "name"),
+    )
+
+
+def _where(filter_: SearchFilter) -> str:
+    statement = filter_.append_to_statement(select(Customer.id), Customer)
+    return str(statement.compile(dialect=postgresql.dialect())).split("WHERE ")[1]
+
+
+def test_prefix_mode_matches_pattern_ops_indexes() -> None:
+    """Test that prefix searches render the expressions the prefix indexes cover."""
+    ddl = {
+        index.name: str(CreateIndex(index).compile(dialect=postgresql.dialect()))
+        for index in Customer.__table__.indexes  # type: ignore[attr-defined]
+    }
+
+    assert ddl["ix_search_customer_name_prefix"].endswith("(name text_pattern_ops)")
+    assert ddl["ix_search_customer_email_lower_prefix"].endswith("(lower(email) text_pattern_ops)")
+    assert _where(SearchFilter(field_name="name", value="Jo", mode="prefix")) == (
+        "search_customer.name LIKE %(name_1)s ESCAPE '/'"
+    )
+    assert _where(SearchFilter(field_name="email", value="Jo", ignore_case=True, mode="prefix")) == (
+        "lower(search_customer.email) LIKE %(lower_1)s ESCAPE '/'"
+    )
+
+
+def test_prefix_mode_escapes_wildcards() -> None:
+    """Test that LIKE wildcards in the value match literally."""
+    statement = SearchFilter(field_name="name", value="50%_off/", mode="prefix").append_to_statement(
+        select(Customer.id), Customer
+    )
+
+    assert statement.compile().params == {"name_1": "50/%/_off//%"}
+
+
+def test_trigram_mode_uses_pg_trgm() -> None:
+    """Test the pg_trgm operator, its negation, similarity ranking and GIN index."""
+    index = next(index for index in Customer.__table__.indexes if index.name.endswith("_trgm"))  # type: ignore[attr-defined]
+    search = SearchFilter(field_name={"name", "email"}, value="jon", mode="trigram")
+    ordered = OrderBy(field_name=search.similarity(Customer), sort_order="desc").append_to_statement(
+        select(Customer.id), Customer
+    )
+
+    assert str(CreateIndex(index).compile(dialect=postgresql.dialect())).endswith("USING gin (name gin_trgm_ops)")
+    assert _where(SearchFilter(field_name="name", value="jon", mode="trigram")) == (
+        "(search_customer.name %% %(param_1)s)"
+    )
+    assert _where(NotInSearchFilter(field_name="name", value="jon", mode="trigram")) == (
+        "(NOT (search_customer.name %% %(param_1)s))"
+    )
+    assert "ORDER BY greatest(similarity(search_customer.email, %(similarity_1)s), similarity(" in str(
+        ordered.compile(dialect=postgresql.dialect())
+    )
+
+
+def test_trigram_mode_falls_back_to_contains() -> None:
+    """Test that other dialects match trigram searches as case-insensitive substrings."""
+    statement = SearchFilter(field_name="name", value="jon", mode="trigram").append_to_statement(
+        select(Customer.id), Customer
+    )
+
+    assert "lower(search_customer.name) LIKE lower(:param_1)" in str(statement)
+    assert statement.compile().params == {"param_1": "%jon%"}
@@ -0,0 +1,173 @@
+"""Unit tests for nearest-neighbor vector filters."""
+
+from collections.abc import Generator
+from typing import Any, Optional, cast
+from unittest.mock import create_autospec
+
+import pytest
+from sqlalchemy import Integer, create_engine, delete, select
+from sqlalchemy.dialects import oracle, postgresql
+from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column
+
+from advanced_alchemy.filters import VectorSimilarityFilter
+from advanced_alchemy.repository import SQLAlchemySyncRepository
+from advanced_alchemy.repository.memory import SQLAlchemySyncMockRepository
+from advanced_alchemy.types import Vector
+from advanced_alchemy.types.vector import register_sqlite_vector_functions
+
+pytestmark = [pytest.mark.unit]
+
+
+class _Base(DeclarativeBase):
+    pass
+
+
+class Document(_Base):
+    __tablename__ = "vector_filter_document"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    rank: Mapped[int] = mapped_column(Integer)
+    embedding: Mapped[list[float]] = mapped_column(Vector(3))
+
+
+class Point(_Base):
+    __tablename__ = "vector_filter_point"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    json_embedding: Mapped[Optional[list[float]]] = mapped_column(Vector(2))
+    binary_embedding: Mapped[Optional[list[float]]] = mapped_column(Vector(2, fallback_format="binary"))
+
+
+class PointRepository(SQLAlchemySyncRepository[Point]):
+    model_type = Point
+
+
+class PointMockRepository(SQLAlchemySyncMockRepository[Point]):
+    model_type = Point
+
+
+_POINTS = {1: [1.0, 0.0], 2: [0.0, 1.0], 3: [0.8, 0.6], 4: [-1.0, 0.1], 5: None}
+
+
+@pytest.fixture
+def session() -> Generator[Session, None, None]:
+    engine = create_engine("sqlite://")
+    register_sqlite_vector_functions(engine)
+    _Base.metadata.create_all(engine, tables=[Point.__table__])  # type: ignore[list-item]
+    with Session(engine) as session:
+        session.add_all(
+            [Point(id=id_, json_embedding=vector, binary_embedding=vector) for id_, vector in _POINTS.items()]
+        )
+        session.commit()
+        yield session
+    engine.dispose()
+
+
+def _sql(statement: Any, dialect: Any) -> str:
+    return " ".join(str(statement.compile(dialect=dialect)).split())
+
+
+def test_orders_by_distance_and_limits_to_k() -> None:
+    """Test that the filter compiles to ``ORDER BY distance LIMIT k`` ahead of existing orderings."""
+    statement = VectorSimilarityFilter("embedding", [1.0, 0.0, 0.0], k=5, metric="l2").append_to_statement(
+        select(Document.id).order_by(Document.rank), Document
+    )
+
+    sql = _sql(statement, postgresql.dialect())
+    assert sql.endswith(
+        "ORDER BY (vector_filter_document.embedding <-> %(param_1)s), vector_filter_document.rank LIMIT %(param_2)s"
+    )
+
+
+@pytest.mark.parametrize(
+    ("metric", "operator"), [("cosine", "<=>"), ("l2", "<->"), ("l1", "<+>"), ("inner_product", "<#>")]
+)
+def test_metrics_use_matching_operator(metric: Any, operator: str) -> None:
+    """Test that each metric uses its pgvector distance operator."""
+    statement = VectorSimilarityFilter(Document.embedding, [1.0, 0.0, 0.0], metric=metric).append_to_statement(
+        select(Document.id), Document
+    )
+
+    assert f"embedding {operator} " in _sql(statement, postgresql.dialect())
+
+
+def test_max_distance_adds_a_where_clause() -> None:
+    """Test that ``max_distance`` restricts matches, including on DELETE statements."""
+    filter_ = VectorSimilarityFilter("embedding", [1.0, 0.0, 0.0], k=None, max_distance=0.25)
+
+    select_sql = _sql(filter_.append_to_statement(select(Document.id), Document), postgresql.dialect())
+    delete_sql = _sql(filter_.append_to_statement(delete(Document), Document), postgresql.dialect())
+
+    assert "WHERE (vector_filter_document.embedding <=> %(param_1)s) <= %(param_2)s" in select_sql
+    assert "LIMIT" not in select_sql
+    assert delete_sql == (
+        "DELETE FROM vector_filter_document WHERE (vector_filter_document.embedding <=> %(param_1)s) <= %(param_2)s"
+    )
+
+
+def test_oracle_limits_orm_selects_with_fetch_first() -> None:
+    """Test that ORM selects on Oracle order by ``VECTOR_DISTANCE`` and keep ``k`` rows."""
+    statement = VectorSimilarityFilter("embedding", [1.0, 0.0, 0.0], k=3).append_to_statement(
+        select(Document.id), Document
+    )
+
+    assert _sql(statement, oracle.dialect()) == (
+        "SELECT vector_filter_document.id FROM vector_filter_document "
+        "ORDER BY VECTOR_DISTANCE(vector_filter_document.embedding, :param_1, COSINE) "
+        "FETCH FIRST __[POSTCOMPILE_param_2] ROWS ONLY"
+    )
+
+
+def test_search_settings_are_execution_options() -> None:
+    """Test that ``ef_search`` and ``probes`` are carried as execution options."""
+    statement = VectorSimilarityFilter("embedding", [1.0, 0.0, 0.0], ef_search=100, probes=4).append_to_statement(
+        select(Document.id), Document
+    )
+    untuned = VectorSimilarityFilter("embedding", [1.0, 0.0, 0.0]).append_to_statement(select(Document.id), Document)
+
+    assert statement.get_execution_options() == {"hnsw_ef_search": 100, "ivfflat_probes": 4}
+    assert untuned.get_execution_options() == {}
+
+
+@pytest.mark.parametrize("field_name", ["json_embedding", "binary_embedding"])
+@pytest.mark.parametrize(
+    ("metric", "vector", "expected"),
+    [
+        ("cosine", [0.9, 0.2], [1, 3, 2]),
+        ("l2", [0.9, 0.2], [1, 3, 2]),
+        ("l1", [-0.5, 0.5], [4, 2, 3]),
+        ("inner_product", [0.0, 2.0], [2, 3, 4]),
+    ],
+)
+def test_sqlite_computes_distances_in_python(
+    session: Session, field_name: str, metric: Any, vector: "list[float]", expected: "list[int]"
+) -> None:
+    """Test that SQLite answers nearest-neighbor queries for JSON and binary vectors."""
+    repository = PointRepository(session=session)
+
+    nearest = repository.get_many(VectorSimilarityFilter(field_name, vector, k=3, metric=metric))
+
+    assert [point.id for point in nearest] == expected
+
+
+def test_sqlite_sorts_missing_vectors_last(session: Session) -> None:
+    """Test that rows without a vector come after every match and fail ``max_distance``."""
+    repository = PointRepository(session=session)
+
+    assert [point.id for point in repository.get_many(VectorSimilarityFilter("json_embedding", [1.0, 0.0], k=None))][
+        -1
+    ] == 5
+    assert repository.count(VectorSimilarityFilter("json_embedding", [1.0, 0.0], k=None, max_distance=0.5)) == 2
+
+
+def test_mock_repository_ranks_by_distance() -> None:
+    """Test that the in-memory repository applies the filter without a database."""
+    session = cast(Session, create_autospec(Session, instance=True))
+    repository = PointMockRepository(session=session)
+    repository.add_many([Point(id=id_, json_embedding=vector) for id_, vector in _POINTS.items()])
+
+    nearest = repository.get_many(VectorSimilarityFilter("json_embedding", [0.9, 0.2], k=3))
+    within = repository.get_many(VectorSimilarityFilter("json_embedding", [0.0, 1.0], k=None, max_distance=0.5))
+
+    assert [point.id for point in nearest] == [1, 3, 2]
+    assert [point.id for point in within] == [2, 3]
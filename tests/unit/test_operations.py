@@ -58,6 +58,24 @@ class TestOnConflictUpsert:
         assert upsert_stmt is not None
         assert hasattr(upsert_stmt, "on_conflict_do_update")
 
+    def test_create_multi_row_upsert(self, sample_table: Table) -> None:
+        """Test that a list of rows produces a single multi-row upsert."""
+        from sqlalchemy.dialects import postgresql
+
+        rows = [{"key": f"key_{i}", "namespace": "test_ns", "value": f"value_{i}"} for i in range(3)]
+
+        upsert_stmt = OnConflictUpsert.create_upsert(
+            table=sample_table,
+            values=rows,
+            conflict_columns=["key", "namespace"],
+            dialect_name="postgresql",
+        )
+
+        compiled = str(upsert_stmt.compile(dialect=postgresql.dialect()))
+        assert "VALUES (%(key_m0)s, %(namespace_m0)s, %(value_m0)s), (%(key_m1)s" in compiled
+        assert "%(key_m2)s" in compiled
+        assert "ON CONFLICT (key, namespace) DO UPDATE SET value = excluded.value" in compiled
+
     def test_create_mysql_upsert(self, sample_table: Table) -> None:
         """Test MySQL ON DUPLICATE KEY UPDATE upsert generation."""
         values = {"key": "test_key", "namespace": "test_ns", "value": "test_value"}
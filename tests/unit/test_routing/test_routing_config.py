@@ -10,7 +10,9 @@ def test_routing_strategy_enum() -> None:
     """Test that RoutingStrategy enum has expected values."""
     assert RoutingStrategy.ROUND_ROBIN is not None
     assert RoutingStrategy.RANDOM is not None
-    assert len(RoutingStrategy) == 2
+    assert RoutingStrategy.LEAST_CONNECTIONS is not None
+    assert RoutingStrategy.LATENCY_EWMA is not None
+    assert len(RoutingStrategy) == 4
 
 
 def test_replica_config_defaults() -> None:
@@ -5,7 +5,10 @@ Tests the context-based state management for routing decisions.
 
 import pytest
 
+from advanced_alchemy.config.routing import StickyWindow
+from advanced_alchemy.exceptions import ImproperConfigurationError
 from advanced_alchemy.routing.context import (
+    consume_sticky_primary,
     force_primary_var,
     primary_context,
     replica_context,
@@ -239,3 +242,62 @@ def test_context_manager_as_decorator_not_supported() -> None:
         assert force_primary_var.get() is True
 
     assert force_primary_var.get() is False
+
+
+def test_consume_sticky_primary_without_window_never_expires() -> None:
+    """Test that stickiness without a window lasts for the whole context."""
+    set_sticky_primary()
+
+    assert all(consume_sticky_primary(None) for _ in range(100))
+
+
+def test_consume_sticky_primary_statement_window() -> None:
+    """Test that stickiness expires after the configured number of statements."""
+    set_sticky_primary()
+    window = StickyWindow(statements=2)
+
+    assert consume_sticky_primary(window) is True
+    assert consume_sticky_primary(window) is True
+    assert consume_sticky_primary(window) is False
+    assert stick_to_primary_var.get() is False
+
+
+def test_consume_sticky_primary_time_window(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that stickiness expires after the configured duration."""
+    import advanced_alchemy.routing.context as context_module
+
+    clock = [100.0]
+    monkeypatch.setattr(context_module.time, "monotonic", lambda: clock[0])
+    set_sticky_primary()
+    window = StickyWindow(seconds=5.0)
+
+    clock[0] = 104.0
+    assert consume_sticky_primary(window) is True
+    clock[0] = 105.0
+    assert consume_sticky_primary(window) is False
+    assert should_use_primary() is False
+
+
+def test_set_sticky_primary_restarts_window() -> None:
+    """Test that a new write restarts the sticky window."""
+    window = StickyWindow(statements=1)
+    set_sticky_primary()
+    assert consume_sticky_primary(window) is True
+
+    set_sticky_primary()
+    assert consume_sticky_primary(window) is True
+    assert consume_sticky_primary(window) is False
+
+
+def test_consume_sticky_primary_not_sticky() -> None:
+    """Test that nothing is consumed when stickiness is not set."""
+    reset_routing_context()
+
+    assert consume_sticky_primary(StickyWindow(statements=1)) is False
+
+
+@pytest.mark.parametrize("kwargs", [{}, {"seconds": 0}, {"statements": 0}])
+def test_sticky_window_validation(kwargs: dict[str, float]) -> None:
+    """Test that StickyWindow requires at least one positive limit."""
+    with pytest.raises(ImproperConfigurationError):
+        StickyWindow(**kwargs)  # type: ignore[arg-type]
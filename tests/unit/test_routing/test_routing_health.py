@@ -0,0 +1,404 @@
+"""Unit tests for replica health checks and circuit breaking."""
+
+import threading
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import Engine, create_engine, select
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from advanced_alchemy.config.routing import HealthCheckConfig, RoutingConfig
+from advanced_alchemy.exceptions import ImproperConfigurationError
+from advanced_alchemy.routing.context import use_bind_group
+from advanced_alchemy.routing.health import (
+    AsyncReplicaHealthMonitor,
+    CircuitBreaker,
+    CircuitState,
+    SyncReplicaHealthMonitor,
+)
+from advanced_alchemy.routing.maker import RoutingAsyncSessionMaker, RoutingSyncSessionMaker
+from advanced_alchemy.routing.selectors import (
+    EngineSelector,
+    LatencyEWMASelector,
+    LeastConnectionsSelector,
+    RandomSelector,
+    RoundRobinSelector,
+)
+from advanced_alchemy.routing.session import RoutingSyncSession
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _unreachable_url(tmp_path: Path) -> str:
+    return f"sqlite:///{tmp_path / 'missing' / 'replica.db'}"
+
+
+def test_circuit_breaker_opens_after_failure_threshold() -> None:
+    """Test that consecutive failures open the circuit."""
+    breaker = CircuitBreaker(failure_threshold=3, clock=FakeClock())
+
+    assert breaker.record_failure() is False
+    assert breaker.record_failure() is False
+    assert breaker.record_failure() is True
+    assert breaker.state is CircuitState.OPEN
+
+
+def test_circuit_breaker_success_resets_failure_count() -> None:
+    """Test that a success between failures resets the failure streak."""
+    breaker = CircuitBreaker(failure_threshold=2, clock=FakeClock())
+
+    breaker.record_failure()
+    breaker.record_success()
+    assert breaker.record_failure() is False
+    assert breaker.state is CircuitState.CLOSED
+
+
+def test_circuit_breaker_half_open_after_recovery_timeout() -> None:
+    """Test that an open circuit allows probes only after the recovery timeout."""
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=30.0, success_threshold=2, clock=clock)
+    breaker.record_failure()
+
+    clock.now = 10.0
+    assert breaker.allow_probe() is False
+    clock.now = 30.0
+    assert breaker.allow_probe() is True
+    assert breaker.state is CircuitState.HALF_OPEN
+
+    assert breaker.record_success() is False
+    assert breaker.record_success() is True
+    assert breaker.state is CircuitState.CLOSED
+
+
+def test_circuit_breaker_half_open_failure_reopens() -> None:
+    """Test that a failed half-open probe reopens the circuit and restarts the cooldown."""
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=5.0, clock=clock)
+    for _ in range(3):
+        breaker.record_failure()
+
+    clock.now = 5.0
+    assert breaker.allow_probe() is True
+    assert breaker.record_failure() is True
+    assert breaker.state is CircuitState.OPEN
+    assert breaker.allow_probe() is False
+
+
+@pytest.mark.parametrize("selector_cls", [RoundRobinSelector, RandomSelector, LeastConnectionsSelector])
+def test_selectors_skip_ejected_engines(selector_cls: "type[EngineSelector[Engine]]") -> None:
+    """Test that ejected engines are never selected and readmitted ones are."""
+    engines: list[Engine] = [MagicMock(name=f"engine_{i}") for i in range(3)]
+    selector = selector_cls(engines)
+
+    selector.eject(engines[1])
+
+    assert selector.is_ejected(engines[1])
+    assert selector.available_engines == [engines[0], engines[2]]
+    assert engines[1] not in {selector.next() for _ in range(30)}
+
+    selector.readmit(engines[1])
+    assert not selector.is_ejected(engines[1])
+    assert engines[1] in {selector.next() for _ in range(60)}
+
+
+def test_latency_selector_skips_ejected_engines() -> None:
+    """Test that the latency-aware selector skips ejected engines."""
+    fast = create_engine("sqlite://")
+    slow = create_engine("sqlite://")
+    selector = LatencyEWMASelector([fast, slow])
+    selector.record(fast, 0.001)
+    selector.record(slow, 0.500)
+
+    selector.eject(fast)
+
+    assert selector.next() is slow
+
+
+def test_selector_with_all_engines_ejected() -> None:
+    """Test that a selector with every engine ejected reports no engines and raises on next()."""
+    engines: list[Engine] = [MagicMock(name="engine")]
+    selector = RoundRobinSelector(engines)
+
+    selector.eject(engines[0])
+
+    assert selector.has_engines() is False
+    assert selector.engines == engines
+    with pytest.raises(RuntimeError, match="No healthy engines available"):
+        selector.next()
+
+
+def test_session_falls_back_to_primary_when_replicas_ejected() -> None:
+    """Test that reads go to the primary when no replica is healthy."""
+    primary: Engine = MagicMock(name="primary")
+    replica: Engine = MagicMock(name="replica")
+    config = RoutingConfig(primary_connection_string="postgresql://primary/db", read_replicas=["postgresql://r/db"])
+    selector = RoundRobinSelector([replica])
+    session = RoutingSyncSession(
+        routing_config=config,
+        selectors={config.default_group: RoundRobinSelector([primary]), config.read_group: selector},
+        default_engine=primary,
+    )
+
+    assert session.get_bind(clause=select(1)) is replica
+    selector.eject(replica)
+    assert session.get_bind(clause=select(1)) is primary
+
+
+def test_explicit_read_bind_group_falls_back_to_primary_when_replicas_ejected() -> None:
+    """Test that an explicit non-shard bind group still falls back to the primary when ejected."""
+    primary: Engine = MagicMock(name="primary")
+    replica: Engine = MagicMock(name="replica")
+    config = RoutingConfig(primary_connection_string="postgresql://primary/db", read_replicas=["postgresql://r/db"])
+    selector = RoundRobinSelector([replica])
+    session = RoutingSyncSession(
+        routing_config=config,
+        selectors={config.default_group: RoundRobinSelector([primary]), config.read_group: selector},
+        default_engine=primary,
+    )
+    selector.eject(replica)
+
+    assert session.get_bind(clause=select(1).execution_options(bind_group=config.read_group)) is primary
+    with use_bind_group(config.read_group):
+        assert session.get_bind(clause=select(1)) is primary
+
+
+def test_health_check_config_validation() -> None:
+    """Test that HealthCheckConfig rejects invalid thresholds."""
+    with pytest.raises(ImproperConfigurationError):
+        HealthCheckConfig(failure_threshold=0)
+    with pytest.raises(ImproperConfigurationError):
+        HealthCheckConfig(interval=0)
+
+
+def test_sync_monitor_ejects_and_readmits_engine(tmp_path: Path) -> None:
+    """Test that the sync monitor ejects failing engines and re-admits recovered ones."""
+    healthy = create_engine("sqlite://")
+    failing = create_engine(_unreachable_url(tmp_path))
+    selector = RoundRobinSelector([healthy, failing])
+    monitor = SyncReplicaHealthMonitor(
+        {"read": selector},
+        HealthCheckConfig(failure_threshold=2, recovery_timeout=0.0),
+    )
+
+    monitor.check_now()
+    assert not selector.is_ejected(failing)
+    monitor.check_now()
+    assert selector.is_ejected(failing)
+    assert not selector.is_ejected(healthy)
+    assert monitor.breaker_for(failing).state is CircuitState.OPEN
+
+    (tmp_path / "missing").mkdir()
+    monitor.check_now()
+    assert not selector.is_ejected(failing)
+    assert monitor.breaker_for(failing).state is CircuitState.CLOSED
+
+
+def test_sync_monitor_times_out_hanging_probe() -> None:
+    """Test that a hanging sync probe counts as a failure after the timeout without delaying other engines."""
+    healthy = create_engine("sqlite://")
+    hanging = create_engine("sqlite://")
+    release = threading.Event()
+    probed: list[Engine] = []
+
+    class HangingMonitor(SyncReplicaHealthMonitor):
+        def _probe(self, engine: Engine) -> bool:
+            probed.append(engine)
+            if engine is hanging:
+                release.wait()
+            return super()._probe(engine)
+
+    selector = RoundRobinSelector([hanging, healthy])
+    monitor = HangingMonitor(
+        {"read": selector}, HealthCheckConfig(timeout=0.05, failure_threshold=1, recovery_timeout=0.0)
+    )
+
+    started = time.monotonic()
+    monitor.check_now()
+    monitor.check_now()
+    elapsed = time.monotonic() - started
+    release.set()
+
+    assert elapsed < 1.0
+    assert selector.is_ejected(hanging)
+    assert not selector.is_ejected(healthy)
+    assert probed.count(hanging) == 1
+    assert probed.count(healthy) == 2
+
+
+def test_sync_monitor_stop_waits_for_running_probes() -> None:
+    """Test that stopping the sync monitor lets in-flight probes finish before disposing their engines."""
+    replica = create_engine("sqlite://")
+    entered = threading.Event()
+    release = threading.Event()
+    results: list[bool] = []
+
+    class SlowMonitor(SyncReplicaHealthMonitor):
+        def _probe(self, engine: Engine) -> bool:
+            probe_engine = self._probe_engine(engine)
+            entered.set()
+            release.wait()
+            with probe_engine.connect() as conn:
+                results.append(conn.execute(select(1)).scalar_one() == 1)
+            return results[-1]
+
+    monitor = SlowMonitor({"read": RoundRobinSelector([replica])}, HealthCheckConfig(timeout=5.0))
+    probe = monitor._start_probe(replica)
+    assert entered.wait(1.0)
+    dispose = MagicMock(wraps=monitor._probe_engines[id(replica)].dispose)
+    monitor._probe_engines[id(replica)].dispose = dispose  # type: ignore[method-assign]
+    threading.Timer(0.05, release.set).start()
+
+    monitor.stop()
+
+    assert probe.done()
+    assert results == [True]
+    dispose.assert_called_once_with()
+    assert not monitor._probe_engines
+
+
+def test_sync_monitor_stop_keeps_engines_of_hanging_probes() -> None:
+    """Test that a probe outlasting the stop timeout keeps its engine instead of having it disposed."""
+    replica = create_engine("sqlite://")
+    release = threading.Event()
+
+    class HangingMonitor(SyncReplicaHealthMonitor):
+        def _probe(self, engine: Engine) -> bool:
+            self._probe_engine(engine)
+            release.wait()
+            return True
+
+    monitor = HangingMonitor({"read": RoundRobinSelector([replica])}, HealthCheckConfig(timeout=0.05))
+    probe = monitor._start_probe(replica)
+    while id(replica) not in monitor._probe_engines:
+        time.sleep(0.001)
+
+    started = time.monotonic()
+    monitor.stop()
+
+    assert time.monotonic() - started < 1.0
+    assert not probe.done()
+    assert id(replica) in monitor._probe_engines
+    release.set()
+    assert probe.result(timeout=1.0) is True
+    monitor.stop()
+    assert not monitor._probe_engines
+
+
+def test_sync_monitor_probe_bypasses_saturated_pool(tmp_path: Path) -> None:
+    """Test that a replica whose pool is exhausted is still probed healthy."""
+    replica = create_engine(f"sqlite:///{tmp_path / 'replica.db'}", pool_size=1, max_overflow=0, pool_timeout=5)
+    selector = RoundRobinSelector([replica])
+    monitor = SyncReplicaHealthMonitor(
+        {"read": selector}, HealthCheckConfig(timeout=0.5, failure_threshold=1, recovery_timeout=0.0)
+    )
+
+    with replica.connect():
+        started = time.monotonic()
+        monitor.check_now()
+        elapsed = time.monotonic() - started
+
+    assert elapsed < 0.5
+    assert not selector.is_ejected(replica)
+    monitor.stop()
+    replica.dispose()
+
+
+def test_sync_monitor_start_and_stop() -> None:
+    """Test that the sync monitor thread starts and stops cleanly."""
+    selector = RoundRobinSelector([create_engine("sqlite://")])
+    monitor = SyncReplicaHealthMonitor({"read": selector}, HealthCheckConfig(interval=0.01))
+
+    monitor.start()
+    assert monitor.is_running
+    monitor.stop()
+    assert not monitor.is_running
+
+
+async def test_async_monitor_ejects_failing_engine(tmp_path: Path) -> None:
+    """Test that the async monitor ejects failing engines."""
+    healthy = create_async_engine("sqlite+aiosqlite://")
+    failing = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'missing' / 'replica.db'}")
+    selector: RoundRobinSelector[AsyncEngine] = RoundRobinSelector([healthy, failing])
+    monitor = AsyncReplicaHealthMonitor({"read": selector}, HealthCheckConfig(failure_threshold=1))
+
+    await monitor.check_now()
+
+    assert selector.is_ejected(failing)
+    assert not selector.is_ejected(healthy)
+    await healthy.dispose()
+    await failing.dispose()
+
+
+async def test_async_monitor_probe_bypasses_saturated_pool(tmp_path: Path) -> None:
+    """Test that an async replica whose pool is exhausted is still probed healthy."""
+    replica = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'replica.db'}", pool_size=1, max_overflow=0, pool_timeout=5
+    )
+    selector: RoundRobinSelector[AsyncEngine] = RoundRobinSelector([replica])
+    monitor = AsyncReplicaHealthMonitor(
+        {"read": selector}, HealthCheckConfig(timeout=0.5, failure_threshold=1, recovery_timeout=0.0)
+    )
+
+    async with replica.connect():
+        await monitor.check_now()
+
+    assert not selector.is_ejected(replica)
+    await monitor.stop()
+    await replica.dispose()
+
+
+def test_sync_maker_starts_and_stops_health_checks() -> None:
+    """Test that the sync maker starts health checks on first use and stops them on close."""
+    maker = RoutingSyncSessionMaker(
+        routing_config=RoutingConfig(
+            primary_connection_string="sqlite://",
+            read_replicas=["sqlite://"],
+            health_check=HealthCheckConfig(interval=0.01),
+        )
+    )
+    monitor = maker.health_monitor
+    assert monitor is not None
+    assert not monitor.is_running
+
+    maker().close()
+    assert monitor.is_running
+
+    maker.close_all()
+    assert not monitor.is_running
+
+
+async def test_async_maker_starts_and_stops_health_checks() -> None:
+    """Test that the async maker starts health checks on first use within a running loop."""
+    maker = RoutingAsyncSessionMaker(
+        routing_config=RoutingConfig(
+            primary_connection_string="sqlite+aiosqlite://",
+            read_replicas=["sqlite+aiosqlite://"],
+            health_check=HealthCheckConfig(interval=0.01),
+        )
+    )
+    monitor = maker.health_monitor
+    assert monitor is not None
+
+    await maker().close()
+    assert monitor.is_running
+
+    await maker.close_all()
+    assert not monitor.is_running
+
+
+def test_maker_without_health_checks_has_no_monitor() -> None:
+    """Test that no monitor is created unless health checks are configured."""
+    maker = RoutingSyncSessionMaker(
+        routing_config=RoutingConfig(primary_connection_string="sqlite://", read_replicas=["sqlite://"])
+    )
+
+    assert maker.health_monitor is None
+    maker.close_all()
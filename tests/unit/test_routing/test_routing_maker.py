@@ -17,7 +17,12 @@ from advanced_alchemy.routing.maker import (
     dispose_session_maker_async,
     dispose_session_maker_sync,
 )
-from advanced_alchemy.routing.selectors import RandomSelector, RoundRobinSelector
+from advanced_alchemy.routing.selectors import (
+    LatencyEWMASelector,
+    LeastConnectionsSelector,
+    RandomSelector,
+    RoundRobinSelector,
+)
 from advanced_alchemy.routing.session import RoutingSyncSession
 
 
@@ -94,6 +99,28 @@ def test_sync_session_maker_creates_random_selector(routing_config: RoutingConfi
     assert isinstance(session._selectors[config.read_group], RandomSelector)
 
 
+@pytest.mark.parametrize(
+    ("strategy", "selector_type"),
+    [
+        (RoutingStrategy.LEAST_CONNECTIONS, LeastConnectionsSelector),
+        (RoutingStrategy.LATENCY_EWMA, LatencyEWMASelector),
+    ],
+)
+def test_sync_session_maker_creates_load_aware_selectors(strategy: RoutingStrategy, selector_type: type) -> None:
+    """Test that RoutingSyncSessionMaker creates load-aware selectors when configured."""
+    config = RoutingConfig(
+        primary_connection_string="sqlite://",
+        read_replicas=["sqlite://", "sqlite://"],
+        routing_strategy=strategy,
+    )
+
+    maker = RoutingSyncSessionMaker(routing_config=config)
+
+    session = maker()
+    assert isinstance(session._selectors[config.read_group], selector_type)
+    maker.close_all()
+
+
 def test_sync_session_maker_call_creates_session(routing_config: RoutingConfig) -> None:
     """Test that calling the maker creates a RoutingSyncSession."""
 
@@ -0,0 +1,385 @@
+"""Unit tests for replication-position (read-your-writes) routing."""
+
+import contextvars
+from collections.abc import Iterator, MutableMapping
+from typing import Any, Optional
+
+import pytest
+from sqlalchemy import Column, Engine, Integer, MetaData, Table, create_engine, insert, select
+from sqlalchemy.exc import OperationalError
+
+from advanced_alchemy.config.routing import RoutingConfig
+from advanced_alchemy.routing.context import (
+    clear_replication_token,
+    get_replication_token,
+    primary_context,
+    replication_token_context,
+    reset_routing_context,
+    set_replication_token,
+    stick_to_primary_var,
+)
+from advanced_alchemy.routing.maker import RoutingSyncSessionMaker
+from advanced_alchemy.routing.replication import (
+    FakePositionProbe,
+    MySQLGTIDProbe,
+    PostgresLSNProbe,
+    ReplicaPositionTracker,
+    ReplicationPositionProbe,
+    ReplicationTokenMiddleware,
+)
+
+metadata = MetaData()
+items = Table("items", metadata, Column("id", Integer, primary_key=True))
+
+
+@pytest.fixture(autouse=True)
+def _isolated_token() -> Iterator[None]:
+    with replication_token_context():
+        yield
+
+
+@pytest.fixture
+def probe() -> FakePositionProbe:
+    return FakePositionProbe()
+
+
+@pytest.fixture
+def maker(probe: FakePositionProbe) -> Iterator[RoutingSyncSessionMaker]:
+    session_maker = RoutingSyncSessionMaker(
+        routing_config=RoutingConfig(
+            primary_connection_string="sqlite://",
+            read_replicas=["sqlite://", "sqlite://"],
+            replication_probe=probe,
+        )
+    )
+    for engine in [session_maker.primary_engine, *session_maker.replica_engines]:
+        metadata.create_all(engine)
+    yield session_maker
+    session_maker.close_all()
+
+
+def test_probes_satisfy_protocol() -> None:
+    """Test that the bundled probes implement the probe protocol."""
+    assert isinstance(PostgresLSNProbe(), ReplicationPositionProbe)
+    assert isinstance(MySQLGTIDProbe(), ReplicationPositionProbe)
+    assert isinstance(FakePositionProbe(), ReplicationPositionProbe)
+
+
+@pytest.mark.parametrize(
+    ("replica", "token", "expected"),
+    [
+        ("0/3000060", "0/3000060", True),
+        ("0/3000061", "0/3000060", True),
+        ("0/300005F", "0/3000060", False),
+        ("1/0", "0/FFFFFFFF", True),
+    ],
+)
+def test_postgres_lsn_comparison(replica: str, token: str, expected: bool) -> None:
+    """Test WAL LSN ordering across the high/low halves."""
+    assert PostgresLSNProbe().is_caught_up(replica, token) is expected
+
+
+@pytest.mark.parametrize(
+    ("replica", "token", "expected"),
+    [
+        ("3e11fa47-71ca-11e1-9e33-c80aa9429562:1-10", "3E11FA47-71CA-11E1-9E33-C80AA9429562:1-10", True),
+        ("3e11fa47-71ca-11e1-9e33-c80aa9429562:1-9", "3e11fa47-71ca-11e1-9e33-c80aa9429562:1-10", False),
+        ("aaaa:1-5:7-9,bbbb:1-3", "aaaa:1-5,bbbb:2", True),
+        ("aaaa:1-5:7-9", "aaaa:6", False),
+        ("aaaa:1-5", "aaaa:1-5,bbbb:1", False),
+        ("aaaa:1-5:blue:1-2", "aaaa:blue:2", True),
+        ("aaaa:1-5", "aaaa:blue:2", False),
+    ],
+)
+def test_mysql_gtid_subset(replica: str, token: str, expected: bool) -> None:
+    """Test GTID-set containment including multiple sources, gaps and tags."""
+    assert MySQLGTIDProbe().is_caught_up(replica, token) is expected
+
+
+@pytest.mark.parametrize(
+    ("probe", "token"),
+    [
+        (PostgresLSNProbe(), "garbage"),
+        (PostgresLSNProbe(), "0/16B3748/1"),
+        (PostgresLSNProbe(), "-1/0"),
+        (MySQLGTIDProbe(), "garbage"),
+        (MySQLGTIDProbe(), "aaaa"),
+        (MySQLGTIDProbe(), "aaaa:blue"),
+        (MySQLGTIDProbe(), "aaaa:1-x"),
+        (FakePositionProbe(), "garbage"),
+    ],
+)
+def test_probes_reject_malformed_tokens(probe: ReplicationPositionProbe, token: str) -> None:
+    """Test that malformed positions raise instead of being compared."""
+    valid = {PostgresLSNProbe: "0/16B3748", MySQLGTIDProbe: "aaaa:1-5", FakePositionProbe: "1"}[type(probe)]
+    with pytest.raises(ValueError):
+        probe.is_caught_up(valid, token)
+
+
+def test_replication_token_survives_copied_context() -> None:
+    """Test that tokens set in a copied context are visible to the owner of the context."""
+    ctx = contextvars.copy_context()
+    ctx.run(set_replication_token, "42")
+
+    assert get_replication_token() == "42"
+    clear_replication_token()
+    assert get_replication_token() is None
+
+
+def test_replication_token_is_not_cleared_by_routing_reset() -> None:
+    """Test that resetting routing state keeps the replication token."""
+    set_replication_token("7")
+    reset_routing_context()
+
+    assert get_replication_token() == "7"
+
+
+def test_write_commit_records_primary_position(maker: RoutingSyncSessionMaker, probe: FakePositionProbe) -> None:
+    """Test that committing a write stores the primary position as the token."""
+    probe.primary = 5
+    with maker() as session:
+        session.execute(insert(items).values(id=1))
+        session.commit()
+
+    assert get_replication_token() == "5"
+    assert stick_to_primary_var.get() is False
+
+
+def test_write_under_primary_context_records_position(maker: RoutingSyncSessionMaker, probe: FakePositionProbe) -> None:
+    """Test that writes forced to the primary still record a replication token."""
+    probe.primary = 6
+    with maker() as session:
+        with primary_context():
+            session.execute(insert(items).values(id=1))
+        session.commit()
+
+    assert get_replication_token() == "6"
+
+
+def test_write_with_explicit_bind_group_records_position(
+    maker: RoutingSyncSessionMaker, probe: FakePositionProbe
+) -> None:
+    """Test that writes routed through an explicit bind group still record a replication token."""
+    probe.primary = 8
+    with maker() as session:
+        session.execute(insert(items).values(id=1).execution_options(bind_group="default"))
+        session.commit()
+
+    assert get_replication_token() == "8"
+
+
+def test_commit_keeps_stickiness_when_reset_disabled(probe: FakePositionProbe) -> None:
+    """Test that ``reset_stickiness_on_commit=False`` is honoured when a position tracker is set."""
+    maker = RoutingSyncSessionMaker(
+        routing_config=RoutingConfig(
+            primary_connection_string="sqlite://",
+            read_replicas=["sqlite://"],
+            replication_probe=probe,
+            reset_stickiness_on_commit=False,
+        )
+    )
+    metadata.create_all(maker.primary_engine)
+    probe.primary = 4
+    with maker() as session:
+        session.execute(insert(items).values(id=1))
+        session.commit()
+
+        assert get_replication_token() == "4"
+        assert stick_to_primary_var.get() is True
+        assert session.get_bind(clause=select(items)) is maker.primary_engine
+    maker.close_all()
+
+
+def test_read_only_commit_does_not_record_position(maker: RoutingSyncSessionMaker, probe: FakePositionProbe) -> None:
+    """Test that a transaction without writes leaves the token untouched."""
+    probe.primary = 5
+    with maker() as session:
+        session.execute(select(items))
+        session.commit()
+
+    assert get_replication_token() is None
+
+
+def test_reads_route_to_caught_up_replica(maker: RoutingSyncSessionMaker, probe: FakePositionProbe) -> None:
+    """Test that reads skip replicas that have not replayed the token."""
+    lagging, caught_up = maker.replica_engines
+    probe.primary = 5
+    probe.set_replica_position(lagging, 3)
+    probe.set_replica_position(caught_up, 5)
+    with maker() as session:
+        session.execute(insert(items).values(id=1))
+        session.commit()
+
+        binds = {session.get_bind(clause=select(items)) for _ in range(4)}
+
+    assert binds == {caught_up}
+
+
+def test_reads_fall_back_to_primary_until_replica_catches_up(
+    maker: RoutingSyncSessionMaker, probe: FakePositionProbe
+) -> None:
+    """Test that reads use the primary while every replica lags, then move back to replicas."""
+    first, second = maker.replica_engines
+    probe.primary = 9
+    probe.set_replica_position(first, 1)
+    probe.set_replica_position(second, 1)
+    with maker() as session:
+        session.execute(insert(items).values(id=1))
+        session.commit()
+
+        assert session.get_bind(clause=select(items)) is maker.primary_engine
+
+        probe.set_replica_position(second, 9)
+        assert session.get_bind(clause=select(items)) is second
+
+
+def test_reads_with_malformed_token_use_primary(maker: RoutingSyncSessionMaker, probe: FakePositionProbe) -> None:
+    """Test that a token the probe cannot parse routes reads to the primary instead of failing."""
+    for engine in maker.replica_engines:
+        probe.set_replica_position(engine, 5)
+    with maker() as session, replication_token_context("garbage"):
+        assert session.get_bind(clause=select(items)) is maker.primary_engine
+
+
+def test_reads_without_token_use_any_replica(maker: RoutingSyncSessionMaker) -> None:
+    """Test that reads without a token use the normal selector."""
+    with maker() as session:
+        binds = {session.get_bind(clause=select(items)) for _ in range(4)}
+
+    assert binds == set(maker.replica_engines)
+
+
+class _FailingPrimaryProbe(FakePositionProbe):
+    def primary_position(self, connection: Any) -> str:
+        raise OperationalError("SELECT", {}, Exception("boom"))
+
+
+def test_unreadable_primary_position_sticks_to_primary() -> None:
+    """Test that reads stay on the primary when the position cannot be read after a write."""
+    maker = RoutingSyncSessionMaker(
+        routing_config=RoutingConfig(
+            primary_connection_string="sqlite://",
+            read_replicas=["sqlite://"],
+            replication_probe=_FailingPrimaryProbe(),
+        )
+    )
+    metadata.create_all(maker.primary_engine)
+    with maker() as session:
+        session.execute(insert(items).values(id=1))
+        session.commit()
+
+        assert get_replication_token() is None
+        assert stick_to_primary_var.get() is True
+        assert session.get_bind(clause=select(items)) is maker.primary_engine
+    maker.close_all()
+
+
+def test_tracker_caches_caught_up_positions(probe: FakePositionProbe) -> None:
+    """Test that a replica known to satisfy a token is not probed again."""
+    engine: Engine = create_engine("sqlite://")
+    tracker = ReplicaPositionTracker(probe)
+    probe.set_replica_position(engine, 10)
+
+    assert tracker.has_caught_up(engine, "8")
+    probe.set_replica_position(engine, 0)
+    assert tracker.has_caught_up(engine, "9")
+    assert not tracker.has_caught_up(engine, "11")
+    engine.dispose()
+
+
+async def _run_middleware(
+    middleware: ReplicationTokenMiddleware, headers: "list[tuple[bytes, bytes]]"
+) -> "list[MutableMapping[str, Any]]":
+    sent: list[MutableMapping[str, Any]] = []
+
+    async def receive() -> "MutableMapping[str, Any]":
+        return {"type": "http.request"}
+
+    async def send(message: "MutableMapping[str, Any]") -> None:
+        sent.append(message)
+
+    await middleware({"type": "http", "headers": headers}, receive, send)
+    return sent
+
+
+async def test_middleware_restores_incoming_token_from_header() -> None:
+    """Test that the incoming header token is visible during the request."""
+    seen: list[Any] = []
+
+    async def app(scope: Any, receive: Any, send: Any) -> None:
+        seen.append(get_replication_token())
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+
+    sent = await _run_middleware(ReplicationTokenMiddleware(app), [(b"x-replication-token", b"0%2F16B3748")])
+
+    assert seen == ["0/16B3748"]
+    assert sent[0]["headers"] == []
+    assert get_replication_token() is None
+
+
+@pytest.mark.parametrize(
+    ("probe", "headers"),
+    [
+        (None, [(b"x-replication-token", b"0/1%0D%0Aset-cookie")]),
+        (None, [(b"x-replication-token", b"1" * 5000)]),
+        (PostgresLSNProbe(), [(b"x-replication-token", b"garbage")]),
+        (PostgresLSNProbe(), [(b"cookie", b"rt=garbage")]),
+    ],
+)
+async def test_middleware_drops_malformed_tokens(
+    probe: Optional[ReplicationPositionProbe], headers: "list[tuple[bytes, bytes]]"
+) -> None:
+    """Test that malformed incoming tokens are ignored rather than routed on."""
+    seen: list[Any] = []
+
+    async def app(scope: Any, receive: Any, send: Any) -> None:
+        seen.append(get_replication_token())
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+
+    await _run_middleware(ReplicationTokenMiddleware(app, cookie_name="rt", probe=probe), headers)
+
+    assert seen == [None]
+
+
+async def test_middleware_returns_new_token_in_header_and_cookie() -> None:
+    """Test that a token recorded during the request is returned to the client."""
+
+    async def app(scope: Any, receive: Any, send: Any) -> None:
+        set_replication_token("uuid:1-5,other:1")
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+
+    middleware = ReplicationTokenMiddleware(app, cookie_name="rt")
+    sent = await _run_middleware(middleware, [(b"cookie", b"session=abc; rt=uuid%3A1-4")])
+
+    headers = dict(sent[0]["headers"])
+    assert headers[b"x-replication-token"] == b"uuid%3A1-5%2Cother%3A1"
+    assert headers[b"set-cookie"].startswith(b"rt=uuid%3A1-5%2Cother%3A1;")
+
+
+async def test_async_session_routes_to_caught_up_replica(probe: FakePositionProbe) -> None:
+    """Test that async routing sessions record tokens and honour them on reads."""
+    from advanced_alchemy.routing.maker import RoutingAsyncSessionMaker
+
+    maker = RoutingAsyncSessionMaker(
+        routing_config=RoutingConfig(
+            primary_connection_string="sqlite+aiosqlite://",
+            read_replicas=["sqlite+aiosqlite://", "sqlite+aiosqlite://"],
+            replication_probe=probe,
+        )
+    )
+    async with maker.primary_engine.begin() as conn:
+        await conn.run_sync(metadata.create_all)
+    lagging, caught_up = maker.replica_engines
+    probe.primary = 3
+    probe.set_replica_position(lagging, 2)
+    probe.set_replica_position(caught_up, 3)
+
+    async with maker() as session:
+        await session.execute(insert(items).values(id=1))
+        await session.commit()
+
+        assert get_replication_token() == "3"
+        binds = await session.run_sync(lambda sync: {sync.get_bind(clause=select(items)) for _ in range(4)})
+
+    assert binds == {caught_up.sync_engine}
+    await maker.close_all()
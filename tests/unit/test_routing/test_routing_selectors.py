@@ -3,12 +3,20 @@
 Tests different strategies for selecting read replicas.
 """
 
+from contextlib import ExitStack
 from unittest.mock import MagicMock
 
 import pytest
-from sqlalchemy import Engine
+from sqlalchemy import Engine, QueuePool, create_engine, text
+from sqlalchemy.exc import IntegrityError, OperationalError
+from sqlalchemy.ext.asyncio import create_async_engine
 
-from advanced_alchemy.routing.selectors import RandomSelector, RoundRobinSelector
+from advanced_alchemy.routing.selectors import (
+    LatencyEWMASelector,
+    LeastConnectionsSelector,
+    RandomSelector,
+    RoundRobinSelector,
+)
 
 
 @pytest.fixture
@@ -160,3 +168,215 @@ def test_has_replicas_returns_true_for_non_empty_list(mock_engines: list[Engine]
     selector = RoundRobinSelector(mock_engines)
 
     assert selector.has_replicas() is True
+
+
+def _engine_with_checkouts(name: str, checked_out: int) -> Engine:
+    engine = MagicMock(name=name)
+    engine.pool.checkedout.return_value = checked_out
+    return engine
+
+
+def _sqlite_engine() -> Engine:
+    return create_engine("sqlite://", poolclass=QueuePool)
+
+
+def test_least_connections_selector_picks_least_loaded() -> None:
+    """Test that LeastConnectionsSelector prefers the pool with fewest checkouts."""
+    busy = _engine_with_checkouts("busy", 5)
+    idle = _engine_with_checkouts("idle", 0)
+    medium = _engine_with_checkouts("medium", 2)
+    selector = LeastConnectionsSelector([busy, idle, medium])
+
+    assert all(selector.next() is idle for _ in range(5))
+
+
+def test_least_connections_selector_rotates_ties() -> None:
+    """Test that LeastConnectionsSelector spreads load across equally loaded pools."""
+    engines = [_engine_with_checkouts(f"engine_{i}", 0) for i in range(3)]
+    selector = LeastConnectionsSelector(engines)
+
+    assert [selector.next() for _ in range(6)] == engines + engines
+
+
+def test_least_connections_selector_tracks_real_pool_checkouts() -> None:
+    """Test that LeastConnectionsSelector reads live checkout counts from the pool."""
+    first = _sqlite_engine()
+    second = _sqlite_engine()
+    selector = LeastConnectionsSelector([first, second])
+
+    with first.connect():
+        assert selector.next() is second
+        assert selector.next() is second
+
+    first.dispose()
+    second.dispose()
+
+
+def test_least_connections_selector_no_engines_raises() -> None:
+    """Test that LeastConnectionsSelector raises RuntimeError when no engines configured."""
+    selector: LeastConnectionsSelector[Engine] = LeastConnectionsSelector([])
+
+    with pytest.raises(RuntimeError, match="No engines configured for least-connections selection"):
+        selector.next()
+
+
+def test_latency_ewma_selector_prefers_faster_engine() -> None:
+    """Test that LatencyEWMASelector routes to the engine with the lowest latency."""
+    slow = _sqlite_engine()
+    fast = _sqlite_engine()
+    selector = LatencyEWMASelector([slow, fast])
+
+    selector.record(slow, 0.200)
+    selector.record(fast, 0.010)
+
+    assert all(selector.next() is fast for _ in range(5))
+
+
+def test_latency_ewma_selector_weights_by_outstanding_connections() -> None:
+    """Test that a fast but saturated engine loses to a slower idle one."""
+    slow = _sqlite_engine()
+    fast = _sqlite_engine()
+    selector = LatencyEWMASelector([slow, fast])
+
+    selector.record(slow, 0.020)
+    selector.record(fast, 0.010)
+
+    with ExitStack() as stack:
+        for _ in range(3):
+            stack.enter_context(fast.connect())
+        assert selector.next() is slow
+    assert selector.next() is fast
+
+
+def test_latency_ewma_selector_prefers_unmeasured_engines() -> None:
+    """Test that engines without samples are tried before measured ones."""
+    measured = _sqlite_engine()
+    unmeasured = _sqlite_engine()
+    selector = LatencyEWMASelector([measured, unmeasured])
+
+    selector.record(measured, 0.001)
+
+    assert selector.next() is unmeasured
+
+
+def test_latency_ewma_selector_smooths_samples() -> None:
+    """Test that samples are folded into the moving average with ``alpha``."""
+    engine = _sqlite_engine()
+    selector = LatencyEWMASelector([engine], alpha=0.5)
+
+    selector.record(engine, 0.100)
+    selector.record(engine, 0.300)
+
+    assert selector.latency(engine) == pytest.approx(0.200)
+
+
+def test_latency_ewma_selector_stale_measurements_decay(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that an old slow measurement decays so the engine is retried."""
+    import advanced_alchemy.routing.selectors as selectors_module
+
+    clock = [1000.0]
+    monkeypatch.setattr(selectors_module.time, "monotonic", lambda: clock[0])
+    slow = _sqlite_engine()
+    fast = _sqlite_engine()
+    selector = LatencyEWMASelector([slow, fast], decay_seconds=1.0)
+
+    selector.record(slow, 0.100)
+    clock[0] += 10.0
+    selector.record(fast, 0.010)
+
+    assert selector.next() is slow
+
+
+def test_latency_ewma_selector_rejects_invalid_parameters() -> None:
+    """Test that LatencyEWMASelector validates its tuning parameters."""
+    with pytest.raises(ValueError, match="alpha"):
+        LatencyEWMASelector([], alpha=0)
+    with pytest.raises(ValueError, match="decay_seconds"):
+        LatencyEWMASelector([], decay_seconds=0)
+    with pytest.raises(ValueError, match="error_penalty"):
+        LatencyEWMASelector([], error_penalty=-1)
+
+
+def test_latency_ewma_selector_breaks_ties_round_robin() -> None:
+    """Test that engines with equal scores, such as unmeasured ones, take turns."""
+    engines = [_sqlite_engine() for _ in range(3)]
+    selector = LatencyEWMASelector(engines)
+
+    assert [selector.next() for _ in range(6)] == engines + engines
+
+
+def test_latency_ewma_selector_penalizes_failed_statements() -> None:
+    """Test that a failed statement records the error penalty and clears its start time."""
+    failing = create_engine("sqlite://")
+    healthy = create_engine("sqlite://")
+    selector = LatencyEWMASelector([failing, healthy], error_penalty=5.0)
+
+    with failing.connect() as conn:
+        with pytest.raises(OperationalError):
+            conn.execute(text("SELECT * FROM missing"))
+        assert conn.info["_aa_query_start"] == []
+
+    assert selector.latency(failing) == pytest.approx(5.0)
+    assert selector.latency(healthy) is None
+    selector.record(healthy, 0.010)
+    assert selector.next() is healthy
+    failing.dispose()
+    healthy.dispose()
+
+
+def test_latency_ewma_selector_ignores_application_errors() -> None:
+    """Test that errors caused by the statement, not the engine, do not change the engine's rank."""
+    engine = create_engine("sqlite://")
+    other = create_engine("sqlite://")
+    selector = LatencyEWMASelector([engine, other], error_penalty=5.0)
+    selector.record(engine, 0.001)
+    selector.record(other, 1.0)
+
+    with engine.connect() as conn:
+        conn.execute(text("CREATE TABLE item (id INTEGER PRIMARY KEY)"))
+        conn.execute(text("INSERT INTO item (id) VALUES (1)"))
+        with pytest.raises(IntegrityError):
+            conn.execute(text("INSERT INTO item (id) VALUES (1)"))
+        assert conn.info["_aa_query_start"] == []
+
+    latency = selector.latency(engine)
+    assert latency is not None
+    assert latency < 1.0
+    assert selector.next() is engine
+    engine.dispose()
+    other.dispose()
+
+
+def test_latency_ewma_selector_measures_statements_from_engine_events() -> None:
+    """Test that statement latency is captured from engine events."""
+    engine = create_engine("sqlite://")
+    selector = LatencyEWMASelector([engine])
+
+    assert selector.latency(engine) is None
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+
+    latency = selector.latency(engine)
+    assert latency is not None
+    assert latency >= 0
+    engine.dispose()
+
+
+async def test_latency_ewma_selector_measures_async_engines() -> None:
+    """Test that async engines are instrumented through their sync engine."""
+    engine = create_async_engine("sqlite+aiosqlite://")
+    selector = LatencyEWMASelector([engine])
+
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+
+    assert selector.latency(engine) is not None
+    await engine.dispose()
+
+
+def test_latency_ewma_selector_no_engines_raises() -> None:
+    """Test that LatencyEWMASelector raises RuntimeError when no engines configured."""
+    selector: LatencyEWMASelector[Engine] = LatencyEWMASelector([])
+
+    with pytest.raises(RuntimeError, match="No engines configured for latency-aware selection"):
+        selector.next()
@@ -8,11 +8,14 @@ from unittest.mock import MagicMock
 import pytest
 from sqlalchemy import Delete, Engine, Insert, Update, select
 
-from advanced_alchemy.config.routing import RoutingConfig
+from advanced_alchemy.config.routing import RoutingConfig, StickyWindow
 from advanced_alchemy.routing.context import (
+    bind_group_var,
     force_primary_var,
+    primary_context,
     reset_routing_context,
     stick_to_primary_var,
+    use_bind_group,
 )
 from advanced_alchemy.routing.selectors import EngineSelector, RoundRobinSelector
 from advanced_alchemy.routing.session import RoutingSyncSession
@@ -352,6 +355,24 @@ def test_rollback_resets_stickiness(
     assert engine in mock_replica_engines
 
 
+def test_commit_and_rollback_keep_context_manager_overrides(
+    routing_session: RoutingSyncSession,
+    mock_primary_engine: Engine,
+    mock_replica_selector: RoundRobinSelector[Engine],
+) -> None:
+    """Test that commit and rollback leave bind groups and forced primary routing to their context managers."""
+    with use_bind_group("read"):
+        routing_session.commit()
+        assert bind_group_var.get() == "read"
+        routing_session.rollback()
+        assert routing_session.get_bind(clause=select(1)) in mock_replica_selector.engines
+
+    with primary_context():
+        routing_session.commit()
+        assert force_primary_var.get() is True
+        assert routing_session.get_bind(clause=select(1)) is mock_primary_engine
+
+
 def test_sticky_disabled_writes_dont_set_flag(
     mock_primary_engine: Engine,
     mock_replica_selector: RoundRobinSelector[Engine],
@@ -437,3 +458,31 @@ def test_has_for_update_detects_for_update_clause() -> None:
     assert session._has_for_update(regular_select) is False
 
     assert session._has_for_update(None) is False
+
+
+def test_sticky_window_returns_reads_to_replicas(
+    mock_primary_engine: Engine,
+    mock_replica_selector: RoundRobinSelector[Engine],
+) -> None:
+    """Test that reads go back to replicas once the sticky window is exhausted."""
+    config = RoutingConfig(
+        primary_connection_string="postgresql://primary:5432/db",
+        read_replicas=["postgresql://replica:5432/db"],
+        sticky_window=StickyWindow(statements=2),
+    )
+    session = RoutingSyncSession(
+        default_engine=mock_primary_engine,
+        selectors={config.read_group: mock_replica_selector},
+        routing_config=config,
+    )
+
+    insert_stmt = MagicMock(spec=Insert)
+    insert_stmt._execution_options = {}
+
+    assert session.get_bind(clause=insert_stmt) is mock_primary_engine
+    assert session.get_bind(clause=select(1)) is mock_primary_engine
+    assert session.get_bind(clause=select(1)) is mock_primary_engine
+    assert session.get_bind(clause=select(1)) in mock_replica_selector.engines
+
+    assert session.get_bind(clause=insert_stmt) is mock_primary_engine
+    assert session.get_bind(clause=select(1)) is mock_primary_engine
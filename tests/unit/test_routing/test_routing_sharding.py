@@ -0,0 +1,423 @@
+"""Unit tests for hash-based sharding and scatter-gather queries."""
+
+from collections import Counter
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Optional
+
+import pytest
+from sqlalchemy import String, and_, create_engine, select
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
+from advanced_alchemy.config.routing import HealthCheckConfig, RoutingConfig, ShardingConfig
+from advanced_alchemy.exceptions import AdvancedAlchemyError, ImproperConfigurationError, RepositoryError
+from advanced_alchemy.filters import CollectionFilter, LimitOffset
+from advanced_alchemy.repository import SQLAlchemyAsyncRepository, SQLAlchemySyncRepository
+from advanced_alchemy.routing.maker import RoutingAsyncSessionMaker, RoutingSyncSessionMaker
+from advanced_alchemy.routing.sharding import ConsistentHashRing, ShardRouter
+
+SHARDS = ["shard_a", "shard_b", "shard_c"]
+
+
+class _Base(DeclarativeBase):
+    pass
+
+
+class Order(_Base):
+    __tablename__ = "sharded_order"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    tenant_id: Mapped[str] = mapped_column(String(20))
+    total: Mapped[Optional[int]] = mapped_column(nullable=True)
+
+
+class OrderSyncRepository(SQLAlchemySyncRepository[Order]):
+    model_type = Order
+
+
+class OrderAsyncRepository(SQLAlchemyAsyncRepository[Order]):
+    model_type = Order
+
+
+def _tenants_by_shard(router: ShardRouter) -> dict[str, str]:
+    """Find one tenant id owned by each shard."""
+    tenants: dict[str, str] = {}
+    index = 0
+    while len(tenants) < len(router.shards):
+        tenants.setdefault(router.shard_for(f"tenant-{index}"), f"tenant-{index}")
+        index += 1
+    return tenants
+
+
+def _routing_config(tmp_path: Path, driver: str = "sqlite") -> RoutingConfig:
+    urls = {shard: f"{driver}:///{tmp_path / shard}.db" for shard in SHARDS}
+    return RoutingConfig(
+        engines={"default": [urls["shard_a"]], **{shard: [url] for shard, url in urls.items()}},
+        sharding=ShardingConfig(shard_key="tenant_id", shards=SHARDS),
+    )
+
+
+@pytest.fixture
+def sync_maker(tmp_path: Path) -> Iterator[RoutingSyncSessionMaker]:
+    maker = RoutingSyncSessionMaker(routing_config=_routing_config(tmp_path))
+    for shard in SHARDS:
+        engine = create_engine(f"sqlite:///{tmp_path / shard}.db")
+        _Base.metadata.create_all(engine)
+        engine.dispose()
+    yield maker
+    maker.close_all()
+
+
+@pytest.fixture
+def isolated_sync_maker(tmp_path: Path) -> Iterator[RoutingSyncSessionMaker]:
+    """A sharded maker whose default engine is a separate database, so stray writes are detectable."""
+    config = _routing_config(tmp_path)
+    config.engines["default"] = [f"sqlite:///{tmp_path / 'default'}.db"]
+    maker = RoutingSyncSessionMaker(routing_config=config)
+    for engines in maker._engines.values():
+        _Base.metadata.create_all(engines[0])
+    yield maker
+    maker.close_all()
+
+
+def _shard_rows(maker: RoutingSyncSessionMaker) -> dict[str, list[tuple[int, Optional[int]]]]:
+    rows: dict[str, list[tuple[int, Optional[int]]]] = {}
+    for group in ("default", *SHARDS):
+        with maker._engines[group][0].connect() as conn:
+            rows[group] = [tuple(row) for row in conn.execute(select(Order.id, Order.total).order_by(Order.id))]
+    return rows
+
+
+def test_hash_ring_is_deterministic_and_balanced() -> None:
+    """Test that keys map to the same node every time and spread across nodes."""
+    ring = ConsistentHashRing(SHARDS)
+    placements = Counter(ring.node_for(f"tenant-{i}") for i in range(3000))
+
+    assert ring.node_for("tenant-1") == ConsistentHashRing(SHARDS).node_for("tenant-1")
+    assert set(placements) == set(SHARDS)
+    assert min(placements.values()) > 600
+
+
+def test_hash_ring_moves_only_removed_node_keys() -> None:
+    """Test that removing a node only remaps the keys it owned."""
+    ring = ConsistentHashRing(SHARDS)
+    before = {key: ring.node_for(key) for key in range(1000)}
+
+    ring.remove_node("shard_b")
+
+    assert ring.nodes == ["shard_a", "shard_c"]
+    for key, node in before.items():
+        if node != "shard_b":
+            assert ring.node_for(key) == node
+
+
+def test_router_resolves_shard_from_kwargs_and_filters() -> None:
+    """Test shard resolution from kwargs, equality criteria and collection filters."""
+    router = ShardRouter(shard_key="tenant_id", shards=SHARDS)
+    tenants = _tenants_by_shard(router)
+
+    assert router.resolve(kwargs={"tenant_id": tenants["shard_b"]}) == "shard_b"
+    assert router.resolve([Order.tenant_id == tenants["shard_c"]]) == "shard_c"
+    assert router.resolve([and_(Order.total > 5, Order.tenant_id == tenants["shard_a"])]) == "shard_a"
+    assert router.resolve([CollectionFilter("tenant_id", [tenants["shard_a"]])]) == "shard_a"
+    assert router.resolve([CollectionFilter("tenant_id", [tenants["shard_a"], tenants["shard_b"]])]) is None
+    assert router.resolve([Order.total == 5], kwargs={"id": 1}) is None
+
+
+def test_router_merges_sorted_shard_results() -> None:
+    """Test the k-way merge with mixed directions, NULLs and global pagination."""
+    a = [Order(id=1, total=1), Order(id=2, total=4), Order(id=3, total=None)]
+    b = [Order(id=4, total=2), Order(id=5, total=3)]
+
+    ascending = ShardRouter.merge([a, b], order_by=("total", False))
+    descending = ShardRouter.merge([list(reversed(b)), [a[1], a[0]]], order_by=Order.total.desc())
+    nulls_first = ShardRouter.merge([[a[2], a[0], a[1]], b], order_by=[("total", False), ("id", True)])
+    page = ShardRouter.merge([a, b], order_by=("total", False), pagination=LimitOffset(limit=2, offset=1))
+
+    assert [o.id for o in ascending] == [1, 4, 5, 2, 3]
+    assert [o.id for o in descending] == [2, 5, 4, 1]
+    assert [o.id for o in nulls_first] == [3, 1, 4, 5, 2]
+    assert [o.id for o in page] == [4, 5]
+
+
+def test_split_pagination_widens_shard_limit() -> None:
+    """Test that each shard fetches ``offset + limit`` rows from the start."""
+    shard_filters, pagination = ShardRouter.split_pagination([LimitOffset(limit=10, offset=20)], ("id", False))
+
+    assert shard_filters == [LimitOffset(limit=30, offset=0)]
+    assert pagination == LimitOffset(limit=10, offset=20)
+    with pytest.raises(RepositoryError, match="requires an order_by"):
+        ShardRouter.split_pagination([LimitOffset(limit=10, offset=20)])
+
+
+def test_sharding_config_validation(tmp_path: Path) -> None:
+    """Test that invalid sharding configurations are rejected."""
+    with pytest.raises(ImproperConfigurationError):
+        ShardingConfig(shard_key="tenant_id", shards=[])
+    with pytest.raises(ImproperConfigurationError):
+        ShardingConfig(shard_key="tenant_id", shards=["a", "a"])
+    with pytest.raises(ImproperConfigurationError, match="no engines configured"):
+        RoutingConfig(
+            primary_connection_string="sqlite://",
+            sharding=ShardingConfig(shard_key="tenant_id", shards=["missing"]),
+        )
+
+
+def test_sync_repository_writes_and_reads_single_shard(sync_maker: RoutingSyncSessionMaker) -> None:
+    """Test that adds go to the owning shard and keyed reads only query that shard."""
+    router = sync_maker.shard_router
+    assert router is not None
+    tenants = _tenants_by_shard(router)
+
+    with sync_maker() as session:
+        repo = OrderSyncRepository(session=session)
+        repo.add_many([Order(id=i, tenant_id=tenants[shard], total=i) for i, shard in enumerate(SHARDS)])
+        session.commit()
+
+        assert repo.get_one(tenant_id=tenants["shard_b"]).id == 1
+        assert repo.count(Order.tenant_id == tenants["shard_c"]) == 1
+
+    for index, shard in enumerate(SHARDS):
+        with sync_maker() as session:
+            rows = session.execute(select(Order.id).execution_options(bind_group=shard)).scalars().all()
+        assert rows == [index]
+
+
+def test_sync_repository_add_with_auto_commit_refreshes_from_shard(tmp_path: Path) -> None:
+    """Test that committing inside ``add`` keeps the shard bind group for the refresh."""
+    config = _routing_config(tmp_path)
+    config.engines["default"] = [f"sqlite:///{tmp_path / 'default'}.db"]
+    maker = RoutingSyncSessionMaker(routing_config=config)
+    for engines in maker._engines.values():
+        _Base.metadata.create_all(engines[0])
+    router = maker.shard_router
+    assert router is not None
+    tenant = _tenants_by_shard(router)["shard_b"]
+
+    with maker() as session:
+        order = OrderSyncRepository(session=session).add(Order(id=1, tenant_id=tenant, total=3), auto_commit=True)
+
+    assert order.total == 3
+    with maker() as session:
+        assert session.execute(select(Order.id).execution_options(bind_group="shard_b")).scalars().all() == [1]
+    with maker.primary_engine.connect() as conn:
+        assert conn.execute(select(Order.id)).all() == []
+    maker.close_all()
+
+
+def test_sync_repository_routes_reads_and_updates_by_shard(isolated_sync_maker: RoutingSyncSessionMaker) -> None:
+    """Test that pk lookups scatter and updates and upserts write to the shard owning each row."""
+    router = isolated_sync_maker.shard_router
+    assert router is not None
+    tenants = _tenants_by_shard(router)
+
+    with isolated_sync_maker() as session:
+        repo = OrderSyncRepository(session=session)
+        repo.add_many([Order(id=i, tenant_id=tenants[shard], total=i) for i, shard in enumerate(SHARDS)])
+        session.commit()
+
+    with isolated_sync_maker() as session:
+        repo = OrderSyncRepository(session=session)
+        assert repo.get(1).tenant_id == tenants["shard_b"]
+        assert repo.exists(id=2)
+        assert not repo.exists(id=9)
+        repo.update(Order(id=0, total=10))
+        repo.update_many([Order(id=1, tenant_id=tenants["shard_b"], total=11)])
+        repo.get_and_update(match_fields=["id"], id=2, total=12)
+        repo.upsert(Order(id=3, tenant_id=tenants["shard_a"], total=13))
+        repo.upsert_many([Order(id=4, tenant_id=tenants["shard_c"], total=14)])
+        _, created = repo.get_or_upsert(match_fields=["id"], id=1, tenant_id=tenants["shard_b"], total=21)
+        assert not created
+        with pytest.raises(RepositoryError, match="shard key 'tenant_id'"):
+            repo.update_many([Order(id=2, total=3)])
+        session.commit()
+
+    assert _shard_rows(isolated_sync_maker) == {
+        "default": [],
+        "shard_a": [(0, 10), (3, 13)],
+        "shard_b": [(1, 21)],
+        "shard_c": [(2, 12), (4, 14)],
+    }
+
+
+def test_sync_repository_routes_deletes_by_shard(isolated_sync_maker: RoutingSyncSessionMaker) -> None:
+    """Test that deletes by pk scatter and keyed deletes only touch the owning shard."""
+    router = isolated_sync_maker.shard_router
+    assert router is not None
+    tenants = _tenants_by_shard(router)
+
+    with isolated_sync_maker() as session:
+        repo = OrderSyncRepository(session=session)
+        repo.add_many([Order(id=i, tenant_id=tenants[SHARDS[i % 3]], total=i) for i in range(6)])
+        session.commit()
+
+    with isolated_sync_maker() as session:
+        repo = OrderSyncRepository(session=session)
+        assert repo.delete(0).id == 0
+        assert [o.id for o in repo.delete_many([1, 5])] == [1, 5]
+        assert [o.id for o in repo.delete_where(tenant_id=tenants["shard_a"])] == [3]
+        session.commit()
+
+    assert _shard_rows(isolated_sync_maker) == {"default": [], "shard_a": [], "shard_b": [(4, 4)], "shard_c": [(2, 2)]}
+
+
+def test_sync_repository_scatter_sees_uncommitted_rows(isolated_sync_maker: RoutingSyncSessionMaker) -> None:
+    """Test that scattered reads run in the caller's session while it holds uncommitted writes."""
+    router = isolated_sync_maker.shard_router
+    assert router is not None
+    tenants = _tenants_by_shard(router)
+
+    with isolated_sync_maker() as session:
+        repo = OrderSyncRepository(session=session)
+        repo.add(Order(id=1, tenant_id=tenants["shard_b"], total=3))
+
+        orders, total = repo.list_and_count()
+        assert [o.id for o in orders] == [1]
+        assert total == 1
+        assert repo.get(1).total == 3
+
+
+def test_sync_repository_scatters_unkeyed_lists(sync_maker: RoutingSyncSessionMaker) -> None:
+    """Test that lists without a shard key query every shard and merge by order_by."""
+    router = sync_maker.shard_router
+    assert router is not None
+    tenants = _tenants_by_shard(router)
+    orders = [Order(id=i, tenant_id=tenants[SHARDS[i % 3]], total=(i * 7) % 10) for i in range(9)]
+
+    with sync_maker() as session:
+        repo = OrderSyncRepository(session=session)
+        repo.add_many(orders)
+        session.commit()
+
+        listed = repo.list(order_by=[("total", True), ("id", False)])
+        page, total = repo.list_and_count(LimitOffset(limit=3, offset=2), order_by=("total", False))
+
+        assert [o.total for o in listed] == sorted((o.total for o in orders), reverse=True)
+        assert total == 9
+        assert [o.total for o in page] == sorted(o.total for o in orders)[2:5]
+        assert repo.count() == 9
+        assert all(o in session for o in listed)
+
+
+def test_sync_repository_scatters_selected_columns(sync_maker: RoutingSyncSessionMaker) -> None:
+    """Test that scattered column selects merge by unselected order_by columns and refuse unordered pages."""
+    router = sync_maker.shard_router
+    assert router is not None
+    tenants = _tenants_by_shard(router)
+
+    with sync_maker() as session:
+        repo = OrderSyncRepository(session=session)
+        repo.add_many([Order(id=i, tenant_id=tenants[SHARDS[i % 3]], total=(i * 7) % 10) for i in range(9)])
+        session.commit()
+
+        rows = repo.get_many_columns(("id",), LimitOffset(limit=3, offset=1), order_by=Order.total.desc())
+        with pytest.raises(RepositoryError, match="requires an order_by"):
+            repo.get_many_columns(("id",), LimitOffset(limit=3, offset=0))
+
+    assert [tuple(row) for row in rows] == [(4,), (1,), (8,)]
+    assert rows[0]._fields == ("id",)
+
+
+def test_ejected_shard_does_not_fall_back_to_default(tmp_path: Path) -> None:
+    """Test that shards are not health checked and writes to an ejected shard fail instead of reaching the default."""
+    config = _routing_config(tmp_path)
+    config.engines["default"] = [f"sqlite:///{tmp_path / 'default'}.db"]
+    config.health_check = HealthCheckConfig()
+    maker = RoutingSyncSessionMaker(routing_config=config)
+    for engines in maker._engines.values():
+        _Base.metadata.create_all(engines[0])
+    router = maker.shard_router
+    assert router is not None and maker.health_monitor is not None
+    shard_engine = maker._engines["shard_b"][0]
+    with pytest.raises(KeyError):
+        maker.health_monitor.breaker_for(shard_engine)
+
+    maker._selectors["shard_b"].eject(shard_engine)
+    with maker() as session:
+        repo = OrderSyncRepository(session=session)
+        with pytest.raises(AdvancedAlchemyError, match="shard_b"):
+            repo.add(Order(id=1, tenant_id=_tenants_by_shard(router)["shard_b"]))
+
+    with maker.primary_engine.connect() as conn:
+        assert conn.execute(select(Order.id)).all() == []
+    maker.close_all()
+
+
+async def test_async_repository_add_with_auto_commit_refreshes_from_shard(tmp_path: Path) -> None:
+    """Test that committing inside an async ``add`` keeps the shard bind group for the refresh."""
+    config = _routing_config(tmp_path, driver="sqlite+aiosqlite")
+    config.engines["default"] = [f"sqlite+aiosqlite:///{tmp_path / 'default'}.db"]
+    maker = RoutingAsyncSessionMaker(routing_config=config)
+    for engines in maker._engines.values():
+        async with engines[0].begin() as conn:
+            await conn.run_sync(_Base.metadata.create_all)
+    router = maker.shard_router
+    assert router is not None
+    tenant = _tenants_by_shard(router)["shard_c"]
+
+    async with maker() as session:
+        order = await OrderAsyncRepository(session=session).add(
+            Order(id=1, tenant_id=tenant, total=3), auto_commit=True
+        )
+
+    assert order.total == 3
+    async with maker.primary_engine.connect() as conn:
+        assert (await conn.execute(select(Order.id))).all() == []
+    await maker.close_all()
+
+
+async def test_async_repository_scatters_unkeyed_lists(tmp_path: Path) -> None:
+    """Test add routing and concurrent scatter-gather with async sessions."""
+    maker = RoutingAsyncSessionMaker(routing_config=_routing_config(tmp_path, driver="sqlite+aiosqlite"))
+    for shard in SHARDS:
+        async with maker._engines[shard][0].begin() as conn:
+            await conn.run_sync(_Base.metadata.create_all)
+    router = maker.shard_router
+    assert router is not None
+    tenants = _tenants_by_shard(router)
+
+    async with maker() as session:
+        repo = OrderAsyncRepository(session=session)
+        await repo.add_many([Order(id=i, tenant_id=tenants[SHARDS[i % 3]], total=10 - i) for i in range(6)])
+        await session.commit()
+
+        listed, total = await repo.list_and_count(order_by=("total", False))
+        keyed = await repo.list(tenant_id=tenants["shard_a"])
+
+    assert [o.total for o in listed] == [5, 6, 7, 8, 9, 10]
+    assert total == 6
+    assert sorted(o.id for o in keyed) == [0, 3]
+    await maker.close_all()
+
+
+async def test_async_repository_routes_every_method_by_shard(tmp_path: Path) -> None:
+    """Test pk lookups, bulk updates, keyed deletes and uncommitted reads with async sessions."""
+    config = _routing_config(tmp_path, driver="sqlite+aiosqlite")
+    config.engines["default"] = [f"sqlite+aiosqlite:///{tmp_path / 'default'}.db"]
+    maker = RoutingAsyncSessionMaker(routing_config=config)
+    for engines in maker._engines.values():
+        async with engines[0].begin() as conn:
+            await conn.run_sync(_Base.metadata.create_all)
+    router = maker.shard_router
+    assert router is not None
+    tenants = _tenants_by_shard(router)
+
+    async with maker() as session:
+        repo = OrderAsyncRepository(session=session)
+        await repo.add_many([Order(id=i, tenant_id=tenants[SHARDS[i % 3]], total=i) for i in range(6)])
+        assert (await repo.list_and_count())[1] == 6
+        await session.commit()
+
+    async with maker() as session:
+        repo = OrderAsyncRepository(session=session)
+        assert (await repo.get(4)).tenant_id == tenants["shard_b"]
+        await repo.update_many([Order(id=4, tenant_id=tenants["shard_b"], total=40)])
+        assert [o.id for o in await repo.delete_where(tenant_id=tenants["shard_a"])] == [0, 3]
+        await session.commit()
+
+    async with maker() as session:
+        repo = OrderAsyncRepository(session=session)
+        assert sorted((o.id, o.total) for o in await repo.list()) == [(1, 1), (2, 2), (4, 40), (5, 5)]
+    async with maker.primary_engine.connect() as conn:
+        assert (await conn.execute(select(Order.id))).all() == []
+    await maker.close_all()
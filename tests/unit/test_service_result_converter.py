@@ -0,0 +1,217 @@
+"""Unit tests for cached schema conversion in ``ResultConverter``."""
+
+import dataclasses
+from pathlib import PurePosixPath
+from typing import Any, Optional, cast
+from unittest import mock
+from unittest.mock import create_autospec
+
+import attrs
+import msgspec
+import pytest
+from pydantic import BaseModel, model_validator
+from sqlalchemy import Row, String
+from sqlalchemy.engine.result import result_tuple
+from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column
+
+from advanced_alchemy.exceptions import AdvancedAlchemyError
+from advanced_alchemy.filters import LimitOffset
+from advanced_alchemy.repository.memory import SQLAlchemySyncMockRepository
+from advanced_alchemy.service import get_row_converter
+from advanced_alchemy.service._util import ResultConverter, _get_schema_converter
+
+pytestmark = [pytest.mark.unit]
+
+
+class _Base(DeclarativeBase):
+    pass
+
+
+class Author(_Base):
+    __tablename__ = "converter_author"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str] = mapped_column(String(50))
+    bio: Mapped[Optional[str]] = mapped_column(nullable=True)
+
+    @property
+    def display_name(self) -> str:
+        return f"{self.name} ({self.id})"
+
+
+class AuthorStruct(msgspec.Struct):
+    id: int
+    name: str
+
+
+class AuthorDisplayStruct(msgspec.Struct):
+    id: int
+    display_name: str
+
+
+class RenamedAuthorStruct(msgspec.Struct, rename="camel"):
+    id: int
+    name: str
+
+
+class AuthorModel(BaseModel):
+    id: int
+    name: str
+
+
+@attrs.define
+class AuthorAttrs:
+    id: int
+    name: str
+    bio: Optional[str] = None
+
+
+class AuthorPathStruct(msgspec.Struct):
+    id: int
+    name: PurePosixPath
+
+
+@dataclasses.dataclass
+class AuthorPathData:
+    id: int
+    name: PurePosixPath
+
+
+def _authors(count: int = 3) -> "list[Author]":
+    return [Author(id=i, name=f"author-{i}") for i in range(count)]
+
+
+@pytest.mark.parametrize("schema_type", [AuthorStruct, RenamedAuthorStruct, AuthorModel, AuthorAttrs])
+def test_to_schema_converts_model_lists(schema_type: "type[Any]") -> None:
+    """Test that pages of mapped instances convert to every supported schema type."""
+    page = ResultConverter().to_schema(
+        _authors(), total=10, filters=[LimitOffset(limit=3, offset=0)], schema_type=schema_type
+    )
+
+    assert [(item.id, item.name) for item in page.items] == [(0, "author-0"), (1, "author-1"), (2, "author-2")]
+    assert all(isinstance(item, schema_type) for item in page.items)
+    assert (page.total, page.limit, page.offset) == (10, 3, 0)
+
+
+def test_to_schema_falls_back_to_attributes_for_fields_not_in_state() -> None:
+    """Test that fields missing from an instance's loaded state are read as attributes."""
+    page = ResultConverter().to_schema(_authors(2), schema_type=AuthorDisplayStruct)
+
+    assert [item.display_name for item in page.items] == ["author-0 (0)", "author-1 (1)"]
+
+
+def test_to_schema_handles_mixed_sources_with_attrs() -> None:
+    """Test the attrs converter with mapped instances and plain mappings in one list."""
+    with mock.patch("advanced_alchemy.service._util.CATTRS_INSTALLED", False):
+        page = ResultConverter().to_schema(
+            [Author(id=1, name="a", bio="b"), {"id": 2, "name": "c", "extra": 1}], schema_type=AuthorAttrs
+        )
+
+    assert page.items == [AuthorAttrs(id=1, name="a", bio="b"), AuthorAttrs(id=2, name="c")]
+
+
+def test_to_schema_reuses_cached_converter() -> None:
+    """Test that the converter for a source and schema type pair is built once."""
+    converter = ResultConverter()
+    _get_schema_converter.cache_clear()
+
+    converter.to_schema(_authors(), schema_type=AuthorStruct)
+    converter.to_schema(_authors(), schema_type=AuthorStruct)
+    single = converter.to_schema(Author(id=7, name="single"), schema_type=AuthorStruct)
+
+    info = _get_schema_converter.cache_info()
+    assert single == AuthorStruct(id=7, name="single")
+    assert (info.misses, info.hits) == (1, 2)
+
+
+@pytest.mark.parametrize("schema_type", [AuthorStruct, RenamedAuthorStruct, AuthorModel, AuthorAttrs, dict])
+def test_row_converter_builds_schemas_from_rows(schema_type: "type[Any]") -> None:
+    """Test that rows of the selected columns convert to every supported schema type."""
+    converter = get_row_converter(Author, schema_type)
+    make_row = result_tuple(converter.columns)
+    rows = [make_row([index if name == "id" else f"value-{index}" for name in converter.columns]) for index in range(2)]
+
+    items = converter.many(rows)
+
+    expected_columns = ("id", "name", "bio") if schema_type in {AuthorAttrs, dict} else ("id", "name")
+    assert converter.columns == expected_columns
+    assert [(item["id"], item["name"]) if schema_type is dict else (item.id, item.name) for item in items] == [
+        (0, "value-0"),
+        (1, "value-1"),
+    ]
+
+
+@pytest.mark.parametrize("schema_type", [AuthorPathStruct, AuthorPathData, AuthorModel, AuthorAttrs])
+def test_row_converter_matches_to_schema(schema_type: "type[Any]") -> None:
+    """Test that rows convert exactly like the instances ``to_schema`` receives."""
+    converter = get_row_converter(Author, schema_type)
+    make_row = result_tuple(converter.columns)
+    rows = [make_row([getattr(author, name) for name in converter.columns]) for author in _authors(2)]
+
+    items = converter.many(rows)
+
+    assert all(isinstance(item, schema_type) for item in items)
+    if schema_type is not AuthorPathData:
+        assert items == ResultConverter().to_schema(_authors(2), schema_type=schema_type).items
+    assert [item.name for item in items] == (
+        [PurePosixPath("author-0"), PurePosixPath("author-1")]
+        if schema_type in {AuthorPathStruct, AuthorPathData}
+        else ["author-0", "author-1"]
+    )
+
+
+def test_row_converter_reads_rows_directly() -> None:
+    """Test that rows are passed to the converter or constructor without building intermediate objects."""
+    seen: list[Any] = []
+
+    class ValidatedAuthorModel(BaseModel):
+        id: int
+        name: str
+
+        @model_validator(mode="before")
+        @classmethod
+        def record(cls, data: Any) -> Any:
+            seen.append(data)
+            return data
+
+    make_row = result_tuple(("id", "name"))
+    rows = [make_row([index, f"author-{index}"]) for index in range(2)]
+
+    assert [item.name for item in get_row_converter(Author, ValidatedAuthorModel).many(rows)] == [
+        "author-0",
+        "author-1",
+    ]
+    assert seen == rows
+    assert all(isinstance(data, Row) for data in seen)
+    with mock.patch("advanced_alchemy.service._util.convert", wraps=msgspec.convert) as convert:
+        assert get_row_converter(Author, AuthorStruct).many(rows) == [
+            AuthorStruct(id=0, name="author-0"),
+            AuthorStruct(id=1, name="author-1"),
+        ]
+        assert not convert.called
+        assert get_row_converter(Author, AuthorPathStruct).many(rows) == [
+            AuthorPathStruct(id=0, name=PurePosixPath("author-0")),
+            AuthorPathStruct(id=1, name=PurePosixPath("author-1")),
+        ]
+    assert convert.call_args.kwargs["obj"] is rows
+
+
+def test_row_converter_rejects_unsupported_types() -> None:
+    """Test that types that are not schemas are rejected."""
+    with pytest.raises(AdvancedAlchemyError):
+        get_row_converter(Author, int)
+
+
+def test_mock_repository_orders_selected_columns() -> None:
+    """Test that the in-memory ``get_many_columns`` applies ``order_by`` like the SQL repository."""
+
+    class AuthorMockRepository(SQLAlchemySyncMockRepository[Author]):
+        model_type = Author
+
+    repository = AuthorMockRepository(session=cast(Session, create_autospec(Session, instance=True)))
+    repository.add_many([Author(id=1, name="b", bio="x"), Author(id=2, name="a", bio="x"), Author(id=3, name="a")])
+    try:
+        assert repository.get_many_columns(("id", "name"), order_by=("name", True)) == [(1, "b"), (2, "a"), (3, "a")]
+        assert repository.get_many_columns(("id",), order_by=[("name", False), ("id", True)]) == [(3,), (2,), (1,)]
+    finally:
+        SQLAlchemySyncMockRepository.__database_clear__()
@@ -0,0 +1,132 @@
+"""Unit tests for loader options derived from output schemas."""
+
+import dataclasses
+from collections.abc import Generator
+from typing import Any, Optional
+
+import msgspec
+import pytest
+from pydantic import BaseModel
+from sqlalchemy import ForeignKey, String, create_engine, event, inspect, select
+from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column, relationship
+
+from advanced_alchemy.service import get_schema_loader_options
+
+pytestmark = [pytest.mark.unit]
+
+
+class _Base(DeclarativeBase):
+    pass
+
+
+class Team(_Base):
+    __tablename__ = "planner_team"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str] = mapped_column(String(50))
+    motto: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
+
+
+class Player(_Base):
+    __tablename__ = "planner_player"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str] = mapped_column(String(50))
+    bio: Mapped[Optional[str]] = mapped_column(String(200), nullable=True)
+    team_id: Mapped[int] = mapped_column(ForeignKey("planner_team.id"))
+    team: Mapped[Team] = relationship()
+    scores: Mapped[list["Score"]] = relationship(back_populates="player")
+
+    @property
+    def label(self) -> str:
+        return f"{self.name}: {self.bio}"
+
+
+class Score(_Base):
+    __tablename__ = "planner_score"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    points: Mapped[int]
+    note: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
+    player_id: Mapped[int] = mapped_column(ForeignKey("planner_player.id"))
+    player: Mapped[Player] = relationship(back_populates="scores")
+
+
+class TeamRead(msgspec.Struct):
+    name: str
+
+
+class ScoreRead(BaseModel):
+    points: int
+
+
+@dataclasses.dataclass
+class PlayerRead:
+    id: int
+    name: str
+    team: Optional[TeamRead]
+    scores: "list[ScoreRead]"
+
+
+class PlayerLabel(msgspec.Struct):
+    name: str
+    label: str
+
+
+@pytest.fixture
+def session() -> Generator[Session, None, None]:
+    engine = create_engine("sqlite://")
+    _Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(
+            Player(
+                name="p",
+                bio="b",
+                team=Team(name="t", motto="m"),
+                scores=[Score(points=1, note="x"), Score(points=2, note="y")],
+            )
+        )
+        session.commit()
+        session.expunge_all()
+        yield session
+    engine.dispose()
+
+
+def _unloaded(instance: Any) -> "set[str]":
+    return set(inspect(instance).unloaded)
+
+
+def test_loader_options_fetch_only_the_serialized_graph(session: Session) -> None:
+    """Test that schema fields become column projections and eager loads, recursively."""
+    statements: list[str] = []
+    event.listen(session.get_bind(), "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+    player = session.scalars(select(Player).options(*get_schema_loader_options(Player, PlayerRead))).one()
+
+    assert len(statements) == 2
+    assert "JOIN planner_team" in statements[0]
+    assert "planner_score" in statements[1]
+    assert _unloaded(player) == {"bio"}
+    assert "motto" in _unloaded(player.team)
+    assert all("note" in _unloaded(score) for score in player.scores)
+    assert [score.points for score in player.scores] == [1, 2]
+    assert len(statements) == 2
+
+
+def test_loader_options_load_all_columns_for_non_column_fields(session: Session) -> None:
+    """Test that schema fields backed by properties keep every column loaded."""
+    player = session.scalars(select(Player).options(*get_schema_loader_options(Player, PlayerLabel))).one()
+
+    assert not {"bio", "name"} & _unloaded(player)
+    assert get_schema_loader_options(Player, PlayerLabel) == ()
+
+
+def test_loader_options_are_cached() -> None:
+    """Test that options are planned once per model and schema pair."""
+    get_schema_loader_options.cache_clear()
+
+    first = get_schema_loader_options(Player, PlayerRead)
+    second = get_schema_loader_options(Player, PlayerRead)
+
+    assert first is second
+    assert get_schema_loader_options.cache_info().hits == 1
@@ -0,0 +1,117 @@
+"""Unit tests for blind-index lookups on encrypted columns."""
+
+import hashlib
+import hmac
+from collections.abc import Generator
+from typing import Optional
+
+import pytest
+from sqlalchemy import create_engine, event, or_, update
+from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column
+
+from advanced_alchemy.exceptions import RepositoryError
+from advanced_alchemy.filters import CollectionFilter, NotInCollectionFilter
+from advanced_alchemy.repository import SQLAlchemySyncRepository
+from advanced_alchemy.types import BlindIndex, EncryptedString
+from advanced_alchemy.types.encrypted_string import get_blind_indexes
+
+pytest.importorskip("cryptography")
+
+pytestmark = [pytest.mark.unit]
+
+
+class _Base(DeclarativeBase):
+    pass
+
+
+class Customer(_Base):
+    __tablename__ = "blind_index_customer"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    email: Mapped[Optional[str]] = mapped_column(EncryptedString(key="encryption-key"))
+    email_index: Mapped[Optional[str]] = mapped_column(
+        BlindIndex("email", key="index-key", normalize=str.casefold), index=True
+    )
+
+
+class CustomerRepository(SQLAlchemySyncRepository[Customer]):
+    model_type = Customer
+
+
+@pytest.fixture
+def session() -> Generator[Session, None, None]:
+    engine = create_engine("sqlite://")
+    _Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all([Customer(id=1, email="Ada@example.com"), Customer(id=2, email="grace@example.com")])
+        session.commit()
+        yield session
+    engine.dispose()
+
+
+def test_digest_is_keyed_hmac_of_normalized_value() -> None:
+    """Test that the index stores HMAC-SHA256 of the normalized plaintext."""
+    index = BlindIndex("email", key="index-key", normalize=str.casefold)
+    expected = hmac.new(b"index-key", b"ada@example.com", hashlib.sha256).hexdigest()
+
+    assert index.digest("ADA@example.com") == expected
+    assert BlindIndex("email", key=lambda: b"index-key").digest("ada@example.com") == expected
+    assert BlindIndex("email", key="other-key").digest("ada@example.com") != expected
+
+
+def test_index_is_maintained_when_the_source_is_set() -> None:
+    """Test that setting the encrypted attribute sets or clears its blind index."""
+    customer = Customer(email="Ada@example.com")
+    assert customer.email_index == BlindIndex("email", key="index-key").digest("ada@example.com")
+
+    customer.email = None
+    assert customer.email_index is None
+    assert get_blind_indexes(Customer) == {"email": [("email_index", Customer.__table__.c.email_index.type)]}  # type: ignore[attr-defined]
+
+
+def test_repository_looks_up_encrypted_values_by_index(session: Session) -> None:
+    """Test that equality filters on the encrypted attribute query the blind index."""
+    statements: list[str] = []
+    event.listen(session.get_bind(), "before_cursor_execute", lambda *args: statements.append(args[2]))
+    repository = CustomerRepository(session=session)
+
+    assert repository.get_one(email="ada@EXAMPLE.com").id == 1
+    assert [customer.id for customer in repository.get_many(Customer.email == "grace@example.com")] == [2]
+    assert repository.get_one_or_none(email="nobody@example.com") is None
+    assert repository.exists(email="grace@example.com")
+    assert all("blind_index_customer.email_index = ?" in statement for statement in statements)
+
+
+def test_repository_translates_other_operators_to_the_index(session: Session) -> None:
+    """Test that ``!=``, ``in_``, ``not_in``, nested clauses and collection filters use the blind index."""
+    repository = CustomerRepository(session=session)
+
+    def ids(*filters: object) -> list[int]:
+        return sorted(customer.id for customer in repository.get_many(*filters))  # type: ignore[arg-type]
+
+    assert ids(Customer.email != "ADA@example.com") == [2]
+    assert ids(Customer.email.in_(["ada@example.com", "nobody@example.com"])) == [1]
+    assert ids(Customer.email.not_in(["ada@example.com"])) == [2]
+    assert ids(or_(Customer.email == "ada@example.com", Customer.id == 2)) == [1, 2]
+    assert ids(CollectionFilter(field_name="email", values=["Grace@example.com"])) == [2]
+    assert ids(CollectionFilter(field_name=Customer.email, values=["ada@example.com", None])) == [1]
+    assert ids(NotInCollectionFilter(field_name="email", values=["grace@example.com"])) == [1]
+    assert ids(Customer.email.is_not(None)) == [1, 2]
+
+
+def test_repository_rejects_unsupported_operators_on_indexed_attributes(session: Session) -> None:
+    """Test that comparisons a blind index cannot answer raise instead of matching nothing."""
+    repository = CustomerRepository(session=session)
+
+    with pytest.raises(RepositoryError, match=r"Customer\.email is encrypted"):
+        repository.get_many(Customer.email.like("ada%"))
+    with pytest.raises(RepositoryError, match=r"Customer\.email is encrypted"):
+        repository.get_many(or_(Customer.id == 1, Customer.email > "a"))
+
+
+def test_bulk_updates_must_set_the_index(session: Session) -> None:
+    """Test that statements bypassing the ORM leave the index to the caller."""
+    session.execute(update(Customer).where(Customer.id == 2).values(email="hopper@example.com"))
+    repository = CustomerRepository(session=session)
+
+    assert repository.get_one_or_none(email="hopper@example.com") is None
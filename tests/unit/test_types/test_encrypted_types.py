@@ -1,11 +1,12 @@
 """Unit tests for the encrypted column types and their optional-dependency facade."""
 
-from typing import Union
+from typing import Optional, Union
 
 import pytest
-from sqlalchemy import column, literal
+from sqlalchemy import column, create_engine, literal, select
+from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column
 
-from advanced_alchemy.types.encrypted_string import EncryptedString, EncryptedText
+from advanced_alchemy.types.encrypted_string import EncryptedString, EncryptedText, EncryptedValue, decrypt_results
 
 
 def test_cryptography_installed_flag_is_bool() -> None:
@@ -112,8 +113,9 @@ def test_static_key_caches_vault(monkeypatch: pytest.MonkeyPatch) -> None:
     assert calls["n"] == 1
 
 
-def test_callable_key_remounts(monkeypatch: pytest.MonkeyPatch) -> None:
-    enc = EncryptedString(key=lambda: "rotating-key")
+def test_callable_key_remounts_when_rotated(monkeypatch: pytest.MonkeyPatch) -> None:
+    keys = ["rotating-key"]
+    enc = EncryptedString(key=lambda: keys[-1])
     calls = {"n": 0}
     original = enc.backend.mount_vault
 
@@ -124,4 +126,65 @@ def test_callable_key_remounts(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr(enc.backend, "mount_vault", counting)
     enc.mount_vault()
     enc.mount_vault()
+    assert calls["n"] == 1
+    keys.append("rotated-key")
+    enc.mount_vault()
     assert calls["n"] == 2
+
+
+def test_decrypt_many_preserves_order_and_none() -> None:
+    enc = EncryptedString(key="batch-key")
+    enc.mount_vault()
+    stored = [enc.backend.encrypt("a"), None, enc.backend.encrypt("b")]
+
+    assert enc.decrypt_many(stored) == ["a", None, "b"]
+
+
+async def test_decrypt_many_async_decrypts_in_chunks() -> None:
+    enc = EncryptedString(key="batch-key")
+    enc.mount_vault()
+    stored = [None if i % 3 == 0 else enc.backend.encrypt(str(i)) for i in range(10)]
+
+    assert await enc.decrypt_many_async(stored, chunk_size=4) == [None if i % 3 == 0 else str(i) for i in range(10)]
+
+
+def test_deferred_value_decrypts_on_first_use() -> None:
+    """Deferred columns load a proxy that hides the plaintext until it is used."""
+    enc = EncryptedString(key="deferred-key", deferred=True)
+    ciphertext = enc.process_bind_param("secret", None)  # type: ignore[arg-type]
+
+    value = enc.process_result_value(ciphertext, None)  # type: ignore[arg-type]
+
+    assert isinstance(value, EncryptedValue)
+    assert repr(value) == "EncryptedValue(decrypted=False)"
+    assert value == "secret"
+    assert value.upper() == "SECRET"
+    assert value.is_decrypted
+    assert enc.process_bind_param(value, None) == ciphertext  # type: ignore[arg-type]
+    assert EncryptedString(key="other-key").process_bind_param(value, None) != ciphertext  # type: ignore[arg-type]
+
+
+class _Base(DeclarativeBase):
+    pass
+
+
+class _Secret(_Base):
+    __tablename__ = "deferred_secret"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    value: Mapped[Optional[str]] = mapped_column(EncryptedString(key="deferred-key", deferred=True))
+
+
+async def test_decrypt_results_replaces_proxies_without_dirtying() -> None:
+    engine = create_engine("sqlite://")
+    _Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all([_Secret(id=i, value=None if i == 2 else f"secret-{i}") for i in range(5)])
+        session.commit()
+
+        secrets = await decrypt_results(session.scalars(select(_Secret).order_by(_Secret.id)), chunk_size=2)
+
+        assert [secret.value for secret in secrets] == ["secret-0", "secret-1", None, "secret-3", "secret-4"]
+        assert all(type(secret.value) is str for secret in secrets if secret.value is not None)
+        assert not session.dirty
+    engine.dispose()
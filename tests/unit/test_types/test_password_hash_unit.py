@@ -138,3 +138,148 @@ def test_verify_and_update_ok_with_rehash() -> None:
     assert new is not None
     assert new != old_hash
     assert strong.verify("pw", new) is True
+
+
+@pytest.mark.skipif(not ARGON2_INSTALLED, reason="argon2-cffi not installed")
+async def test_async_hash_and_verify_run_in_worker_threads() -> None:
+    import threading
+    from typing import Union
+
+    from advanced_alchemy.types.password_hash.argon2 import Argon2Hasher
+    from advanced_alchemy.utils.sync_tools import CapacityLimiter
+
+    threads: set[int] = set()
+
+    class RecordingHasher(Argon2Hasher):
+        def hash(self, value: Union[str, bytes]) -> str:
+            threads.add(threading.get_ident())
+            return super().hash(value)
+
+    backend = RecordingHasher()
+    backend.limiter = CapacityLimiter(2)
+    hashed = await backend.hash_async("pw")
+
+    assert threads and threading.get_ident() not in threads
+    assert await backend.verify_async("pw", hashed) is True
+    assert await backend.verify_async("wrong", hashed) is False
+
+
+@pytest.mark.skipif(not ARGON2_INSTALLED, reason="argon2-cffi not installed")
+async def test_verify_and_update_async_rehashes_stale_hash() -> None:
+    from advanced_alchemy.types.password_hash.argon2 import Argon2Hasher
+    from advanced_alchemy.types.password_hash.base import HashedPassword
+
+    strong = Argon2Hasher(time_cost=10)
+    hp = HashedPassword(Argon2Hasher(time_cost=1).hash("pw"), strong)
+
+    assert await hp.verify_async("pw") is True
+    assert await hp.verify_and_update_async("wrong") == (False, None)
+    ok, new = await hp.verify_and_update_async("pw")
+    assert ok is True
+    assert new is not None
+    assert strong.verify("pw", new) is True
+
+
+@pytest.mark.skipif(not ARGON2_INSTALLED, reason="argon2-cffi not installed")
+async def test_prehash_passwords_stores_hash_without_rehashing() -> None:
+    from typing import Optional
+
+    from sqlalchemy import create_engine, select
+    from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column
+
+    from advanced_alchemy.types.password_hash.argon2 import Argon2Hasher
+    from advanced_alchemy.types.password_hash.base import HashedPassword, PasswordHash, prehash_passwords_async
+
+    class Base(DeclarativeBase):
+        pass
+
+    class Account(Base):
+        __tablename__ = "prehash_account"
+
+        id: Mapped[int] = mapped_column(primary_key=True)
+        password: Mapped[Optional[str]] = mapped_column(PasswordHash(backend=Argon2Hasher()))
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        account = Account(id=1, password="pw")
+        session.add(account)
+        await prehash_passwords_async(session.new)
+
+        assert isinstance(account.password, HashedPassword)
+        session.commit()
+        stored = session.scalar(select(Account.password))
+
+        assert isinstance(stored, HashedPassword)
+        assert stored.hash_string == account.password.hash_string
+        assert stored.verify("pw") is True
+    engine.dispose()
+
+
+@pytest.mark.skipif(not ARGON2_INSTALLED, reason="argon2-cffi not installed")
+async def test_async_session_flush_hashes_passwords_off_the_event_loop() -> None:
+    import threading
+    from typing import Optional
+
+    from sqlalchemy import select
+    from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
+    from advanced_alchemy.config import SQLAlchemyAsyncConfig
+    from advanced_alchemy.types.password_hash.argon2 import Argon2Hasher
+    from advanced_alchemy.types.password_hash.base import HashedPassword, PasswordHash
+
+    hashing_threads: list[int] = []
+
+    class RecordingArgon2Hasher(Argon2Hasher):
+        def hash(self, password: "str | bytes") -> str:
+            hashing_threads.append(threading.get_ident())
+            return super().hash(password)
+
+    class Base(DeclarativeBase):
+        pass
+
+    class Account(Base):
+        __tablename__ = "flush_prehash_account"
+
+        id: Mapped[int] = mapped_column(primary_key=True)
+        password: Mapped[Optional[str]] = mapped_column(PasswordHash(backend=RecordingArgon2Hasher()))
+
+    class Note(Base):
+        __tablename__ = "flush_prehash_note"
+
+        id: Mapped[int] = mapped_column(primary_key=True)
+
+    config = SQLAlchemyAsyncConfig(connection_string="sqlite+aiosqlite://", enable_password_hash_listener=True)
+    config.session_config.expire_on_commit = False
+    engine = config.get_engine()
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with config.create_session_maker()() as session:
+        session.add_all([Account(id=1, password="pw"), Account(id=2, password="pw"), Note(id=1)])
+        await session.flush()
+        account = await session.get_one(Account, 2)
+        account.password = "new"
+        await session.commit()
+        stored = await session.scalar(select(Account.password).where(Account.id == 2))
+
+    assert len(hashing_threads) == 3
+    assert threading.get_ident() not in hashing_threads
+    assert isinstance(stored, HashedPassword)
+    assert stored.verify("new") is True
+    await engine.dispose()
+
+
+def test_password_hash_listener_is_opt_in() -> None:
+    from sqlalchemy import event
+    from sqlalchemy.orm import Session
+
+    from advanced_alchemy._listeners import prehash_passwords
+    from advanced_alchemy.types.password_hash.base import setup_password_hash_listeners
+
+    assert not event.contains(Session, "before_flush", prehash_passwords)
+    try:
+        setup_password_hash_listeners()
+        setup_password_hash_listeners()
+        assert event.contains(Session, "before_flush", prehash_passwords)
+    finally:
+        event.remove(Session, "before_flush", prehash_passwords)
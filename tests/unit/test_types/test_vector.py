@@ -2,20 +2,34 @@
 
 import array
 import importlib
+import math
+import struct
 import subprocess
 import sys
 import textwrap
+from types import SimpleNamespace
 from typing import Any, Optional, cast
 
 import pytest
-from sqlalchemy import Column, Integer, Table, create_engine, insert, select
+from sqlalchemy import Column, Engine, Integer, MetaData, Table, create_engine, event, insert, inspect, select
+from sqlalchemy.dialects import mysql as mysql_dialect_mod
 from sqlalchemy.dialects import oracle as oracle_dialect_mod
 from sqlalchemy.dialects import postgresql as postgresql_dialect_mod
 from sqlalchemy.dialects import sqlite as sqlite_dialect_mod
+from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
-from sqlalchemy.types import JSON
+from sqlalchemy.schema import CreateIndex
+from sqlalchemy.types import JSON, LargeBinary
 
-from advanced_alchemy.types import Vector
+from advanced_alchemy.types import Vector, vector_index
+from advanced_alchemy.types import vector as vector_module
+from advanced_alchemy.types.vector import (
+    _apply_vector_search_options,
+    _create_sqlite_vector_functions,
+    register_sqlite_vector_functions,
+    register_vector_search_options,
+    vector_distances,
+)
 
 
 def test_vector_is_publicly_exported() -> None:
@@ -251,7 +265,33 @@ def test_vector_distance_unsupported_dialect_raises() -> None:
     column: Column[list[float]] = Column("embedding", Vector(3))
     statement = column.cosine_distance([1.0, 2.0, 3.0])
     with pytest.raises(NotImplementedError):
-        str(statement.compile(dialect=sqlite_dialect_mod.dialect()))  # type: ignore[no-untyped-call,unused-ignore]
+        str(statement.compile(dialect=mysql_dialect_mod.dialect()))  # type: ignore[no-untyped-call,unused-ignore]
+
+
+def test_vector_distance_sqlite_calls_registered_function() -> None:
+    """On SQLite, distances call the ``aa_vector_distance`` function registered on each connection."""
+    column: Column[list[float]] = Column("embedding", Vector(3))
+    statement = column.l2_distance([1.0, 2.0, 3.0])
+    assert str(statement.compile(dialect=sqlite_dialect_mod.dialect())) == "aa_vector_distance(embedding, ?, 'l2')"  # type: ignore[no-untyped-call,unused-ignore]
+
+
+def test_register_sqlite_vector_functions_only_instruments_sqlite() -> None:
+    """The distance function is created on connections of registered SQLite engines only."""
+    postgres = create_engine("postgresql+psycopg2://localhost/db", module=SimpleNamespace(paramstyle="pyformat"))
+    registered = create_engine("sqlite://")
+    unregistered = create_engine("sqlite://")
+
+    register_sqlite_vector_functions(postgres)
+    register_sqlite_vector_functions(registered)
+    register_sqlite_vector_functions(registered)
+
+    assert not event.contains(postgres, "connect", _create_sqlite_vector_functions)
+    assert event.contains(registered, "connect", _create_sqlite_vector_functions)
+    assert not event.contains(Engine, "connect", _create_sqlite_vector_functions)
+    with registered.connect() as conn:
+        assert conn.exec_driver_sql("SELECT aa_vector_distance('[1, 0]', '[0, 0]', 'l2')").scalar_one() == 1.0
+    with unregistered.connect() as conn, pytest.raises(OperationalError):
+        conn.exec_driver_sql("SELECT aa_vector_distance('[1, 0]', '[0, 0]', 'l2')")
 
 
 def test_vector_distance_usable_in_order_by_on_postgresql() -> None:
@@ -290,3 +330,189 @@ def test_vector_sqlite_round_trip_via_json_fallback() -> None:
         row: Optional[Any] = conn.execute(select(table.c.embedding).where(table.c.id == 1)).first()
     assert row is not None
     assert row[0] == [0.1, 0.2, 0.3]
+
+
+def test_vector_index_postgresql_ddl() -> None:
+    """``vector_index`` emits pgvector HNSW and IVFFlat indexes with their operator class and options."""
+    metadata = MetaData()
+    table = Table("vector_index_doc", metadata, Column("id", Integer, primary_key=True), Column("embedding", Vector(3)))
+    hnsw = vector_index("vector_index_doc", table.c.embedding, m=16, ef_construction=64)
+    ivfflat = vector_index("vector_index_doc", table.c.embedding, "inner_product", "ivfflat", lists=100)
+
+    dialect = postgresql_dialect_mod.dialect()  # type: ignore[no-untyped-call,unused-ignore]
+    assert str(CreateIndex(hnsw).compile(dialect=dialect)) == (
+        "CREATE INDEX ix_vector_index_doc_embedding_hnsw ON vector_index_doc "
+        "USING hnsw (embedding vector_cosine_ops) WITH (m = 16, ef_construction = 64)"
+    )
+    assert str(CreateIndex(ivfflat).compile(dialect=dialect)) == (
+        "CREATE INDEX ix_vector_index_doc_embedding_ivfflat ON vector_index_doc "
+        "USING ivfflat (embedding vector_ip_ops) WITH (lists = 100)"
+    )
+
+
+def test_vector_index_oracle_ddl() -> None:
+    """``vector_index`` emits an Oracle 23ai vector index with the matching distance."""
+    metadata = MetaData()
+    table = Table("vector_index_doc", metadata, Column("id", Integer, primary_key=True), Column("embedding", Vector(3)))
+    index = vector_index("vector_index_doc", table.c.embedding, "l2", "ivfflat", lists=8, target_accuracy=90)
+
+    assert str(CreateIndex(index).compile(dialect=oracle_dialect_mod.dialect())) == (  # type: ignore[no-untyped-call,unused-ignore]
+        "CREATE VECTOR INDEX ix_vector_index_doc_embedding_ivfflat ON vector_index_doc (embedding) "
+        "ORGANIZATION NEIGHBOR PARTITIONS DISTANCE EUCLIDEAN WITH TARGET ACCURACY 90 "
+        "PARAMETERS (type IVF, neighbor partitions 8)"
+    )
+
+
+def test_vector_index_is_skipped_on_other_dialects() -> None:
+    """Declaring a vector index in a model does not break ``create_all`` on SQLite."""
+
+    class _Base(DeclarativeBase):
+        pass
+
+    class _IndexedVectorModel(_Base):
+        __tablename__ = "vector_indexed_model"
+        __table_args__ = (vector_index("vector_indexed_model", "embedding"),)
+        id: Mapped[int] = mapped_column(Integer, primary_key=True)
+        embedding: Mapped[list[float]] = mapped_column(Vector(3))
+
+    engine = create_engine("sqlite:///:memory:")
+    _Base.metadata.create_all(engine)
+    assert inspect(engine).get_indexes("vector_indexed_model") == []
+
+
+def test_vector_search_options_set_local_on_postgresql() -> None:
+    """``hnsw_ef_search`` / ``ivfflat_probes`` execution options become ``SET LOCAL`` statements."""
+    executed: list[str] = []
+    cursor = SimpleNamespace(execute=executed.append)
+    context = SimpleNamespace(execution_options={"hnsw_ef_search": 80, "ivfflat_probes": None})
+
+    _apply_vector_search_options(
+        SimpleNamespace(),  # type: ignore[arg-type]
+        cursor,  # type: ignore[arg-type]
+        "SELECT 1",
+        {},
+        context,  # type: ignore[arg-type]
+        False,
+    )
+    assert executed == ["SET LOCAL hnsw.ef_search = 80"]
+
+
+def test_register_vector_search_options_only_instruments_postgresql() -> None:
+    """The listener is registered per PostgreSQL engine, once, and never globally."""
+    postgres = create_engine("postgresql+psycopg2://localhost/db", module=SimpleNamespace(paramstyle="pyformat"))
+    sqlite = create_engine("sqlite://")
+
+    register_vector_search_options(postgres)
+    register_vector_search_options(postgres)
+    register_vector_search_options(sqlite)
+
+    assert event.contains(postgres, "before_cursor_execute", _apply_vector_search_options)
+    assert len(postgres.dispatch.before_cursor_execute) == 1
+    assert not event.contains(sqlite, "before_cursor_execute", _apply_vector_search_options)
+    assert not event.contains(Engine, "before_cursor_execute", _apply_vector_search_options)
+
+
+@pytest.mark.parametrize("enable_vector_search", [False, True])
+def test_configs_register_vector_search_options_when_enabled(enable_vector_search: bool) -> None:
+    """Engines created by the configs and routing session makers are only instrumented on request."""
+    from advanced_alchemy.config import RoutingConfig, SQLAlchemySyncConfig
+    from advanced_alchemy.routing import RoutingSyncSessionMaker
+
+    url = "postgresql+psycopg2://localhost/db"
+
+    def create_postgres_engine(connection_string: str, **kwargs: Any) -> Engine:
+        return create_engine(connection_string, module=SimpleNamespace(paramstyle="pyformat"), **kwargs)
+
+    config = SQLAlchemySyncConfig(
+        engine_instance=create_postgres_engine(url), enable_vector_search=enable_vector_search
+    )
+    maker = RoutingSyncSessionMaker(
+        routing_config=RoutingConfig(primary_connection_string=url, read_replicas=[url]),
+        create_engine_callable=create_postgres_engine,
+        enable_vector_search=enable_vector_search,
+    )
+    engines = [config.get_engine(), maker.primary_engine, *maker.replica_engines]
+
+    assert len(engines) == 3
+    for engine in engines:
+        assert event.contains(engine, "before_cursor_execute", _apply_vector_search_options) is enable_vector_search
+    maker.close_all()
+
+
+@pytest.mark.parametrize("enable_vector_search", [False, True])
+def test_configs_register_sqlite_vector_functions_when_enabled(enable_vector_search: bool) -> None:
+    """SQLite engines created by the configs and routing session makers only get the function on request."""
+    from advanced_alchemy.config import RoutingConfig, SQLAlchemySyncConfig
+    from advanced_alchemy.routing import RoutingSyncSessionMaker
+
+    config = SQLAlchemySyncConfig(connection_string="sqlite://", enable_vector_search=enable_vector_search)
+    maker = RoutingSyncSessionMaker(
+        routing_config=RoutingConfig(primary_connection_string="sqlite://", read_replicas=["sqlite://"]),
+        enable_vector_search=enable_vector_search,
+    )
+
+    for engine in (config.get_engine(), maker.primary_engine, *maker.replica_engines):
+        assert event.contains(engine, "connect", _create_sqlite_vector_functions) is enable_vector_search
+    maker.close_all()
+
+
+def test_vector_binary_fallback_uses_large_binary() -> None:
+    """``fallback_format="binary"`` replaces the JSON fallback but not native vector types."""
+    binary = Vector(3, fallback_format="binary")
+
+    assert isinstance(binary.dialect_impl(sqlite_dialect_mod.dialect()).impl, LargeBinary)  # type: ignore[no-untyped-call,unused-ignore]
+    assert isinstance(binary.dialect_impl(oracle_dialect_mod.dialect()).impl, oracle_dialect_mod.VECTOR)  # type: ignore[no-untyped-call,unused-ignore]
+
+
+def test_vector_binary_round_trip_on_sqlite() -> None:
+    """Binary vectors are stored as packed little-endian float32 and read back as ``list[float]``."""
+    metadata = MetaData()
+    table = Table(
+        "vector_binary_model",
+        metadata,
+        Column("id", Integer, primary_key=True),
+        Column("embedding", Vector(3, fallback_format="binary")),
+    )
+    engine = create_engine("sqlite:///:memory:")
+    metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(
+            insert(table),
+            [
+                {"id": 1, "embedding": [0.5, -1.0, 2.25]},
+                {"id": 2, "embedding": array.array("d", [1.0, 2.0, 3.0])},
+                {"id": 3, "embedding": None},
+            ],
+        )
+        stored = conn.exec_driver_sql("SELECT embedding FROM vector_binary_model WHERE id = 1").scalar_one()
+        rows = conn.execute(select(table.c.embedding).order_by(table.c.id)).scalars().all()
+
+    assert stored == struct.pack("<3f", 0.5, -1.0, 2.25)
+    assert rows == [[0.5, -1.0, 2.25], [1.0, 2.0, 3.0], None]
+
+
+def test_vector_binary_accepts_numpy_arrays() -> None:
+    """NumPy arrays are packed as float32 without going through Python floats."""
+    np = pytest.importorskip("numpy")
+    processor = Vector(2, fallback_format="binary").dialect_impl(sqlite_dialect_mod.dialect())  # type: ignore[no-untyped-call,unused-ignore]
+
+    assert processor.process_bind_param(np.array([1.5, 3.0]), sqlite_dialect_mod.dialect()) == struct.pack(
+        "<2f", 1.5, 3.0
+    )  # type: ignore[no-untyped-call,unused-ignore]
+
+
+@pytest.mark.parametrize("numpy_installed", [True, False])
+def test_vector_distances_match_database_metrics(monkeypatch: pytest.MonkeyPatch, numpy_installed: bool) -> None:
+    """``vector_distances`` returns the same distances with and without NumPy."""
+    if numpy_installed:
+        pytest.importorskip("numpy")
+    monkeypatch.setattr(vector_module, "NUMPY_INSTALLED", numpy_installed)
+    monkeypatch.setattr(vector_module, "_DISTANCE_CHUNK_SIZE", 2)
+    vectors = [[3.0, 4.0], [1.0, 0.0], [0.0, 0.0]]
+
+    assert vector_distances([1.0, 0.0], vectors, "l2") == pytest.approx([math.sqrt(20), 0.0, 1.0])
+    assert vector_distances([1.0, 0.0], vectors, "l1") == pytest.approx([6.0, 0.0, 1.0])
+    assert vector_distances([1.0, 0.0], vectors, "inner_product") == pytest.approx([-3.0, -1.0, 0.0])
+    cosine = vector_distances([1.0, 0.0], vectors, "cosine")
+    assert cosine[:2] == pytest.approx([0.4, 0.0])
+    assert math.isnan(cosine[2])
@@ -0,0 +1,188 @@
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool, QueuePool
+
+from advanced_alchemy.config.routing import RoutingConfig
+from advanced_alchemy.config.sync import SQLAlchemySyncConfig
+from advanced_alchemy.exceptions import ImproperConfigurationError
+from advanced_alchemy.routing.maker import RoutingSyncSessionMaker
+from advanced_alchemy.utils.pool import (
+    PoolEventHook,
+    PoolMonitor,
+    prewarm_engine_async,
+    prewarm_engine_sync,
+)
+
+
+class RecordingHook:
+    def __init__(self) -> None:
+        self.events: list[tuple[str, str, object]] = []
+
+    def on_checkout(self, engine: str, wait: float) -> None:
+        self.events.append(("checkout", engine, wait))
+
+    def on_connect(self, engine: str, latency: float) -> None:
+        self.events.append(("connect", engine, latency))
+
+    def on_invalidate(self, engine: str, soft: bool) -> None:
+        self.events.append(("invalidate", engine, soft))
+
+
+def test_prewarm_engine_sync_fills_pool(tmp_path: Path) -> None:
+    engine = create_engine(f"sqlite:///{tmp_path / 'db.sqlite'}", poolclass=QueuePool, pool_size=3)
+
+    assert prewarm_engine_sync(engine, 5) == 3
+    assert engine.pool.checkedin() == 3  # type: ignore[attr-defined]
+    engine.dispose()
+
+
+def test_prewarm_engine_sync_skips_null_pool(tmp_path: Path) -> None:
+    engine = create_engine(f"sqlite:///{tmp_path / 'db.sqlite'}", poolclass=NullPool)
+
+    assert prewarm_engine_sync(engine, 5) == 0
+    engine.dispose()
+
+
+def test_prewarm_engine_sync_logs_unreachable_engine(tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+    engine = create_engine(f"sqlite:///{tmp_path / 'missing' / 'db.sqlite'}", poolclass=QueuePool)
+
+    assert prewarm_engine_sync(engine, 2) == 0
+    assert "Could not pre-warm connection pool" in caplog.text
+    engine.dispose()
+
+
+async def test_prewarm_engine_async_fills_pool(tmp_path: Path) -> None:
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'db.sqlite'}", pool_size=2)
+
+    assert await prewarm_engine_async(engine, 4) == 2
+    assert engine.sync_engine.pool.checkedin() == 2  # type: ignore[attr-defined]
+    await engine.dispose()
+
+
+async def test_prewarm_engine_async_returns_connections_on_failure(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'db.sqlite'}", pool_size=3)
+    attempts: list[int] = []
+
+    @event.listens_for(engine.sync_engine, "do_connect")
+    def fail_second_connect(*_: object) -> None:
+        attempts.append(1)
+        if len(attempts) == 2:
+            raise OSError("connection refused")
+
+    assert await prewarm_engine_async(engine, 3) == 0
+    assert "Could not pre-warm connection pool" in caplog.text
+    assert engine.sync_engine.pool.checkedout() == 0  # type: ignore[attr-defined]
+    assert engine.sync_engine.pool.checkedin() == 2  # type: ignore[attr-defined]
+    await engine.dispose()
+
+
+def test_routing_maker_prewarms_replicas(tmp_path: Path) -> None:
+    maker = RoutingSyncSessionMaker(
+        routing_config=RoutingConfig(
+            primary_connection_string=f"sqlite:///{tmp_path / 'primary.sqlite'}",
+            read_replicas=[f"sqlite:///{tmp_path / 'replica.sqlite'}"],
+        ),
+        engine_config={"poolclass": QueuePool, "pool_size": 2},
+    )
+
+    assert maker.prewarm(2) == 4
+    assert [engine.pool.checkedin() for engine in maker.replica_engines] == [2]  # type: ignore[attr-defined]
+    maker.close_all()
+
+
+def test_config_prewarm_engines(tmp_path: Path) -> None:
+    config = SQLAlchemySyncConfig(connection_string=f"sqlite:///{tmp_path / 'db.sqlite'}", prewarm_pool=2)
+
+    assert config.prewarm_engines() == 2
+    assert SQLAlchemySyncConfig(connection_string="sqlite://").prewarm_engines() == 0
+    config.get_engine().dispose()
+
+
+def test_config_rejects_negative_prewarm_pool() -> None:
+    with pytest.raises(ImproperConfigurationError, match="prewarm_pool"):
+        SQLAlchemySyncConfig(connection_string="sqlite://", prewarm_pool=-1)
+
+
+def test_pool_monitor_tracks_usage_and_notifies_hooks(tmp_path: Path) -> None:
+    engine = create_engine(f"sqlite:///{tmp_path / 'db.sqlite'}", poolclass=QueuePool, pool_size=2, max_overflow=2)
+    hook = RecordingHook()
+    monitor = PoolMonitor(engine, label="primary", hooks=[hook], buckets=(0.5, 0.001))
+
+    with engine.connect(), engine.connect(), engine.connect() as third:
+        third.execute(text("SELECT 1"))
+        busy = monitor.stats()
+        third.invalidate()
+    idle = monitor.stats()
+
+    assert isinstance(hook, PoolEventHook)
+    assert (busy.size, busy.in_use, busy.idle, busy.overflow) == (2, 3, 0, 1)
+    assert (idle.in_use, idle.checkouts, idle.connects, idle.invalidations) == (0, 3, 3, 1)
+    assert list(idle.checkout_wait_histogram) == [0.001, 0.5, float("inf")]
+    assert idle.checkout_wait_histogram[float("inf")] == 3
+    assert idle.checkout_wait_mean > 0
+    assert idle.connect_time_mean > 0
+    assert [name for name, _, _ in hook.events] == ["connect", "checkout"] * 3 + ["invalidate"]
+    assert {label for _, label, _ in hook.events} == {"primary"}
+    engine.dispose()
+
+
+def test_pool_monitor_survives_dispose(tmp_path: Path) -> None:
+    engine = create_engine(f"sqlite:///{tmp_path / 'db.sqlite'}", poolclass=QueuePool)
+    monitor = PoolMonitor(engine)
+
+    with engine.connect():
+        pass
+    engine.dispose()
+    with engine.connect():
+        pass
+
+    assert monitor.stats().checkouts == 2
+    assert monitor.stats().engine == f"sqlite:///{tmp_path / 'db.sqlite'}"
+    engine.dispose()
+
+
+async def test_pool_monitor_async_engine(tmp_path: Path) -> None:
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'db.sqlite'}")
+    monitor = PoolMonitor(engine)
+
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+        assert monitor.stats().in_use == 1
+
+    assert (monitor.stats().checkouts, monitor.stats().connects) == (1, 1)
+    await engine.dispose()
+
+
+def test_routing_maker_pool_stats_by_engine(tmp_path: Path) -> None:
+    hook = RecordingHook()
+    maker = RoutingSyncSessionMaker(
+        routing_config=RoutingConfig(
+            primary_connection_string=f"sqlite:///{tmp_path / 'primary.sqlite'}",
+            read_replicas=[f"sqlite:///{tmp_path / 'replica1.sqlite'}", f"sqlite:///{tmp_path / 'replica2.sqlite'}"],
+        ),
+        pool_event_hooks=[hook],
+    )
+
+    with maker() as session:
+        session.execute(text("SELECT 1"))
+
+    stats = maker.pool_stats()
+    assert set(stats) == {"default[0]", "read[0]", "read[1]"}
+    assert sum(item.checkouts for item in stats.values()) == 1
+    assert {label for _, label, _ in hook.events} <= set(stats)
+    maker.close_all()
+
+
+def test_config_pool_stats(tmp_path: Path) -> None:
+    config = SQLAlchemySyncConfig(connection_string=f"sqlite:///{tmp_path / 'db.sqlite'}", instrument_pool=True)
+    with config.get_session() as session:
+        session.execute(text("SELECT 1"))
+
+    assert config.pool_stats()["default"].checkouts == 1
+    assert SQLAlchemySyncConfig(connection_string="sqlite://").pool_stats() == {}
+    config.get_engine().dispose()